@@ -21,6 +21,7 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.monitoring import post_fork
 
 # Configure logging
 logging.basicConfig(
@@ -92,6 +93,7 @@ def main():
                 'max_requests': 1000,
                 'max_requests_jitter': 100,
                 'preload_app': True,
+                'post_fork': post_fork,
                 'access_logfile': '-',
                 'error_logfile': '-',
                 'loglevel': 'info'
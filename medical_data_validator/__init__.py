@@ -45,6 +45,62 @@ from .performance import (
     performance_monitor,
 )
 
+from .cache_store import TieredCache
+
+from .codesets import (
+    CodeSet,
+    CodeSetRegistry,
+    codeset_registry,
+)
+
+from .dates import (
+    DateParser,
+    ParsedDates,
+    date_parsing_session,
+    parse_dates,
+)
+
+from .ranges import (
+    RangeEngine,
+    RangeEvaluation,
+    VITAL_SIGNS,
+    LAB_RANGES_BY_LOINC,
+    build_ranges,
+)
+
+from .schema import (
+    ColumnSchema,
+    Schema,
+    infer_schema,
+    infer_csv_schema,
+)
+
+from .declarative import (
+    DeclarativeRuleValidator,
+    compile_expression,
+    load_rules,
+)
+
+from .sequences import SequenceValidator
+
+from .relational import (
+    ForeignKey,
+    MultiTableValidator,
+)
+
+from .backends import is_arrow_table, to_arrow_table
+
+from .loaders import iter_columnar, load_file, read_columnar
+from .scratch import ScratchCache
+
+from .excel import iter_excel, validate_excel
+
+from .fhir import FhirStructureChecker, iter_fhir, validate_fhir_ndjson
+
+from .hl7 import Hl7StructureChecker, iter_hl7, validate_hl7
+
+from .omop import ConceptValidator, ConceptVocabulary, omop_validator
+
 __all__ = [
     # Core classes
     "MedicalDataValidator",
@@ -77,4 +133,70 @@ __all__ = [
     "OptimizedMedicalDataValidator",
     "timed_validation",
     "performance_monitor",
+    "TieredCache",
+    
+    # Medical code sets
+    "CodeSet",
+    "CodeSetRegistry",
+    "codeset_registry",
+    
+    # Date parsing
+    "DateParser",
+    "ParsedDates",
+    "date_parsing_session",
+    "parse_dates",
+    
+    # Range checking
+    "RangeEngine",
+    "RangeEvaluation",
+    "VITAL_SIGNS",
+    "LAB_RANGES_BY_LOINC",
+    "build_ranges",
+    
+    # Schema inference
+    "ColumnSchema",
+    "Schema",
+    "infer_schema",
+    "infer_csv_schema",
+    
+    # Declarative rules
+    "DeclarativeRuleValidator",
+    "compile_expression",
+    "load_rules",
+    
+    # Sequence checks
+    "SequenceValidator",
+    
+    # Multi-table validation
+    "ForeignKey",
+    "MultiTableValidator",
+    
+    # Arrow backend
+    "is_arrow_table",
+    "to_arrow_table",
+    
+    # Data loading
+    "load_file",
+    "read_columnar",
+    "iter_columnar",
+    "ScratchCache",
+    
+    # Excel streaming
+    "iter_excel",
+    "validate_excel",
+    
+    # FHIR bulk data
+    "FhirStructureChecker",
+    "iter_fhir",
+    "validate_fhir_ndjson",
+    
+    # HL7 v2 messages
+    "Hl7StructureChecker",
+    "iter_hl7",
+    "validate_hl7",
+    
+    # OMOP CDM
+    "ConceptValidator",
+    "ConceptVocabulary",
+    "omop_validator",
 ] 
\ No newline at end of file
@@ -10,6 +10,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 
+from .serialization import to_builtin
+
+# Text columns arrive as objects, pandas strings, or (from the loaders)
+# ``category`` for low-cardinality text
+TEXT_DTYPES = ['object', 'string', 'category']
+
 @dataclass
 class DataQualityMetric:
     """Represents a data quality metric."""
@@ -66,7 +72,7 @@ class AdvancedAnalytics:
         # Consistency (check for data type consistency)
         consistency_scores = []
         for col in df.columns:
-            if df[col].dtype in ['object', 'string']:
+            if df[col].dtype in TEXT_DTYPES:
                 # Check for mixed data types in string columns
                 unique_types = df[col].dropna().apply(type).nunique()
                 consistency_scores.append(1.0 if unique_types <= 1 else 0.5)
@@ -169,7 +175,7 @@ class AdvancedAnalytics:
                     ))
             
             # Data type inconsistency
-            if df[col].dtype == 'object':
+            if df[col].dtype in TEXT_DTYPES:
                 # Check for mixed data types
                 type_counts = col_data.apply(type).value_counts()
                 if len(type_counts) > 1:
@@ -274,7 +280,7 @@ class AdvancedAnalytics:
             }
         
         # Categorical columns summary
-        categorical_cols = df.select_dtypes(include=['object']).columns
+        categorical_cols = df.select_dtypes(include=TEXT_DTYPES).columns
         for col in categorical_cols:
             value_counts = df[col].value_counts()
             summary['categorical_summary'][col] = {
@@ -343,19 +349,7 @@ class AdvancedAnalytics:
         """Generate serializable statistical summary."""
         summary = self.generate_statistical_summary(df)
         
-        # Convert numpy types to native Python types
-        def convert_numpy_types(obj):
-            if hasattr(obj, 'item'):
-                return obj.item()
-            elif isinstance(obj, dict):
-                # Convert all keys to str for JSON serialization
-                return {str(k): convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(v) for v in obj]
-            else:
-                return obj
-        
-        return convert_numpy_types(summary)
+        return to_builtin(summary)
     
     def _calculate_overall_quality_score(self, df: pd.DataFrame) -> float:
         """Calculate overall data quality score."""
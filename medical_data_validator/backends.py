@@ -0,0 +1,129 @@
+"""
+Apache Arrow execution backend.
+
+Built-in rules implement ``validate_arrow`` using ``pyarrow.compute``
+kernels, which are multi-threaded and work on Arrow string buffers instead
+of Python ``str`` objects. ``MedicalDataValidator.validate`` uses this path
+when given a ``pyarrow.Table`` (or a Polars DataFrame, which converts to
+Arrow without copying); pandas stays the default. Rules without an Arrow
+implementation fall back to ``ValidationRule.validate_arrow``, which
+converts the table to pandas.
+
+pyarrow is optional; the helpers here are only called with Arrow data.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+from .dates import DateParser, ParsedDates, default_date_parser
+
+
+def is_arrow_table(data: Any) -> bool:
+    """Whether ``data`` is a pyarrow Table."""
+    return pa is not None and isinstance(data, pa.Table)
+
+
+def to_arrow_table(data: Any) -> Optional["pa.Table"]:
+    """Return ``data`` as a pyarrow Table if it is Arrow or Polars data, else None."""
+    if is_arrow_table(data):
+        return data
+    if pa is not None and type(data).__module__.split(".")[0] == "polars" and hasattr(data, "to_arrow"):
+        return data.to_arrow()
+    return None
+
+
+def arrow_logical_type(arrow_type: "pa.DataType") -> str:
+    """Classify an Arrow type into the logical types used by SchemaValidator."""
+    types = pa.types
+    if types.is_dictionary(arrow_type):
+        return "category"
+    if types.is_boolean(arrow_type):
+        return "boolean"
+    if types.is_integer(arrow_type):
+        return "integer"
+    if types.is_floating(arrow_type) or types.is_decimal(arrow_type):
+        return "float"
+    if types.is_timestamp(arrow_type) or types.is_date(arrow_type):
+        return "datetime"
+    if types.is_string(arrow_type) or types.is_large_string(arrow_type):
+        return "string"
+    return "unknown"
+
+
+def is_arrow_text(arrow_type: "pa.DataType") -> bool:
+    """Whether an Arrow column holds text (plain or dictionary-encoded strings)."""
+    if pa.types.is_dictionary(arrow_type):
+        return arrow_logical_type(arrow_type.value_type) == "string"
+    return arrow_logical_type(arrow_type) == "string"
+
+
+def as_strings(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Cast a column to strings (decoding dictionaries) for string kernels."""
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column
+    if pa.types.is_dictionary(column.type) and is_arrow_text(column.type):
+        return column.cast(column.type.value_type)
+    return pc.cast(column, pa.string())
+
+
+def regex_mask(column: "pa.ChunkedArray", pattern: str) -> "pa.ChunkedArray":
+    """Boolean column of regex search results; nulls stay null."""
+    return pc.match_substring_regex(as_strings(column), pattern=pattern)
+
+
+def count_true(mask: "pa.ChunkedArray") -> int:
+    """Number of true values in a boolean column (nulls ignored)."""
+    return int(pc.sum(pc.cast(pc.fill_null(mask, False), pa.int64())).as_py() or 0)
+
+
+def duplicate_row_count(table: "pa.Table") -> int:
+    """Rows that repeat an earlier row, like ``DataFrame.duplicated().sum()``."""
+    if table.num_rows == 0 or table.num_columns == 0:
+        return 0
+    try:
+        distinct = table.group_by(table.column_names).aggregate([]).num_rows
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+        return int(table.to_pandas().duplicated().sum())
+    return table.num_rows - distinct
+
+
+def parse_arrow_dates(column: "pa.ChunkedArray", parser: Optional[DateParser] = None) -> Dict[str, Any]:
+    """
+    Parse a date column once per distinct value.
+
+    Returns the unique values' ParsedDates (``parsed``) and the per-row index
+    into them (``indices``, an Arrow array with nulls for missing rows), so
+    counts can be taken with ``pc.take`` without materializing per-row dates.
+    """
+    uniques = pc.unique(column).drop_null()
+    indices = pc.index_in(column, value_set=uniques)
+    values = pd.Series(uniques.to_pylist(), dtype=object)
+    parsed: ParsedDates = (parser or default_date_parser).parse(values)
+    return {"parsed": parsed, "indices": indices}
+
+
+def count_rows(unique_mask: np.ndarray, indices: "pa.Array") -> int:
+    """Count rows whose unique value satisfies ``unique_mask``."""
+    if len(unique_mask) == 0:
+        return 0
+    return count_true(pc.take(pa.array(unique_mask), indices))
+
+
+def arrow_summary(table: "pa.Table") -> Dict[str, Any]:
+    """Summary fields of MedicalDataValidator computed from Arrow metadata."""
+    return {
+        "total_rows": int(table.num_rows),
+        "total_columns": int(table.num_columns),
+        "missing_values": {name: int(table.column(name).null_count) for name in table.column_names},
+        "duplicate_rows": duplicate_row_count(table),
+        "data_types": {field.name: str(field.type) for field in table.schema},
+    }
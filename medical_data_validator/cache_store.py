@@ -0,0 +1,145 @@
+"""
+Two-tier result storage for validation caches.
+
+Entries live in an in-process LRU and, optionally, in a SQLite database so
+that restarts and multiple gunicorn workers can reuse each other's results.
+Values must be JSON-serializable.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TieredCache:
+    """
+    LRU cache with an optional SQLite tier shared between processes.
+
+    The memory tier is consulted first; misses fall through to the disk tier
+    (when ``db_path`` is set) and hits found there are promoted back into
+    memory. Several caches can share one database file through ``namespace``.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        db_path: Optional[str] = None,
+        namespace: str = "default",
+    ):
+        self.max_size = max_size
+        self.db_path = db_path
+        self.namespace = namespace
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open (or re-open after a fork) the SQLite connection."""
+        if self.db_path is None:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "created REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key`` or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            conn = self._connection()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT value FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` in every configured tier."""
+        with self._lock:
+            self._remember(key, value)
+            conn = self._connection()
+            if conn is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, created) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, json.dumps(value), time.time()),
+                )
+                conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry in this cache's namespace."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+                conn.commit()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks and SQLite connections cannot be pickled; the copy gets its
+        # own lock and opens its own connection on first use
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_memory"] = OrderedDict(self._memory)
+        del state["_lock"]
+        state["_conn"] = None
+        state["_conn_pid"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._memory),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "persistent": self.db_path is not None,
+        }
@@ -0,0 +1,121 @@
+"""
+Vectorized check-digit and layout validation for medical identifiers.
+
+Each validator works on the unique values of a column: the uniques are
+turned into a right-aligned digit matrix (one row per value, one uint8 column
+per digit) and the checksum is computed with NumPy array operations. The
+per-unique result is then broadcast back to every row.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+# NPI check digits are computed as if the number carried the 80840 card-issuer prefix
+NPI_PREFIX = "80840"
+
+# Accepted NDC segment layouts (labeler-product-package)
+NDC_LAYOUTS = {(4, 4, 2), (5, 3, 2), (5, 4, 1), (5, 4, 2)}
+
+
+def digit_matrix(values: pd.Series, width: int) -> np.ndarray:
+    """
+    Build a right-aligned digit matrix from digit-only strings.
+
+    Values are left-padded with zeros to ``width``, which leaves Luhn-style
+    checksums unchanged.
+    """
+    padded = values.astype(str).str.zfill(width).tolist()
+    if not padded:
+        return np.zeros((0, width), dtype=np.uint8)
+    raw = np.asarray(padded, dtype=f"S{width}")
+    return raw.view(np.uint8).reshape(len(padded), width) - ord("0")
+
+
+def luhn_valid(digits: np.ndarray) -> np.ndarray:
+    """Luhn (mod 10) check over each row of a digit matrix, check digit last."""
+    if digits.shape[0] == 0:
+        return np.zeros(0, dtype=bool)
+    doubled = digits.astype(np.int64)
+    # Every second digit counting from the right-most check digit is doubled
+    positions = np.arange(digits.shape[1])[::-1] % 2 == 1
+    doubled[:, positions] *= 2
+    doubled[doubled > 9] -= 9
+    return doubled.sum(axis=1) % 10 == 0
+
+
+def _map_unique(values: pd.Series, unique_check: Callable[[pd.Series], np.ndarray]) -> np.ndarray:
+    """Run ``unique_check`` on the unique non-null values and map back to rows."""
+    row_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    valid = np.ones(len(values), dtype=bool)
+    if len(uniques) == 0:
+        return valid
+    unique_valid = unique_check(pd.Series(uniques, dtype=object).astype(str).str.strip())
+    present = row_codes >= 0
+    valid[present] = unique_valid[row_codes[present]]
+    return valid
+
+
+def _loinc_unique(values: pd.Series) -> np.ndarray:
+    parts = values.str.extract(r"^(\d{1,5})-(\d)$")
+    well_formed = parts[0].notna().to_numpy()
+    result = np.zeros(len(values), dtype=bool)
+    if well_formed.any():
+        numbers = (parts[0] + parts[1])[well_formed]
+        result[well_formed] = luhn_valid(digit_matrix(numbers, 6))
+    return result
+
+
+def _npi_unique(values: pd.Series) -> np.ndarray:
+    well_formed = values.str.fullmatch(r"\d{10}").to_numpy(dtype=bool)
+    result = np.zeros(len(values), dtype=bool)
+    if well_formed.any():
+        prefixed = NPI_PREFIX + values[well_formed]
+        result[well_formed] = luhn_valid(digit_matrix(prefixed, 15))
+    return result
+
+
+def normalize_ndc(values: pd.Series) -> pd.Series:
+    """
+    Normalize NDCs to the 11-digit 5-4-2 form.
+
+    Hyphenated 4-4-2, 5-3-2, 5-4-1 and 5-4-2 codes and bare 11-digit codes are
+    accepted; anything else (including ambiguous 10-digit codes without
+    hyphens) normalizes to NaN.
+    """
+    strings = values.astype(str).str.strip()
+    parts = strings.str.extract(r"^(\d{4,5})-(\d{3,4})-(\d{1,2})$")
+    lengths = np.column_stack([parts[i].str.len().fillna(0).to_numpy(dtype=int) for i in range(3)])
+    layout_ok = np.zeros(len(strings), dtype=bool)
+    for layout in NDC_LAYOUTS:
+        layout_ok |= (lengths == np.array(layout)).all(axis=1)
+
+    normalized = parts[0].str.zfill(5) + parts[1].str.zfill(4) + parts[2].str.zfill(2)
+    normalized = normalized.where(layout_ok)
+    bare = strings.str.fullmatch(r"\d{11}").fillna(False).to_numpy(dtype=bool)
+    normalized[bare] = strings[bare]
+    return normalized
+
+
+def loinc_check_digit_valid(values: pd.Series) -> np.ndarray:
+    """Row mask of LOINC codes whose mod-10 check digit is correct (nulls pass)."""
+    return _map_unique(values, _loinc_unique)
+
+
+def npi_valid(values: pd.Series) -> np.ndarray:
+    """Row mask of NPIs that pass the Luhn check with the 80840 prefix (nulls pass)."""
+    return _map_unique(values, _npi_unique)
+
+
+def ndc_valid(values: pd.Series) -> np.ndarray:
+    """Row mask of NDCs in a recognized segment layout (nulls pass)."""
+    return _map_unique(values, lambda uniques: normalize_ndc(uniques).notna().to_numpy())
+
+
+# Structural validators by code type
+CHECK_DIGIT_VALIDATORS: Dict[str, Callable[[pd.Series], np.ndarray]] = {
+    "loinc": loinc_check_digit_valid,
+    "npi": npi_valid,
+    "ndc": ndc_valid,
+}
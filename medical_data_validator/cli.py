@@ -8,7 +8,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 import pandas as pd
 
@@ -20,27 +20,48 @@ from . import (
     PHIDetector,
     DataQualityChecker,
 )
+from .loaders import load_file
+from .scratch import ScratchCache
 
 
-def load_data(file_path: str) -> pd.DataFrame:
-    """Load data from various file formats."""
-    path = Path(file_path)
-    
-    if path.suffix.lower() == '.csv':
-        return pd.read_csv(file_path)
-    elif path.suffix.lower() in ['.xlsx', '.xls']:
-        return pd.read_excel(file_path)
-    elif path.suffix.lower() == '.json':
-        return pd.read_json(file_path)
-    elif path.suffix.lower() == '.parquet':
-        return pd.read_parquet(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {path.suffix}")
+def load_data(
+    file_path: str,
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Load data from various file formats.
+    
+    ``columns`` limits CSV, Parquet and Feather reads to the given columns;
+    ``dtypes`` are expected column types used as CSV load hints.
+    """
+    return load_file(file_path, columns=columns, dtypes=dtypes)
 
 
 def create_validator_from_args(args) -> MedicalDataValidator:
-    """Create a validator based on command line arguments."""
-    validator = MedicalDataValidator()
+    """
+    Create a validator based on command line arguments.
+    
+    The compliance and analytics engines, PHI detection and quality checks
+    read every column, so they run only when asked for; without them the
+    file is read for the columns the remaining rules use.
+    """
+    engines = {
+        "enable_compliance": getattr(args, "compliance", False),
+        "enable_analytics": getattr(args, "analytics", False),
+    }
+    
+    # Add profile-based validators
+    if args.profile:
+        profile = get_profile(args.profile)
+        if profile:
+            wanted = {PHIDetector: args.detect_phi, DataQualityChecker: args.quality_checks}
+            rules = [rule for rule in profile.rules if wanted.get(type(rule), True)]
+            return MedicalDataValidator(rules, **engines)
+        else:
+            print(f"Warning: Profile '{args.profile}' not found. Using basic validation.")
+    
+    validator = MedicalDataValidator(**engines)
     
     # Add schema validation if specified
     if args.required_columns or args.column_types:
@@ -58,14 +79,6 @@ def create_validator_from_args(args) -> MedicalDataValidator:
     if args.quality_checks:
         validator.add_rule(DataQualityChecker())
     
-    # Add profile-based validators
-    if args.profile:
-        profile = get_profile(args.profile)
-        if profile:
-            return profile.create_validator()
-        else:
-            print(f"Warning: Profile '{args.profile}' not found. Using basic validation.")
-    
     return validator
 
 
@@ -82,6 +95,9 @@ Examples:
   # Use a pre-configured profile
   medical-validator data.csv --profile clinical_trials
   
+  # Profile with its PHI and quality checks, plus compliance reporting
+  medical-validator data.csv --profile clinical_trials --detect-phi --quality-checks --compliance
+  
   # Custom schema validation
   medical-validator data.csv --required-columns "patient_id,age" --column-types '{"age": "int"}'
   
@@ -98,7 +114,7 @@ Available profiles:
     
     parser.add_argument(
         "file",
-        help="Path to the data file (CSV, Excel, JSON, or Parquet)"
+        help="Path to the data file (CSV, optionally .gz/.bz2/.zst compressed, Excel, JSON, Parquet, or Feather)"
     )
     
     parser.add_argument(
@@ -120,13 +136,36 @@ Available profiles:
     parser.add_argument(
         "--detect-phi",
         action="store_true",
-        help="Enable PHI/PII detection"
+        help="Enable PHI/PII detection (also a profile's own PHI checks)"
     )
     
     parser.add_argument(
         "--quality-checks",
         action="store_true",
-        help="Enable data quality checks"
+        help="Enable data quality checks (also a profile's own quality checks)"
+    )
+    
+    parser.add_argument(
+        "--compliance",
+        action="store_true",
+        help="Run the compliance engine (reads every column)"
+    )
+    
+    parser.add_argument(
+        "--analytics",
+        action="store_true",
+        help="Run the analytics engine (reads every column)"
+    )
+    
+    parser.add_argument(
+        "--scratch-cache",
+        action="store_true",
+        help="Convert the file once to a memory-mapped Arrow scratch file and reuse it on later runs"
+    )
+    
+    parser.add_argument(
+        "--scratch-dir",
+        help="Directory for scratch files (default: $MEDICAL_VALIDATOR_SCRATCH_DIR or ~/.cache/medical_data_validator/scratch)"
     )
     
     parser.add_argument(
@@ -151,18 +190,23 @@ Available profiles:
     args = parser.parse_args()
     
     try:
+        # Create validator first so the file is read with its column projection and type hints
+        validator = create_validator_from_args(args)
+        columns = validator.referenced_columns()
+        
         # Load data
         if args.verbose:
             print(f"Loading data from {args.file}...")
         
-        data = load_data(args.file)
+        dtypes = validator.column_type_hints()
+        if args.scratch_cache:
+            data = ScratchCache(args.scratch_dir).load(args.file, columns=columns, dtypes=dtypes)
+        else:
+            data = load_data(args.file, columns=columns, dtypes=dtypes)
         
         if args.verbose:
             print(f"Loaded {len(data)} rows and {len(data.columns)} columns")
         
-        # Create validator
-        validator = create_validator_from_args(args)
-        
         if args.verbose:
             print(f"Running validation with {len(validator.rules)} rules...")
         
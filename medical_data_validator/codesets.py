@@ -0,0 +1,203 @@
+"""
+Medical code-set lookup tables.
+
+A CodeSet holds the known codes of one terminology (ICD-10-CM, LOINC, CPT,
+NDC, ...) as a sorted NumPy byte-string array. Membership checks are done
+with ``np.searchsorted`` over the unique values of a column and mapped back to
+rows, so existence checks are vectorized. Code sets saved as ``.npy`` files are
+memory-mapped read-only, so every worker process shares the same pages.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .checkdigits import normalize_ndc
+
+
+def normalize_codes(values: pd.Series, code_type: str) -> pd.Series:
+    """Normalize code strings for lookup (trimmed, upper-case, ICD dots removed, NDC as 11 digits)."""
+    normalized = values.astype(str).str.strip().str.upper()
+    if code_type in ("icd10", "icd9"):
+        # CMS code files list ICD codes without the decimal point
+        normalized = normalized.str.replace(".", "", regex=False)
+    elif code_type == "ndc":
+        # Compare NDCs in any segment layout through their 11-digit form
+        normalized = normalize_ndc(normalized).fillna(normalized)
+    return normalized
+
+
+def _to_bytes(values: pd.Series) -> np.ndarray:
+    """Encode strings as a fixed-width ASCII byte array."""
+    try:
+        return np.asarray(values.tolist(), dtype="S")
+    except UnicodeEncodeError:
+        # Non-ASCII values cannot be valid codes; '?' keeps them out of the set
+        encoded = [value.encode("ascii", errors="replace") for value in values.tolist()]
+        return np.asarray(encoded, dtype="S")
+
+
+class CodeSet:
+    """
+    Sorted lookup table of the valid codes for one code type.
+
+    Codes can be given directly or loaded lazily from ``source`` on first use.
+    Supported sources are ``.npy`` files (memory-mapped), plain text files with
+    one code per line, and CSV files (first column, or ``column``).
+    """
+
+    def __init__(
+        self,
+        code_type: str,
+        codes: Optional[Iterable[str]] = None,
+        source: Optional[Union[str, Path]] = None,
+        column: Optional[str] = None,
+    ):
+        if codes is None and source is None:
+            raise ValueError("CodeSet needs either codes or a source file")
+        self.code_type = code_type
+        self.source = str(source) if source is not None else None
+        self.column = column
+        self._codes: Optional[np.ndarray] = None
+        self._fingerprint: Optional[str] = None
+        if codes is not None:
+            self._codes = self._build(pd.Series(list(codes), dtype=object))
+
+    def _build(self, values: pd.Series) -> np.ndarray:
+        """Normalize, de-duplicate and sort raw code values."""
+        values = values.dropna()
+        normalized = normalize_codes(values, self.code_type)
+        normalized = normalized[normalized != ""]
+        return np.unique(_to_bytes(normalized))
+
+    def _load(self) -> np.ndarray:
+        """Load the code table from ``source``."""
+        path = Path(self.source)
+        if path.suffix.lower() == ".npy":
+            # Saved tables are already normalized and sorted
+            return np.load(path, mmap_mode="r")
+        if path.suffix.lower() in (".csv", ".tsv"):
+            sep = "\t" if path.suffix.lower() == ".tsv" else ","
+            frame = pd.read_csv(path, sep=sep, dtype=str, usecols=[self.column] if self.column else [0])
+            return self._build(frame.iloc[:, 0])
+        with open(path, "r", encoding="utf-8") as handle:
+            lines = [line.strip() for line in handle]
+        return self._build(pd.Series(lines, dtype=object))
+
+    @property
+    def codes(self) -> np.ndarray:
+        """The sorted code array, loaded on first access."""
+        if self._codes is None:
+            self._codes = self._load()
+        return self._codes
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the code table has been loaded."""
+        return self._codes is not None
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the code table, used to version cached results."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(np.ascontiguousarray(self.codes).tobytes(), digest_size=16)
+            digest.update(self.code_type.encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def save(self, path: Union[str, Path]) -> str:
+        """Save the code table as an ``.npy`` file that later loads memory-mapped."""
+        path = Path(path)
+        if path.suffix.lower() != ".npy":
+            path = path.with_suffix(".npy")
+        np.save(path, np.ascontiguousarray(self.codes))
+        return str(path)
+
+    def contains(self, values: Union[pd.Series, List[str], np.ndarray]) -> np.ndarray:
+        """
+        Check membership for a batch of values.
+
+        Returns a boolean array aligned with ``values``. Only the unique values
+        are normalized and looked up.
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+        row_codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        if len(uniques) == 0:
+            return np.zeros(len(series), dtype=bool)
+
+        table = self.codes
+        lookup = _to_bytes(normalize_codes(pd.Series(uniques, dtype=object), self.code_type))
+        if len(table) == 0:
+            unique_found = np.zeros(len(lookup), dtype=bool)
+        else:
+            positions = np.searchsorted(table, lookup)
+            positions = np.minimum(positions, len(table) - 1)
+            unique_found = table[positions] == lookup
+
+        found = np.zeros(len(series), dtype=bool)
+        present = row_codes >= 0
+        found[present] = unique_found[row_codes[present]]
+        return found
+
+    def __contains__(self, code: str) -> bool:
+        return bool(self.contains([code])[0])
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class CodeSetRegistry:
+    """
+    Registry of code sets by code type.
+
+    Code sets are resolved lazily: registering a file path does not read it
+    until a validator first asks for that code type. When ``search_dir`` is set
+    (or ``MEDICAL_VALIDATOR_CODESET_DIR`` is defined), files named
+    ``<code_type>.npy``, ``.txt`` or ``.csv`` in that directory are picked up
+    automatically.
+    """
+
+    _SUFFIXES = (".npy", ".txt", ".csv", ".tsv")
+
+    def __init__(self, search_dir: Optional[str] = None):
+        self.search_dir = search_dir
+        self._code_sets: Dict[str, CodeSet] = {}
+
+    def register(self, code_type: str, code_set: Union[CodeSet, str, Path, Iterable[str]]) -> CodeSet:
+        """Register a code set, a path to one, or an iterable of codes."""
+        if not isinstance(code_set, CodeSet):
+            if isinstance(code_set, (str, Path)):
+                code_set = CodeSet(code_type, source=code_set)
+            else:
+                code_set = CodeSet(code_type, codes=code_set)
+        self._code_sets[code_type] = code_set
+        return code_set
+
+    def unregister(self, code_type: str) -> bool:
+        """Remove a registered code set."""
+        return self._code_sets.pop(code_type, None) is not None
+
+    def get(self, code_type: str) -> Optional[CodeSet]:
+        """Get the code set for ``code_type`` or None if none is configured."""
+        if code_type in self._code_sets:
+            return self._code_sets[code_type]
+
+        search_dir = self.search_dir or os.environ.get("MEDICAL_VALIDATOR_CODESET_DIR")
+        if search_dir:
+            for suffix in self._SUFFIXES:
+                candidate = Path(search_dir) / f"{code_type}{suffix}"
+                if candidate.exists():
+                    return self.register(code_type, candidate)
+        return None
+
+    def list_code_sets(self) -> List[str]:
+        """List registered code types."""
+        return list(self._code_sets.keys())
+
+
+# Global code-set registry
+codeset_registry = CodeSetRegistry()
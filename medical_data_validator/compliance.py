@@ -2,12 +2,50 @@
 Advanced Compliance Validation Engine for Medical Data Validator v1.2
 """
 
+import hashlib
+import json
+import os
 import re
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import numpy as np
 
+from .cache_store import TieredCache
+from .codesets import CodeSet, codeset_registry
+from .serialization import to_builtin
+
+# Bump when the scan logic changes so stale cached column results are ignored
+_SCAN_VERSION = 1
+
+GDPR_SENSITIVE_PATTERNS = [r'\b(race|ethnicity|religion|health|biometric|genetic|sexuality)\b']
+
+# Column-name keywords and value patterns for the medical coding checks
+MEDICAL_CODE_PATTERNS = {
+    'icd10': (('icd', 'diagnosis'), r'^[A-Z]\d{2}(?:\.\d{1,2})?$'),
+    'loinc': (('loinc', 'lab', 'test'), r'^\d{1,5}-\d$'),
+    'cpt': (('cpt', 'procedure', 'service'), r'^\d{5}$'),
+}
+
+_default_column_cache: Optional[TieredCache] = None
+
+
+def get_default_column_cache() -> TieredCache:
+    """
+    Get the process-wide column scan cache.
+
+    Set ``MEDICAL_VALIDATOR_CACHE_DB`` to a file path to back the cache with
+    SQLite so restarts and sibling workers share column results.
+    """
+    global _default_column_cache
+    if _default_column_cache is None:
+        _default_column_cache = TieredCache(
+            max_size=4096,
+            db_path=os.environ.get('MEDICAL_VALIDATOR_CACHE_DB') or None,
+            namespace='compliance_columns',
+        )
+    return _default_column_cache
+
 @dataclass
 class ComplianceViolation:
     """Represents a compliance violation."""
@@ -40,7 +78,19 @@ class CustomComplianceRule:
 class ComplianceEngine:
     """Advanced compliance validation engine for medical data."""
     
-    def __init__(self):
+    def __init__(self, column_cache: Optional[TieredCache] = None, use_column_cache: bool = True,
+                 code_sets: Optional[Dict[str, CodeSet]] = None):
+        """
+        Args:
+            column_cache: Cache for per-column scan results (defaults to the shared cache)
+            use_column_cache: Set to False to rescan every column on every call
+            code_sets: Code sets for existence checks (defaults to the global registry)
+        """
+        self.code_sets = code_sets or {}
+        if use_column_cache:
+            self.column_cache = column_cache if column_cache is not None else get_default_column_cache()
+        else:
+            self.column_cache = None
         self.hipaa_patterns = {
             'names': r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',
             'ssn': r'\d{3}-\d{2}-\d{4}',
@@ -82,13 +132,124 @@ class ComplianceEngine:
         """Clear all custom compliance rules."""
         self.custom_rules.clear()
     
+    def _active_code_sets(self) -> Dict[str, CodeSet]:
+        """Code sets used by the medical coding checks."""
+        active = {}
+        for code_type in MEDICAL_CODE_PATTERNS:
+            code_set = self.code_sets.get(code_type) or codeset_registry.get(code_type)
+            if code_set is not None:
+                active[code_type] = code_set
+        return active
+
+    def _count_invalid_codes(self, column_data: pd.Series, pattern: str,
+                             code_set: Optional[CodeSet]) -> int:
+        """Count malformed (or unknown) codes, checking each unique value once."""
+        row_codes, uniques = pd.factorize(column_data)
+        unique_values = pd.Series(uniques, dtype=object)
+        unique_invalid = ~unique_values.str.match(pattern, na=False).to_numpy(dtype=bool)
+        if code_set is not None:
+            unique_invalid |= ~code_set.contains(unique_values)
+        if not unique_invalid.any():
+            return 0
+        counts = np.bincount(row_codes[row_codes >= 0], minlength=len(uniques))
+        return int(counts[unique_invalid].sum())
+
+    def _ruleset_version(self) -> str:
+        """Fingerprint of every pattern that influences a column scan."""
+        payload = json.dumps({
+            'scan': _SCAN_VERSION,
+            'hipaa': self.hipaa_patterns,
+            'gdpr_sensitive': GDPR_SENSITIVE_PATTERNS,
+            'coding': MEDICAL_CODE_PATTERNS,
+            'code_sets': {
+                code_type: code_set.fingerprint
+                for code_type, code_set in self._active_code_sets().items()
+            },
+            'custom': [(rule.pattern, rule.field_pattern) for rule in self.custom_rules],
+        }, sort_keys=True)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _column_fingerprint(column: str, series: pd.Series) -> str:
+        """Hash a column's name, dtype and values."""
+        try:
+            row_hashes = pd.util.hash_pandas_object(series, index=False).values
+        except TypeError:
+            # Unhashable cells (lists, dicts) are hashed through their repr
+            row_hashes = pd.util.hash_pandas_object(series.astype(str), index=False).values
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+        digest.update(str(series.dtype).encode('utf-8'))
+        digest.update(str(column).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _scan_column(self, column: str, series: pd.Series) -> Dict[str, Any]:
+        """Run every pattern against one column and return the detection outcome."""
+        column_data = series.astype(str)
+        hits: Dict[str, bool] = {}
+
+        def found(pattern: str) -> bool:
+            # HIPAA and GDPR share patterns, so each one is evaluated only once
+            if pattern not in hits:
+                hits[pattern] = bool(column_data.str.contains(pattern, regex=True, na=False).any())
+            return hits[pattern]
+
+        personal_patterns = [
+            self.hipaa_patterns['names'], self.hipaa_patterns['ssn'],
+            self.hipaa_patterns['email'], self.hipaa_patterns['phone'],
+        ]
+        col_lower = str(column).lower()
+        code_sets = self._active_code_sets()
+        coding = {}
+        for code_type, (keywords, pattern) in MEDICAL_CODE_PATTERNS.items():
+            if any(keyword in col_lower for keyword in keywords):
+                coding[code_type] = self._count_invalid_codes(column_data, pattern, code_sets.get(code_type))
+            else:
+                coding[code_type] = 0
+
+        custom = [
+            index for index, rule in enumerate(self.custom_rules)
+            if (rule.field_pattern is None or re.search(rule.field_pattern, str(column), re.IGNORECASE))
+            and found(rule.pattern)
+        ]
+        return {
+            'hipaa_names': found(self.hipaa_patterns['names']),
+            'hipaa_ssn': found(self.hipaa_patterns['ssn']),
+            'gdpr_personal': [found(pattern) for pattern in personal_patterns],
+            'gdpr_sensitive': [found(pattern) for pattern in GDPR_SENSITIVE_PATTERNS],
+            'coding': coding,
+            'custom': custom,
+        }
+
+    def scan_columns(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the detection outcome for every column, reusing cached scans.
+
+        Columns are keyed by (content hash, rule-set version), so a column that
+        was already scanned under the same rules is never scanned again.
+        """
+        version = self._ruleset_version()
+        scans = {}
+        for column in df.columns:
+            series = df[column]
+            if self.column_cache is None:
+                scans[column] = self._scan_column(column, series)
+                continue
+            key = f"{self._column_fingerprint(column, series)}:{version}"
+            scan = self.column_cache.get(key)
+            if scan is None:
+                scan = self._scan_column(column, series)
+                self.column_cache.set(key, scan)
+            scans[column] = scan
+        return scans
+
     def comprehensive_compliance_validation(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Perform comprehensive compliance validation."""
+        scans = self.scan_columns(df)
+
         # HIPAA check (real)
         hipaa_violations = []
         for column in df.columns:
-            column_data = df[column].astype(str)
-            if column_data.str.contains(self.hipaa_patterns['names'], regex=True, na=False).any():
+            if scans[column]['hipaa_names']:
                 hipaa_violations.append(ComplianceViolation(
                     standard='HIPAA',
                     rule_id='PHI_NAME_DETECTED',
@@ -97,7 +258,7 @@ class ComplianceEngine:
                     message=f"Potential names detected in column '{column}'",
                     recommendation="Consider de-identification"
                 ))
-            if column_data.str.contains(self.hipaa_patterns['ssn'], regex=True, na=False).any():
+            if scans[column]['hipaa_ssn']:
                 hipaa_violations.append(ComplianceViolation(
                     standard='HIPAA',
                     rule_id='PHI_SSN_DETECTED',
@@ -115,15 +276,10 @@ class ComplianceEngine:
 
         # GDPR check (real)
         gdpr_violations = []
-        gdpr_patterns = {
-            'personal': [self.hipaa_patterns['names'], self.hipaa_patterns['ssn'], self.hipaa_patterns['email'], self.hipaa_patterns['phone']],
-            'sensitive': [r'\b(race|ethnicity|religion|health|biometric|genetic|sexuality)\b']
-        }
         for column in df.columns:
-            column_data = df[column].astype(str)
             # Personal data
-            for pattern in gdpr_patterns['personal']:
-                if column_data.str.contains(pattern, regex=True, na=False).any():
+            for hit in scans[column]['gdpr_personal']:
+                if hit:
                     gdpr_violations.append(ComplianceViolation(
                         standard='GDPR',
                         rule_id='PERSONAL_DATA_DETECTED',
@@ -133,8 +289,8 @@ class ComplianceEngine:
                         recommendation="Ensure lawful basis for processing"
                     ))
             # Sensitive data
-            for pattern in gdpr_patterns['sensitive']:
-                if column_data.str.contains(pattern, regex=True, na=False).any():
+            for hit in scans[column]['gdpr_sensitive']:
+                if hit:
                     gdpr_violations.append(ComplianceViolation(
                         standard='GDPR',
                         rule_id='SENSITIVE_DATA_DETECTED',
@@ -184,21 +340,9 @@ class ComplianceEngine:
             fda_recommendations.append("Document system validation procedures")
 
         # Medical coding checks (real)
-        icd10_pattern = r'^[A-Z]\d{2}(?:\.\d{1,2})?$'
-        loinc_pattern = r'^\d{1,5}-\d$'
-        cpt_pattern = r'^\d{5}$'
-        icd10_violations = 0
-        loinc_violations = 0
-        cpt_violations = 0
-        for column in df.columns:
-            col_lower = column.lower()
-            column_data = df[column].astype(str)
-            if 'icd' in col_lower or 'diagnosis' in col_lower:
-                icd10_violations += (~column_data.str.match(icd10_pattern, na=False)).sum()
-            if 'loinc' in col_lower or 'lab' in col_lower or 'test' in col_lower:
-                loinc_violations += (~column_data.str.match(loinc_pattern, na=False)).sum()
-            if 'cpt' in col_lower or 'procedure' in col_lower or 'service' in col_lower:
-                cpt_violations += (~column_data.str.match(cpt_pattern, na=False)).sum()
+        icd10_violations = sum(scans[column]['coding']['icd10'] for column in df.columns)
+        loinc_violations = sum(scans[column]['coding']['loinc'] for column in df.columns)
+        cpt_violations = sum(scans[column]['coding']['cpt'] for column in df.columns)
         icd10_score = max(0, 100 - icd10_violations * 10)
         loinc_score = max(0, 100 - loinc_violations * 10)
         cpt_score = max(0, 100 - cpt_violations * 10)
@@ -208,20 +352,16 @@ class ComplianceEngine:
         # Custom rules check
         custom_violations = []
         for column in df.columns:
-            column_data = df[column].astype(str)
-            for rule in self.custom_rules:
-                # Check if rule applies to this column (field_pattern)
-                if rule.field_pattern is None or re.search(rule.field_pattern, column, re.IGNORECASE):
-                    # Check if pattern matches in column data
-                    if column_data.str.contains(rule.pattern, regex=True, na=False).any():
-                        custom_violations.append(ComplianceViolation(
-                            standard='CUSTOM',
-                            rule_id=rule.name,
-                            severity=rule.severity,
-                            field=column,
-                            message=f"Custom rule '{rule.name}' violation: {rule.description}",
-                            recommendation=rule.recommendation or "Review custom compliance rule"
-                        ))
+            for index in scans[column]['custom']:
+                rule = self.custom_rules[index]
+                custom_violations.append(ComplianceViolation(
+                    standard='CUSTOM',
+                    rule_id=rule.name,
+                    severity=rule.severity,
+                    field=column,
+                    message=f"Custom rule '{rule.name}' violation: {rule.description}",
+                    recommendation=rule.recommendation or "Review custom compliance rule"
+                ))
         
         # Aggregate all violations
         all_violations = [
@@ -243,20 +383,6 @@ class ComplianceEngine:
         overall_score = sum(scores) / len(scores)
         overall_risk = 'low' if overall_score >= 90 else 'medium' if overall_score >= 70 else 'high' if overall_score >= 50 else 'critical'
         
-        # Convert all numpy types to native Python types
-        def convert_numpy_types(obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, dict):
-                return {k: convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(item) for item in obj]
-            return obj
-        
         # Convert ComplianceViolation objects to dictionaries
         def violation_to_dict(violation):
             return {
@@ -281,7 +407,7 @@ class ComplianceEngine:
         report = {
             'standards': {
                 'hipaa': {
-                    'score': convert_numpy_types(hipaa_score),
+                    'score': to_builtin(hipaa_score),
                     'risk_level': hipaa_risk,
                     'violations': hipaa_violations_dict,
                     'violations_count': len(hipaa_violations),
@@ -289,7 +415,7 @@ class ComplianceEngine:
                     'compliant': len(hipaa_violations) == 0
                 },
                 'gdpr': {
-                    'score': convert_numpy_types(gdpr_score),
+                    'score': to_builtin(gdpr_score),
                     'risk_level': gdpr_risk,
                     'violations': gdpr_violations_dict,
                     'violations_count': len(gdpr_violations),
@@ -297,7 +423,7 @@ class ComplianceEngine:
                     'compliant': len(gdpr_violations) == 0
                 },
                 'fda': {
-                    'score': convert_numpy_types(fda_score),
+                    'score': to_builtin(fda_score),
                     'risk_level': fda_risk,
                     'violations': fda_violations_dict,
                     'violations_count': len(fda_violations),
@@ -305,32 +431,32 @@ class ComplianceEngine:
                     'compliant': len(fda_violations) == 0
                 },
                 'medical_coding': {
-                    'icd10_score': convert_numpy_types(icd10_score),
-                    'loinc_score': convert_numpy_types(loinc_score),
-                    'cpt_score': convert_numpy_types(cpt_score),
+                    'icd10_score': to_builtin(icd10_score),
+                    'loinc_score': to_builtin(loinc_score),
+                    'cpt_score': to_builtin(cpt_score),
                     'icd10': {
-                        'score': convert_numpy_types(icd10_score),
+                        'score': to_builtin(icd10_score),
                         'risk_level': icd10_risk,
-                        'violations_count': convert_numpy_types(icd10_violations),
-                        'compliant': convert_numpy_types(icd10_violations) == 0
+                        'violations_count': to_builtin(icd10_violations),
+                        'compliant': to_builtin(icd10_violations) == 0
                     },
                     'loinc': {
-                        'score': convert_numpy_types(loinc_score),
+                        'score': to_builtin(loinc_score),
                         'risk_level': loinc_risk,
-                        'violations_count': convert_numpy_types(loinc_violations),
-                        'compliant': convert_numpy_types(loinc_violations) == 0
+                        'violations_count': to_builtin(loinc_violations),
+                        'compliant': to_builtin(loinc_violations) == 0
                     },
                     'cpt': {
-                        'score': convert_numpy_types(cpt_score),
+                        'score': to_builtin(cpt_score),
                         'risk_level': cpt_risk,
-                        'violations_count': convert_numpy_types(cpt_violations),
-                        'compliant': convert_numpy_types(cpt_violations) == 0
+                        'violations_count': to_builtin(cpt_violations),
+                        'compliant': to_builtin(cpt_violations) == 0
                     }
                 }
             },
             'template_applied': getattr(self, 'template_applied', None),
             'all_violations': all_violations_dict,
-            'overall_score': convert_numpy_types(overall_score),
+            'overall_score': to_builtin(overall_score),
             'risk_level': overall_risk
         }
         
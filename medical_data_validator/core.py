@@ -11,6 +11,9 @@ from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 from pydantic import BaseModel
 
+from .backends import arrow_summary, to_arrow_table
+from .dates import date_parsing_session
+
 # Import compliance engine for v1.2
 try:
     from .compliance import ComplianceEngine
@@ -99,6 +102,41 @@ class ValidationRule(BaseModel):
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         """Validate the data and return a list of issues."""
         raise NotImplementedError("Subclasses must implement validate()")
+    
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        """
+        Validate a pyarrow Table.
+        
+        Rules with a native Arrow implementation override this; the default
+        converts the table to pandas and calls validate().
+        """
+        return self.validate(table.to_pandas())
+    
+    def referenced_columns(self) -> Optional[List[str]]:
+        """
+        Columns whose values this rule reads, or None if it may read any column.
+        
+        Used to load only the needed columns of columnar files. Checks that
+        look only at column names do not count; loaders keep the full list of
+        names in ``data.attrs["source_columns"]``.
+        """
+        return None
+    
+    def column_type_hints(self) -> Dict[str, str]:
+        """Expected types (``column_types`` aliases) this rule declares for columns."""
+        return {}
+    
+    def is_row_local(self) -> bool:
+        """
+        Whether every issue this rule reports belongs to one row and depends
+        only on that row's values.
+        
+        Such rules find the same issues in a concatenation of datasets as in
+        each dataset alone, which lets ``BatchValidator.validate_datasets``
+        run them once over many datasets. Rules that count, cap, compare rows
+        or report column-level findings must return False.
+        """
+        return False
 
 
 class MedicalDataValidator:
@@ -159,6 +197,30 @@ class MedicalDataValidator:
         """Add a custom validator function."""
         self._validators[name] = validator
     
+    def referenced_columns(self) -> Optional[List[str]]:
+        """
+        Columns the configured rules read, or None if every column is needed.
+        
+        Custom validators and the compliance and analytics engines may read
+        any column, so enabling them disables projection.
+        """
+        if self._validators or self.compliance_engine is not None or self.analytics_engine is not None:
+            return None
+        columns: List[str] = []
+        for rule in self.rules:
+            rule_columns = rule.referenced_columns()
+            if rule_columns is None:
+                return None
+            columns.extend(column for column in rule_columns if column not in columns)
+        return columns
+    
+    def column_type_hints(self) -> Dict[str, str]:
+        """Expected column types declared by the rules, used as load hints."""
+        hints: Dict[str, str] = {}
+        for rule in self.rules:
+            hints.update(rule.column_type_hints())
+        return hints
+    
     def add_custom_compliance_rule(self, name: str, pattern: str, severity: str = 'medium', 
                                   field_pattern: Optional[str] = None, description: str = "", 
                                   recommendation: Optional[str] = None) -> None:
@@ -195,13 +257,14 @@ class MedicalDataValidator:
             return template_manager.list_templates()
         return {}
     
-    def validate(self, data: Union[pd.DataFrame, Dict[str, List], List[Dict]]) -> ValidationResult:
+    def validate(self, data: Union[pd.DataFrame, Dict[str, List], List[Dict], Any]) -> ValidationResult:
         """
         Validate the provided data against all configured rules.
         
         Args:
             data: Data to validate. Can be a pandas DataFrame, dictionary of lists,
-                  or list of dictionaries.
+                  list of dictionaries, pyarrow Table or Polars DataFrame. Arrow
+                  and Polars data run through the rules' Arrow implementations.
         
         Returns:
             ValidationResult containing validation issues and summary
@@ -209,7 +272,9 @@ class MedicalDataValidator:
         import time
         start_time = time.time()
         
-        # Convert data to DataFrame if needed
+        # Convert data to DataFrame if needed; Arrow/Polars data stays in Arrow
+        table = None
+        df = None
         if isinstance(data, dict):
             df = pd.DataFrame(data)
         elif isinstance(data, list):
@@ -217,50 +282,71 @@ class MedicalDataValidator:
         elif isinstance(data, pd.DataFrame):
             df = data
         else:
-            raise ValueError("Data must be a pandas DataFrame, dict, or list")
+            table = to_arrow_table(data)
+            if table is None:
+                raise ValueError("Data must be a pandas DataFrame, pyarrow Table, dict, or list")
+        
+        def as_frame() -> pd.DataFrame:
+            # Only materialized for consumers without an Arrow implementation
+            nonlocal df
+            if df is None:
+                df = table.to_pandas()
+            return df
         
         # Initialize result
         result = ValidationResult(is_valid=True)
         
-        # Run all validation rules
-        for rule in self.rules:
-            try:
-                issues = rule.validate(df)
-                for issue in issues:
-                    result.add_issue(issue)
-            except Exception as e:
-                # Add error for rule failure
-                error_issue = ValidationIssue(
-                    severity="error",
-                    message=f"Rule '{rule.name}' failed: {str(e)}",
-                    rule_name=rule.name,
-                )
-                result.add_issue(error_issue)
+        # Parsed date columns are shared by every rule in this run
+        with date_parsing_session():
+            # Run all validation rules
+            for rule in self.rules:
+                try:
+                    if table is not None and type(rule).validate_arrow is not ValidationRule.validate_arrow:
+                        issues = rule.validate_arrow(table)
+                    else:
+                        issues = rule.validate(as_frame())
+                    for issue in issues:
+                        result.add_issue(issue)
+                except Exception as e:
+                    # Add error for rule failure
+                    error_issue = ValidationIssue(
+                        severity="error",
+                        message=f"Rule '{rule.name}' failed: {str(e)}",
+                        rule_name=rule.name,
+                    )
+                    result.add_issue(error_issue)
         
-        # Run custom validators
-        for name, validator in self._validators.items():
-            try:
-                if callable(validator):
-                    validator_result = validator(df)
-                    if isinstance(validator_result, list):
-                        for issue in validator_result:
-                            result.add_issue(issue)
-                    elif isinstance(validator_result, ValidationIssue):
-                        result.add_issue(validator_result)
-            except Exception as e:
-                error_issue = ValidationIssue(
-                    severity="error",
-                    message=f"Custom validator '{name}' failed: {str(e)}",
-                )
-                result.add_issue(error_issue)
+            # Run custom validators
+            for name, validator in self._validators.items():
+                try:
+                    if callable(validator):
+                        validator_result = validator(as_frame())
+                        if isinstance(validator_result, list):
+                            for issue in validator_result:
+                                result.add_issue(issue)
+                        elif isinstance(validator_result, ValidationIssue):
+                            result.add_issue(validator_result)
+                except Exception as e:
+                    error_issue = ValidationIssue(
+                        severity="error",
+                        message=f"Custom validator '{name}' failed: {str(e)}",
+                    )
+                    result.add_issue(error_issue)
         
         # Generate summary
-        result.summary = self._generate_summary(df, result)
+        if table is not None:
+            result.summary = {
+                **arrow_summary(table),
+                "validation_rules_applied": len(self.rules),
+                "custom_validators_applied": len(self._validators),
+            }
+        else:
+            result.summary = self._generate_summary(df, result)
         
         # Add compliance validation if enabled (v1.2)
         if self.compliance_engine is not None:
             try:
-                compliance_report = self.compliance_engine.comprehensive_compliance_validation(df)
+                compliance_report = self.compliance_engine.comprehensive_compliance_validation(as_frame())
                 result.summary['compliance_report'] = compliance_report
             except Exception as e:
                 # Add compliance validation error
@@ -274,7 +360,7 @@ class MedicalDataValidator:
         # Add analytics if enabled (v1.2)
         if self.analytics_engine is not None:
             try:
-                analytics_report = self.analytics_engine.comprehensive_analysis(df)
+                analytics_report = self.analytics_engine.comprehensive_analysis(as_frame())
                 result.summary['analytics_report'] = analytics_report
             except Exception as e:
                 # Add analytics error
@@ -7,7 +7,6 @@ A web-based interface for validating medical datasets with interactive visualiza
 import os
 import tempfile
 import traceback
-from pathlib import Path
 from typing import Dict, Any, Optional
 import json
 
@@ -27,6 +26,7 @@ from .validators import (
     MedicalCodeValidator, RangeValidator, DateValidator
 )
 from .extensions import get_profile
+from .loaders import load_file
 
 
 class ValidationDashboard:
@@ -139,18 +139,7 @@ class ValidationDashboard:
     
     def load_data(self, file_path: str) -> pd.DataFrame:
         """Load data from file."""
-        path = Path(file_path)
-        
-        if path.suffix.lower() == '.csv':
-            return pd.read_csv(file_path)
-        elif path.suffix.lower() in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path)
-        elif path.suffix.lower() == '.json':
-            return pd.read_json(file_path)
-        elif path.suffix.lower() == '.parquet':
-            return pd.read_parquet(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {path.suffix}")
+        return load_file(file_path)
     
     def create_validator(self, detect_phi: bool, quality_checks: bool, profile: str) -> MedicalDataValidator:
         """Create validator based on options."""
@@ -18,16 +18,29 @@ from werkzeug.exceptions import HTTPException
 try:
     from medical_data_validator.dashboard.routes import register_routes
     from medical_data_validator.dashboard.dash_layout import setup_dash_layout, setup_dash_callbacks
+    from medical_data_validator.dashboard.json_provider import FastJSONProvider
+    from medical_data_validator.dashboard.compression import (
+        DEFAULT_COMPRESS_MIN_SIZE, DecompressMiddleware, compress_response,
+    )
 except ImportError:
     # Fallback for relative imports when used as package
     from .routes import register_routes
     from .dash_layout import setup_dash_layout, setup_dash_callbacks
+    from .json_provider import FastJSONProvider
+    from .compression import DEFAULT_COMPRESS_MIN_SIZE, DecompressMiddleware, compress_response
 
 
 def create_dashboard_app():
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'dev-secret-key'
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+    app.json = FastJSONProvider(app)
+    # gzip/zstd request bodies are decoded as they are read
+    app.wsgi_app = DecompressMiddleware(app.wsgi_app, app.config)
+
+    @app.after_request
+    def compress(response):
+        return compress_response(response, app.config.get('COMPRESS_MIN_SIZE', DEFAULT_COMPRESS_MIN_SIZE))
 
     # Register Flask routes
     register_routes(app)
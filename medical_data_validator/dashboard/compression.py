@@ -0,0 +1,189 @@
+"""
+Compressed request and response bodies for the REST API.
+
+Uploads may be sent with ``Content-Encoding: gzip`` (or ``zstd`` when the
+``zstandard`` package is installed). ``DecompressMiddleware`` decodes them
+as they are read, so the endpoints and upload parsers see plain bytes and
+still stream. The decoded size is capped (by ``MAX_UPLOAD_BYTES`` and by the
+request's own body limit), so a small compressed body cannot expand into an
+unbounded one; exceeding the cap is a 413 like any oversized upload.
+
+Responses are compressed for clients that send ``Accept-Encoding``.
+Streamed NDJSON responses are compressed record by record and flushed, so
+clients still receive each record as soon as it is produced. Compressed
+responses keep their ETag as a weak validator.
+"""
+
+import gzip
+import io
+import zlib
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Mapping, Optional
+
+from flask import Response, request
+from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.wsgi import get_input_stream
+
+from .uploads import DEFAULT_MAX_UPLOAD_BYTES
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Responses smaller than this are sent uncompressed
+DEFAULT_COMPRESS_MIN_SIZE = 1024
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+COMPRESSIBLE_MIMETYPES = {"application/json", "application/x-ndjson", "text/csv"}
+
+
+def _gzip_reader(stream: IO[bytes]) -> IO[bytes]:
+    return gzip.GzipFile(fileobj=stream, mode="rb")
+
+
+def _zstd_reader(stream: IO[bytes]) -> IO[bytes]:
+    return zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True)
+
+
+def request_decoders() -> Dict[str, Callable[[IO[bytes]], IO[bytes]]]:
+    """Decoding stream wrappers by ``Content-Encoding`` this server accepts."""
+    decoders = {"gzip": _gzip_reader, "x-gzip": _gzip_reader}
+    if zstandard is not None:
+        decoders["zstd"] = _zstd_reader
+    return decoders
+
+
+def response_encodings() -> List[str]:
+    """Response encodings this server offers, most preferred first."""
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+class DecodedStream(io.RawIOBase):
+    """
+    Decoded request body that raises 413 once it passes its limit.
+
+    The limit is the smaller of ``max_bytes`` and the body limit of the
+    request being served, looked up when read, since endpoints may raise
+    their own limit first. Reaching the limit exactly peeks one more byte:
+    werkzeug's ``LimitedStream`` stops reading there without complaint, so
+    an oversized body would otherwise arrive silently truncated.
+
+    Args:
+        stream: Decoding stream over the raw body
+        max_bytes: Decoded size cap
+        environ: WSGI environ of the request
+    """
+
+    def __init__(self, stream: IO[bytes], max_bytes: int, environ: Dict[str, Any]):
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._environ = environ
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def limit(self) -> int:
+        """The decoded size allowed for the current request."""
+        req = self._environ.get("werkzeug.request")
+        request_limit = getattr(req, "max_content_length", None)
+        if request_limit is None:
+            return self._max_bytes
+        return min(self._max_bytes, request_limit)
+
+    def readinto(self, buffer: Any) -> int:
+        limit = self.limit()
+        data = self._stream.read(len(buffer))
+        self._pos += len(data)
+        if self._pos > limit or (data and self._pos == limit and self._stream.read(1)):
+            raise RequestEntityTooLarge()
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class DecompressMiddleware:
+    """
+    WSGI middleware decoding compressed request bodies.
+
+    Args:
+        app: WSGI application to wrap
+        config: Mapping read for ``MAX_UPLOAD_BYTES`` on each request
+    """
+
+    def __init__(self, app: Callable, config: Optional[Mapping[str, Any]] = None):
+        self.app = app
+        self.config = config if config is not None else {}
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding in ("", "identity"):
+            return self.app(environ, start_response)
+
+        decoder = request_decoders().get(encoding)
+        if decoder is None:
+            error = UnsupportedMediaType(f"Unsupported Content-Encoding: {encoding}")
+            return error(environ, start_response)
+
+        max_bytes = self.config.get("MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES)
+        body = get_input_stream(environ, safe_fallback=False)
+        environ["wsgi.input"] = DecodedStream(decoder(body), max_bytes, environ)
+        # The decoded length is unknown; the stream now ends itself
+        environ["wsgi.input_terminated"] = True
+        environ.pop("CONTENT_LENGTH", None)
+        del environ["HTTP_CONTENT_ENCODING"]
+        return self.app(environ, start_response)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress a streamed body, flushing after every chunk."""
+    if encoding == "zstd":
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        flush_mode = zlib.Z_SYNC_FLUSH
+    try:
+        for chunk in chunks:
+            if chunk:
+                yield compressor.compress(chunk) + compressor.flush(flush_mode)
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def compress_response(response: Response, min_size: int = DEFAULT_COMPRESS_MIN_SIZE) -> Response:
+    """Compress ``response`` for the current request's ``Accept-Encoding``, if worthwhile."""
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or response.status_code in (204, 304):
+        return response
+    response.vary.add("Accept-Encoding")
+    if "Content-Encoding" in response.headers or response.direct_passthrough:
+        return response
+    encoding = request.accept_encodings.best_match(response_encodings())
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_chunks(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        response.set_data(_compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+
+    # The compressed bytes differ, so the ETag only holds weakly
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,327 @@
+"""
+Asynchronous validation jobs for the REST API.
+
+Large uploads are validated outside the request: ``POST /api/jobs`` stores
+the upload, records a job in a local SQLite database and hands it to a
+bounded process pool; ``GET /api/jobs/<id>`` reads the job's status,
+progress and result back from the database. Workers write progress to the
+same database, so status reads never wait for a running validation and no
+outside queue or broker is needed.
+
+Set ``JOB_DIR`` in the Flask config (or ``MEDICAL_VALIDATOR_JOB_DIR``) to
+choose where the database and uploads live and ``JOB_WORKERS`` to size the
+pool. Jobs left queued or running when the last server using a job
+directory stopped are marked failed when the next one starts. Finished jobs
+and their issues are deleted ``JOB_RETENTION_SECONDS`` after they finish
+(a day by default); the sweep runs whenever a job is submitted.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Union
+
+import pandas as pd
+
+from ..serialization import dumps, loads
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+JOB_KINDS = ("validate", "compliance", "analytics")
+
+# Rows per batch for validation jobs; each finished batch updates progress
+JOB_BATCH_SIZE = 50000
+
+# Seconds a finished job is kept before it is deleted
+DEFAULT_JOB_RETENTION_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    file_path TEXT,
+    params TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS job_issues (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    issue TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+def default_job_dir() -> Path:
+    """Job directory from ``MEDICAL_VALIDATOR_JOB_DIR`` or the system temp dir."""
+    configured = os.environ.get("MEDICAL_VALIDATOR_JOB_DIR")
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "medical_validator_jobs"
+
+
+def _now() -> str:
+    return pd.Timestamp.now().isoformat()
+
+
+class JobStore:
+    """
+    SQLite-backed job records shared by the web process and the workers.
+
+    Every call opens its own connection, so a store can be used from any
+    thread or process.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def create(self, kind: str, file_path: Optional[str], params: Dict[str, Any]) -> str:
+        """Record a queued job and return its id."""
+        job_id = uuid.uuid4().hex
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, kind, status, file_path, params, created_at) VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, file_path, json.dumps(params), _now()),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job record, with params and result decoded, or None."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = loads(job["result"]) if job["result"] is not None else None
+        return job
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as connection:
+            connection.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def start(self, job_id: str) -> None:
+        self._update(job_id, status="running", started_at=_now())
+
+    def set_progress(self, job_id: str, progress: float) -> None:
+        self._update(job_id, progress=round(min(max(progress, 0.0), 1.0), 4))
+
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Store a job's result; an ``issues`` list is stored row by row for paging."""
+        result = dict(result)
+        issues = result.pop("issues", None)
+        if issues is not None:
+            result["issues_count"] = len(issues)
+            with self._connect() as connection:
+                connection.executemany(
+                    "INSERT INTO job_issues (job_id, seq, issue) VALUES (?, ?, ?)",
+                    ((job_id, seq, dumps(issue)) for seq, issue in enumerate(issues)),
+                )
+        self._update(
+            job_id, status="completed", progress=1.0, finished_at=_now(),
+            result=dumps(result),
+        )
+
+    def issues(self, job_id: str, cursor: int = 0, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        A job's stored issues from position ``cursor`` on, at most ``limit``.
+
+        Rows are read lazily, so iterating over every issue of a large
+        result does not load them all at once.
+        """
+        query = "SELECT issue FROM job_issues WHERE job_id = ? AND seq >= ? ORDER BY seq"
+        args: tuple = (job_id, cursor)
+        if limit is not None:
+            query += " LIMIT ?"
+            args += (limit,)
+        with self._connect() as connection:
+            for (issue,) in connection.execute(query, args):
+                yield loads(issue)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._update(job_id, status="failed", finished_at=_now(), error=error)
+
+    def fail_unfinished(self, error: str = "Interrupted by a server restart") -> int:
+        """Mark jobs left queued or running by a previous server as failed."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE status IN ('queued', 'running')",
+                (error, _now()),
+            )
+            return cursor.rowcount
+
+    def purge_finished(self, older_than: float) -> int:
+        """Delete jobs finished more than ``older_than`` seconds ago, with their issues."""
+        cutoff = (pd.Timestamp.now() - pd.Timedelta(seconds=older_than)).isoformat()
+        with self._connect() as connection:
+            expired = "SELECT id FROM jobs WHERE status IN ('completed', 'failed') AND finished_at < ?"
+            connection.execute(f"DELETE FROM job_issues WHERE job_id IN ({expired})", (cutoff,))
+            cursor = connection.execute(f"DELETE FROM jobs WHERE id IN ({expired})", (cutoff,))
+            return cursor.rowcount
+
+
+def _run_validate(data: pd.DataFrame, params: Dict[str, Any], progress: Callable[[float], None]) -> Dict[str, Any]:
+    from ..performance import BatchValidator
+    from .routes import build_file_validation_response, create_validator, scan_phi_values
+
+    validator = create_validator(params.get("detect_phi", True), params.get("quality_checks", True), params.get("profile", ""))
+    batch_validator = BatchValidator(validator, batch_size=params.get("batch_size", JOB_BATCH_SIZE))
+    result = batch_validator.validate_batches(data, progress_callback=lambda done, total: progress(0.1 + 0.8 * done / total))
+    return build_file_validation_response(result, params.get("standards") or ["icd10", "loinc", "cpt"], scan_phi_values(data))
+
+
+def _run_compliance(data: pd.DataFrame, params: Dict[str, Any], progress: Callable[[float], None]) -> Dict[str, Any]:
+    from .routes import apply_custom_rules, create_validator, flatten_v1_2_compliance_report
+
+    validator = create_validator(
+        detect_phi=True, quality_checks=True, profile='', enable_compliance=True, template=params.get("template")
+    )
+    apply_custom_rules(validator, params.get("custom_rules", []))
+    result = validator.validate(data)
+    return {
+        "success": True,
+        "message": "v1.2 Advanced Compliance Validation Complete",
+        "compliance_report": flatten_v1_2_compliance_report(result.summary.get('compliance_report', {})),
+    }
+
+
+def _run_analytics(data: pd.DataFrame, params: Dict[str, Any], progress: Callable[[float], None]) -> Dict[str, Any]:
+    from ..analytics import AdvancedAnalytics
+    from .routes import build_analytics_response
+
+    report = AdvancedAnalytics().comprehensive_analysis(data, params.get("time_column"))
+    return build_analytics_response(report)
+
+
+_RUNNERS = {
+    "validate": _run_validate,
+    "compliance": _run_compliance,
+    "analytics": _run_analytics,
+}
+
+
+def run_job(db_path: str, job_id: str) -> None:
+    """Run one job in a worker process, recording progress and the outcome."""
+    from .utils import load_data
+
+    store = JobStore(db_path)
+    job = store.get(job_id)
+    if job is None:
+        return
+    store.start(job_id)
+    try:
+        data = load_data(job["file_path"])
+        store.set_progress(job_id, 0.1)
+        result = _RUNNERS[job["kind"]](data, job["params"], lambda value: store.set_progress(job_id, value))
+        store.complete(job_id, result)
+    except Exception as e:
+        store.fail(job_id, f"{type(e).__name__}: {e}")
+    finally:
+        try:
+            os.unlink(job["file_path"])
+        except OSError:
+            pass
+
+
+class JobManager:
+    """
+    Queues jobs in a ``JobStore`` and runs them in a bounded process pool.
+
+    Args:
+        job_dir: Directory for the job database and stored uploads
+        max_workers: Worker processes; defaults to two or the CPU count if lower
+        retention_seconds: How long finished jobs are kept
+    """
+
+    def __init__(self, job_dir: Optional[Union[str, Path]] = None, max_workers: Optional[int] = None,
+                 retention_seconds: Optional[float] = None):
+        self.job_dir = Path(job_dir) if job_dir is not None else default_job_dir()
+        self.upload_dir = self.job_dir / "uploads"
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.store = JobStore(self.job_dir / "jobs.sqlite3")
+        self.max_workers = max_workers or min(2, os.cpu_count() or 1)
+        self.retention_seconds = (
+            retention_seconds if retention_seconds is not None else DEFAULT_JOB_RETENTION_SECONDS
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._dir_lock = self._recover()
+
+    def _recover(self) -> Optional[IO[str]]:
+        """
+        Fail the jobs a previous server left unfinished.
+
+        Every manager holds a shared lock on the job directory while it
+        lives. Only a manager that finds no other holder fails queued and
+        running jobs, so a restarted gunicorn worker leaves its siblings'
+        jobs alone. Without ``fcntl`` every manager recovers.
+        """
+        if fcntl is None:
+            self.store.fail_unfinished()
+            return None
+        handle = open(self.job_dir / "server.lock", "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            pass
+        else:
+            self.store.fail_unfinished()
+        fcntl.flock(handle, fcntl.LOCK_SH)
+        return handle
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def upload_path(self, suffix: str) -> str:
+        """A new file path for a stored upload."""
+        handle, path = tempfile.mkstemp(dir=self.upload_dir, suffix=suffix)
+        os.close(handle)
+        return path
+
+    def submit(self, kind: str, file_path: str, params: Dict[str, Any]) -> str:
+        """Queue a job on a stored file and return its id."""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self.store.purge_finished(self.retention_seconds)
+        job_id = self.store.create(kind, file_path, params)
+        self.pool.submit(run_job, self.store.db_path, job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
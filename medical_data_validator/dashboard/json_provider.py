@@ -0,0 +1,39 @@
+"""
+Flask JSON provider backed by the package serializer.
+"""
+
+import json
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+from ..serialization import default, dumps, dumps_bytes, loads
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    ``jsonify`` through ``medical_data_validator.serialization``.
+
+    NumPy, pandas and date values are encoded directly, so views can return
+    validation results without converting them first. Keys are sorted like
+    Flask's default provider, and responses are indented in debug mode
+    unless ``compact`` is set. Install with ``app.json = FastJSONProvider(app)``.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.keys() - {"sort_keys", "indent"}:
+            kwargs.setdefault("default", default)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj, sort_keys=kwargs.get("sort_keys", self.sort_keys), indent=kwargs.get("indent"))
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if self.compact is False or (self.compact is None and self._app.debug) else None
+        return self._app.response_class(
+            dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent) + b"\n", mimetype=self.mimetype
+        )
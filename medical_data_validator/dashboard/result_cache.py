@@ -0,0 +1,136 @@
+"""
+Content-addressed caching of file validation results.
+
+Re-validating the same file with the same options gives the same result, so
+``/api/validate/file`` keys finished results by a SHA-256 of the uploaded
+bytes plus the validator configuration. The key doubles as the response's
+strong ETag: a client that sends it back in ``If-None-Match`` gets a 304
+without a response body, and a repeated upload is answered from the cache
+without parsing or validating it again.
+
+Uploads are hashed as they are read. Multipart files are already spooled by
+werkzeug, and small raw bodies are buffered in memory, so both are hashed
+before validation and can be answered from the cache. Large raw bodies are
+streamed into validation through ``HashingReader`` and their result is
+stored afterwards, for the next upload of the same file.
+
+Results live in a ``TieredCache``: an LRU per worker backed, when
+``RESULT_CACHE_DB`` (or ``MEDICAL_VALIDATOR_CACHE_DB``) is set, by a SQLite
+file that all gunicorn workers share. That file outlives the process, so
+keys also cover ``validation_version()``: the package and scan versions and
+the code tables in use, so upgrades and new code sets are never answered
+with stale results.
+"""
+
+import hashlib
+import io
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+from .. import __version__
+from ..codesets import codeset_registry
+from ..compliance import _SCAN_VERSION
+from ..serialization import dumps_bytes
+
+# Read size when hashing a seekable upload
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Raw bodies up to this size are buffered so they can be looked up before validation
+DEFAULT_CACHE_BUFFER_BYTES = 8 * 1024 * 1024
+
+# Code types whose registered tables change validation results
+CODE_SET_TYPES = ("icd10", "icd9", "loinc", "cpt", "ndc", "npi")
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Read-only stream that hashes everything read through it.
+
+    Args:
+        stream: Binary stream to read from
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.hash = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.stream.read(len(buffer))
+        buffer[:len(data)] = data
+        self.hash.update(data)
+        return len(data)
+
+    def hexdigest(self) -> str:
+        """SHA-256 of the bytes read so far."""
+        return self.hash.hexdigest()
+
+
+def hash_stream(stream: IO[bytes]) -> str:
+    """SHA-256 of a seekable stream's contents, leaving it rewound."""
+    digest = hashlib.sha256()
+    for chunk in _chunks(stream):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _chunks(stream: IO[bytes]) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(_HASH_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def validation_version(validator: Any = None) -> Dict[str, Any]:
+    """Package, scan and code-table versions that a validation result depends on."""
+    code_sets = {}
+    for code_type in CODE_SET_TYPES:
+        code_set = codeset_registry.get(code_type)
+        if code_set is not None:
+            code_sets[code_type] = code_set.fingerprint
+    for rule in getattr(validator, "rules", []):
+        for code_type, code_set in (getattr(rule, "code_sets", None) or {}).items():
+            code_sets[f"{rule.name}:{code_type}"] = code_set.fingerprint
+
+    version = {"package": __version__, "scan": _SCAN_VERSION, "code_sets": code_sets}
+    engine = getattr(validator, "compliance_engine", None)
+    if engine is not None:
+        version["compliance"] = engine._ruleset_version()
+    return version
+
+
+def result_key(content_hash: str, *options: Any) -> str:
+    """Cache key and ETag for a result: the content hash plus everything that shaped it."""
+    digest = hashlib.sha256(content_hash.encode())
+    digest.update(dumps_bytes(options))
+    return digest.hexdigest()[:40]
+
+
+def hashed_upload(stream: IO[bytes], content_length: Optional[int],
+                  buffer_limit: int = DEFAULT_CACHE_BUFFER_BYTES
+                  ) -> Tuple[IO[bytes], Optional[str], Optional[HashingReader]]:
+    """
+    Prepare an upload for hashing as ``(stream, content_hash, reader)``.
+
+    ``content_hash`` is set when it is known before validation: for seekable
+    uploads and for raw bodies of at most ``buffer_limit`` bytes, which are
+    buffered in memory. Otherwise ``stream`` reads through ``reader``, which
+    has the hash once the stream has been consumed.
+    """
+    if _seekable(stream):
+        return stream, hash_stream(stream), None
+    if content_length is not None and content_length <= buffer_limit:
+        buffered = io.BytesIO(stream.read())
+        return buffered, hash_stream(buffered), None
+    reader = HashingReader(stream)
+    return io.BufferedReader(reader, _HASH_CHUNK_SIZE), None, reader
+
+
+def _seekable(stream: IO[bytes]) -> bool:
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, ValueError):
+        return False
@@ -5,14 +5,14 @@ This module provides both UI routes (HTML pages) and API routes (JSON endpoints)
 for the unified Flask application.
 """
 
+import io
 import os
-import tempfile
 import traceback
+from dataclasses import asdict
 from pathlib import Path
 from flask import render_template, request, jsonify, Blueprint, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 import pandas as pd
-import numpy as np
-import json
 from typing import Dict, List, Optional, Any
 
 import sys
@@ -27,63 +27,95 @@ try:
     from medical_data_validator.core import MedicalDataValidator, ValidationResult
     from medical_data_validator.validators import PHIDetector, DataQualityChecker, MedicalCodeValidator
     from medical_data_validator.extensions import get_profile
-    from medical_data_validator.dashboard.utils import load_data, generate_charts
+    from medical_data_validator.dashboard.utils import generate_charts
+    from medical_data_validator.excel import read_excel
+    from medical_data_validator.dashboard.jobs import JOB_KINDS, JobManager
+    from medical_data_validator.dashboard.uploads import (
+        DEFAULT_MAX_UPLOAD_BYTES, RAW_UPLOAD_TYPES, UPLOAD_FORMATS,
+        iter_upload_batches, read_upload, upload_format,
+    )
+    from medical_data_validator.performance import BatchValidator
+    from medical_data_validator.serialization import loads, to_builtin
+    from medical_data_validator.dashboard.validator_pool import (
+        ValidatorConfig, ValidatorPool, default_configs, freeze_rules, thaw_rules,
+    )
+    from medical_data_validator.extensions import list_available_profiles
+    from medical_data_validator.compliance_templates import template_manager
+    from medical_data_validator.dashboard.streaming import chunk_records, ndjson_response, wants_ndjson
+    from medical_data_validator.dashboard.result_cache import (
+        DEFAULT_CACHE_BUFFER_BYTES, hashed_upload, result_key, validation_version
+    )
+    from medical_data_validator.cache_store import TieredCache
 except ImportError:
     # Fallback for relative imports when used as package
     from ..core import MedicalDataValidator, ValidationResult
     from ..validators import PHIDetector, DataQualityChecker, MedicalCodeValidator
     from ..extensions import get_profile
-    from .utils import load_data, generate_charts
+    from .utils import generate_charts
+    from ..excel import read_excel
+    from .jobs import JOB_KINDS, JobManager
+    from .uploads import (
+        DEFAULT_MAX_UPLOAD_BYTES, RAW_UPLOAD_TYPES, UPLOAD_FORMATS,
+        iter_upload_batches, read_upload, upload_format,
+    )
+    from ..performance import BatchValidator
+    from ..serialization import loads, to_builtin
+    from .validator_pool import ValidatorConfig, ValidatorPool, default_configs, freeze_rules, thaw_rules
+    from ..extensions import list_available_profiles
+    from ..compliance_templates import template_manager
+    from .streaming import chunk_records, ndjson_response, wants_ndjson
+    from .result_cache import (
+        DEFAULT_CACHE_BUFFER_BYTES, hashed_upload, result_key, validation_version
+    )
+    from ..cache_store import TieredCache
 
 def convert_numpy_types(obj):
     """Convert numpy types to native Python types for JSON serialization."""
-    try:
-        print(f"convert_numpy_types called with: {type(obj)} - {obj}")
-        
-        if isinstance(obj, np.ndarray):
-            result = obj.tolist()
-            print(f"Converted numpy array to list: {result}")
-            return result
-        elif isinstance(obj, np.integer):
-            result = int(obj)
-            print(f"Converted numpy integer: {result}")
-            return result
-        elif isinstance(obj, np.floating):
-            result = float(obj)
-            print(f"Converted numpy float: {result}")
-            return result
-        elif isinstance(obj, np.bool_):
-            result = bool(obj)
-            print(f"Converted numpy bool: {result}")
-            return result
-        elif isinstance(obj, dict):
-            print(f"Converting dict with {len(obj)} items")
-            result = {key: convert_numpy_types(value) for key, value in obj.items()}
-            print(f"Converted dict: {result}")
-            return result
-        elif isinstance(obj, list):
-            print(f"Converting list with {len(obj)} items")
-            result = [convert_numpy_types(item) for item in obj]
-            print(f"Converted list: {result}")
-            return result
-        elif obj is None:
-            print("Converting None")
-            return None
-        elif isinstance(obj, (bool, int, float, str)):
-            print(f"Returning native type: {obj}")
-            return obj
-        else:
-            result = str(obj)
-            print(f"Converting to string: {result}")
-            return result
-    except Exception as e:
-        print(f"ERROR in convert_numpy_types: {e}")
-        print(f"ERROR traceback: {traceback.format_exc()}")
-        # Fallback: convert to string if conversion fails
-        return str(obj)
+    return to_builtin(obj)
+
+def frame_from_json(data) -> pd.DataFrame:
+    """DataFrame from a JSON payload: a list of records or a dict of columns.
+
+    Column lists shorter than the longest are padded with None and single
+    values are repeated down the column.
+    """
+    if not isinstance(data, dict):
+        return pd.DataFrame(data)
+    length = max((len(value) if isinstance(value, list) else 1 for value in data.values()), default=0)
+    return pd.DataFrame({
+        key: value + [None] * (length - len(value)) if isinstance(value, list) else [value] * length
+        for key, value in data.items()
+    })
+
+
+# Value patterns reported by the HIPAA section of the compliance report
+PHI_VALUE_PATTERNS = {
+    "SSN": r'\d{3}-\d{2}-\d{4}',
+    "Email": r'@.*\.',
+}
+
+
+def scan_phi_values(data: pd.DataFrame, hits: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
+    """Columns whose values match each PHI pattern, accumulated into ``hits`` across batches."""
+    hits = hits if hits is not None else {kind: [] for kind in PHI_VALUE_PATTERNS}
+    for kind, pattern in PHI_VALUE_PATTERNS.items():
+        for col in data.columns:
+            if col not in hits[kind] and any(data[col].astype(str).str.contains(pattern, na=False)):
+                hits[kind].append(col)
+    return hits
+
+
+# Words generate_compliance_report looks for in issue messages
+COMPLIANCE_KEYWORDS = ("phi", "pii", "icd10", "diagnosis", "loinc", "lab", "cpt", "procedure", "fhir", "omop")
+
+
+def generate_compliance_report(data: Optional[pd.DataFrame], result: ValidationResult, standards: List[str],
+                               phi_hits: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+    """Generate compliance report for medical standards.
 
-def generate_compliance_report(data: pd.DataFrame, result: ValidationResult, standards: List[str]) -> Dict[str, Any]:
-    """Generate compliance report for medical standards."""
+    ``phi_hits`` from ``scan_phi_values`` replaces the value scan of ``data``
+    when the data was validated in batches.
+    """
     compliance_report = {}
     
     for standard in standards:
@@ -92,17 +124,12 @@ def generate_compliance_report(data: pd.DataFrame, result: ValidationResult, sta
             phi_detected = False
             phi_issues = []
             
-            # Check for SSN patterns
-            for col in data.columns:
-                if any(data[col].astype(str).str.contains(r'\d{3}-\d{2}-\d{4}', na=False)):
+            if phi_hits is None:
+                phi_hits = scan_phi_values(data)
+            for kind, columns in phi_hits.items():
+                for col in columns:
                     phi_detected = True
-                    phi_issues.append(f"SSN detected in column: {col}")
-            
-            # Check for email patterns
-            for col in data.columns:
-                if any(data[col].astype(str).str.contains(r'@.*\.', na=False)):
-                    phi_detected = True
-                    phi_issues.append(f"Email detected in column: {col}")
+                    phi_issues.append(f"{kind} detected in column: {col}")
             
             # Also check validation issues for PHI mentions
             for issue in result.issues:
@@ -233,32 +260,85 @@ def generate_compliance_report(data: pd.DataFrame, result: ValidationResult, sta
 
 def convert_validation_issue_to_dict(issue) -> Dict[str, Any]:
     """Convert ValidationIssue to dictionary."""
-    try:
-        print(f"convert_validation_issue_to_dict called with: {type(issue)}")
-        print(f"Issue attributes: {dir(issue)}")
-        
-        result = {
-            "severity": getattr(issue, 'severity', 'unknown'),
-            "description": getattr(issue, 'message', str(issue)),
-            "column": getattr(issue, 'column', None),
-            "row": getattr(issue, 'row', None),
-            "value": getattr(issue, 'value', None),
-            "rule_name": getattr(issue, 'rule_name', None)
-        }
-        
-        print(f"Converted issue to dict: {result}")
-        return result
-    except Exception as e:
-        print(f"ERROR in convert_validation_issue_to_dict: {e}")
-        print(f"ERROR traceback: {traceback.format_exc()}")
-        return {
-            "severity": "error",
-            "description": f"Failed to convert issue: {str(e)}",
-            "column": None,
-            "row": None,
-            "value": None,
-            "rule_name": None
+    return {
+        "severity": issue.severity,
+        "description": issue.message,
+        "column": issue.column,
+        "row": issue.row,
+        "value": issue.value,
+        "rule_name": issue.rule_name
+    }
+
+
+def build_file_validation_response(result: ValidationResult, standards: List[str],
+                                   phi_hits: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Response body for a validated file (shared by the file endpoint and validation jobs)."""
+    # Generate compliance report
+    compliance_report = generate_compliance_report(None, result, standards, phi_hits)
+    
+    issues_dict = [convert_validation_issue_to_dict(issue) for issue in result.issues]
+    
+    return {
+        "success": True,
+        "is_valid": result.is_valid,
+        "total_issues": len(result.issues),
+        "error_count": len([i for i in result.issues if i.severity == 'error']),
+        "warning_count": len([i for i in result.issues if i.severity == 'warning']),
+        "info_count": len([i for i in result.issues if i.severity == 'info']),
+        "compliance_report": compliance_report,
+        "issues": issues_dict,
+        "summary": {
+            "total_rows": result.summary.get("total_rows", 0),
+            "total_columns": result.summary.get("total_columns", 0),
+            "is_valid": result.is_valid,
+            "total_issues": len(result.issues)
         }
+    }
+
+
+def flatten_v1_2_compliance_report(compliance_report: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the v1.2 compliance report to one entry per standard."""
+    if 'standards' in compliance_report:
+        standards = compliance_report['standards']
+        if isinstance(standards, dict):
+            return {
+                'hipaa': standards.get('hipaa', {}),
+                'gdpr': standards.get('gdpr', {}),
+                'fda': standards.get('fda', {}),
+                'medical_coding': standards.get('medical_coding', {}),
+                'overall_score': compliance_report.get('overall_score', 0),
+                'risk_level': compliance_report.get('risk_level', 'low'),
+                'all_violations': compliance_report.get('all_violations', []),
+                'template_applied': compliance_report.get('template_applied')
+            }
+    return compliance_report
+
+
+def apply_custom_rules(validator: MedicalDataValidator, rules: List[Dict[str, Any]]) -> None:
+    """Add stored custom compliance rules to a validator's compliance engine."""
+    if validator.compliance_engine is None:
+        return
+    for rule_data in rules:
+        validator.compliance_engine.add_custom_pattern(
+            name=rule_data['name'],
+            pattern=rule_data['pattern'],
+            severity=rule_data['severity'],
+            field_pattern=rule_data.get('field_pattern'),
+            description=rule_data.get('description', ''),
+            recommendation=rule_data.get('recommendation')
+        )
+
+
+def build_analytics_response(analytics_report: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe analytics response body."""
+    return {
+        "success": True,
+        "quality_metrics": analytics_report.get('quality_metrics', {}),
+        "anomalies": analytics_report.get('anomalies', []),
+        "trends": analytics_report.get('trends', []),
+        "statistical_summary": analytics_report.get('statistical_summary', {}),
+        "overall_quality_score": analytics_report.get('overall_quality_score', 0.0)
+    }
 
 
 # Extracted API endpoint functions for use by both Flask routes and RESTX resources
@@ -326,29 +406,7 @@ def api_validate_data():
         # Convert data to DataFrame
         print("Converting data to DataFrame...")
         try:
-            # Handle arrays of different lengths by padding with None
-            if isinstance(data, dict):
-                # Find the maximum length
-                max_length = max(len(value) if isinstance(value, list) else 1 for value in data.values())
-                print(f"Maximum array length: {max_length}")
-                
-                # Pad shorter arrays with None
-                padded_data = {}
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        if len(value) < max_length:
-                            padded_data[key] = value + [None] * (max_length - len(value))
-                            print(f"Padded {key} from {len(value)} to {max_length} items")
-                        else:
-                            padded_data[key] = value
-                    else:
-                        # Convert single values to lists
-                        padded_data[key] = [value] * max_length
-                        print(f"Converted {key} single value to list of {max_length} items")
-                
-                df = pd.DataFrame(padded_data)
-            else:
-                df = pd.DataFrame(data)
+            df = frame_from_json(data)
             
             print(f"DataFrame created: {df.shape} - columns: {list(df.columns)}")
             print(f"DataFrame dtypes: {df.dtypes.to_dict()}")
@@ -365,7 +423,7 @@ def api_validate_data():
         # Create validator
         print("Creating validator...")
         try:
-            validator = create_validator(detect_phi, quality_checks, profile)
+            validator = get_validator(detect_phi, quality_checks, profile)
             print(f"Validator created with {len(validator.rules)} rules")
         except Exception as e:
             print(f"ERROR creating validator: {e}")
@@ -396,6 +454,9 @@ def api_validate_data():
         else:
             compliance_report = {}
         
+        if wants_ndjson():
+            return ndjson_response(result_records(result, compliance_report))
+        
         return jsonify({
             "success": True,
             "message": "Validation complete",
@@ -409,6 +470,8 @@ def api_validate_data():
             "compliance_report": compliance_report
         })
         
+    except RequestEntityTooLarge:
+        return jsonify({"success": False, "error": "Request body too large"}), 413
     except Exception as e:
         print(f"=== API VALIDATE DATA ERROR ===")
         print(f"Unexpected error: {e}")
@@ -421,92 +484,331 @@ def api_validate_data():
         }), 500
 
 
+def allow_large_upload() -> int:
+    """Raise this request's body limit to ``MAX_UPLOAD_BYTES`` and return it.
+
+    Flask before 3.1 cannot override the limit per request, so the app-wide
+    ``MAX_CONTENT_LENGTH`` still applies there.
+    """
+    max_bytes = current_app.config.get('MAX_UPLOAD_BYTES', DEFAULT_MAX_UPLOAD_BYTES)
+    try:
+        request.max_content_length = max_bytes
+    except AttributeError:
+        pass
+    return max_bytes
+
+
+def open_upload():
+    """The request's upload as ``(stream, format, error)``.
+
+    Accepts a multipart ``file`` field or a raw CSV/JSON Lines body sent with
+    a matching Content-Type; raw bodies are parsed straight from the request
+    stream without being spooled. ``error`` is a message for a 400 response.
+    """
+    if request.mimetype in RAW_UPLOAD_TYPES:
+        return request.stream, RAW_UPLOAD_TYPES[request.mimetype], None
+    
+    if 'file' not in request.files:
+        return None, None, 'No file provided'
+    file = request.files['file']
+    if file.filename == '':
+        return None, None, 'No file selected'
+    
+    # Security: File type validation
+    fmt = upload_format(file.filename)
+    if fmt not in UPLOAD_FORMATS:
+        return None, None, 'File type not allowed. Supported formats: CSV, JSON Lines, Excel, JSON, Parquet, Arrow'
+    
+    # Security: Filename sanitization
+    import re
+    safe_filename = re.sub(r'[^a-zA-Z0-9._-]', '_', file.filename)
+    if safe_filename != file.filename:
+        return None, None, 'Invalid filename characters'
+    return file.stream, fmt, None
+
+
+def validate_upload_stream(validator: MedicalDataValidator, stream, fmt: str):
+    """Validate an upload batch by batch, returning the result and PHI value hits."""
+    phi_hits = scan_phi_values(pd.DataFrame())
+    
+    def batches():
+        for batch in iter_upload_batches(stream, fmt):
+            scan_phi_values(batch, phi_hits)
+            yield batch
+    
+    result = BatchValidator(validator).validate_stream(batches())
+    return result, phi_hits
+
+
+def get_result_cache() -> TieredCache:
+    """The app's file validation result cache, created on first use.
+
+    Set ``RESULT_CACHE_DB`` (or ``MEDICAL_VALIDATOR_CACHE_DB``) to share
+    results between workers through a SQLite file.
+    """
+    cache = current_app.extensions.get('result_cache')
+    if cache is None:
+        db_path = current_app.config.get('RESULT_CACHE_DB') or os.environ.get('MEDICAL_VALIDATOR_CACHE_DB') or None
+        cache = TieredCache(
+            max_size=current_app.config.get('RESULT_CACHE_SIZE', 256),
+            db_path=db_path,
+            namespace='api_results',
+        )
+        current_app.extensions['result_cache'] = cache
+    return cache
+
+
+def cached_response(body: Dict[str, Any], etag: str):
+    """A JSON response for a cacheable result, answering ``If-None-Match`` with a 304."""
+    # werkzeug's make_conditional only handles GET and HEAD; uploads are POSTs
+    response = current_app.response_class(status=304) if request.if_none_match.contains_weak(etag) else jsonify(body)
+    response.set_etag(etag)
+    # Results may describe PHI: never store them in shared caches
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def result_records(result: ValidationResult, compliance_report: Dict[str, Any]):
+    """NDJSON records for a finished ``/validate/data`` result."""
+    yield {"type": "header", "success": True}
+    yield from chunk_records(result.issues, asdict)
+    yield {
+        "type": "summary",
+        "success": True,
+        "message": "Validation complete",
+        "is_valid": result.is_valid,
+        "total_issues": len(result.issues),
+        "error_count": len([i for i in result.issues if i.severity == 'error']),
+        "warning_count": len([i for i in result.issues if i.severity == 'warning']),
+        "info_count": len([i for i in result.issues if i.severity == 'info']),
+        "summary": result.summary,
+        "compliance_report": compliance_report
+    }
+
+
+def stream_file_validation(validator: MedicalDataValidator, stream, fmt: str, standards: List[str]):
+    """NDJSON records for a streamed file validation.
+
+    Only issues the compliance report matches on are kept until the end, so
+    memory does not grow with the number of row-level issues.
+    """
+    yield {"type": "header", "success": True, "format": fmt, "standards": standards}
+    
+    phi_hits = scan_phi_values(pd.DataFrame())
+    report_issues = ValidationResult(is_valid=True)
+    counts = {"error": 0, "warning": 0, "info": 0}
+    total_rows = total_columns = 0
+    
+    def batches():
+        try:
+            for batch in iter_upload_batches(stream, fmt):
+                scan_phi_values(batch, phi_hits)
+                yield batch
+        finally:
+            stream.close()
+    
+    for batch_result in BatchValidator(validator).iter_stream(batches()):
+        batch = batch_result.summary["batch_results"][0]
+        total_rows = batch["end_row"]
+        total_columns = max(total_columns, batch_result.summary["total_columns"])
+        for issue in batch_result.issues:
+            counts[issue.severity] = counts.get(issue.severity, 0) + 1
+            if any(word in issue.message.lower() for word in COMPLIANCE_KEYWORDS):
+                report_issues.add_issue(issue)
+        if not batch_result.is_valid:
+            report_issues.is_valid = False
+        yield from chunk_records(
+            batch_result.issues, convert_validation_issue_to_dict,
+            batch=batch["batch_num"], start_row=batch["start_row"], end_row=batch["end_row"],
+        )
+    
+    total_issues = sum(counts.values())
+    yield {
+        "type": "summary",
+        "success": True,
+        "is_valid": report_issues.is_valid,
+        "total_issues": total_issues,
+        "error_count": counts["error"],
+        "warning_count": counts["warning"],
+        "info_count": counts["info"],
+        "compliance_report": generate_compliance_report(None, report_issues, standards, phi_hits),
+        "summary": {
+            "total_rows": total_rows,
+            "total_columns": total_columns,
+            "is_valid": report_issues.is_valid,
+            "total_issues": total_issues
+        }
+    }
+
+
 def api_validate_file():
-    """Validate uploaded file via API."""
+    """Validate uploaded file via API.
+
+    The upload is parsed from the request stream into batches, so CSV and
+    JSON Lines uploads are validated in constant memory. With
+    ``Accept: application/x-ndjson`` issues are streamed back per batch.
+    """
     try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+        max_bytes = allow_large_upload()
+        stream, fmt, error = open_upload()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
         
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'}), 400
+        # Get parameters (query string for raw uploads)
+        options = request.args if request.mimetype in RAW_UPLOAD_TYPES else request.form
+        detect_phi = options.get('detect_phi', 'true').lower() == 'true'
+        quality_checks = options.get('quality_checks', 'true').lower() == 'true'
+        profile = options.get('profile', '')
+        standards = options.getlist('standards') or ["icd10", "loinc", "cpt"]
         
-        # Security: File type validation
-        allowed_extensions = {'csv', 'xlsx', 'xls', 'json', 'parquet'}
-        if '.' not in file.filename or file.filename.rsplit('.', 1)[1].lower() not in allowed_extensions:
-            return jsonify({'success': False, 'error': 'File type not allowed. Supported formats: CSV, Excel, JSON, Parquet'}), 400
+        validator = get_validator(detect_phi, quality_checks, profile)
+        if wants_ndjson():
+            # Flask closes uploaded files when the view returns, before the
+            # response is streamed; detach the upload so the records own it
+            if 'file' in request.files:
+                request.files['file'].stream = io.BytesIO()
+            return ndjson_response(stream_file_validation(validator, stream, fmt, standards))
         
-        # Security: File size validation (16MB limit)
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to beginning
-        if file_size > 16 * 1024 * 1024:  # 16MB
-            return jsonify({'success': False, 'error': 'File too large. Maximum size is 16MB'}), 400
+        # Results are cached by upload content and everything that shapes them
+        options_key = (
+            fmt, detect_phi, quality_checks, (profile or '').strip(), sorted(standards),
+            validation_version(validator),
+        )
+        cache = get_result_cache()
+        buffer_limit = current_app.config.get('RESULT_CACHE_BUFFER_BYTES', DEFAULT_CACHE_BUFFER_BYTES)
+        stream, content_hash, reader = hashed_upload(stream, request.content_length, buffer_limit)
+        if content_hash is not None:
+            etag = result_key(content_hash, *options_key)
+            cached = cache.get(etag)
+            if cached is not None:
+                return cached_response(cached, etag)
         
-        # Security: Filename sanitization
-        import re
-        safe_filename = re.sub(r'[^a-zA-Z0-9._-]', '_', file.filename)
-        if safe_filename != file.filename:
-            return jsonify({'success': False, 'error': 'Invalid filename characters'}), 400
+        result, phi_hits = validate_upload_stream(validator, stream, fmt)
+        body = to_builtin(build_file_validation_response(result, standards, phi_hits))
+        if content_hash is None:
+            etag = result_key(reader.hexdigest(), *options_key)
+        cache.set(etag, body)
+        return cached_response(body, etag)
+    
+    except RequestEntityTooLarge:
+        return jsonify({
+            'success': False,
+            'error': f'File too large. Maximum size is {max_bytes // (1024 * 1024)}MB'
+        }), 413
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": f"File validation failed: {str(e)}",
+            "traceback": traceback.format_exc() if current_app.debug else None
+        }), 500
+
+
+# Most datasets accepted in one /validate/batch request
+DEFAULT_MAX_BATCH_DATASETS = 10000
+
+
+def read_batch_datasets() -> List[tuple]:
+    """The datasets of a batch request as ``(id, data)`` pairs.
+
+    The body is a JSON array (or ``{"datasets": [...]}``) or NDJSON with one
+    dataset per line. Each dataset is a ``/validate/data`` payload, optionally
+    wrapped as ``{"id": ..., "data": ...}``; unwrapped datasets are numbered.
+    """
+    if RAW_UPLOAD_TYPES.get(request.mimetype) == 'jsonl':
+        items = [loads(line) for line in request.stream if line.strip()]
+    else:
+        items = request.get_json(silent=True)
+        if isinstance(items, dict) and 'datasets' in items:
+            items = items['datasets']
+        if not isinstance(items, list):
+            raise ValueError('Expected a JSON array of datasets')
+    
+    datasets = []
+    for position, item in enumerate(items):
+        if isinstance(item, dict) and 'data' in item and set(item) <= {'id', 'data'}:
+            datasets.append((item.get('id', position), item['data']))
+        else:
+            datasets.append((position, item))
+    return datasets
+
+
+def batch_records(validator: MedicalDataValidator, datasets: List[tuple], standards: List[str]):
+    """Records for a batch response: a header, one per dataset, then a summary."""
+    yield {"type": "header", "success": True, "total_datasets": len(datasets)}
+    
+    positions, frames, entries = [], [], {}
+    for position, (dataset_id, data) in enumerate(datasets):
+        try:
+            frames.append(frame_from_json(data))
+            positions.append(position)
+        except Exception as e:
+            entries[position] = {"id": dataset_id, "success": False, "error": f"Failed to create DataFrame: {str(e)}"}
+    
+    results = BatchValidator(validator).validate_datasets(frames)
+    for position, frame, result in zip(positions, frames, results):
+        entries[position] = {
+            "id": datasets[position][0],
+            **build_file_validation_response(result, standards, scan_phi_values(frame)),
+        }
+    
+    valid = issues = 0
+    for position in range(len(datasets)):
+        entry = entries[position]
+        valid += bool(entry.get("is_valid"))
+        issues += entry.get("total_issues", 0)
+        yield {"type": "dataset", **entry}
+    yield {
+        "type": "summary",
+        "success": True,
+        "total_datasets": len(datasets),
+        "valid_datasets": valid,
+        "total_issues": issues,
+    }
+
+
+def api_validate_batch():
+    """Validate many small datasets in one request.
+
+    Routing, parsing and validator lookup are paid once per batch, and
+    row-local rules run once per group of datasets with the same columns
+    (see ``BatchValidator.validate_datasets``); results are reported per
+    dataset.
+    """
+    try:
+        try:
+            datasets = read_batch_datasets()
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        max_datasets = current_app.config.get('MAX_BATCH_DATASETS', DEFAULT_MAX_BATCH_DATASETS)
+        if len(datasets) > max_datasets:
+            return jsonify({
+                'success': False,
+                'error': f'Too many datasets. Maximum is {max_datasets} per batch'
+            }), 413
         
-        # Get parameters
-        detect_phi = request.form.get('detect_phi', 'true').lower() == 'true'
-        quality_checks = request.form.get('quality_checks', 'true').lower() == 'true'
-        profile = request.form.get('profile', '')
-        standards = request.form.getlist('standards') or ["icd10", "loinc", "cpt"]
+        detect_phi = request.args.get('detect_phi', 'true').lower() == 'true'
+        quality_checks = request.args.get('quality_checks', 'true').lower() == 'true'
+        profile = request.args.get('profile', '')
+        standards = request.args.getlist('standards') or ["icd10", "loinc", "cpt"]
         
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.rsplit('.', 1)[1]}") as tmp_file:
-            file.save(tmp_file.name)
-            tmp_path = tmp_file.name
+        validator = get_validator(detect_phi, quality_checks, profile)
+        records = batch_records(validator, datasets, standards)
+        if wants_ndjson():
+            return ndjson_response(records)
         
-        try:
-            # Load data
-            data = load_data(tmp_path)
-            
-            # Create validator
-            validator = create_validator(detect_phi, quality_checks, profile)
-            
-            # Validate data
-            result = validator.validate(data)
-            
-            # Generate compliance report
-            compliance_report = generate_compliance_report(data, result, standards)
-            
-            # Convert result to dict
-            result_dict = convert_numpy_types(result.to_dict())
-            issues_dict = [convert_validation_issue_to_dict(issue) for issue in result.issues]
-            
-            response_data = {
-                "success": True,
-                "is_valid": result.is_valid,
-                "total_issues": len(result.issues),
-                "error_count": len([i for i in result.issues if i.severity == 'error']),
-                "warning_count": len([i for i in result.issues if i.severity == 'warning']),
-                "info_count": len([i for i in result.issues if i.severity == 'info']),
-                "compliance_report": compliance_report,
-                "issues": issues_dict,
-                "summary": {
-                    "total_rows": len(data),
-                    "total_columns": len(data.columns),
-                    "is_valid": result.is_valid,
-                    "total_issues": len(result.issues)
-                }
-            }
-            
-            return jsonify(response_data)
-            
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-                
+        records = list(records)
+        body = {key: value for key, value in records[-1].items() if key != "type"}
+        body["datasets"] = [
+            {key: value for key, value in record.items() if key != "type"} for record in records[1:-1]
+        ]
+        return jsonify(body)
+    
+    except RequestEntityTooLarge:
+        return jsonify({'success': False, 'error': 'Request body too large'}), 413
     except Exception as e:
         return jsonify({
             "success": False,
-            "error": f"File validation failed: {str(e)}",
+            "error": f"Batch validation failed: {str(e)}",
             "traceback": traceback.format_exc() if current_app.debug else None
         }), 500
 
@@ -525,7 +827,7 @@ def api_compliance_check():
                 if file.filename.endswith('.csv'):
                     df = pd.read_csv(file)
                 elif file.filename.endswith('.xlsx'):
-                    df = pd.read_excel(file)
+                    df = read_excel(file)
                 else:
                     return jsonify({"success": False, "error": "Unsupported file format"}), 400
             except Exception as e:
@@ -542,7 +844,7 @@ def api_compliance_check():
         
         # Create validator for compliance check
         try:
-            validator = create_validator(detect_phi=True, quality_checks=True, profile='')
+            validator = get_validator(detect_phi=True, quality_checks=True, profile='')
         except Exception as validator_error:
             import traceback
             print(traceback.format_exc())
@@ -607,7 +909,7 @@ def api_v1_2_compliance():
             if file.filename.endswith('.csv'):
                 df = pd.read_csv(file)
             elif file.filename.endswith('.xlsx'):
-                df = pd.read_excel(file)
+                df = read_excel(file)
             else:
                 return jsonify({"success": False, "error": "Unsupported file format"}), 400
         except Exception as e:
@@ -635,24 +937,16 @@ def api_v1_2_compliance():
         
         # Create validator with v1.2 compliance enabled and optional template
         try:
-            validator = create_validator(detect_phi=True, quality_checks=True, profile='', enable_compliance=True, template=template)
+            # Custom rules from global storage are part of the pooled configuration
+            validator = get_validator(
+                detect_phi=True, quality_checks=True, profile='', enable_compliance=True, template=template,
+                custom_rules=_custom_rules_storage,
+            )
         except Exception as validator_error:
             import traceback
             print(traceback.format_exc())
             return jsonify({"success": False, "error": f"Failed to create validator: {str(validator_error)}", "traceback": traceback.format_exc()}), 500
         
-        # Apply custom rules from global storage
-        if validator.compliance_engine is not None:
-            for rule_data in _custom_rules_storage:
-                validator.compliance_engine.add_custom_pattern(
-                    name=rule_data['name'],
-                    pattern=rule_data['pattern'],
-                    severity=rule_data['severity'],
-                    field_pattern=rule_data.get('field_pattern'),
-                    description=rule_data.get('description', ''),
-                    recommendation=rule_data.get('recommendation')
-                )
-        
         # Validate data
         try:
             result = validator.validate(df)
@@ -661,24 +955,8 @@ def api_v1_2_compliance():
             print(traceback.format_exc())
             return jsonify({"success": False, "error": f"Validation failed: {str(validation_error)}", "traceback": traceback.format_exc()}), 500
         
-        # Get v1.2 compliance report
-        compliance_report = result.summary.get('compliance_report', {})
-        
-        # Flatten the structure to match test expectations
-        if 'standards' in compliance_report:
-            standards = compliance_report['standards']
-            if isinstance(standards, dict):
-                flattened_report = {
-                    'hipaa': standards.get('hipaa', {}),
-                    'gdpr': standards.get('gdpr', {}),
-                    'fda': standards.get('fda', {}),
-                    'medical_coding': standards.get('medical_coding', {}),
-                    'overall_score': compliance_report.get('overall_score', 0),
-                    'risk_level': compliance_report.get('risk_level', 'low'),
-                    'all_violations': compliance_report.get('all_violations', []),
-                    'template_applied': compliance_report.get('template_applied')
-                }
-                compliance_report = flattened_report
+        # Get v1.2 compliance report, flattened to match test expectations
+        compliance_report = flatten_v1_2_compliance_report(result.summary.get('compliance_report', {}))
         
         return jsonify({
             "success": True,
@@ -785,7 +1063,7 @@ def api_analytics():
             if file.filename and file.filename.endswith('.csv'):
                 df = pd.read_csv(file)
             elif file.filename and file.filename.endswith('.xlsx'):
-                df = pd.read_excel(file)
+                df = read_excel(file)
             else:
                 return jsonify({"success": False, "error": "Unsupported file format"}), 400
         except Exception as e:
@@ -811,18 +1089,8 @@ def api_analytics():
                     "traceback": traceback.format_exc()
                 }), 500
 
-            # Debug: print analytics_report before serialization
-            print('analytics_report:', analytics_report)
-            serialized_report = convert_numpy_types({
-                "success": True,
-                "quality_metrics": analytics_report.get('quality_metrics', {}),
-                "anomalies": analytics_report.get('anomalies', []),
-                "trends": analytics_report.get('trends', []),
-                "statistical_summary": analytics_report.get('statistical_summary', {}),
-                "overall_quality_score": analytics_report.get('overall_quality_score', 0.0)
-            })
+            serialized_report = build_analytics_response(analytics_report)
             try:
-                print('serialized_report:', serialized_report)
                 return jsonify(serialized_report)
             except Exception as e:
                 import traceback
@@ -849,6 +1117,129 @@ def api_analytics():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Issues per page of a stored job result
+ISSUE_PAGE_SIZE = 1000
+
+
+def get_job_manager() -> JobManager:
+    """The app's validation job manager, created on first use."""
+    manager = current_app.extensions.get('validation_jobs')
+    if manager is None:
+        manager = JobManager(
+            current_app.config.get('JOB_DIR'),
+            current_app.config.get('JOB_WORKERS'),
+            current_app.config.get('JOB_RETENTION_SECONDS'),
+        )
+        current_app.extensions['validation_jobs'] = manager
+    return manager
+
+
+def api_create_job():
+    """Queue an uploaded file for asynchronous validation, compliance or analytics."""
+    try:
+        max_bytes = allow_large_upload()
+        if 'file' not in request.files:
+            return jsonify({'success': False, 'error': 'No file provided'}), 400
+        
+        file = request.files['file']
+        if file.filename == '':
+            return jsonify({'success': False, 'error': 'No file selected'}), 400
+        
+        allowed_extensions = {'csv', 'xlsx', 'xls', 'json', 'parquet'}
+        if '.' not in file.filename or file.filename.rsplit('.', 1)[1].lower() not in allowed_extensions:
+            return jsonify({'success': False, 'error': 'File type not allowed. Supported formats: CSV, Excel, JSON, Parquet'}), 400
+        
+        kind = request.form.get('kind', 'validate')
+        if kind not in JOB_KINDS:
+            return jsonify({'success': False, 'error': f"Unknown job kind '{kind}'. Supported: {', '.join(JOB_KINDS)}"}), 400
+        
+        params = {
+            'detect_phi': request.form.get('detect_phi', 'true').lower() == 'true',
+            'quality_checks': request.form.get('quality_checks', 'true').lower() == 'true',
+            'profile': request.form.get('profile', ''),
+            'standards': request.form.getlist('standards') or ["icd10", "loinc", "cpt"],
+            'template': request.form.get('template'),
+            'time_column': request.form.get('time_column'),
+            # Workers cannot see this process's in-memory rules
+            'custom_rules': list(_custom_rules_storage),
+        }
+        
+        manager = get_job_manager()
+        upload_path = manager.upload_path(f".{file.filename.rsplit('.', 1)[1].lower()}")
+        file.save(upload_path)
+        job_id = manager.submit(kind, upload_path, params)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
+    except RequestEntityTooLarge:
+        return jsonify({
+            'success': False,
+            'error': f'File too large. Maximum size is {max_bytes // (1024 * 1024)}MB'
+        }), 413
+    except Exception as e:
+        return jsonify({'success': False, 'error': f"Failed to queue job: {str(e)}"}), 500
+
+
+def issue_page(manager: JobManager, job_id: str, cursor: int, limit: int) -> Dict[str, Any]:
+    """One page of a job's stored issues and the cursor of the next page."""
+    issues = list(manager.store.issues(job_id, cursor, limit + 1))
+    has_more = len(issues) > limit
+    return {
+        'issues': issues[:limit],
+        'next_cursor': cursor + limit if has_more else None
+    }
+
+
+def api_get_job(job_id):
+    """Status, progress and (when finished) result of a job.
+
+    A validation result carries the first page of its issues and a
+    ``next_cursor`` for ``/api/jobs/<id>/issues``.
+    """
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': f"Job '{job_id}' not found"}), 404
+    
+    result = job['result']
+    if result is not None and 'issues_count' in result:
+        limit = request.args.get('limit', ISSUE_PAGE_SIZE, type=int)
+        result.update(issue_page(manager, job_id, 0, max(limit, 0)))
+    
+    return jsonify({
+        'success': True,
+        'job_id': job['id'],
+        'kind': job['kind'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+        'result': result,
+        'error': job['error']
+    })
+
+
+def api_get_job_issues(job_id):
+    """Stored issues of a finished job, by cursor, or all of them as NDJSON."""
+    manager = get_job_manager()
+    if manager.get(job_id) is None:
+        return jsonify({'success': False, 'error': f"Job '{job_id}' not found"}), 404
+    
+    cursor = max(request.args.get('cursor', 0, type=int), 0)
+    if wants_ndjson():
+        return ndjson_response(
+            {'type': 'issue', **issue} for issue in manager.store.issues(job_id, cursor)
+        )
+    
+    limit = max(request.args.get('limit', ISSUE_PAGE_SIZE, type=int), 0)
+    return jsonify({'success': True, 'job_id': job_id, 'cursor': cursor, **issue_page(manager, job_id, cursor, limit)})
+
+
 def api_monitoring_stats():
     """Get monitoring statistics."""
     try:
@@ -1011,6 +1402,11 @@ def create_api_blueprint():
         """Validate uploaded file via API."""
         return api_validate_file()
 
+    @api_bp.route('/validate/batch', methods=['POST'])
+    def api_validate_batch_endpoint():
+        """Validate many datasets in one request."""
+        return api_validate_batch()
+
     @api_bp.route('/compliance/check', methods=['POST'])
     def api_compliance_check_endpoint():
         """Check compliance with medical standards."""
@@ -1056,6 +1452,21 @@ def create_api_blueprint():
         """Get advanced analytics for uploaded data."""
         return api_analytics()
 
+    @api_bp.route('/jobs', methods=['POST'])
+    def api_create_job_endpoint():
+        """Queue an asynchronous validation job."""
+        return api_create_job()
+
+    @api_bp.route('/jobs/<job_id>', methods=['GET'])
+    def api_get_job_endpoint(job_id):
+        """Get the status and result of a validation job."""
+        return api_get_job(job_id)
+
+    @api_bp.route('/jobs/<job_id>/issues', methods=['GET'])
+    def api_get_job_issues_endpoint(job_id):
+        """Page through the issues of a finished validation job."""
+        return api_get_job_issues(job_id)
+
     @api_bp.route('/monitoring/stats', methods=['GET'])
     def api_monitoring_stats_endpoint():
         """Get monitoring statistics."""
@@ -1106,8 +1517,48 @@ def create_validator(detect_phi: bool, quality_checks: bool, profile: str, enabl
     
     return validator
 
+
+def build_pooled_validator(config: ValidatorConfig) -> MedicalDataValidator:
+    """Build the validator for a pool configuration."""
+    validator = create_validator(config.detect_phi, True, config.profile, config.enable_compliance, config.template)
+    apply_custom_rules(validator, thaw_rules(config.custom_rules))
+    return validator
+
+
+def get_validator_pool() -> ValidatorPool:
+    """The app's validator pool, created on first use."""
+    pool = current_app.extensions.get('validator_pool')
+    if pool is None:
+        pool = ValidatorPool(build_pooled_validator)
+        current_app.extensions['validator_pool'] = pool
+    return pool
+
+
+def get_validator(detect_phi: bool, quality_checks: bool, profile: str, enable_compliance: bool = True,
+                  template: Optional[str] = None, custom_rules: Optional[List[Dict[str, Any]]] = None) -> MedicalDataValidator:
+    """A shared pre-built validator for this configuration; it must not be modified.
+
+    Takes the same arguments as ``create_validator``, plus custom compliance
+    rules to apply.
+    """
+    config = ValidatorConfig(
+        detect_phi=bool(detect_phi),
+        profile=(profile or '').strip(),
+        enable_compliance=enable_compliance,
+        template=template or None,
+        custom_rules=freeze_rules(custom_rules or []),
+    )
+    return get_validator_pool().get(config)
+
+
 def register_routes(app):
     """Register all routes (UI and API) with the Flask app."""
+    # Build the common validator configurations before the first request
+    pool = ValidatorPool(build_pooled_validator)
+    app.extensions['validator_pool'] = pool
+    if app.config.get('WARM_VALIDATOR_POOL', True):
+        pool.warm(default_configs(list_available_profiles(), template_manager.list_templates()))
+    
     # Create and register API Blueprint
     api_bp = create_api_blueprint()
     app.register_blueprint(api_bp)
@@ -1157,50 +1608,28 @@ def register_routes(app):
     @app.route('/upload', methods=['POST'])
     def upload_file():
         try:
-            if 'file' not in request.files:
-                return jsonify({'error': 'No file provided'}), 400
-            file = request.files['file']
-            if file.filename == '':
-                return jsonify({'error': 'No file selected'}), 400
-            # Security: File type validation
-            allowed_extensions = {'csv', 'xlsx', 'xls', 'json', 'parquet'}
-            if '.' not in file.filename or file.filename.rsplit('.', 1)[1].lower() not in allowed_extensions:
-                return jsonify({'error': 'File type not allowed. Supported formats: CSV, Excel, JSON, Parquet'}), 400
-            
-            # Security: File size validation (16MB limit)
-            file.seek(0, 2)  # Seek to end
-            file_size = file.tell()
-            file.seek(0)  # Reset to beginning
-            if file_size > 16 * 1024 * 1024:  # 16MB
-                return jsonify({'error': 'File too large. Maximum size is 16MB'}), 400
-            
-            # Security: Filename sanitization
-            import re
-            safe_filename = re.sub(r'[^a-zA-Z0-9._-]', '_', file.filename)
-            if safe_filename != file.filename:
-                return jsonify({'error': 'Invalid filename characters'}), 400
-            detect_phi = request.form.get('detect_phi', 'false').lower() == 'true'
-            quality_checks = request.form.get('quality_checks', 'false').lower() == 'true'
-            profile = request.form.get('profile', '')
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.rsplit('.', 1)[1]}") as tmp_file:
-                file.save(tmp_file.name)
-                tmp_path = tmp_file.name
-            data = load_data(tmp_path)
-            validator = create_validator(detect_phi, quality_checks, profile)
+            # Charts need the whole frame in memory, so this endpoint keeps
+            # the app-wide MAX_CONTENT_LENGTH rather than MAX_UPLOAD_BYTES
+            max_bytes = request.max_content_length
+            stream, fmt, error = open_upload()
+            if error:
+                return jsonify({'error': error}), 400
+            options = request.args if request.mimetype in RAW_UPLOAD_TYPES else request.form
+            detect_phi = options.get('detect_phi', 'false').lower() == 'true'
+            quality_checks = options.get('quality_checks', 'false').lower() == 'true'
+            profile = options.get('profile', '')
+            # Charts need the whole frame, so this endpoint reads the upload at once
+            data = read_upload(stream, fmt)
+            validator = get_validator(detect_phi, quality_checks, profile)
             result = validator.validate(data)
             charts = generate_charts(data, result)
             # Generate compliance report
             standards = ['hipaa', 'icd10', 'loinc', 'cpt', 'fhir', 'omop']
             compliance_report = generate_compliance_report(data, result, standards)
-            os.unlink(tmp_path)
-            # Convert result to dict and handle numpy types
-            result_dict = convert_numpy_types(result.to_dict())
-            charts_dict = convert_numpy_types(charts)
-            
             return jsonify({
                 'success': True,
-                'result': result_dict,
-                'charts': charts_dict,
+                'result': result.to_dict(),
+                'charts': charts,
                 'compliance_report': compliance_report,
                 'summary': {
                     'total_rows': len(data),
@@ -1212,6 +1641,8 @@ def register_routes(app):
                     'info_count': len([i for i in result.issues if i.severity == 'info'])
                 }
             })
+        except RequestEntityTooLarge:
+            return jsonify({'error': f'File too large. Maximum size is {max_bytes // (1024 * 1024)}MB'}), 413
         except Exception as e:
             return jsonify({
                 'error': f'Validation failed: {str(e)}',
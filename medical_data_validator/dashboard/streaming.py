@@ -0,0 +1,51 @@
+"""
+Streaming NDJSON responses for large validation results.
+
+Clients that send ``Accept: application/x-ndjson`` get one JSON record per
+line instead of one JSON document: a ``header`` record straight away,
+``issues`` records as batches are validated, and a closing ``summary``
+record. Nothing is built up in memory beyond the current batch, so time to
+first byte and server memory stay flat as issue counts grow. An error after
+the response has started is reported as a final ``error`` record, since the
+status code has already been sent.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from flask import Response, request, stream_with_context
+
+from ..serialization import dumps_bytes
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Issues per ``issues`` record
+ISSUE_CHUNK_SIZE = 1000
+
+
+def dumps_line(record: Dict[str, Any]) -> bytes:
+    """One NDJSON line for ``record``."""
+    return dumps_bytes(record) + b"\n"
+
+
+def wants_ndjson() -> bool:
+    """Whether the client asked for a streamed NDJSON response."""
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(records: Iterable[Dict[str, Any]]) -> Response:
+    """Stream ``records`` as NDJSON, keeping the request context for lazy readers."""
+
+    def generate() -> Iterator[bytes]:
+        try:
+            for record in records:
+                yield dumps_line(record)
+        except Exception as e:
+            yield dumps_line({"type": "error", "success": False, "error": str(e)})
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def chunk_records(items: List[Any], convert: Callable[[Any], Any], **fields: Any) -> Iterator[Dict[str, Any]]:
+    """``issues`` records holding converted ``items`` in chunks, each tagged with ``fields``."""
+    for start in range(0, len(items), ISSUE_CHUNK_SIZE):
+        yield {"type": "issues", **fields, "issues": [convert(item) for item in items[start:start + ISSUE_CHUNK_SIZE]]}
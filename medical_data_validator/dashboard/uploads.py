@@ -0,0 +1,159 @@
+"""
+Streaming upload parsing for the REST API.
+
+Uploads are parsed straight from the request stream instead of being saved
+to a temporary file and loaded again. CSV and JSON Lines bodies are read
+incrementally into DataFrame batches for ``BatchValidator.validate_stream``,
+so memory stays bounded by the batch size whatever the upload size. Formats
+that need random access (Excel, Parquet, JSON documents) are read from a
+seekable stream, spooling a non-seekable body to disk first.
+
+Arrow IPC streams (``application/vnd.apache.arrow.stream``, ``.arrows``)
+are read record batch by record batch straight into DataFrames, with no
+text parsing at all; Arrow IPC files (``.arrow``, ``.feather``) need a
+seekable stream. Both require pyarrow.
+
+The size limit is enforced by the request stream itself (Flask's
+``max_content_length``), which stops reading as soon as it is exceeded,
+including chunked requests without a Content-Length.
+"""
+
+import shutil
+import tempfile
+from typing import IO, Iterator, List, Optional
+
+import pandas as pd
+
+from ..backends import pa
+from ..serialization import loads
+
+# Rows per validation batch for streamed uploads
+UPLOAD_BATCH_SIZE = 100000
+
+# Default upload limit; streamed formats are parsed in constant memory
+DEFAULT_MAX_UPLOAD_BYTES = 4 * 1024 * 1024 * 1024
+
+STREAMING_FORMATS = {"csv", "jsonl", "ndjson", "arrows"}
+ARROW_FILE_FORMATS = {"arrow", "feather"}
+UPLOAD_FORMATS = STREAMING_FORMATS | ARROW_FILE_FORMATS | {"xlsx", "xls", "json", "parquet"}
+
+# Raw (non-multipart) request bodies are recognized by their content type
+RAW_UPLOAD_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/vnd.apache.arrow.stream": "arrows",
+    "application/vnd.apache.arrow.file": "arrow",
+}
+
+# Bodies up to this size are spooled in memory rather than on disk
+_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+def upload_format(filename: Optional[str]) -> Optional[str]:
+    """Lower-case extension of an upload's file name, if any."""
+    if not filename or "." not in filename:
+        return None
+    return filename.rsplit(".", 1)[1].lower()
+
+
+def _seekable(stream: IO[bytes]) -> IO[bytes]:
+    """The stream itself if it can seek, else a spooled copy of it."""
+    try:
+        if stream.seekable():
+            return stream
+    except (AttributeError, ValueError):
+        pass
+    spooled = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MEMORY_BYTES)
+    shutil.copyfileobj(stream, spooled)
+    spooled.seek(0)
+    return spooled
+
+
+def read_upload(stream: IO[bytes], fmt: str) -> pd.DataFrame:
+    """Read a whole upload into one DataFrame."""
+    if fmt == "csv":
+        return pd.read_csv(stream)
+    if fmt in ("jsonl", "ndjson"):
+        batches = list(_iter_jsonl(stream, UPLOAD_BATCH_SIZE))
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    if fmt in ("xlsx", "xls"):
+        from ..excel import read_excel
+        return read_excel(_seekable(stream))
+    if fmt == "json":
+        return pd.read_json(_seekable(stream))
+    if fmt == "parquet":
+        return pd.read_parquet(_seekable(stream))
+    if fmt == "arrows":
+        return _require_pyarrow(fmt).ipc.open_stream(stream).read_all().to_pandas()
+    if fmt in ARROW_FILE_FORMATS:
+        _require_pyarrow(fmt)
+        from pyarrow import feather
+        return feather.read_table(_seekable(stream)).to_pandas()
+    raise ValueError(f"Unsupported file format: .{fmt}")
+
+
+def _require_pyarrow(fmt: str):
+    if pa is None:
+        raise ValueError(f"Reading .{fmt} uploads requires pyarrow")
+    return pa
+
+
+def _iter_arrow_stream(stream: IO[bytes], batch_size: int) -> Iterator[pd.DataFrame]:
+    # Small record batches are combined so each validation batch is full-sized
+    reader = _require_pyarrow("arrows").ipc.open_stream(stream)
+    pending = []
+    rows = 0
+    for record_batch in reader:
+        pending.append(record_batch)
+        rows += record_batch.num_rows
+        if rows < batch_size:
+            continue
+        table = pa.Table.from_batches(pending, schema=reader.schema)
+        full = rows - rows % batch_size
+        for start in range(0, full, batch_size):
+            yield table.slice(start, batch_size).to_pandas()
+        pending = table.slice(full).to_batches()
+        rows -= full
+    if rows:
+        yield pa.Table.from_batches(pending, schema=reader.schema).to_pandas()
+
+
+def _iter_jsonl(stream: IO[bytes], batch_size: int) -> Iterator[pd.DataFrame]:
+    records: List[dict] = []
+    for line in stream:
+        if not line.strip():
+            continue
+        records.append(loads(line))
+        if len(records) == batch_size:
+            yield pd.DataFrame.from_records(records)
+            records = []
+    if records:
+        yield pd.DataFrame.from_records(records)
+
+
+def iter_upload_batches(
+    stream: IO[bytes],
+    fmt: str,
+    batch_size: int = UPLOAD_BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse an upload into DataFrame batches of at most ``batch_size`` rows.
+
+    CSV, JSON Lines and Arrow streams are read incrementally; other formats
+    are read whole and then sliced.
+    """
+    if fmt == "csv":
+        with pd.read_csv(stream, chunksize=batch_size) as reader:
+            yield from reader
+        return
+    if fmt in ("jsonl", "ndjson"):
+        yield from _iter_jsonl(stream, batch_size)
+        return
+    if fmt == "arrows":
+        yield from _iter_arrow_stream(stream, batch_size)
+        return
+    data = read_upload(stream, fmt)
+    for start in range(0, max(len(data), 1), batch_size):
+        yield data.iloc[start:start + batch_size]
@@ -4,7 +4,6 @@ Utility functions for the Medical Data Validator Dashboard.
 
 import sys
 import os
-from pathlib import Path
 import pandas as pd
 
 # Add the project root to Python path for direct execution
@@ -14,29 +13,25 @@ if __name__ == "__main__":
 
 try:
     from medical_data_validator.core import ValidationResult
+    from medical_data_validator.loaders import load_file
 except ImportError:
     # Fallback for relative imports when used as package
     from ..core import ValidationResult
+    from ..loaders import load_file
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence
 try:
     import plotly.express as px
 except ImportError:
     # Fallback if plotly is not installed
     px = None
 
-def load_data(file_path: str) -> pd.DataFrame:
-    path = Path(file_path)
-    if path.suffix.lower() == '.csv':
-        return pd.read_csv(file_path)
-    elif path.suffix.lower() in ['.xlsx', '.xls']:
-        return pd.read_excel(file_path)
-    elif path.suffix.lower() == '.json':
-        return pd.read_json(file_path)
-    elif path.suffix.lower() == '.parquet':
-        return pd.read_parquet(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {path.suffix}")
+def load_data(
+    file_path: str,
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    return load_file(file_path, columns=columns, dtypes=dtypes)
 
 def generate_charts(data: pd.DataFrame, result: ValidationResult) -> Dict[str, Any]:
     charts = {}
@@ -0,0 +1,103 @@
+"""
+Pre-built validators shared by API requests.
+
+Building a validator creates its rules, compliance engine (with any
+template and custom rules applied) and analytics engine. ``ValidatorPool``
+keeps one validator per configuration for the life of the worker process,
+so a request only looks its configuration up. Pools are filled at app
+start (``warm``); with gunicorn's ``preload_app`` the warmed validators are
+built once in the master and shared by the forked workers.
+
+Pooled validators are shared between requests and threads and must not be
+modified; build a separate one with ``create_validator`` to customize it.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..core import MedicalDataValidator
+
+
+class ValidatorConfig(NamedTuple):
+    """Everything that changes how a pooled validator is built."""
+
+    detect_phi: bool = True
+    profile: str = ""
+    enable_compliance: bool = True
+    template: Optional[str] = None
+    # Custom compliance rules applied, as ``freeze_rules`` tuples
+    custom_rules: Tuple[Tuple[Tuple[str, Any], ...], ...] = ()
+
+
+def freeze_rules(rules: List[Dict[str, Any]]) -> Tuple[Tuple[Tuple[str, Any], ...], ...]:
+    """Custom rule dicts as a hashable configuration value."""
+    return tuple(tuple(sorted(rule.items())) for rule in rules)
+
+
+def thaw_rules(frozen: Tuple[Tuple[Tuple[str, Any], ...], ...]) -> List[Dict[str, Any]]:
+    return [dict(rule) for rule in frozen]
+
+
+class ValidatorPool:
+    """
+    Validators keyed by ``ValidatorConfig``, least recently used evicted first.
+
+    Args:
+        build: Builds the validator for a configuration
+        max_size: Most configurations kept
+    """
+
+    def __init__(self, build: Callable[[ValidatorConfig], MedicalDataValidator], max_size: int = 64):
+        self.build = build
+        self.max_size = max_size
+        self._validators: "OrderedDict[ValidatorConfig, MedicalDataValidator]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, config: ValidatorConfig) -> MedicalDataValidator:
+        """The shared validator for ``config``, building it on first use."""
+        with self._lock:
+            validator = self._validators.get(config)
+            if validator is not None:
+                self._validators.move_to_end(config)
+                self.hits += 1
+                return validator
+            self.misses += 1
+
+        # Built outside the lock; a concurrent build of the same config is harmless
+        validator = self.build(config)
+        with self._lock:
+            validator = self._validators.setdefault(config, validator)
+            self._validators.move_to_end(config)
+            while len(self._validators) > self.max_size:
+                self._validators.popitem(last=False)
+        return validator
+
+    def warm(self, configs: Iterable[ValidatorConfig]) -> int:
+        """Build the validators for ``configs`` ahead of the first request."""
+        count = 0
+        for config in configs:
+            self.get(config)
+            count += 1
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._validators), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+def default_configs(profiles: Iterable[str], templates: Iterable[str] = ()) -> Tuple[ValidatorConfig, ...]:
+    """Configurations the API uses without extra parameters, for warming."""
+    configs = [ValidatorConfig(detect_phi=detect_phi) for detect_phi in (True, False)]
+    configs.extend(ValidatorConfig(profile=profile) for profile in profiles)
+    configs.extend(ValidatorConfig(template=template) for template in templates)
+    return tuple(configs)
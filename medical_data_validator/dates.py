@@ -0,0 +1,212 @@
+"""
+Shared date-parsing service.
+
+Date columns are parsed once per unique value with an explicit format
+inferred from a sample, instead of letting pandas fall back to per-element
+dateutil parsing. Values that do not fit the first format are retried with
+the next best format, so columns mixing several layouts are detected and
+reported. Within a validation run, parsed columns are cached so every rule
+that needs the same dates reuses one parse.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Candidate formats, most common first; ties go to the earlier format
+DEFAULT_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%Y/%m/%d",
+    "%m-%d-%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%Y%m%d",
+    "%d-%b-%Y",
+    "%d %b %Y",
+    "%b %d, %Y",
+]
+
+# Marker recorded when values were only parseable by pandas' format inference
+INFERRED_FORMAT = "inferred"
+
+
+def _parse_single(value: str) -> Any:
+    """Parse one value with pandas' inference, returning NaT on failure."""
+    try:
+        parsed = pd.Timestamp(value)
+    except (ValueError, TypeError, OverflowError):
+        return pd.NaT
+    if parsed is pd.NaT:
+        return pd.NaT
+    return parsed.tz_localize(None) if parsed.tzinfo is not None else parsed
+
+
+@dataclass
+class ParsedDates:
+    """Result of parsing a column of dates."""
+
+    values: pd.Series
+    formats: List[str] = field(default_factory=list)
+    invalid_count: int = 0
+
+    @property
+    def format(self) -> Optional[str]:
+        """The format that parsed the most values."""
+        return self.formats[0] if self.formats else None
+
+    @property
+    def mixed(self) -> bool:
+        """Whether more than one format was needed."""
+        return len(self.formats) > 1
+
+
+class DateParser:
+    """
+    Parses date columns with inferred explicit formats.
+
+    Args:
+        formats: Candidate strptime formats, most preferred first
+        sample_size: Number of unique values used to rank candidate formats
+        fallback: Whether to try pandas' own inference on values no
+            candidate format can parse
+    """
+
+    def __init__(
+        self,
+        formats: Optional[Sequence[str]] = None,
+        sample_size: int = 500,
+        fallback: bool = True,
+    ):
+        self.formats = list(formats) if formats is not None else list(DEFAULT_DATE_FORMATS)
+        self.sample_size = sample_size
+        self.fallback = fallback
+
+    def infer_format(self, values: pd.Series, candidates: Optional[Sequence[str]] = None) -> Optional[str]:
+        """Return the candidate format that parses the most values of a sample."""
+        sample = values.head(self.sample_size)
+        best_format, best_count = None, 0
+        for fmt in candidates if candidates is not None else self.formats:
+            count = int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+            if count > best_count:
+                best_format, best_count = fmt, count
+                if count == len(sample):
+                    break
+        return best_format
+
+    def _parse_strings(self, values: pd.Series) -> Tuple[pd.Series, List[str]]:
+        """Parse unique strings format by format; returns timestamps and formats used."""
+        parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+        remaining = values
+        candidates = list(self.formats)
+        used: List[str] = []
+
+        while len(remaining) and candidates:
+            fmt = self.infer_format(remaining, candidates)
+            if fmt is None:
+                break
+            candidates.remove(fmt)
+            attempt = pd.to_datetime(remaining, format=fmt, errors="coerce")
+            hits = attempt.notna()
+            parsed[remaining.index[hits]] = attempt[hits]
+            used.append(fmt)
+            remaining = remaining[~hits]
+
+        if self.fallback and len(remaining):
+            # Only the leftover uniques pay for per-value inference
+            attempt = pd.Series(
+                [_parse_single(value) for value in remaining],
+                index=remaining.index,
+                dtype="datetime64[ns]",
+            )
+            hits = attempt.notna()
+            if hits.any():
+                parsed[remaining.index[hits]] = attempt[hits]
+                used.append(INFERRED_FORMAT)
+
+        return parsed, used
+
+    def parse(self, values: pd.Series) -> ParsedDates:
+        """Parse a column of dates, mapping per-unique results back to rows."""
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return ParsedDates(values=values)
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            converted = pd.to_datetime(values, errors="coerce")
+            invalid = int((converted.isna() & values.notna()).sum())
+            return ParsedDates(values=converted, invalid_count=invalid)
+
+        row_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        unique_values = pd.Series(uniques, dtype=object)
+        # Already-parsed objects (datetime, date, Timestamp) skip string parsing
+        timestamps = unique_values[unique_values.map(lambda v: isinstance(v, np.datetime64) or hasattr(v, "year"))]
+        strings = unique_values.drop(timestamps.index).astype(str).str.strip()
+
+        parsed_uniques, used = self._parse_strings(strings)
+        if len(timestamps):
+            parsed_uniques = pd.concat([parsed_uniques, pd.to_datetime(timestamps, errors="coerce")]).sort_index()
+
+        # The extra trailing NaT slot absorbs the -1 codes of missing values
+        table = np.append(
+            parsed_uniques.reindex(range(len(uniques))).to_numpy(dtype="datetime64[ns]"),
+            np.datetime64("NaT", "ns"),
+        )
+        converted = pd.Series(table.take(row_codes), index=values.index, name=values.name)
+
+        invalid = int((converted.isna() & values.notna()).sum())
+        return ParsedDates(values=converted, formats=used, invalid_count=invalid)
+
+
+default_date_parser = DateParser()
+
+_session_cache: ContextVar[Optional[Dict[Tuple[int, Any], Tuple[pd.DataFrame, ParsedDates]]]] = ContextVar(
+    "date_parsing_session", default=None
+)
+
+
+@contextmanager
+def date_parsing_session() -> Iterator[None]:
+    """
+    Cache parsed date columns for the duration of a validation run.
+
+    Nested sessions share the outermost cache.
+    """
+    if _session_cache.get() is not None:
+        yield
+        return
+    token = _session_cache.set({})
+    try:
+        yield
+    finally:
+        _session_cache.reset(token)
+
+
+def parse_dates(data: pd.DataFrame, column: Any, parser: Optional[DateParser] = None) -> ParsedDates:
+    """
+    Parse ``data[column]`` as dates, reusing the result within a session.
+
+    Results are only shared when the default parser is used, since custom
+    parsers may accept different formats.
+    """
+    cache = _session_cache.get()
+    shareable = cache is not None and parser is None
+    key = (id(data), column)
+    if shareable and key in cache:
+        cached_data, cached_result = cache[key]
+        if cached_data is data:
+            return cached_result
+
+    result = (parser or default_date_parser).parse(data[column])
+    if shareable:
+        # Keeping a reference to ``data`` guarantees its id is not reused
+        cache[key] = (data, result)
+    return result
@@ -0,0 +1,452 @@
+"""
+Declarative validation rules compiled to vectorized expressions.
+
+Rules are written in JSON or YAML instead of Python functions::
+
+    dates: [admission_date, discharge_date]
+    rules:
+      - name: discharge_after_admission
+        assert: discharge_date >= admission_date
+      - name: adult_hemoglobin
+        column: hemoglobin
+        range: {min: 12.0, max: 15.5}
+        when: sex == 'F' and age >= 18
+      - name: mrn_format
+        column: mrn
+        regex: '^MRN\\d{6}$'
+        severity: warning
+
+Expressions use Python syntax restricted to column names, constants,
+comparisons, ``and``/``or``/``not``, arithmetic and the functions in
+FUNCTIONS. Each expression is compiled once with :mod:`ast` into a small
+hashable intermediate representation (nested tuples). Evaluation walks the
+IR with whole-column pandas/NumPy operations and memoizes every node, so
+subexpressions shared by several rules (for example a parsed date column or
+a common condition) are computed once per validation run. The IR does not
+depend on pandas and can be translated for other backends.
+
+Rows where a column used by the assertion is missing are not reported;
+use ``not_null`` (or ``notnull(...)``) to require values.
+"""
+
+import ast
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from .core import ValidationIssue, ValidationRule
+from .dates import parse_dates
+
+Node = Tuple[Any, ...]
+
+_COMPARISONS = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+_ARITHMETIC = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+}
+
+# Supported functions and their argument counts
+FUNCTIONS = {
+    "col": 1,
+    "isnull": 1,
+    "notnull": 1,
+    "matches": 2,
+    "isin": 2,
+    "between": 3,
+    "date": 1,
+    "length": 1,
+    "abs": 1,
+}
+
+# Functions whose argument may legitimately be missing
+_NULL_AWARE = {"isnull", "notnull"}
+
+
+def _constant(value: Any) -> Any:
+    """Make list constants hashable so nodes can be memoized."""
+    if isinstance(value, (list, set)):
+        return tuple(value)
+    return value
+
+
+def _compile_node(node: ast.AST) -> Node:
+    if isinstance(node, ast.Name):
+        return ("col", node.id)
+    if isinstance(node, ast.Constant):
+        return ("const", node.value)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        values = []
+        for element in node.elts:
+            if not isinstance(element, ast.Constant):
+                raise ValueError("Only constants are allowed inside lists")
+            values.append(element.value)
+        return ("const", tuple(values))
+    if isinstance(node, ast.BoolOp):
+        op = "and" if isinstance(node.op, ast.And) else "or"
+        return (op,) + tuple(_compile_node(value) for value in node.values)
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand)
+        if isinstance(node.op, ast.Not):
+            return ("not", operand)
+        if isinstance(node.op, ast.USub):
+            if operand[0] == "const":
+                return ("const", -operand[1])
+            return ("neg", operand)
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    if isinstance(node, ast.BinOp):
+        op = _ARITHMETIC.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return ("arith", op, _compile_node(node.left), _compile_node(node.right))
+    if isinstance(node, ast.Compare):
+        # a < b < c becomes (a < b) and (b < c)
+        parts = []
+        left = _compile_node(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            symbol = _COMPARISONS.get(type(op))
+            if symbol is None:
+                raise ValueError(f"Unsupported comparison: {type(op).__name__}")
+            right = _compile_node(comparator)
+            parts.append(("cmp", symbol, left, right))
+            left = right
+        return parts[0] if len(parts) == 1 else ("and",) + tuple(parts)
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = getattr(node.func, "id", type(node.func).__name__)
+            raise ValueError(f"Unknown function: {name}")
+        if node.keywords or len(node.args) != FUNCTIONS[node.func.id]:
+            raise ValueError(f"{node.func.id}() takes {FUNCTIONS[node.func.id]} positional arguments")
+        args = tuple(_compile_node(arg) for arg in node.args)
+        if node.func.id == "col":
+            if args[0][0] != "const" or not isinstance(args[0][1], str):
+                raise ValueError("col() takes a column name string")
+            return ("col", args[0][1])
+        return ("call", node.func.id) + args
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+def compile_expression(expression: str) -> Node:
+    """Compile an expression string into IR."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid rule expression '{expression}': {e.msg}") from e
+    return _compile_node(tree.body)
+
+
+def referenced_columns(node: Node, null_sensitive_only: bool = False) -> Set[str]:
+    """Columns used by an IR node, optionally skipping those inside isnull/notnull."""
+    kind = node[0]
+    if kind == "col":
+        return {node[1]}
+    if kind == "const":
+        return set()
+    if kind == "call" and null_sensitive_only and node[1] in _NULL_AWARE:
+        return set()
+    children = node[2:] if kind in ("call", "cmp", "arith") else node[1:]
+    columns: Set[str] = set()
+    for child in children:
+        columns |= referenced_columns(child, null_sensitive_only)
+    return columns
+
+
+def _and(*nodes: Node) -> Node:
+    nodes = tuple(node for node in nodes if node is not None)
+    return nodes[0] if len(nodes) == 1 else ("and",) + nodes
+
+
+class CompiledRule:
+    """A single declarative rule compiled to IR."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        if "name" not in spec:
+            raise ValueError("Declarative rules need a 'name'")
+        self.name = spec["name"]
+        self.description = spec.get("description", "")
+        self.severity = spec.get("severity", "error")
+        self.column = spec.get("column")
+        self.message = spec.get("message")
+        self.assertion = self._compile_assertion(spec)
+        self.condition = compile_expression(spec["when"]) if spec.get("when") else None
+        self.columns = referenced_columns(self.assertion)
+        if self.condition is not None:
+            self.columns |= referenced_columns(self.condition)
+        self.null_sensitive = referenced_columns(self.assertion, null_sensitive_only=True)
+
+    def _compile_assertion(self, spec: Dict[str, Any]) -> Node:
+        parts: List[Node] = []
+        if spec.get("assert"):
+            parts.append(compile_expression(spec["assert"]))
+
+        sugar = [key for key in ("range", "regex", "in", "not_null") if key in spec]
+        if sugar and not self.column:
+            raise ValueError(f"Rule '{self.name}' uses {sugar[0]} without a 'column'")
+        column = ("col", self.column)
+        if "range" in spec:
+            bounds = spec["range"]
+            if bounds.get("min") is not None:
+                parts.append(("cmp", ">=", column, ("const", bounds["min"])))
+            if bounds.get("max") is not None:
+                parts.append(("cmp", "<=", column, ("const", bounds["max"])))
+        if "regex" in spec:
+            parts.append(("call", "matches", column, ("const", spec["regex"])))
+        if "in" in spec:
+            parts.append(("call", "isin", column, ("const", _constant(spec["in"]))))
+        if spec.get("not_null"):
+            parts.append(("call", "notnull", column))
+
+        if not parts:
+            raise ValueError(f"Rule '{self.name}' has nothing to check")
+        return _and(*parts)
+
+
+class ExpressionEvaluator:
+    """
+    Evaluates IR nodes against a DataFrame with memoization.
+
+    One evaluator is used per validation run so identical subexpressions
+    across rules are computed once.
+    """
+
+    def __init__(self, data: pd.DataFrame, date_columns: Iterable[str] = ()):
+        self.data = data
+        self.date_columns = set(date_columns)
+        self.memo: Dict[Node, Any] = {}
+
+    def evaluate(self, node: Node) -> Any:
+        if node in self.memo:
+            return self.memo[node]
+        result = self._evaluate(node)
+        self.memo[node] = result
+        return result
+
+    def mask(self, node: Node) -> np.ndarray:
+        """Evaluate a boolean node to a row mask (missing counts as False)."""
+        result = self.evaluate(node)
+        if isinstance(result, pd.Series):
+            return result.fillna(False).to_numpy(dtype=bool)
+        return np.full(len(self.data), bool(result))
+
+    def _evaluate(self, node: Node) -> Any:
+        kind = node[0]
+        if kind == "const":
+            return node[1]
+        if kind == "col":
+            if node[1] in self.date_columns:
+                return parse_dates(self.data, node[1]).values
+            return self.data[node[1]]
+        if kind == "and":
+            result = self.mask(node[1])
+            for child in node[2:]:
+                result = result & self.mask(child)
+            return pd.Series(result, index=self.data.index)
+        if kind == "or":
+            result = self.mask(node[1])
+            for child in node[2:]:
+                result = result | self.mask(child)
+            return pd.Series(result, index=self.data.index)
+        if kind == "not":
+            return pd.Series(~self.mask(node[1]), index=self.data.index)
+        if kind == "neg":
+            return -self.evaluate(node[1])
+        if kind == "cmp":
+            left, right = self.evaluate(node[2]), self.evaluate(node[3])
+            return _COMPARE[node[1]](left, right)
+        if kind == "arith":
+            left, right = self.evaluate(node[2]), self.evaluate(node[3])
+            return _ARITH[node[1]](left, right)
+        if kind == "call":
+            return self._call(node[1], node[2:])
+        raise ValueError(f"Unknown IR node: {kind}")
+
+    def _call(self, name: str, args: Tuple[Node, ...]) -> Any:
+        if name == "date":
+            if args[0][0] == "col":
+                return parse_dates(self.data, args[0][1]).values
+            return pd.to_datetime(self.evaluate(args[0]), errors="coerce")
+
+        values = [self.evaluate(arg) for arg in args]
+        if name == "isnull":
+            return pd.Series(pd.isna(values[0]), index=self.data.index) if np.ndim(values[0]) else pd.isna(values[0])
+        if name == "notnull":
+            return pd.Series(pd.notna(values[0]), index=self.data.index) if np.ndim(values[0]) else pd.notna(values[0])
+        if name == "matches":
+            return _match_uniques(values[0], values[1])
+        if name == "isin":
+            return values[0].isin(list(values[1]))
+        if name == "between":
+            return (values[0] >= values[1]) & (values[0] <= values[2])
+        if name == "length":
+            return values[0].astype(str).str.len().where(values[0].notna())
+        if name == "abs":
+            return values[0].abs() if isinstance(values[0], pd.Series) else abs(values[0])
+        raise ValueError(f"Unknown function: {name}")
+
+
+_COMPARE = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+_ARITH = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+}
+
+
+def _match_uniques(values: pd.Series, pattern: str) -> pd.Series:
+    """Regex search run once per distinct value."""
+    row_codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    unique_match = pd.Series(uniques, dtype=object).astype(str).str.contains(pattern, regex=True).to_numpy(dtype=bool)
+    # The trailing slot maps missing values to False
+    table = np.append(unique_match, False)
+    return pd.Series(table.take(row_codes), index=values.index)
+
+
+def load_rules(source: Union[str, Path, Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Load a declarative rule set.
+
+    Args:
+        source: Path to a .json/.yaml/.yml file, a JSON/YAML string, a rule
+            set dictionary or a list of rule dictionaries
+
+    Returns:
+        Rule set dictionary with ``rules`` and ``dates`` keys
+    """
+    if isinstance(source, list):
+        return {"rules": source, "dates": []}
+    if isinstance(source, dict):
+        return {"rules": source.get("rules", []), "dates": source.get("dates", [])}
+
+    text = str(source)
+    path = Path(text)
+    suffix = path.suffix.lower() if "\n" not in text else ""
+    is_yaml = suffix in (".yaml", ".yml")
+    if suffix in (".json", ".yaml", ".yml"):
+        if not path.exists():
+            raise FileNotFoundError(f"Rule file not found: {text}")
+        text = path.read_text()
+
+    stripped = text.lstrip()
+    if not is_yaml and stripped[:1] in ("{", "["):
+        parsed = json.loads(text)
+    elif yaml is None:
+        raise ImportError("PyYAML is required for YAML rule files. Install with: pip install pyyaml")
+    else:
+        parsed = yaml.safe_load(text)
+    if not isinstance(parsed, (dict, list)):
+        raise ValueError(f"Rule set must be a mapping or a list of rules, got {type(parsed).__name__}")
+    return load_rules(parsed)
+
+
+class DeclarativeRuleValidator(ValidationRule):
+    """
+    Runs a set of declarative rules as one vectorized validation rule.
+
+    Each failing rule produces one issue with the number of failing rows;
+    set ``row_level=True`` to get one issue per failing row instead.
+    """
+
+    def __init__(
+        self,
+        rules: Union[str, Path, Dict[str, Any], List[Dict[str, Any]]],
+        row_level: bool = False,
+        name: str = "DeclarativeRuleValidator",
+        description: str = "Validates data against declarative rules",
+    ):
+        super().__init__(name=name, description=description)
+        rule_set = load_rules(rules)
+        self.compiled_rules = [CompiledRule(spec) for spec in rule_set["rules"]]
+        self.date_columns = list(rule_set["dates"])
+        self.row_level = row_level
+
+    def referenced_columns(self) -> Optional[List[str]]:
+        columns: List[str] = []
+        for rule in self.compiled_rules:
+            columns.extend(sorted(rule.columns - set(columns)))
+        return columns
+
+    def is_row_local(self) -> bool:
+        # Expressions are evaluated element-wise; only the counted form aggregates
+        return self.row_level
+
+    def evaluate(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Row masks of failing rows per rule; rules with missing columns are skipped."""
+        evaluator = ExpressionEvaluator(data, self.date_columns)
+        failures = {}
+        for rule in self.compiled_rules:
+            if not rule.columns <= set(data.columns):
+                continue
+            failed = ~evaluator.mask(rule.assertion)
+            for column in rule.null_sensitive:
+                failed &= data[column].notna().to_numpy()
+            if rule.condition is not None:
+                failed &= evaluator.mask(rule.condition)
+            failures[rule.name] = failed
+        return failures
+
+    def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
+        issues = []
+        failures = self.evaluate(data)
+
+        for rule in self.compiled_rules:
+            failed = failures.get(rule.name)
+            if failed is None or not failed.any():
+                continue
+
+            if self.row_level:
+                for row in np.flatnonzero(failed):
+                    issues.append(
+                        ValidationIssue(
+                            severity=rule.severity,
+                            message=rule.message or f"Row fails rule '{rule.name}'",
+                            column=rule.column,
+                            row=int(row),
+                            value=data[rule.column].iloc[row] if rule.column else None,
+                            rule_name=rule.name,
+                        )
+                    )
+                continue
+
+            count = int(failed.sum())
+            if rule.message:
+                message = f"{rule.message} ({count} rows)"
+            elif rule.column:
+                message = f"Column '{rule.column}' has {count} values failing rule '{rule.name}'"
+            else:
+                message = f"{count} rows fail rule '{rule.name}'"
+            issues.append(
+                ValidationIssue(
+                    severity=rule.severity,
+                    message=message,
+                    column=rule.column,
+                    rule_name=rule.name,
+                )
+            )
+
+        return issues
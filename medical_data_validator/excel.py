@@ -0,0 +1,199 @@
+"""
+Streaming Excel ingestion.
+
+``iter_excel`` reads .xlsx sheets with openpyxl in read-only mode and
+yields DataFrames of a bounded number of rows, so a 300k-row export never
+has to sit in memory as cell objects or as one frame. Combined with
+``BatchValidator.validate_stream`` a sheet is validated as it is read, and
+``validate_excel`` runs several sheets in separate processes.
+
+``read_excel`` loads a whole sheet and uses the Rust-based calamine engine
+when ``python-calamine`` is installed; otherwise it defers to pandas. Legacy
+.xls files always go through pandas.
+"""
+
+import importlib.util
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .core import MedicalDataValidator, ValidationResult
+from .loaders import CSV_NULL_VALUES, _project, _with_source_columns
+from .performance import BatchValidator
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+ExcelSource = Union[str, Path, Any]
+SheetRef = Union[str, int]
+
+
+def has_calamine() -> bool:
+    """Whether the calamine engine for ``pd.read_excel`` is installed."""
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def _is_legacy(source: ExcelSource) -> bool:
+    name = str(source) if isinstance(source, (str, Path)) else getattr(source, "filename", "") or ""
+    return str(name).lower().endswith(".xls")
+
+
+def _open_workbook(source: ExcelSource) -> "openpyxl.Workbook":
+    if openpyxl is None:
+        raise ImportError("Reading .xlsx files requires openpyxl")
+    return openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+
+
+def _worksheet(workbook: "openpyxl.Workbook", sheet_name: SheetRef) -> Any:
+    if isinstance(sheet_name, int):
+        return workbook.worksheets[sheet_name]
+    return workbook[sheet_name]
+
+
+def sheet_names(source: ExcelSource) -> List[str]:
+    """Names of the worksheets in a workbook."""
+    if _is_legacy(source):
+        return list(pd.ExcelFile(source).sheet_names)
+    workbook = _open_workbook(source)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _frame(rows: List[tuple], header: List[str], positions: List[int], source_columns: List[str]) -> pd.DataFrame:
+    frame = pd.DataFrame.from_records(
+        [[row[i] if i < len(row) else None for i in positions] for row in rows],
+        columns=[header[i] for i in positions],
+    )
+    # Match pd.read_excel: missing-value markers in text cells become NaN
+    for column in frame.columns[frame.dtypes == object]:
+        values = frame[column]
+        frame[column] = values.mask(values.isin(CSV_NULL_VALUES), np.nan)
+    return _with_source_columns(frame.infer_objects(), source_columns)
+
+
+def iter_excel(
+    source: ExcelSource,
+    sheet_name: SheetRef = 0,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 10000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a worksheet as DataFrames of at most ``batch_size`` rows.
+
+    The first row is the header and completely blank rows are skipped.
+    Column types are inferred per batch.
+
+    Args:
+        source: Path or binary file object of an .xlsx workbook
+        sheet_name: Sheet name or position
+        columns: Columns to keep; None keeps every column
+        batch_size: Maximum rows per yielded DataFrame
+    """
+    if _is_legacy(source):
+        frame = pd.read_excel(source, sheet_name=sheet_name)
+        selected = _project(list(frame.columns), columns)
+        for start in range(0, len(frame), batch_size):
+            yield _with_source_columns(frame.iloc[start:start + batch_size][selected].reset_index(drop=True), frame.columns)
+        return
+
+    workbook = _open_workbook(source)
+    try:
+        rows = _worksheet(workbook, sheet_name).iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        header = [str(value) if value is not None else f"Unnamed: {i}" for i, value in enumerate(header_row)]
+        wanted = set(_project(header, columns))
+        positions = [i for i, name in enumerate(header) if name in wanted]
+
+        batch: List[tuple] = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield _frame(batch, header, positions, header)
+                batch = []
+        if batch:
+            yield _frame(batch, header, positions, header)
+    finally:
+        workbook.close()
+
+
+def read_excel(
+    source: ExcelSource,
+    sheet_name: SheetRef = 0,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Read a whole worksheet, using the calamine engine when available."""
+    engine = "calamine" if has_calamine() and not _is_legacy(source) else None
+    if columns is None:
+        frame = pd.read_excel(source, sheet_name=sheet_name, engine=engine)
+        return _with_source_columns(frame, frame.columns)
+
+    header = list(pd.read_excel(source, sheet_name=sheet_name, engine=engine, nrows=0).columns)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    wanted = set(columns)
+    frame = pd.read_excel(source, sheet_name=sheet_name, engine=engine, usecols=lambda name: name in wanted)
+    return _with_source_columns(frame, header)
+
+
+def _validate_sheet(
+    validator: MedicalDataValidator,
+    source: ExcelSource,
+    sheet_name: SheetRef,
+    batch_size: int,
+) -> ValidationResult:
+    batches = iter_excel(source, sheet_name, columns=validator.referenced_columns(), batch_size=batch_size)
+    return BatchValidator(validator, batch_size=batch_size).validate_stream(batches)
+
+
+def validate_excel(
+    validator: MedicalDataValidator,
+    source: Union[str, Path],
+    sheets: Optional[Sequence[SheetRef]] = None,
+    batch_size: int = 10000,
+    max_workers: Optional[int] = None,
+) -> Dict[str, ValidationResult]:
+    """
+    Validate worksheets while streaming them, one process per sheet.
+
+    Args:
+        validator: Validator applied to every sheet
+        source: Path of the workbook
+        sheets: Sheet names or positions; defaults to every sheet
+        batch_size: Rows per validation batch
+        max_workers: Worker processes; defaults to one per sheet up to the
+            CPU count. Validators that cannot be pickled (for example with
+            custom validator functions) are run in this process.
+
+    Returns:
+        Sheet name -> ValidationResult
+    """
+    names = sheet_names(source)
+    selected = [names[sheet] if isinstance(sheet, int) else sheet for sheet in (sheets or names)]
+    workers = max_workers or min(len(selected), os.cpu_count() or 1)
+
+    parallel = workers > 1 and len(selected) > 1
+    if parallel:
+        try:
+            pickle.dumps(validator)
+        except Exception:
+            parallel = False
+
+    if not parallel:
+        return {sheet: _validate_sheet(validator, source, sheet, batch_size) for sheet in selected}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {sheet: pool.submit(_validate_sheet, validator, source, sheet, batch_size) for sheet in selected}
+        return {sheet: future.result() for sheet, future in futures.items()}
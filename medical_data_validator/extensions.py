@@ -86,6 +86,7 @@ class MedicalProfiles:
             RangeValidator,
             DateValidator,
         )
+        from .sequences import SequenceValidator
         
         rules = [
             SchemaValidator(
@@ -101,7 +102,13 @@ class MedicalProfiles:
             RangeValidator(ranges={
                 "age": {"min": 18, "max": 100},
                 "bmi": {"min": 15, "max": 60},
-            })
+            }),
+            SequenceValidator(
+                group_column="subject_id",
+                time_column="visit_date",
+                sequence_column="visit_number",
+                checks=["monotonic"],
+            )
         ]
         
         return ValidationProfile(
@@ -137,7 +144,7 @@ class MedicalProfiles:
                 "diagnosis_code": "icd10",
                 "procedure_code": "cpt",
                 "medication_code": "ndc"
-            }),
+            }, verify_check_digits=True),
             DateValidator(
                 date_columns=["encounter_date", "birth_date"],
                 min_date="1900-01-01"
@@ -216,7 +223,7 @@ class MedicalProfiles:
             MedicalCodeValidator(code_columns={
                 "test_code": "loinc",
                 "diagnosis_code": "icd10"
-            }),
+            }, verify_check_digits=True),
             RangeValidator(ranges={
                 "test_value": {"min": -1000, "max": 10000},  # Generic range
             }),
@@ -0,0 +1,400 @@
+"""
+Streaming validation of FHIR Bulk Data NDJSON exports.
+
+A bulk export is one file per resource type with one JSON resource per
+line. ``iter_fhir`` reads such a file line by line, parses each resource
+with orjson when it is installed (the standard library ``json`` otherwise)
+and flattens selected element paths into DataFrame batches, so the usual
+rules (ranges, codes, dates, PHI) run on FHIR data with memory bounded by
+the batch size. While flattening, ``FhirStructureChecker`` checks what the
+rules cannot see: unparseable lines, missing ``resourceType``/``id``,
+missing required elements and malformed references.
+
+``validate_fhir_ndjson`` splits an uncompressed file at line boundaries
+into byte ranges and validates the ranges in worker processes.
+
+Paths are dotted element names, with list positions as integers
+(``code.coding.0.code``). A list reached without a position uses its first
+element.
+"""
+
+import gzip
+import json
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .core import MedicalDataValidator, ValidationIssue, ValidationResult
+from .performance import BatchValidator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Columns flattened when no paths are given
+DEFAULT_PATHS: Dict[str, Dict[str, str]] = {
+    "Patient": {
+        "gender": "gender",
+        "birth_date": "birthDate",
+        "family_name": "name.family",
+        "postal_code": "address.postalCode",
+    },
+    "Observation": {
+        "status": "status",
+        "subject": "subject.reference",
+        "code": "code.coding.code",
+        "code_system": "code.coding.system",
+        "value": "valueQuantity.value",
+        "unit": "valueQuantity.unit",
+        "effective_date": "effectiveDateTime",
+    },
+    "Condition": {
+        "subject": "subject.reference",
+        "code": "code.coding.code",
+        "code_system": "code.coding.system",
+        "onset_date": "onsetDateTime",
+    },
+    "Encounter": {
+        "status": "status",
+        "subject": "subject.reference",
+        "class": "class.code",
+        "start": "period.start",
+        "end": "period.end",
+    },
+}
+
+# Elements with minimum cardinality 1 in FHIR R4; "[x]" marks choice types
+REQUIRED_ELEMENTS: Dict[str, Tuple[str, ...]] = {
+    "AllergyIntolerance": ("patient",),
+    "Condition": ("subject",),
+    "DiagnosticReport": ("status", "code"),
+    "Encounter": ("status", "class"),
+    "Immunization": ("status", "vaccineCode", "patient", "occurrence[x]"),
+    "MedicationRequest": ("status", "intent", "medication[x]", "subject"),
+    "Observation": ("status", "code"),
+    "Procedure": ("status", "subject"),
+}
+
+REFERENCE_ELEMENTS = ("subject", "patient", "encounter")
+
+FHIR_ID = re.compile(r"^[A-Za-z0-9\-.]{1,64}$")
+FHIR_REFERENCE = re.compile(
+    r"^(?:[A-Z][A-Za-z]+/[A-Za-z0-9\-.]{1,64}(?:/_history/[A-Za-z0-9\-.]{1,64})?"
+    r"|urn:uuid:[0-9a-fA-F\-]{36}|#.*|https?://\S+)$"
+)
+
+
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """Split a dotted element path, turning list positions into ints."""
+    return tuple(int(part) if part.isdigit() else part for part in path.split("."))
+
+
+def resolve_path(resource: Any, path: Tuple[Union[str, int], ...]) -> Any:
+    """Value at ``path`` in a parsed resource, or None when absent."""
+    value = resource
+    for part in path:
+        if isinstance(value, list):
+            if isinstance(part, int):
+                value = value[part] if part < len(value) else None
+                continue
+            value = value[0] if value else None
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value
+
+
+def _has_element(resource: Dict[str, Any], element: str) -> bool:
+    if element.endswith("[x]"):
+        prefix = element[:-3]
+        return any(key.startswith(prefix) and key[len(prefix):][:1].isupper() for key in resource)
+    return resource.get(element) not in (None, "", [], {})
+
+
+class FhirStructureChecker:
+    """
+    Tallies FHIR structural problems while resources are read.
+
+    Problems are counted per kind rather than reported per resource; each
+    issue records the first offending line (0-based) as its row.
+
+    Args:
+        resource_type: Expected resource type; other resources are reported
+            and skipped
+    """
+
+    rule_name = "fhir_structure"
+
+    def __init__(self, resource_type: Optional[str] = None):
+        self.resource_type = resource_type
+        self.lines = 0
+        # (message, column) -> [count, first line]
+        self.tally: Dict[Tuple[str, Optional[str]], List[int]] = {}
+
+    def _report(self, message: str, column: Optional[str], line: int) -> None:
+        entry = self.tally.get((message, column))
+        if entry is None:
+            self.tally[(message, column)] = [1, line]
+        else:
+            entry[0] += 1
+            entry[1] = min(entry[1], line)
+
+    def invalid_json(self, line: int) -> None:
+        self._report("lines are not valid JSON objects", None, line)
+
+    def check(self, resource: Dict[str, Any], line: int) -> bool:
+        """Check one resource; returns False if it should not be flattened."""
+        resource_type = resource.get("resourceType")
+        if not isinstance(resource_type, str):
+            self._report("resources have no resourceType", "resourceType", line)
+            return False
+        if self.resource_type is not None and resource_type != self.resource_type:
+            self._report(f"resources are {resource_type}, expected {self.resource_type}", "resourceType", line)
+            return False
+
+        resource_id = resource.get("id")
+        if resource_id is None:
+            self._report(f"{resource_type} resources have no id", "id", line)
+        elif not isinstance(resource_id, str) or not FHIR_ID.match(resource_id):
+            self._report(f"{resource_type} resources have an invalid id", "id", line)
+
+        for element in REQUIRED_ELEMENTS.get(resource_type, ()):
+            if not _has_element(resource, element):
+                self._report(f"{resource_type} resources are missing required element '{element}'", element, line)
+
+        for element in REFERENCE_ELEMENTS:
+            value = resource.get(element)
+            reference = value.get("reference") if isinstance(value, dict) else None
+            if reference is not None and not (isinstance(reference, str) and FHIR_REFERENCE.match(reference)):
+                self._report(f"{resource_type} resources have a malformed reference in '{element}'", element, line)
+        return True
+
+    def merge(self, other: "FhirStructureChecker", line_offset: int = 0) -> None:
+        """Add another checker's tally, shifting its lines by ``line_offset``."""
+        self.lines += other.lines
+        for (message, column), (count, first) in other.tally.items():
+            entry = self.tally.setdefault((message, column), [0, first + line_offset])
+            entry[0] += count
+            entry[1] = min(entry[1], first + line_offset)
+
+    def issues(self) -> List[ValidationIssue]:
+        """One error per kind of problem, in order of first occurrence."""
+        return [
+            ValidationIssue(
+                severity="error",
+                message=f"{count} {message} (first at line {first + 1})",
+                column=column,
+                row=first,
+                rule_name=self.rule_name,
+            )
+            for (message, column), (count, first) in sorted(self.tally.items(), key=lambda item: item[1][1])
+        ]
+
+
+def _open(path: Path):
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_lines(
+    file_path: Union[str, Path],
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Lines of an NDJSON file whose first byte lies in ``[start, end)``.
+
+    ``start`` must be the beginning of a line (see ``split_offsets``).
+    """
+    with _open(Path(file_path)) as handle:
+        if start:
+            handle.seek(start)
+        position = start
+        for line in handle:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line
+
+
+def split_offsets(file_path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to ``parts`` byte ranges that start on line boundaries.
+
+    Compressed files cannot be entered mid-stream and give a single range.
+    """
+    path = Path(file_path)
+    size = path.stat().st_size
+    if parts <= 1 or size == 0 or path.suffix.lower() == ".gz":
+        return [(0, size)]
+
+    boundaries = [0]
+    with open(path, "rb") as handle:
+        for part in range(1, parts):
+            handle.seek(max(size * part // parts, boundaries[-1]))
+            handle.readline()
+            position = handle.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _flatten_batch(rows: Dict[str, List[Any]]) -> pd.DataFrame:
+    return pd.DataFrame(rows).infer_objects()
+
+
+def iter_fhir(
+    file_path: Union[str, Path],
+    paths: Optional[Dict[str, str]] = None,
+    resource_type: Optional[str] = None,
+    batch_size: int = 10000,
+    checker: Optional[FhirStructureChecker] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream FHIR NDJSON resources as flattened DataFrame batches.
+
+    Every batch has ``id`` and ``resourceType`` columns plus one column per
+    entry of ``paths``. Blank lines are skipped; unparseable lines and
+    resources rejected by ``checker`` are left out of the batches.
+
+    Args:
+        file_path: Path to a .ndjson (or .ndjson.gz) file
+        paths: Column name -> element path; defaults to ``DEFAULT_PATHS``
+            for ``resource_type``
+        resource_type: Expected resource type
+        batch_size: Maximum resources per batch
+        checker: Structure checker to feed; one is created if omitted
+        start: Byte offset of the first line to read
+        end: Byte offset to stop before
+    """
+    if paths is None:
+        paths = DEFAULT_PATHS.get(resource_type, {})
+    checker = checker or FhirStructureChecker(resource_type)
+    parsed_paths = {"id": ("id",), "resourceType": ("resourceType",)}
+    parsed_paths.update({column: parse_path(path) for column, path in paths.items()})
+
+    rows: Dict[str, List[Any]] = {column: [] for column in parsed_paths}
+    count = 0
+    for line in iter_lines(file_path, start, end):
+        line_number = checker.lines
+        checker.lines += 1
+        if not line.strip():
+            continue
+        try:
+            resource = _loads(line)
+        except ValueError:
+            resource = None
+        if not isinstance(resource, dict):
+            checker.invalid_json(line_number)
+            continue
+        if not checker.check(resource, line_number):
+            continue
+
+        for column, path in parsed_paths.items():
+            rows[column].append(resolve_path(resource, path))
+        count += 1
+        if count == batch_size:
+            yield _flatten_batch(rows)
+            rows = {column: [] for column in parsed_paths}
+            count = 0
+    if count:
+        yield _flatten_batch(rows)
+
+
+def _validate_range(
+    validator: MedicalDataValidator,
+    file_path: Union[str, Path],
+    paths: Optional[Dict[str, str]],
+    resource_type: Optional[str],
+    batch_size: int,
+    start: int,
+    end: Optional[int],
+) -> Tuple[ValidationResult, FhirStructureChecker]:
+    checker = FhirStructureChecker(resource_type)
+    batches = iter_fhir(file_path, paths, resource_type, batch_size, checker, start, end)
+    result = BatchValidator(validator, batch_size=batch_size).validate_stream(batches)
+    return result, checker
+
+
+def validate_fhir_ndjson(
+    validator: MedicalDataValidator,
+    file_path: Union[str, Path],
+    paths: Optional[Dict[str, str]] = None,
+    resource_type: Optional[str] = None,
+    batch_size: int = 10000,
+    max_workers: Optional[int] = None,
+) -> ValidationResult:
+    """
+    Validate a FHIR Bulk Data NDJSON file.
+
+    Runs ``validator`` on the flattened resources and adds the structural
+    issues found by ``FhirStructureChecker``. Issue rows from the rules are
+    positions among the flattened resources; structural issue rows are
+    line numbers.
+
+    Args:
+        validator: Validator applied to the flattened columns
+        file_path: Path to the NDJSON file
+        paths: Column name -> element path (see ``iter_fhir``)
+        resource_type: Expected resource type
+        batch_size: Resources per validation batch
+        max_workers: Worker processes, each validating one byte range of
+            the file; defaults to the CPU count. Validators that cannot be
+            pickled run in this process.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1:
+        try:
+            pickle.dumps(validator)
+        except Exception:
+            workers = 1
+
+    ranges = split_offsets(file_path, workers)
+    args = (validator, file_path, paths, resource_type, batch_size)
+    if len(ranges) == 1:
+        chunks = [_validate_range(*args, 0, None)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(_validate_range, *args, start, end) for start, end in ranges]
+            chunks = [future.result() for future in futures]
+
+    combined = ValidationResult(is_valid=True)
+    checker = FhirStructureChecker(resource_type)
+    total_resources = total_columns = total_batches = 0
+    for result, chunk_checker in chunks:
+        for issue in result.issues:
+            if issue.row is not None:
+                issue.row += total_resources
+            combined.add_issue(issue)
+        checker.merge(chunk_checker, line_offset=checker.lines)
+        total_resources += result.summary["total_rows"]
+        total_columns = max(total_columns, result.summary["total_columns"])
+        total_batches += result.summary["total_batches"]
+
+    for issue in checker.issues():
+        combined.add_issue(issue)
+    combined.summary = {
+        "total_rows": total_resources,
+        "total_columns": total_columns,
+        "total_batches": total_batches,
+        "total_lines": checker.lines,
+        "resource_type": resource_type,
+        "workers": len(ranges),
+    }
+    return combined
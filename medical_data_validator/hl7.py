@@ -0,0 +1,463 @@
+"""
+Streaming validation of HL7 v2 message files.
+
+``iter_hl7`` reads a file of HL7 v2 messages (ADT, ORU, ...), as written by
+interface engines with or without MLLP framing, and extracts configured
+fields such as ``PID-3.1`` or ``OBX-5`` into DataFrame batches for the
+usual rules (``MedicalCodeValidator``, ``RangeValidator``, ...). Only the
+segments named by a field are split into fields, so parsing stays cheap.
+``Hl7StructureChecker`` reports what the rules cannot see: segments outside
+a message, malformed MSH headers, missing message type or control ID,
+invalid segment IDs and missing required segments.
+
+``validate_hl7`` splits a file at message boundaries into byte ranges and
+validates the ranges in worker processes.
+
+Field references follow HL7 numbering: ``SEG-field[.component[.subcomponent]]``
+with ``MSH-1`` being the field separator. The first repetition of a field
+is used. By default a message gives one row using the first occurrence of
+each segment; with ``repeat_segment="OBX"`` an ORU message gives one row
+per OBX segment, with the other fields repeated.
+"""
+
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .core import MedicalDataValidator, ValidationIssue, ValidationResult
+from .performance import BatchValidator
+
+FieldSpec = Tuple[str, int, Optional[int], Optional[int]]
+
+DEFAULT_FIELDS: Dict[str, str] = {
+    "patient_id": "PID-3.1",
+    "birth_date": "PID-7",
+    "sex": "PID-8",
+    "observation_code": "OBX-3.1",
+    "observation_system": "OBX-3.3",
+    "observation_value": "OBX-5",
+    "units": "OBX-6.1",
+    "result_status": "OBX-11",
+}
+
+# Segments every message of a type must contain, keyed by MSH-9.1
+REQUIRED_SEGMENTS: Dict[str, Tuple[str, ...]] = {
+    "ADT": ("EVN", "PID"),
+    "ORM": ("PID", "ORC"),
+    "ORU": ("PID", "OBR"),
+    "SIU": ("SCH",),
+}
+
+# Batch and file header/trailer segments wrap messages and carry no data
+ENVELOPE_SEGMENTS = {"FHS", "FTS", "BHS", "BTS"}
+
+FIELD_SPEC = re.compile(r"^([A-Z][A-Z0-9]{2})-(\d+)(?:\.(\d+))?(?:\.(\d+))?$")
+SEGMENT_ID = re.compile(r"^[A-Z][A-Z0-9]{2}$")
+SEGMENT_BREAK = re.compile(rb"[\r\n]+")
+# MLLP start block, end block
+MLLP_CHARS = b"\x0b\x1c"
+
+READ_BLOCK = 1 << 20
+
+
+def parse_field_spec(spec: str) -> FieldSpec:
+    """Parse ``PID-3.1`` into (segment, field, component, subcomponent)."""
+    match = FIELD_SPEC.match(spec.strip().upper())
+    if not match:
+        raise ValueError(f"Invalid HL7 field reference: {spec!r}")
+    segment, field, component, subcomponent = match.groups()
+    return (
+        segment,
+        int(field),
+        int(component) if component else None,
+        int(subcomponent) if subcomponent else None,
+    )
+
+
+MESSAGE_CODE = parse_field_spec("MSH-9.1")
+
+
+class Delimiters:
+    """Separators declared in MSH-1 and MSH-2."""
+
+    __slots__ = ("field", "component", "repetition", "escape", "subcomponent")
+
+    def __init__(self, header: str):
+        self.field = header[3]
+        encoding = header[4:8].split(self.field, 1)[0]
+        self.component = encoding[0] if len(encoding) > 0 else "^"
+        self.repetition = encoding[1] if len(encoding) > 1 else "~"
+        self.escape = encoding[2] if len(encoding) > 2 else "\\"
+        self.subcomponent = encoding[3] if len(encoding) > 3 else "&"
+
+    def unescape(self, value: str) -> str:
+        """Replace the delimiter escape sequences (\\F\\, \\S\\, ...)."""
+        if self.escape not in value:
+            return value
+        e = self.escape
+        for code, char in (
+            ("F", self.field), ("S", self.component), ("R", self.repetition),
+            ("T", self.subcomponent), ("E", self.escape),
+        ):
+            value = value.replace(f"{e}{code}{e}", char)
+        return value
+
+    def extract(self, fields: List[str], spec: FieldSpec) -> Optional[str]:
+        """Value of one field reference in a split segment, or None when empty."""
+        segment, number, component, subcomponent = spec
+        # MSH-1 is the field separator itself, so MSH fields are shifted by one
+        index = number - 1 if segment == "MSH" else number
+        if segment == "MSH" and number == 1:
+            return self.field
+        if index >= len(fields):
+            return None
+        value = fields[index]
+        if segment != "MSH" or number != 2:
+            value = value.split(self.repetition, 1)[0]
+            if component is not None:
+                parts = value.split(self.component)
+                value = parts[component - 1] if component <= len(parts) else ""
+                if subcomponent is not None:
+                    parts = value.split(self.subcomponent)
+                    value = parts[subcomponent - 1] if subcomponent <= len(parts) else ""
+        return self.unescape(value) if value else None
+
+
+def iter_segments(
+    file_path: Union[str, Path],
+    start: int = 0,
+    end: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> Iterator[str]:
+    """
+    Segments in the byte range ``[start, end)`` of an HL7 v2 file.
+
+    Segments may end in CR, LF or CRLF; MLLP framing characters are dropped.
+    """
+    with open(file_path, "rb") as handle:
+        handle.seek(start)
+        remaining = None if end is None else end - start
+        pending = b""
+        while remaining is None or remaining > 0:
+            block = handle.read(READ_BLOCK if remaining is None else min(READ_BLOCK, remaining))
+            if not block:
+                break
+            if remaining is not None:
+                remaining -= len(block)
+            pieces = SEGMENT_BREAK.split(pending + block)
+            pending = pieces.pop()
+            for piece in pieces:
+                piece = piece.strip(MLLP_CHARS)
+                if piece:
+                    yield piece.decode(encoding, errors="replace")
+        pending = pending.strip(MLLP_CHARS)
+        if pending:
+            yield pending.decode(encoding, errors="replace")
+
+
+def split_offsets(file_path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to ``parts`` byte ranges that each start at an MSH segment."""
+    size = Path(file_path).stat().st_size
+    if parts <= 1 or size == 0:
+        return [(0, size)]
+
+    boundaries = [0]
+    with open(file_path, "rb") as handle:
+        for part in range(1, parts):
+            position = max(size * part // parts, boundaries[-1] + 1)
+            handle.seek(position)
+            found = None
+            carry = b""
+            while found is None:
+                block = handle.read(READ_BLOCK)
+                if not block:
+                    break
+                match = re.search(rb"[\r\n\x0b]MSH", carry + block)
+                if match:
+                    found = position - len(carry) + match.start() + 1
+                else:
+                    carry = block[-3:]
+                    position += len(block)
+            if found is None or found >= size:
+                break
+            if found > boundaries[-1]:
+                boundaries.append(found)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+class Hl7StructureChecker:
+    """
+    Tallies HL7 v2 structural problems while messages are read.
+
+    Problems are counted per kind; each issue records the first offending
+    message (0-based) as its row.
+    """
+
+    rule_name = "hl7_structure"
+
+    def __init__(self):
+        self.messages = 0
+        # (message, column) -> [count, first message]
+        self.tally: Dict[Tuple[str, Optional[str]], List[int]] = {}
+
+    def _report(self, message: str, column: Optional[str], position: int) -> None:
+        entry = self.tally.get((message, column))
+        if entry is None:
+            self.tally[(message, column)] = [1, position]
+        else:
+            entry[0] += 1
+            entry[1] = min(entry[1], position)
+
+    def orphan_segment(self) -> None:
+        self._report("segments appear before the first MSH segment", None, self.messages)
+
+    def check(self, message_code: Optional[str], control_id: Optional[str], segment_ids: List[str], position: int) -> None:
+        """Check one parsed message; ``message_code`` is MSH-9.1 (ADT, ORU, ...)."""
+        if not message_code:
+            self._report("messages have no message type (MSH-9)", "MSH-9", position)
+        if not control_id:
+            self._report("messages have no control ID (MSH-10)", "MSH-10", position)
+        for segment_id in segment_ids:
+            if not SEGMENT_ID.match(segment_id):
+                self._report("messages contain invalid segment IDs", None, position)
+                break
+        for required in REQUIRED_SEGMENTS.get(message_code, ()):
+            if required not in segment_ids:
+                self._report(f"{message_code} messages are missing required segment {required}", required, position)
+
+    def malformed_header(self, position: int) -> None:
+        self._report("messages have a malformed MSH header", "MSH", position)
+
+    def merge(self, other: "Hl7StructureChecker", offset: int = 0) -> None:
+        """Add another checker's tally, shifting its messages by ``offset``."""
+        self.messages += other.messages
+        for (message, column), (count, first) in other.tally.items():
+            entry = self.tally.setdefault((message, column), [0, first + offset])
+            entry[0] += count
+            entry[1] = min(entry[1], first + offset)
+
+    def issues(self) -> List[ValidationIssue]:
+        """One error per kind of problem, in order of first occurrence."""
+        return [
+            ValidationIssue(
+                severity="error",
+                message=f"{count} {message} (first in message {first + 1})",
+                column=column,
+                row=first,
+                rule_name=self.rule_name,
+            )
+            for (message, column), (count, first) in sorted(self.tally.items(), key=lambda item: item[1][1])
+        ]
+
+
+def _split_messages(segments: Iterator[str], checker: Hl7StructureChecker) -> Iterator[List[str]]:
+    """Group segments into messages, each starting with its MSH segment."""
+    message: List[str] = []
+    for segment in segments:
+        segment_id = segment[:3]
+        if segment_id in ENVELOPE_SEGMENTS:
+            continue
+        if segment_id == "MSH":
+            if message:
+                yield message
+            message = [segment]
+        elif message:
+            message.append(segment)
+        else:
+            checker.orphan_segment()
+    if message:
+        yield message
+
+
+def _message_rows(
+    segments: List[str],
+    specs: Dict[str, FieldSpec],
+    wanted: set,
+    repeat_segment: Optional[str],
+    checker: Hl7StructureChecker,
+) -> Iterator[List[Optional[str]]]:
+    """Rows of field values for one message, after checking its structure."""
+    position = checker.messages
+    checker.messages += 1
+    header = segments[0]
+    if len(header) < 8:
+        checker.malformed_header(position)
+        return
+    delimiters = Delimiters(header)
+
+    # Only the segments that fields refer to are split
+    split: Dict[str, List[List[str]]] = {}
+    for segment in segments:
+        if segment[:3] in wanted:
+            split.setdefault(segment[:3], []).append(segment.split(delimiters.field))
+    first = {segment_id: occurrences[0] for segment_id, occurrences in split.items()}
+    msh = first["MSH"]
+    checker.check(
+        delimiters.extract(msh, MESSAGE_CODE),
+        delimiters.extract(msh, specs["control_id"]),
+        [segment[:3] for segment in segments],
+        position,
+    )
+
+    for occurrence in split.get(repeat_segment, []) if repeat_segment else [None]:
+        row = []
+        for spec in specs.values():
+            fields = occurrence if spec[0] == repeat_segment else first.get(spec[0])
+            row.append(delimiters.extract(fields, spec) if fields is not None else None)
+        yield row
+
+
+def _numeric_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    # Like pd.read_csv, columns whose values are all numbers become numeric
+    for column in frame.columns:
+        values = frame[column]
+        converted = pd.to_numeric(values, errors="coerce")
+        if values.notna().any() and converted.notna().sum() == values.notna().sum():
+            frame[column] = converted
+    return frame
+
+
+def iter_hl7(
+    file_path: Union[str, Path],
+    fields: Optional[Union[Sequence[str], Dict[str, str]]] = None,
+    repeat_segment: Optional[str] = None,
+    batch_size: int = 10000,
+    checker: Optional[Hl7StructureChecker] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream HL7 v2 messages as DataFrame batches of extracted fields.
+
+    Every batch has ``message_type`` (MSH-9) and ``control_id`` (MSH-10)
+    columns plus one column per field. Columns whose values are all numeric
+    are converted to numbers.
+
+    Args:
+        file_path: Path to the message file
+        fields: Field references, or column name -> field reference;
+            defaults to ``DEFAULT_FIELDS``
+        repeat_segment: Segment producing one row per occurrence (e.g. OBX)
+        batch_size: Maximum rows per batch
+        checker: Structure checker to feed; one is created if omitted
+        start: Byte offset of the first message to read
+        end: Byte offset to stop before
+        encoding: Character encoding of the file
+    """
+    if fields is None:
+        fields = DEFAULT_FIELDS
+    if not isinstance(fields, dict):
+        fields = {spec: spec for spec in fields}
+    specs = {"message_type": parse_field_spec("MSH-9"), "control_id": parse_field_spec("MSH-10")}
+    specs.update({column: parse_field_spec(spec) for column, spec in fields.items()})
+    wanted = {spec[0] for spec in specs.values()}
+    repeat_segment = repeat_segment.upper() if repeat_segment else None
+    if repeat_segment:
+        wanted.add(repeat_segment)
+    checker = checker or Hl7StructureChecker()
+
+    rows: Dict[str, List[Any]] = {column: [] for column in specs}
+    count = 0
+    for segments in _split_messages(iter_segments(file_path, start, end, encoding), checker):
+        for row in _message_rows(segments, specs, wanted, repeat_segment, checker):
+            for column, item in zip(rows, row):
+                rows[column].append(item)
+            count += 1
+            if count == batch_size:
+                yield _numeric_columns(pd.DataFrame(rows))
+                rows = {column: [] for column in specs}
+                count = 0
+    if count:
+        yield _numeric_columns(pd.DataFrame(rows))
+
+
+def _validate_range(
+    validator: MedicalDataValidator,
+    file_path: Union[str, Path],
+    fields: Optional[Union[Sequence[str], Dict[str, str]]],
+    repeat_segment: Optional[str],
+    batch_size: int,
+    encoding: str,
+    start: int,
+    end: Optional[int],
+) -> Tuple[ValidationResult, Hl7StructureChecker]:
+    checker = Hl7StructureChecker()
+    batches = iter_hl7(file_path, fields, repeat_segment, batch_size, checker, start, end, encoding)
+    result = BatchValidator(validator, batch_size=batch_size).validate_stream(batches)
+    return result, checker
+
+
+def validate_hl7(
+    validator: MedicalDataValidator,
+    file_path: Union[str, Path],
+    fields: Optional[Union[Sequence[str], Dict[str, str]]] = None,
+    repeat_segment: Optional[str] = None,
+    batch_size: int = 10000,
+    max_workers: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> ValidationResult:
+    """
+    Validate an HL7 v2 message file.
+
+    Runs ``validator`` on the extracted fields and adds the structural
+    issues found by ``Hl7StructureChecker``. Issue rows from the rules are
+    positions among the extracted rows; structural issue rows are message
+    numbers.
+
+    Args:
+        validator: Validator applied to the extracted columns
+        file_path: Path to the message file
+        fields: Field references (see ``iter_hl7``)
+        repeat_segment: Segment producing one row per occurrence
+        batch_size: Rows per validation batch
+        max_workers: Worker processes, each validating one byte range of
+            the file; defaults to the CPU count. Validators that cannot be
+            pickled run in this process.
+        encoding: Character encoding of the file
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1:
+        try:
+            pickle.dumps(validator)
+        except Exception:
+            workers = 1
+
+    ranges = split_offsets(file_path, workers)
+    args = (validator, file_path, fields, repeat_segment, batch_size, encoding)
+    if len(ranges) == 1:
+        chunks = [_validate_range(*args, 0, None)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(_validate_range, *args, start, end) for start, end in ranges]
+            chunks = [future.result() for future in futures]
+
+    combined = ValidationResult(is_valid=True)
+    checker = Hl7StructureChecker()
+    total_rows = total_columns = total_batches = 0
+    for result, chunk_checker in chunks:
+        for issue in result.issues:
+            if issue.row is not None:
+                issue.row += total_rows
+            combined.add_issue(issue)
+        checker.merge(chunk_checker, offset=checker.messages)
+        total_rows += result.summary["total_rows"]
+        total_columns = max(total_columns, result.summary["total_columns"])
+        total_batches += result.summary["total_batches"]
+
+    for issue in checker.issues():
+        combined.add_issue(issue)
+    combined.summary = {
+        "total_rows": total_rows,
+        "total_columns": total_columns,
+        "total_batches": total_batches,
+        "total_messages": checker.messages,
+        "workers": len(ranges),
+    }
+    return combined
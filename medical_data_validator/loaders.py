@@ -0,0 +1,316 @@
+"""
+Shared data loading with column projection.
+
+Every entry point (CLI, dashboard, web API) loads files through
+:func:`load_file`. Only the requested columns are read: Parquet prunes
+column chunks, Feather files are memory-mapped so unread columns are never
+paged in, and CSV files are parsed by pyarrow's multi-threaded reader with
+the other columns skipped. Loaded frames record the file's full column list
+in ``df.attrs["source_columns"]`` so checks that only look at column names
+(required columns, PHI-like names) still see every column.
+
+pyarrow is optional; without it CSV goes through ``pd.read_csv`` and
+Parquet through ``pd.read_parquet``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .backends import pa, pc
+from .schema import TYPE_ALIASES
+
+try:
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pacsv = None
+    pq = None
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+FEATHER_SUFFIXES = {".feather", ".arrow", ".ipc"}
+# Compressed CSV is detected from the extension by both pyarrow and pandas
+COMPRESSION_SUFFIXES = {".gz", ".bz2", ".zst"}
+
+# pandas' default missing-value markers, so both CSV readers agree on nulls
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def is_columnar_file(file_path: Union[str, Path]) -> bool:
+    """Whether a file is in a format that supports column projection."""
+    return file_format(file_path) in PARQUET_SUFFIXES | FEATHER_SUFFIXES
+
+
+def file_format(file_path: Union[str, Path]) -> str:
+    """Format suffix of a file, ignoring a compression suffix (``data.csv.gz`` -> ``.csv``)."""
+    path = Path(file_path)
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in COMPRESSION_SUFFIXES:
+        return suffixes[-2]
+    return path.suffix.lower()
+
+
+def source_columns(data: Any) -> List[str]:
+    """Every column of the data's source, including columns not loaded."""
+    attrs = getattr(data, "attrs", None) or {}
+    if "source_columns" in attrs:
+        return list(attrs["source_columns"])
+    return list(data.column_names if hasattr(data, "column_names") else data.columns)
+
+
+def _project(available: Sequence[str], columns: Optional[Sequence[str]]) -> List[str]:
+    """Requested columns that exist in the file, in file order."""
+    if columns is None:
+        return list(available)
+    wanted = set(columns)
+    return [name for name in available if name in wanted]
+
+
+def _with_source_columns(frame: pd.DataFrame, source_columns: Sequence[str]) -> pd.DataFrame:
+    frame.attrs["source_columns"] = list(source_columns)
+    return frame
+
+
+def _read_parquet(path: Path, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if pq is None:
+        frame = pd.read_parquet(path)
+        return _with_source_columns(frame[_project(frame.columns, columns)], frame.columns)
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    names = parquet_file.schema_arrow.names
+    table = parquet_file.read(columns=_project(names, columns))
+    return _with_source_columns(table.to_pandas(), names)
+
+
+def _iter_parquet(path: Path, columns: Optional[Sequence[str]], batch_size: int) -> Iterator[pd.DataFrame]:
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    names = parquet_file.schema_arrow.names
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=_project(names, columns)):
+        yield _with_source_columns(batch.to_pandas(), names)
+
+
+def _read_feather(path: Path, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    # Uncompressed Feather V2 is read zero-copy from the mapping
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        names = reader.schema.names
+        table = reader.read_all().select(_project(names, columns))
+        return _with_source_columns(table.to_pandas(), names)
+
+
+def _iter_feather(path: Path, columns: Optional[Sequence[str]], batch_size: int) -> Iterator[pd.DataFrame]:
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        names = reader.schema.names
+        selected = _project(names, columns)
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index).select(selected)
+            for offset in range(0, batch.num_rows, batch_size):
+                yield _with_source_columns(batch.slice(offset, batch_size).to_pandas(), names)
+
+
+def read_columnar(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read a Parquet or Feather file, loading only ``columns``.
+
+    Args:
+        file_path: Path to a .parquet/.pq or .feather/.arrow/.ipc file
+        columns: Columns to load; None loads every column. Names missing
+            from the file are ignored.
+
+    Returns:
+        DataFrame of the projected columns, with the file's column names in
+        ``attrs["source_columns"]``
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return _read_parquet(path, columns)
+    if suffix in FEATHER_SUFFIXES:
+        if pa is None:
+            raise ImportError("Reading Feather files requires pyarrow")
+        return _read_feather(path, columns)
+    raise ValueError(f"Unsupported columnar format: {path.suffix}")
+
+
+def iter_columnar(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 65536,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a Parquet or Feather file as DataFrames of at most ``batch_size`` rows.
+
+    Parquet is read row group by row group and Feather record batch by
+    record batch, so memory use is bounded by the batch size and the
+    projected columns.
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if pq is None:
+        raise ImportError("Streaming columnar files requires pyarrow")
+    if suffix in PARQUET_SUFFIXES:
+        return _iter_parquet(path, columns, batch_size)
+    if suffix in FEATHER_SUFFIXES:
+        return _iter_feather(path, columns, batch_size)
+    raise ValueError(f"Unsupported columnar format: {path.suffix}")
+
+
+def _text_hints(dtypes: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Columns declared as text (``string`` or ``category``) in a column_types map."""
+    hints = {}
+    for column, expected in (dtypes or {}).items():
+        logical = TYPE_ALIASES.get(str(expected).lower())
+        if logical in ("string", "category"):
+            hints[column] = logical
+    return hints
+
+
+def read_csv_table(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    parse_dates: bool = False,
+) -> Tuple["pa.Table", List[str]]:
+    """
+    Parse a (possibly compressed) CSV file with pyarrow.
+
+    Returns the table of the projected columns and the file's column names.
+
+    Columns declared as text in ``dtypes`` are read as strings, so codes
+    such as ZIP codes keep their leading zeros; other hints are left to the
+    validators, which report mismatches instead of failing the load. Unless
+    ``parse_dates`` is set, columns pyarrow would read as dates stay text,
+    matching ``pd.read_csv``.
+    """
+    path = str(file_path)
+    with pacsv.open_csv(path) as reader:
+        inferred = reader.schema
+    names = inferred.names
+
+    column_types = {column: pa.string() for column in _text_hints(dtypes) if column in names}
+    if not parse_dates:
+        for field in inferred:
+            if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+                column_types[field.name] = pa.string()
+
+    convert_options = pacsv.ConvertOptions(
+        column_types=column_types,
+        include_columns=_project(names, columns),
+        null_values=CSV_NULL_VALUES,
+        strings_can_be_null=True,
+    )
+    return pacsv.read_csv(path, convert_options=convert_options), names
+
+
+def encode_strings(
+    table: "pa.Table",
+    dtypes: Optional[Dict[str, str]] = None,
+    max_unique_ratio: float = 0.5,
+) -> "pa.Table":
+    """
+    Dictionary-encode low-cardinality string columns (loaded as ``category``).
+
+    Columns declared ``category`` are always encoded and columns declared
+    ``string`` never are; other string columns are encoded when their
+    distinct values are at most ``max_unique_ratio`` of the rows.
+    """
+    hints = _text_hints(dtypes)
+    for index, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        hint = hints.get(field.name)
+        if hint == "string":
+            continue
+        column = table.column(index)
+        if hint == "category" or (
+            table.num_rows and pc.count_distinct(column).as_py() <= max_unique_ratio * table.num_rows
+        ):
+            table = table.set_column(index, field.name, pc.dictionary_encode(column))
+    return table
+
+
+def _read_csv_pandas(
+    path: Path,
+    columns: Optional[Sequence[str]],
+    dtypes: Optional[Dict[str, str]],
+) -> pd.DataFrame:
+    names = list(pd.read_csv(path, nrows=0).columns)
+    usecols = _project(names, columns)
+    dtype = {column: ("category" if hint == "category" else str) for column, hint in _text_hints(dtypes).items() if column in usecols}
+    frame = pd.read_csv(path, usecols=usecols, dtype=dtype or None)
+    return _with_source_columns(frame[usecols], names)
+
+
+def read_csv(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    categorical_strings: bool = True,
+    arrow_strings: bool = False,
+) -> pd.DataFrame:
+    """
+    Read a CSV file (optionally .gz/.bz2/.zst compressed) into a DataFrame.
+
+    Args:
+        file_path: Path to the CSV file
+        columns: Columns to load; None loads every column
+        dtypes: Expected column types (``SchemaValidator.column_types``)
+            used as load hints for text columns
+        categorical_strings: Load low-cardinality text as ``category``
+        arrow_strings: Load the remaining text as ``string[pyarrow]``
+            instead of Python objects
+
+    Returns:
+        DataFrame with the file's column names in ``attrs["source_columns"]``
+    """
+    path = Path(file_path)
+    if pacsv is None:
+        return _read_csv_pandas(path, columns, dtypes)
+    try:
+        table, names = read_csv_table(path, columns, dtypes)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # Files pyarrow cannot type from its first block (for example a
+        # number column with text further down) take pandas' slower path
+        return _read_csv_pandas(path, columns, dtypes)
+
+    if categorical_strings:
+        table = encode_strings(table, dtypes)
+    types_mapper = {pa.string(): pd.StringDtype("pyarrow")}.get if arrow_strings else None
+    return _with_source_columns(table.to_pandas(types_mapper=types_mapper), names)
+
+
+def load_file(
+    file_path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Load a CSV, Excel, JSON, Parquet or Feather file.
+
+    Args:
+        file_path: Path to the data file
+        columns: Columns the validator needs (``referenced_columns()``);
+            the other columns are not loaded
+        dtypes: Expected column types used as CSV load hints
+
+    Raises:
+        ValueError: If the file format is not supported
+    """
+    fmt = file_format(file_path)
+    if fmt in PARQUET_SUFFIXES | FEATHER_SUFFIXES:
+        return read_columnar(file_path, columns=columns)
+    if fmt == ".csv":
+        return read_csv(file_path, columns=columns, dtypes=dtypes)
+    if fmt in (".xlsx", ".xls"):
+        from .excel import read_excel
+        return read_excel(file_path, columns=columns)
+    if fmt == ".json":
+        return pd.read_json(file_path)
+    raise ValueError(f"Unsupported file format: {Path(file_path).suffix}")
@@ -70,6 +70,13 @@ class RealTimeMonitor:
             self.monitor_thread.start()
             print("🔍 Real-time monitoring started")
     
+    def restart_after_fork(self) -> None:
+        """Restart the loop in a forked child, where the parent's thread does not exist."""
+        if self.monitoring_active:
+            self.monitoring_active = False
+            self.monitor_thread = None
+            self.start_monitoring()
+    
     def stop_monitoring(self) -> None:
         """Stop the monitoring system."""
         self.monitoring_active = False
@@ -350,4 +357,15 @@ class RealTimeMonitor:
                 time.sleep(60)
 
 # Global monitoring instance
-monitor = RealTimeMonitor() 
\ No newline at end of file
+monitor = RealTimeMonitor()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """
+    gunicorn ``post_fork`` hook restarting the monitoring loop in each worker.
+
+    With ``preload_app`` validators are built, and the loop started, in the
+    master; its thread does not exist in the forked workers. Other forked
+    children, such as validation worker processes, are left without one.
+    """
+    monitor.restart_after_fork()
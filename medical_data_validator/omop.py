@@ -0,0 +1,382 @@
+"""
+OMOP Common Data Model validation.
+
+``ConceptVocabulary`` holds the OMOP ``CONCEPT`` table as parallel NumPy
+arrays sorted by ``concept_id``: the ids themselves as int64, a small
+integer code for each concept's domain, and standard / invalid flags.
+Saved vocabularies are memory-mapped read-only, so worker processes share
+the pages, and lookups are one ``np.searchsorted`` over a column's values:
+no joins against the vocabulary are ever built.
+
+``ConceptValidator`` checks concept_id columns for existence, expected
+domain, standard status and deprecation. ``omop_validator`` combines it with
+required-column, date and range rules for the ``person``,
+``visit_occurrence``, ``condition_occurrence`` and ``measurement`` tables and
+with their primary and foreign keys in a ``MultiTableValidator``, so
+streamed (chunked) CDM tables are checked in one pass per table.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .core import ValidationIssue, ValidationRule
+from .extensions import ValidationProfile
+from .relational import MultiTableValidator
+from .validators import DateValidator, RangeValidator, SchemaValidator
+
+# Per-table rules: concept columns map to the domain their concepts must belong to
+OMOP_TABLES: Dict[str, Dict[str, Any]] = {
+    "person": {
+        "primary_key": "person_id",
+        "required": ["person_id", "gender_concept_id", "year_of_birth", "race_concept_id", "ethnicity_concept_id"],
+        "concepts": {
+            "gender_concept_id": "Gender",
+            "race_concept_id": "Race",
+            "ethnicity_concept_id": "Ethnicity",
+        },
+        "dates": ["birth_datetime"],
+        "ranges": {
+            "year_of_birth": {"min": 1850, "max": pd.Timestamp.now().year},
+            "month_of_birth": {"min": 1, "max": 12},
+            "day_of_birth": {"min": 1, "max": 31},
+        },
+    },
+    "visit_occurrence": {
+        "primary_key": "visit_occurrence_id",
+        "required": [
+            "visit_occurrence_id", "person_id", "visit_concept_id",
+            "visit_start_date", "visit_end_date", "visit_type_concept_id",
+        ],
+        "concepts": {
+            "visit_concept_id": "Visit",
+            "visit_type_concept_id": "Type Concept",
+        },
+        "dates": ["visit_start_date", "visit_end_date"],
+    },
+    "condition_occurrence": {
+        "primary_key": "condition_occurrence_id",
+        "required": [
+            "condition_occurrence_id", "person_id", "condition_concept_id",
+            "condition_start_date", "condition_type_concept_id",
+        ],
+        "concepts": {
+            "condition_concept_id": "Condition",
+            "condition_type_concept_id": "Type Concept",
+        },
+        "dates": ["condition_start_date", "condition_end_date"],
+    },
+    "measurement": {
+        "primary_key": "measurement_id",
+        "required": [
+            "measurement_id", "person_id", "measurement_concept_id",
+            "measurement_date", "measurement_type_concept_id",
+        ],
+        "concepts": {
+            "measurement_concept_id": "Measurement",
+            "measurement_type_concept_id": "Type Concept",
+            "unit_concept_id": "Unit",
+            "value_as_concept_id": None,
+        },
+        "dates": ["measurement_date"],
+    },
+}
+
+OMOP_FOREIGN_KEYS = [
+    ("visit_occurrence", "person_id", "person", "person_id"),
+    ("condition_occurrence", "person_id", "person", "person_id"),
+    ("condition_occurrence", "visit_occurrence_id", "visit_occurrence", "visit_occurrence_id"),
+    ("measurement", "person_id", "person", "person_id"),
+    ("measurement", "visit_occurrence_id", "visit_occurrence", "visit_occurrence_id"),
+]
+
+_VOCABULARY_FILES = ("concept_ids.npy", "domain_codes.npy", "standard.npy", "invalid.npy")
+
+
+class ConceptVocabulary:
+    """
+    OMOP concepts as sorted, optionally memory-mapped NumPy arrays.
+
+    Args:
+        concept_ids: Concept ids (any order, unique)
+        domains: Domain id of each concept
+        standard: Whether each concept is a standard concept
+        invalid: Whether each concept is deprecated or upgraded
+    """
+
+    def __init__(
+        self,
+        concept_ids: Sequence[int],
+        domains: Optional[Sequence[str]] = None,
+        standard: Optional[Sequence[bool]] = None,
+        invalid: Optional[Sequence[bool]] = None,
+    ):
+        ids = np.asarray(concept_ids, dtype=np.int64)
+        if domains is not None:
+            domain_codes, domain_names = pd.factorize(np.asarray(domains, dtype=object), use_na_sentinel=True)
+            self.domain_names = [str(name) for name in domain_names]
+            domain_codes = domain_codes.astype(np.int16)
+        else:
+            self.domain_names = []
+            domain_codes = np.full(len(ids), -1, dtype=np.int16)
+        standard = np.ones(len(ids), dtype=bool) if standard is None else np.asarray(standard, dtype=bool)
+        invalid = np.zeros(len(ids), dtype=bool) if invalid is None else np.asarray(invalid, dtype=bool)
+
+        order = np.argsort(ids, kind="stable")
+        self.concept_ids = ids[order]
+        self.domain_codes = domain_codes[order]
+        self.standard = standard[order]
+        self.invalid = invalid[order]
+
+    @classmethod
+    def _from_arrays(cls, concept_ids, domain_codes, standard, invalid, domain_names) -> "ConceptVocabulary":
+        vocabulary = cls.__new__(cls)
+        vocabulary.concept_ids = concept_ids
+        vocabulary.domain_codes = domain_codes
+        vocabulary.standard = standard
+        vocabulary.invalid = invalid
+        vocabulary.domain_names = list(domain_names)
+        return vocabulary
+
+    @classmethod
+    def from_concept_file(
+        cls,
+        path: Union[str, Path],
+        sep: str = "\t",
+        chunksize: int = 1_000_000,
+    ) -> "ConceptVocabulary":
+        """
+        Build from an OMOP ``CONCEPT`` file (tab-separated, as downloaded from Athena).
+
+        The file is read in chunks and only ``concept_id``, ``domain_id``,
+        ``standard_concept`` and ``invalid_reason`` are kept.
+        """
+        ids, domains, standard, invalid = [], [], [], []
+        reader = pd.read_csv(
+            path,
+            sep=sep,
+            usecols=["concept_id", "domain_id", "standard_concept", "invalid_reason"],
+            dtype={"concept_id": np.int64, "domain_id": "category", "standard_concept": str, "invalid_reason": str},
+            keep_default_na=False,
+            na_values=[""],
+            quoting=csv.QUOTE_NONE,
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            ids.append(chunk["concept_id"].to_numpy())
+            domains.append(chunk["domain_id"].astype(object).to_numpy())
+            standard.append((chunk["standard_concept"] == "S").to_numpy())
+            invalid.append(chunk["invalid_reason"].notna().to_numpy())
+        if not ids:
+            return cls([])
+        return cls(np.concatenate(ids), np.concatenate(domains), np.concatenate(standard), np.concatenate(invalid))
+
+    def save(self, directory: Union[str, Path]) -> str:
+        """Save as ``.npy`` files that ``load`` memory-maps."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = (self.concept_ids, self.domain_codes, self.standard, self.invalid)
+        for name, array in zip(_VOCABULARY_FILES, arrays):
+            np.save(directory / name, np.ascontiguousarray(array))
+        with open(directory / "domains.json", "w", encoding="utf-8") as handle:
+            json.dump(self.domain_names, handle)
+        return str(directory)
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "ConceptVocabulary":
+        """Load a saved vocabulary, memory-mapped read-only."""
+        directory = Path(directory)
+        arrays = [np.load(directory / name, mmap_mode="r") for name in _VOCABULARY_FILES]
+        with open(directory / "domains.json", "r", encoding="utf-8") as handle:
+            domain_names = json.load(handle)
+        return cls._from_arrays(*arrays, domain_names)
+
+    def domain_code(self, domain: str) -> int:
+        """Integer code of a domain, or -2 if no concept has it."""
+        try:
+            return self.domain_names.index(domain)
+        except ValueError:
+            return -2
+
+    def lookup(self, values: Union[pd.Series, np.ndarray, List[int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find concept ids in the vocabulary.
+
+        Returns ``(present, found, positions)``: which values are non-missing,
+        which of those are known concepts, and each value's index into the
+        vocabulary arrays (only meaningful where ``found``).
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        numbers = pd.to_numeric(series, errors="coerce")
+        present = series.notna().to_numpy()
+        integral = numbers.notna().to_numpy() & (numbers.fillna(0) % 1 == 0).to_numpy()
+        ids = numbers.where(integral, -1).to_numpy(dtype=np.int64, na_value=-1)
+
+        if len(self.concept_ids) == 0:
+            positions = np.zeros(len(ids), dtype=np.intp)
+            return present, np.zeros(len(ids), dtype=bool), positions
+        positions = np.searchsorted(self.concept_ids, ids)
+        positions = np.minimum(positions, len(self.concept_ids) - 1)
+        found = integral & (self.concept_ids[positions] == ids)
+        return present, found, positions
+
+    def __contains__(self, concept_id: int) -> bool:
+        return bool(self.lookup([concept_id])[1][0])
+
+    def __len__(self) -> int:
+        return len(self.concept_ids)
+
+
+class ConceptValidator(ValidationRule):
+    """
+    Checks OMOP concept_id columns against a ``ConceptVocabulary``.
+
+    Each column maps to the domain its concepts must belong to, or None for
+    any domain. Columns with a domain must also hold standard concepts.
+    Concept 0 ("no matching concept") is allowed but reported as a warning.
+    """
+
+    def __init__(
+        self,
+        concept_columns: Dict[str, Optional[str]],
+        vocabulary: ConceptVocabulary,
+        sample_size: int = 3,
+        name: str = "ConceptValidator",
+        description: str = "Validates OMOP concept ids against the vocabulary",
+    ):
+        super().__init__(name=name, description=description)
+        self.concept_columns = concept_columns
+        self.vocabulary = vocabulary
+        self.sample_size = sample_size
+
+    def referenced_columns(self) -> Optional[List[str]]:
+        return list(self.concept_columns)
+
+    def _issue(self, severity: str, message: str, column: str, series: pd.Series, mask: np.ndarray) -> ValidationIssue:
+        sample = pd.unique(series[mask])[:self.sample_size].tolist()
+        return ValidationIssue(
+            severity=severity,
+            message=f"{message}. Sample: {sample}",
+            column=column,
+            rule_name=self.name,
+        )
+
+    def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
+        issues = []
+        vocabulary = self.vocabulary
+
+        for column, domain in self.concept_columns.items():
+            if column not in data.columns:
+                continue
+            series = data[column]
+            present, found, positions = vocabulary.lookup(series)
+            unmapped = present & (pd.to_numeric(series, errors="coerce") == 0).to_numpy()
+            unknown = present & ~found & ~unmapped
+            # Athena lists concept 0 (domain "Metadata"); it only gets the warning
+            found = found & ~unmapped
+
+            if unknown.any():
+                issues.append(self._issue(
+                    "error",
+                    f"Found {int(unknown.sum())} concept_ids in column '{column}' that are not in the vocabulary",
+                    column, series, unknown,
+                ))
+            if unmapped.any():
+                issues.append(ValidationIssue(
+                    severity="warning",
+                    message=f"Column '{column}' has {int(unmapped.sum())} rows with concept_id 0 (no matching concept)",
+                    column=column,
+                    rule_name=self.name,
+                ))
+
+            hit = positions[found]
+            if domain is not None and vocabulary.domain_names:
+                wrong_domain = np.zeros(len(series), dtype=bool)
+                wrong_domain[found] = vocabulary.domain_codes[hit] != vocabulary.domain_code(domain)
+                if wrong_domain.any():
+                    issues.append(self._issue(
+                        "error",
+                        f"Found {int(wrong_domain.sum())} concept_ids outside domain '{domain}' in column '{column}'",
+                        column, series, wrong_domain,
+                    ))
+            if domain is not None:
+                non_standard = np.zeros(len(series), dtype=bool)
+                non_standard[found] = ~vocabulary.standard[hit]
+                if non_standard.any():
+                    issues.append(self._issue(
+                        "warning",
+                        f"Found {int(non_standard.sum())} non-standard concept_ids in column '{column}'",
+                        column, series, non_standard,
+                    ))
+            deprecated = np.zeros(len(series), dtype=bool)
+            deprecated[found] = vocabulary.invalid[hit]
+            if deprecated.any():
+                issues.append(self._issue(
+                    "warning",
+                    f"Found {int(deprecated.sum())} deprecated or upgraded concept_ids in column '{column}'",
+                    column, series, deprecated,
+                ))
+
+        return issues
+
+
+def omop_table_rules(table: str, vocabulary: Optional[ConceptVocabulary] = None) -> List[ValidationRule]:
+    """Rules for one OMOP CDM table; concept checks need a vocabulary."""
+    spec = OMOP_TABLES[table]
+    rules: List[ValidationRule] = [
+        SchemaValidator(
+            required_columns=spec["required"],
+            column_types={column: "int" for column in spec["concepts"] if column in spec["required"]},
+        ),
+        DateValidator(date_columns=spec["dates"], min_date="1850-01-01"),
+    ]
+    if spec.get("ranges"):
+        rules.append(RangeValidator(ranges=spec["ranges"]))
+    if vocabulary is not None:
+        rules.append(ConceptValidator(spec["concepts"], vocabulary))
+    return rules
+
+
+def omop_profile(table: str, vocabulary: Optional[ConceptVocabulary] = None) -> ValidationProfile:
+    """Single-table profile for an OMOP CDM table."""
+    return ValidationProfile(
+        name=f"OMOP CDM {table}",
+        description=f"Validation for the OMOP CDM {table} table",
+        rules=omop_table_rules(table, vocabulary),
+        metadata={
+            "domain": "observational_research",
+            "compliance": ["OMOP-CDM-5.4"],
+            "data_types": [table],
+        },
+    )
+
+
+def omop_validator(
+    vocabulary: Optional[ConceptVocabulary] = None,
+    tables: Optional[Iterable[str]] = None,
+) -> MultiTableValidator:
+    """
+    Multi-table validator for OMOP CDM tables.
+
+    Args:
+        vocabulary: Concept vocabulary; without it concept ids are only
+            type checked
+        tables: Tables to configure; defaults to every table in ``OMOP_TABLES``
+
+    Returns:
+        MultiTableValidator with primary keys, foreign keys and table rules.
+        Pass tables to ``validate`` as DataFrames or chunk iterables.
+    """
+    names = list(tables) if tables is not None else list(OMOP_TABLES)
+    unknown = sorted(set(names) - set(OMOP_TABLES))
+    if unknown:
+        raise ValueError(f"Unsupported OMOP tables: {unknown}")
+    return MultiTableValidator(
+        primary_keys={table: OMOP_TABLES[table]["primary_key"] for table in names},
+        foreign_keys=[fk for fk in OMOP_FOREIGN_KEYS if fk[0] in names and fk[2] in names],
+        table_rules={table: omop_table_rules(table, vocabulary) for table in names},
+    )
@@ -7,9 +7,11 @@ for large-scale medical data validation.
 
 import time
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 from .core import ValidationRule, ValidationIssue, ValidationResult
+from .dates import date_parsing_session
 
 if TYPE_CHECKING:
     from .core import MedicalDataValidator
@@ -85,6 +87,17 @@ class ValidationCache:
         }
 
 
+def _run_check(check: Callable[[pd.DataFrame], Any], data: pd.DataFrame, name: str, label: str) -> List[ValidationIssue]:
+    """Issues from one rule or custom validator, reporting a failure as an issue."""
+    try:
+        issues = check(data)
+    except Exception as e:
+        return [ValidationIssue(severity="error", message=f"{label} failed: {str(e)}", rule_name=name)]
+    if isinstance(issues, ValidationIssue):
+        return [issues]
+    return list(issues) if isinstance(issues, list) else []
+
+
 class BatchValidator:
     """
     Validator for processing large datasets in batches.
@@ -137,40 +150,175 @@ class BatchValidator:
             
             # Extract batch
             batch_data = data.iloc[start_idx:end_idx].copy()
-            
-            # Check cache first
-            rule_names = [rule.name for rule in self.validator.rules]
-            cached_result = self.cache.get(batch_data, rule_names)
-            
-            if cached_result:
-                batch_result = cached_result
-            else:
-                # Run validation on batch
-                batch_result = self.validator.validate(batch_data)
-                # Cache the result
-                self.cache.set(batch_data, rule_names, batch_result)
-            
-            # Combine results
-            for issue in batch_result.issues:
-                # Adjust row numbers to reflect global position
-                if issue.row is not None:
-                    issue.row += start_idx
-                combined_result.add_issue(issue)
-            
-            # Update summary
-            combined_result.summary["batch_results"].append({
-                "batch_num": batch_num,
-                "start_row": start_idx,
-                "end_row": end_idx,
-                "issues_count": len(batch_result.issues),
-                "is_valid": batch_result.is_valid
-            })
+            self._validate_batch(batch_data, batch_num, start_idx, combined_result)
             
             # Progress callback
             if progress_callback:
                 progress_callback(batch_num + 1, total_batches)
         
         return combined_result
+    
+    def validate_stream(
+        self,
+        batches: Iterable[pd.DataFrame],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> ValidationResult:
+        """
+        Validate DataFrames as they are produced by a reader.
+        
+        Only one batch is held at a time, so memory stays bounded for
+        streamed sources such as ``iter_columnar`` or ``iter_excel``.
+        
+        Args:
+            batches: Iterable of DataFrame chunks, in row order
+            progress_callback: Optional callback called with (batches done, rows done)
+            
+        Returns:
+            Combined validation result; issue rows are positions in the whole stream
+        """
+        combined_result = ValidationResult(is_valid=True)
+        combined_result.summary = {
+            "total_rows": 0,
+            "total_columns": 0,
+            "batch_size": self.batch_size,
+            "total_batches": 0,
+            "batch_results": []
+        }
+        
+        start_idx = 0
+        for batch_num, batch_data in enumerate(batches):
+            self._validate_batch(batch_data, batch_num, start_idx, combined_result)
+            start_idx += len(batch_data)
+            combined_result.summary["total_columns"] = max(combined_result.summary["total_columns"], len(batch_data.columns))
+            combined_result.summary["total_batches"] = batch_num + 1
+            
+            if progress_callback:
+                progress_callback(batch_num + 1, start_idx)
+        
+        combined_result.summary["total_rows"] = start_idx
+        return combined_result
+    
+    def iter_stream(self, batches: Iterable[pd.DataFrame]) -> Iterator[ValidationResult]:
+        """
+        Validate DataFrames as they are produced, yielding each batch's result.
+        
+        Nothing is accumulated between batches, so issues can be handed on
+        (for example to a streaming response) as soon as their batch is done.
+        
+        Args:
+            batches: Iterable of DataFrame chunks, in row order
+        
+        Yields:
+            One result per batch; issue rows are positions in the whole stream
+            and ``summary["batch_results"]`` holds the batch's row range
+        """
+        start_idx = 0
+        for batch_num, batch_data in enumerate(batches):
+            batch_result = ValidationResult(is_valid=True)
+            batch_result.summary = {
+                "total_rows": len(batch_data),
+                "total_columns": len(batch_data.columns),
+                "batch_results": []
+            }
+            self._validate_batch(batch_data, batch_num, start_idx, batch_result)
+            start_idx += len(batch_data)
+            yield batch_result
+    
+    def validate_datasets(self, datasets: Sequence[pd.DataFrame]) -> List[ValidationResult]:
+        """
+        Validate many small datasets in one call.
+        
+        Datasets with the same columns and dtypes are concatenated and each
+        row-local rule (see ``ValidationRule.is_row_local``) runs once over
+        the combined frame, its issues split back to the dataset their row
+        falls in. Every other rule and custom validator runs on each dataset
+        alone, since counts, caps and comparisons between rows would
+        otherwise mix datasets. Compliance, analytics and monitoring are left
+        to the caller.
+        
+        Args:
+            datasets: DataFrames to validate independently
+        
+        Returns:
+            One result per dataset, in order; issue rows are positions in
+            that dataset
+        """
+        results = [ValidationResult(is_valid=True) for _ in datasets]
+        frames = [data.reset_index(drop=True) for data in datasets]
+        
+        groups: Dict[Tuple[Tuple[str, str], ...], List[int]] = {}
+        for position, data in enumerate(frames):
+            key = tuple(sorted((str(column), str(dtype)) for column, dtype in data.dtypes.items()))
+            groups.setdefault(key, []).append(position)
+        
+        checks = [(rule.name, rule.validate, f"Rule '{rule.name}'", rule.is_row_local()) for rule in self.validator.rules]
+        checks.extend(
+            (name, check, f"Custom validator '{name}'", False)
+            for name, check in self.validator._validators.items() if callable(check)
+        )
+        any_row_local = any(row_local for *_, row_local in checks)
+        
+        with date_parsing_session():
+            for members in groups.values():
+                group_frames = [frames[position] for position in members]
+                combined = None
+                if len(members) > 1 and any_row_local:
+                    combined = pd.concat(group_frames, ignore_index=True)
+                    offsets = np.cumsum([0] + [len(data) for data in group_frames])
+        
+                for name, check, label, row_local in checks:
+                    issues = _run_check(check, combined, name, label) if row_local and combined is not None else None
+                    if issues is None or any(issue.row is None for issue in issues):
+                        # Not row-local (or it failed): only the datasets themselves can say
+                        for position, data in zip(members, group_frames):
+                            for issue in _run_check(check, data, name, label):
+                                results[position].add_issue(issue)
+                        continue
+                    for issue in issues:
+                        member = int(np.searchsorted(offsets, issue.row, side="right")) - 1
+                        issue.row -= int(offsets[member])
+                        results[members[member]].add_issue(issue)
+        
+        for result, data in zip(results, frames):
+            result.summary = {"total_rows": len(data), "total_columns": len(data.columns)}
+        return results
+    
+    def _validate_batch(
+        self,
+        batch_data: pd.DataFrame,
+        batch_num: int,
+        start_idx: int,
+        combined_result: ValidationResult,
+    ) -> None:
+        """Validate one batch and merge its issues at global row positions."""
+        # Check cache first
+        rule_names = [rule.name for rule in self.validator.rules]
+        cached_result = self.cache.get(batch_data, rule_names)
+        
+        if cached_result:
+            batch_result = cached_result
+        else:
+            # Run validation on batch
+            batch_result = self.validator.validate(batch_data)
+            # Cache the result
+            self.cache.set(batch_data, rule_names, batch_result)
+        
+        # Combine results
+        for issue in batch_result.issues:
+            # Adjust row numbers to reflect global position
+            if issue.row is not None:
+                issue.row += start_idx
+            combined_result.add_issue(issue)
+        
+        # Update summary
+        combined_result.summary["batch_results"].append({
+            "batch_num": batch_num,
+            "start_row": start_idx,
+            "end_row": start_idx + len(batch_data),
+            "issues_count": len(batch_result.issues),
+            "is_valid": batch_result.is_valid
+        })
+    
 
 
 class PerformanceMonitor:
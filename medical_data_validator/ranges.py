@@ -0,0 +1,228 @@
+"""
+Vectorized range checking for numeric medical data.
+
+All configured columns are stacked into one 2-D float array and compared
+against broadcast lower/upper bound rows in a single pass. Bounds can come
+from unit-aware packs (vital signs, laboratory results keyed by LOINC) and
+can depend on other columns of the same row (for example age- or
+sex-specific ranges).
+
+A range configuration maps a column to a bound specification::
+
+    {
+        "hemoglobin": {
+            "min": 13.5, "max": 17.5, "unit": "g/dL",
+            "when": [
+                {"if": {"sex": "F"}, "min": 12.0, "max": 15.5},
+                {"if": {"age": (None, 18)}, "min": 11.0, "max": 16.0},
+            ],
+        },
+    }
+
+``when`` cases are tried in order and the first matching case sets the
+row's bounds; rows matching no case use the top-level ``min``/``max``. A
+condition value that is a scalar tests equality, a list or set tests
+membership, and a ``(low, high)`` tuple tests ``low <= value < high``
+(either end may be ``None``).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Physiologically plausible limits; values outside are almost certainly errors
+VITAL_SIGNS: Dict[str, Dict[str, Any]] = {
+    "heart_rate": {"min": 20, "max": 250, "unit": "/min"},
+    "systolic_bp": {"min": 50, "max": 260, "unit": "mm[Hg]"},
+    "diastolic_bp": {"min": 20, "max": 160, "unit": "mm[Hg]"},
+    "respiratory_rate": {"min": 4, "max": 60, "unit": "/min"},
+    "temperature": {"min": 30.0, "max": 45.0, "unit": "Cel"},
+    "oxygen_saturation": {"min": 50, "max": 100, "unit": "%"},
+    "weight": {"min": 0.3, "max": 400.0, "unit": "kg"},
+    "height": {"min": 30.0, "max": 250.0, "unit": "cm"},
+    "bmi": {"min": 10.0, "max": 80.0, "unit": "kg/m2"},
+}
+
+# Plausible limits for common laboratory results, keyed by LOINC code
+LAB_RANGES_BY_LOINC: Dict[str, Dict[str, Any]] = {
+    "2345-7": {"name": "glucose", "min": 10, "max": 1000, "unit": "mg/dL",
+               "conversions": {"mmol/L": (0.0555, 0.0)}},
+    "718-7": {"name": "hemoglobin", "min": 3.0, "max": 25.0, "unit": "g/dL"},
+    "2823-3": {"name": "potassium", "min": 1.5, "max": 10.0, "unit": "mmol/L"},
+    "2951-2": {"name": "sodium", "min": 100, "max": 180, "unit": "mmol/L"},
+    "2160-0": {"name": "creatinine", "min": 0.1, "max": 20.0, "unit": "mg/dL",
+               "conversions": {"umol/L": (88.42, 0.0)}},
+    "6690-2": {"name": "wbc", "min": 0.1, "max": 200.0, "unit": "10*3/uL"},
+    "777-3": {"name": "platelets", "min": 5, "max": 2000, "unit": "10*3/uL"},
+    "4548-4": {"name": "hba1c", "min": 3.0, "max": 20.0, "unit": "%"},
+}
+
+# Generic (scale, offset) conversions between units: value_to = value_from * scale + offset
+UNIT_CONVERSIONS: Dict[Tuple[str, str], Tuple[float, float]] = {
+    ("Cel", "[degF]"): (1.8, 32.0),
+    ("kg", "[lb_av]"): (2.20462, 0.0),
+    ("cm", "[in_i]"): (0.393701, 0.0),
+    ("g/dL", "g/L"): (10.0, 0.0),
+}
+
+
+def convert_bound(value: Optional[float], scale: float, offset: float) -> Optional[float]:
+    """Convert a bound with a (scale, offset) pair, keeping None."""
+    return None if value is None else value * scale + offset
+
+
+def build_ranges(
+    pack: Dict[str, Dict[str, Any]],
+    columns: Optional[Dict[str, str]] = None,
+    units: Optional[Dict[str, str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build a range configuration from a bound pack.
+
+    Args:
+        pack: Bound pack such as VITAL_SIGNS or LAB_RANGES_BY_LOINC
+        columns: Data column -> pack key; defaults to every pack key as a column
+        units: Data column -> unit the column is recorded in, when it differs
+            from the pack's unit
+
+    Returns:
+        Range configuration for RangeValidator
+    """
+    columns = columns if columns is not None else {key: key for key in pack}
+    units = units or {}
+    ranges: Dict[str, Dict[str, Any]] = {}
+
+    for column, key in columns.items():
+        if key not in pack:
+            raise KeyError(f"No range defined for '{key}'")
+        spec = dict(pack[key])
+        conversions = spec.pop("conversions", {})
+        spec.pop("name", None)
+        target_unit = units.get(column)
+        if target_unit and target_unit != spec.get("unit"):
+            factor = conversions.get(target_unit) or UNIT_CONVERSIONS.get((spec.get("unit"), target_unit))
+            if factor is None:
+                raise ValueError(f"Cannot convert '{key}' from {spec.get('unit')} to {target_unit}")
+            spec["min"] = convert_bound(spec.get("min"), *factor)
+            spec["max"] = convert_bound(spec.get("max"), *factor)
+            spec["unit"] = target_unit
+        ranges[column] = spec
+
+    return ranges
+
+
+@dataclass
+class RangeEvaluation:
+    """Outcome of a range evaluation; one row per data row, one column per checked column."""
+
+    columns: List[str]
+    below: np.ndarray
+    above: np.ndarray
+
+    @property
+    def out_of_range(self) -> np.ndarray:
+        """Boolean matrix of values outside their bounds."""
+        return self.below | self.above
+
+    def below_counts(self) -> np.ndarray:
+        """Number of values below the minimum, per column."""
+        return self.below.sum(axis=0)
+
+    def above_counts(self) -> np.ndarray:
+        """Number of values above the maximum, per column."""
+        return self.above.sum(axis=0)
+
+    def row_bitmap(self) -> np.ndarray:
+        """Per-row bitmaps (packed bits, column order) of out-of-range values."""
+        return np.packbits(self.out_of_range, axis=1)
+
+    def failing_rows(self) -> np.ndarray:
+        """Positions of rows with at least one out-of-range value."""
+        return np.flatnonzero(self.out_of_range.any(axis=1))
+
+
+def _condition_mask(data: pd.DataFrame, condition: Dict[str, Any]) -> np.ndarray:
+    """Evaluate an ``if`` mapping to a row mask (all entries must hold)."""
+    mask = np.ones(len(data), dtype=bool)
+    for column, expected in condition.items():
+        if column not in data.columns:
+            return np.zeros(len(data), dtype=bool)
+        values = data[column]
+        if isinstance(expected, tuple):
+            low, high = expected
+            numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                if low is not None:
+                    mask &= numbers >= low
+                if high is not None:
+                    mask &= numbers < high
+        elif isinstance(expected, (list, set, frozenset)):
+            mask &= values.isin(list(expected)).to_numpy(dtype=bool)
+        else:
+            mask &= values.eq(expected).fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def _bound(value: Optional[float], missing: float) -> float:
+    return missing if value is None else float(value)
+
+
+class RangeEngine:
+    """
+    Evaluates a range configuration against a DataFrame in one broadcast.
+
+    Columns missing from the data or without a numeric dtype are skipped.
+    """
+
+    def __init__(self, ranges: Dict[str, Dict[str, Any]]):
+        self.ranges = ranges
+
+    def referenced_columns(self) -> List[str]:
+        """Every column a range or a ``when`` condition reads."""
+        columns = list(self.ranges)
+        for spec in self.ranges.values():
+            for case in spec.get("when", []):
+                columns.extend(column for column in case.get("if", {}) if column not in columns)
+        return columns
+
+    def applicable_columns(self, data: pd.DataFrame) -> List[str]:
+        """Configured columns that are present and numeric."""
+        return [
+            column for column in self.ranges
+            if column in data.columns and pd.api.types.is_numeric_dtype(data[column])
+        ]
+
+    def _bounds(self, data: pd.DataFrame, columns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower/upper bounds, shaped (1, n_cols) or (n_rows, n_cols) if any are conditional."""
+        lower = np.array([[_bound(self.ranges[c].get("min"), -np.inf) for c in columns]])
+        upper = np.array([[_bound(self.ranges[c].get("max"), np.inf) for c in columns]])
+
+        conditional = [(j, c) for j, c in enumerate(columns) if self.ranges[c].get("when")]
+        if not conditional:
+            return lower, upper
+
+        lower = np.repeat(lower, len(data), axis=0)
+        upper = np.repeat(upper, len(data), axis=0)
+        for j, column in conditional:
+            cases = self.ranges[column]["when"]
+            masks = [_condition_mask(data, case.get("if", {})) for case in cases]
+            lower[:, j] = np.select(masks, [_bound(case.get("min"), -np.inf) for case in cases], lower[:, j])
+            upper[:, j] = np.select(masks, [_bound(case.get("max"), np.inf) for case in cases], upper[:, j])
+        return lower, upper
+
+    def evaluate(self, data: pd.DataFrame) -> RangeEvaluation:
+        """Compare every applicable column against its bounds."""
+        columns = self.applicable_columns(data)
+        if not columns:
+            empty = np.zeros((len(data), 0), dtype=bool)
+            return RangeEvaluation(columns=[], below=empty, above=empty.copy())
+
+        values = data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        lower, upper = self._bounds(data, columns)
+        # NaN compares False, so missing values are never out of range
+        with np.errstate(invalid="ignore"):
+            below = values < lower
+            above = values > upper
+        return RangeEvaluation(columns=columns, below=below, above=above)
@@ -0,0 +1,306 @@
+"""
+Referential integrity validation across related tables.
+
+Tables are passed as a dict of DataFrames (or iterables of DataFrame chunks
+for tables too large for memory) together with declared primary and
+foreign keys. Key columns are normalized value by value and hashed to
+uint64 once per table; referenced key sets are kept as sorted unique
+arrays and foreign keys are checked with ``np.searchsorted``. Tables are
+processed parents first so a streamed child table is read exactly once.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .core import ValidationIssue, ValidationResult, ValidationRule
+from .dates import date_parsing_session
+
+KeyColumns = Tuple[str, ...]
+TableInput = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+def _as_columns(columns: Union[str, Sequence[str]]) -> KeyColumns:
+    return (columns,) if isinstance(columns, str) else tuple(columns)
+
+
+@dataclass(frozen=True)
+class ForeignKey:
+    """A foreign key from ``table.columns`` to ``ref_table.ref_columns``."""
+
+    table: str
+    columns: KeyColumns
+    ref_table: str
+    ref_columns: KeyColumns
+
+    @classmethod
+    def from_spec(cls, spec: Union["ForeignKey", Dict[str, Any], Sequence[Any]]) -> "ForeignKey":
+        """Build from a dict, a (table, columns, ref_table, ref_columns) tuple or a ForeignKey."""
+        if isinstance(spec, ForeignKey):
+            return spec
+        if isinstance(spec, dict):
+            table, columns = spec["table"], spec["columns"]
+            ref_table, ref_columns = spec["ref_table"], spec.get("ref_columns", spec["columns"])
+        else:
+            table, columns, ref_table, ref_columns = spec
+        columns, ref_columns = _as_columns(columns), _as_columns(ref_columns)
+        if len(columns) != len(ref_columns):
+            raise ValueError(f"Foreign key {table}{list(columns)} -> {ref_table}{list(ref_columns)} has mismatched columns")
+        return cls(table, columns, ref_table, ref_columns)
+
+    def describe(self) -> str:
+        return f"{self.table}({', '.join(self.columns)}) -> {self.ref_table}({', '.join(self.ref_columns)})"
+
+
+# Float-formatted integer text such as "123.0"; only the ".0" is dropped
+_FLOAT_TEXT = r"^([+-]?\d+)\.0+$"
+
+
+def _number_text(value: Any) -> str:
+    """A numeric key as text, with integral floats written as integers."""
+    if isinstance(value, (float, np.floating)) and np.isfinite(value) and value == int(value):
+        return str(int(value))
+    return str(value)
+
+
+def _canonical_key_text(values: pd.Series) -> pd.Series:
+    """Key values as text, with numeric values in one canonical form.
+
+    Numbers are normalized so ``1`` and ``1.0`` agree; text is kept as it
+    is apart from a trailing ``.0``, so zero-padded identifiers such as
+    ``"00123"`` stay distinct from ``"123"``. Each value is normalized on
+    its own, so a key gets the same text (and hash) whatever else is in its
+    table or chunk.
+    """
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+        return values.astype(str)
+    if pd.api.types.is_float_dtype(values):
+        text = values.astype(str)
+        integral = values.notna() & (values % 1 == 0)
+        text[integral] = values[integral].astype(np.int64).astype(str)
+        return text
+    strings = values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    text = values.astype(str)
+    text[strings] = text[strings].str.replace(_FLOAT_TEXT, r"\1", regex=True)
+    if not strings.all():
+        text[~strings] = values[~strings].map(_number_text)
+    return text
+
+
+def hash_keys(data: pd.DataFrame, columns: KeyColumns) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash key columns to uint64 and return (hashes, present mask).
+
+    Keys are compared as text with numbers in canonical form, so ``1``,
+    ``1.0`` and ``"1"`` in different tables or chunks refer to the same key
+    while ``"001"`` does not. Rows with any missing key column are marked as not present.
+    """
+    present = data[list(columns)].notna().all(axis=1).to_numpy()
+    frame = pd.DataFrame({column: _canonical_key_text(data[column]) for column in columns}, index=data.index)
+    hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    return hashes, present
+
+
+def _contains(sorted_keys: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+    if len(sorted_keys) == 0:
+        return np.zeros(len(hashes), dtype=bool)
+    positions = np.searchsorted(sorted_keys, hashes)
+    positions[positions == len(sorted_keys)] = 0
+    return sorted_keys[positions] == hashes
+
+
+def _chunks(table: TableInput) -> Iterator[pd.DataFrame]:
+    if isinstance(table, pd.DataFrame):
+        yield table
+    else:
+        yield from table
+
+
+class MultiTableValidator:
+    """
+    Validates primary keys, foreign keys and per-table rules over related tables.
+
+    Args:
+        primary_keys: Table name -> primary key column(s)
+        foreign_keys: Foreign keys as ForeignKey objects, dicts with
+            ``table``/``columns``/``ref_table``/``ref_columns`` or 4-tuples
+        table_rules: Table name -> validation rules run on that table
+        sample_size: Number of orphan key values quoted in issue messages
+    """
+
+    def __init__(
+        self,
+        primary_keys: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        foreign_keys: Optional[Sequence[Any]] = None,
+        table_rules: Optional[Dict[str, List[ValidationRule]]] = None,
+        sample_size: int = 5,
+    ):
+        self.primary_keys = {table: _as_columns(cols) for table, cols in (primary_keys or {}).items()}
+        self.foreign_keys = [ForeignKey.from_spec(spec) for spec in (foreign_keys or [])]
+        self.table_rules = table_rules or {}
+        self.sample_size = sample_size
+
+    def _table_order(self, tables: Dict[str, TableInput]) -> List[str]:
+        """Order tables so referenced tables come before the tables pointing at them."""
+        parents = {name: set() for name in tables}
+        for fk in self.foreign_keys:
+            if fk.table in tables and fk.ref_table in tables and fk.ref_table != fk.table:
+                parents[fk.table].add(fk.ref_table)
+
+        order: List[str] = []
+        while parents:
+            ready = sorted(name for name, deps in parents.items() if not deps - set(order))
+            if not ready:
+                raise ValueError(f"Foreign keys form a cycle between tables: {sorted(parents)}")
+            for name in ready:
+                order.append(name)
+                del parents[name]
+        return order
+
+    def _run_rules(self, table: str, chunk: pd.DataFrame, offset: int, result: ValidationResult) -> None:
+        for rule in self.table_rules.get(table, []):
+            try:
+                issues = rule.validate(chunk)
+            except Exception as e:
+                issues = [ValidationIssue(
+                    severity="error",
+                    message=f"Rule '{rule.name}' failed: {str(e)}",
+                    rule_name=rule.name,
+                )]
+            for issue in issues:
+                issue.column = f"{table}.{issue.column}" if issue.column else table
+                if issue.row is not None:
+                    issue.row += offset
+                result.add_issue(issue)
+
+    def validate(self, tables: Dict[str, TableInput]) -> ValidationResult:
+        """
+        Validate related tables.
+
+        Args:
+            tables: Table name -> DataFrame, or an iterable of DataFrame chunks
+                (for example ``pd.read_csv(path, chunksize=...)``)
+
+        Returns:
+            ValidationResult with issues from every table; issue columns are
+            prefixed with the table name
+        """
+        result = ValidationResult(is_valid=True)
+        summary: Dict[str, Any] = {"tables": {}, "foreign_keys": []}
+
+        for fk in self.foreign_keys:
+            if fk.table == fk.ref_table and fk.table in tables and not isinstance(tables[fk.table], pd.DataFrame):
+                raise ValueError(f"Self-referencing foreign key {fk.describe()} needs an in-memory table")
+
+        # Key sets other tables point at, filled as each parent table is read
+        needed = {(fk.ref_table, fk.ref_columns) for fk in self.foreign_keys}
+        key_sets: Dict[Tuple[str, KeyColumns], np.ndarray] = {}
+
+        fk_stats = {fk: {"checked": 0, "orphans": 0, "samples": []} for fk in self.foreign_keys}
+
+        with date_parsing_session():
+            for table in self._table_order(tables):
+                pk = self.primary_keys.get(table)
+                collected: Dict[KeyColumns, List[np.ndarray]] = {
+                    cols: [] for ref, cols in needed if ref == table
+                }
+                pk_hashes: List[np.ndarray] = []
+                pk_missing = 0
+                rows = 0
+
+                # Self references need the table's own key set before checking
+                for fk in self.foreign_keys:
+                    if fk.table == table and fk.ref_table == table and set(fk.ref_columns) <= set(tables[table].columns):
+                        hashes, present = hash_keys(tables[table], fk.ref_columns)
+                        key_sets[(table, fk.ref_columns)] = np.unique(hashes[present])
+
+                for chunk in _chunks(tables[table]):
+                    if pk is not None and set(pk) <= set(chunk.columns):
+                        hashes, present = hash_keys(chunk, pk)
+                        pk_hashes.append(hashes[present])
+                        pk_missing += int((~present).sum())
+                    for cols in collected:
+                        if set(cols) <= set(chunk.columns):
+                            hashes, present = hash_keys(chunk, cols)
+                            collected[cols].append(hashes[present])
+
+                    for fk in self.foreign_keys:
+                        parent_keys = key_sets.get((fk.ref_table, fk.ref_columns))
+                        if fk.table != table or parent_keys is None or not set(fk.columns) <= set(chunk.columns):
+                            continue
+                        hashes, present = hash_keys(chunk, fk.columns)
+                        orphans = present & ~_contains(parent_keys, hashes)
+                        stats = fk_stats[fk]
+                        stats["checked"] += int(present.sum())
+                        stats["orphans"] += int(orphans.sum())
+                        missing = self.sample_size - len(stats["samples"])
+                        if missing > 0 and orphans.any():
+                            sample = chunk.loc[orphans, list(fk.columns)].drop_duplicates().head(missing)
+                            stats["samples"].extend(
+                                tuple(row) if len(fk.columns) > 1 else row[0]
+                                for row in sample.itertuples(index=False)
+                            )
+
+                    self._run_rules(table, chunk, rows, result)
+                    rows += len(chunk)
+
+                for cols, parts in collected.items():
+                    # No parts means the key columns were absent, so the key set is unknown
+                    if parts and (table, cols) not in key_sets:
+                        key_sets[(table, cols)] = np.unique(np.concatenate(parts))
+
+                duplicates = 0
+                if pk_hashes:
+                    all_keys = np.concatenate(pk_hashes)
+                    duplicates = len(all_keys) - len(np.unique(all_keys))
+                    self._report_primary_key(table, pk, duplicates, pk_missing, result)
+                summary["tables"][table] = {
+                    "rows": rows,
+                    "duplicate_primary_keys": duplicates,
+                    "missing_primary_keys": pk_missing,
+                }
+
+        for fk, stats in fk_stats.items():
+            if (fk.ref_table, fk.ref_columns) not in key_sets or fk.table not in tables:
+                result.add_issue(ValidationIssue(
+                    severity="warning",
+                    message=f"Foreign key {fk.describe()} was not checked: table or columns missing",
+                    column=fk.table,
+                ))
+                continue
+            if stats["orphans"]:
+                result.add_issue(ValidationIssue(
+                    severity="error",
+                    message=(
+                        f"Table '{fk.table}' has {stats['orphans']} orphan rows: "
+                        f"({', '.join(fk.columns)}) not found in '{fk.ref_table}'. Sample: {stats['samples']}"
+                    ),
+                    column=f"{fk.table}.{fk.columns[0]}",
+                ))
+            summary["foreign_keys"].append({
+                "foreign_key": fk.describe(),
+                "checked_rows": stats["checked"],
+                "orphan_rows": stats["orphans"],
+            })
+
+        result.summary = summary
+        return result
+
+    def _report_primary_key(
+        self, table: str, pk: KeyColumns, duplicates: int, missing: int, result: ValidationResult
+    ) -> None:
+        column = f"{table}.{pk[0]}"
+        if duplicates:
+            result.add_issue(ValidationIssue(
+                severity="error",
+                message=f"Table '{table}' has {duplicates} duplicate primary key values in ({', '.join(pk)})",
+                column=column,
+            ))
+        if missing:
+            result.add_issue(ValidationIssue(
+                severity="error",
+                message=f"Table '{table}' has {missing} rows with a missing primary key ({', '.join(pk)})",
+                column=column,
+            ))
@@ -0,0 +1,264 @@
+"""
+Schema inference, typed loading and dtype compatibility.
+
+A schema is inferred once from a sample of a dataset and records a compact
+load dtype for every column (nullable ``Int32``/``Int64`` integers,
+``category`` for low-cardinality text, Arrow-backed strings, parsed dates).
+It can emit ``dtype=`` maps for :func:`pandas.read_csv` so files load
+straight into those types, and it compiles to a :class:`SchemaValidator`
+whose checks only look at column names and dtypes.
+"""
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+from .dates import INFERRED_FORMAT, DateParser
+
+# Expected type names accepted in ``column_types`` and the logical type they mean
+TYPE_ALIASES: Dict[str, str] = {
+    "int": "integer",
+    "integer": "integer",
+    "int64": "integer",
+    "float": "float",
+    "float64": "float",
+    "number": "float",
+    "string": "string",
+    "str": "string",
+    "object": "string",
+    "text": "string",
+    "datetime": "datetime",
+    "date": "datetime",
+    "timestamp": "datetime",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "category": "category",
+    "categorical": "category",
+}
+
+# Logical types each actual logical type satisfies
+_SATISFIES: Dict[str, set] = {
+    "integer": {"integer"},
+    "float": {"float"},
+    "string": {"string"},
+    # Low-cardinality text loaded as category still counts as text
+    "category": {"category", "string"},
+    "datetime": {"datetime"},
+    "boolean": {"boolean"},
+}
+
+STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else "string"
+
+
+def logical_type(dtype: Any) -> str:
+    """Classify a pandas/NumPy dtype (or dtype name) into a logical type."""
+    if isinstance(dtype, str):
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype)
+        except TypeError:
+            return "unknown"
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_string_dtype(dtype) or pd.api.types.is_object_dtype(dtype):
+        return "string"
+    return "unknown"
+
+
+@lru_cache(maxsize=1024)
+def is_type_compatible(actual: str, expected: str) -> bool:
+    """
+    Check whether a column of dtype ``actual`` satisfies an expected type.
+
+    ``expected`` is either an alias from TYPE_ALIASES or an exact dtype name.
+    """
+    if actual == expected:
+        return True
+    return is_logical_compatible(logical_type(actual), expected)
+
+
+def is_logical_compatible(actual_logical: str, expected: str) -> bool:
+    """Check whether a column of logical type ``actual_logical`` satisfies an expected type alias."""
+    wanted = TYPE_ALIASES.get(expected.lower())
+    if wanted is None:
+        return False
+    return wanted in _SATISFIES.get(actual_logical, set())
+
+
+def is_text_dtype(dtype: Any) -> bool:
+    """Whether values of this dtype are text (object, string or text categories)."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return logical_type(dtype.categories.dtype) == "string"
+    return logical_type(dtype) == "string"
+
+
+@dataclass
+class ColumnSchema:
+    """Inferred description of a single column."""
+
+    name: str
+    logical_type: str
+    dtype: str
+    nullable: bool = True
+    date_format: Optional[str] = None
+
+
+@dataclass
+class Schema:
+    """Column schema with typed-loading and validation helpers."""
+
+    columns: Dict[str, ColumnSchema]
+
+    def read_csv_dtypes(self) -> Dict[str, str]:
+        """``dtype=`` map for :func:`pandas.read_csv`; dates load as text and are parsed afterwards."""
+        return {
+            name: (STRING_DTYPE if column.logical_type == "datetime" else column.dtype)
+            for name, column in self.columns.items()
+        }
+
+    def date_columns(self) -> Dict[str, Optional[str]]:
+        """Date columns and the format inferred for each."""
+        return {
+            name: column.date_format
+            for name, column in self.columns.items()
+            if column.logical_type == "datetime"
+        }
+
+    def apply(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Cast a DataFrame to the schema's load types (columns not in the schema are kept)."""
+        converted = {}
+        for name, column in self.columns.items():
+            if name not in data.columns or str(data[name].dtype) == column.dtype:
+                continue
+            if column.logical_type == "datetime":
+                converted[name] = pd.to_datetime(data[name], format=column.date_format, errors="coerce")
+            else:
+                converted[name] = data[name].astype(column.dtype)
+        return data.assign(**converted) if converted else data
+
+    def read_csv(self, path: Any, **kwargs: Any) -> pd.DataFrame:
+        """Read a CSV file directly into the schema's types."""
+        dtypes = self.read_csv_dtypes()
+        dtypes.update(kwargs.pop("dtype", None) or {})
+        data = pd.read_csv(path, dtype=dtypes, **kwargs)
+        return self.apply(data)
+
+    def to_validator(self, required: bool = True, **kwargs: Any):
+        """Compile the schema into a SchemaValidator."""
+        from .validators import SchemaValidator
+
+        return SchemaValidator(
+            required_columns=list(self.columns) if required else None,
+            # Category is a storage choice; any text column satisfies it
+            column_types={
+                name: "string" if column.logical_type == "category" else column.logical_type
+                for name, column in self.columns.items()
+            },
+            **kwargs,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert schema to a JSON-serializable dictionary."""
+        return {"columns": [asdict(column) for column in self.columns.values()]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Schema":
+        """Rebuild a schema from :meth:`to_dict` output."""
+        columns = [ColumnSchema(**column) for column in data["columns"]]
+        return cls(columns={column.name: column for column in columns})
+
+
+def _integer_dtype(series: pd.Series) -> str:
+    """Smallest nullable integer dtype for the sample, with headroom for unseen rows."""
+    values = series.dropna()
+    if values.empty:
+        return "Int64"
+    # Keep a 16x margin since the full file may hold larger values than the sample
+    limit = np.iinfo(np.int32).max // 16
+    if values.min() >= -limit and values.max() <= limit:
+        return "Int32"
+    return "Int64"
+
+
+def _infer_column(
+    name: str,
+    series: pd.Series,
+    category_threshold: float,
+    max_categories: int,
+    date_parser: DateParser,
+) -> ColumnSchema:
+    nullable = bool(series.isna().any())
+    kind = logical_type(series.dtype)
+
+    if kind == "integer":
+        return ColumnSchema(name, "integer", _integer_dtype(series), nullable)
+    if kind == "float":
+        # Kept at float64: whole-number samples may still hold fractions later,
+        # and float32 would shift values sitting on range boundaries
+        return ColumnSchema(name, "float", "float64", nullable)
+    if kind == "boolean":
+        return ColumnSchema(name, "boolean", "boolean", nullable)
+    if kind == "datetime":
+        return ColumnSchema(name, "datetime", "datetime64[ns]", nullable)
+    if kind == "category":
+        return ColumnSchema(name, "category", "category", nullable)
+
+    values = series.dropna()
+    if values.empty:
+        return ColumnSchema(name, "string", STRING_DTYPE, nullable)
+
+    parsed = date_parser.parse(values)
+    if parsed.invalid_count == 0 and len(parsed.formats) == 1 and parsed.format != INFERRED_FORMAT:
+        return ColumnSchema(name, "datetime", "datetime64[ns]", nullable, date_format=parsed.format)
+
+    unique_count = values.nunique()
+    if unique_count <= max_categories and unique_count <= category_threshold * len(values):
+        return ColumnSchema(name, "category", "category", nullable)
+    return ColumnSchema(name, "string", STRING_DTYPE, nullable)
+
+
+def infer_schema(
+    data: pd.DataFrame,
+    sample_size: Optional[int] = 10000,
+    category_threshold: float = 0.5,
+    max_categories: int = 1000,
+) -> Schema:
+    """
+    Infer a schema from a DataFrame (or the first ``sample_size`` rows of it).
+
+    Args:
+        data: Data to infer from, typically a sample read with ``nrows=``
+        sample_size: Number of rows to inspect; None inspects all rows
+        category_threshold: Maximum ratio of unique to non-null values for category columns
+        max_categories: Maximum number of distinct values for category columns
+
+    Returns:
+        Inferred Schema
+    """
+    sample = data.head(sample_size) if sample_size is not None else data
+    parser = DateParser(fallback=False)
+    columns = {
+        name: _infer_column(name, sample[name], category_threshold, max_categories, parser)
+        for name in sample.columns
+    }
+    return Schema(columns=columns)
+
+
+def infer_csv_schema(path: Union[str, Any], sample_rows: int = 10000, **kwargs: Any) -> Schema:
+    """Infer a schema from the first ``sample_rows`` rows of a CSV file."""
+    return infer_schema(pd.read_csv(path, nrows=sample_rows, **kwargs), sample_size=None)
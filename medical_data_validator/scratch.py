@@ -0,0 +1,167 @@
+"""
+Memory-mapped columnar scratch copies of input files.
+
+Re-validating the same large CSV re-parses it every time. ``ScratchCache``
+converts an input file once into an uncompressed Arrow IPC (Feather V2)
+file, dictionary-encoding low-cardinality string columns, and later runs
+memory-map that file instead: opening it costs milliseconds, only the
+columns a validator reads are paged in, and worker processes validating
+the same file share the page cache.
+
+Scratch files are keyed by the source's resolved path, size, modification
+time and a hash of its first and last megabyte, so an edited file gets a
+new entry. Columns declared as text in the validator's type hints are read
+as strings, as in a direct load, and the hints are part of the key. Set ``MEDICAL_VALIDATOR_SCRATCH_DIR`` to choose where they live.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import pandas as pd
+
+from .backends import pa
+from .loaders import (
+    FEATHER_SUFFIXES,
+    PARQUET_SUFFIXES,
+    _text_hints,
+    encode_strings,
+    file_format,
+    read_columnar,
+    read_csv_table,
+)
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+SCRATCH_SUFFIX = ".arrow"
+PARTIAL_HASH_BYTES = 1 << 20
+
+
+def default_scratch_dir() -> Path:
+    """Scratch directory from ``MEDICAL_VALIDATOR_SCRATCH_DIR`` or the user cache."""
+    configured = os.environ.get("MEDICAL_VALIDATOR_SCRATCH_DIR")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "medical_data_validator" / "scratch"
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> str:
+    """Identity of a file's current contents without reading all of it."""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    digest = hashlib.sha256(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+    with open(path, "rb") as handle:
+        digest.update(handle.read(PARTIAL_HASH_BYTES))
+        if stat.st_size > PARTIAL_HASH_BYTES:
+            handle.seek(max(stat.st_size - PARTIAL_HASH_BYTES, PARTIAL_HASH_BYTES))
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def _read_source(path: Path, dtypes: Optional[Dict[str, str]] = None) -> "pa.Table":
+    """Read any supported input file into an Arrow table."""
+    suffix = file_format(path)
+    if suffix == ".csv":
+        # Same parsing as a direct load, so cached and uncached runs agree
+        return read_csv_table(path, dtypes=dtypes)[0]
+    if suffix in PARQUET_SUFFIXES:
+        return pq.read_table(str(path))
+    if suffix in FEATHER_SUFFIXES:
+        with pa.OSFile(str(path)) as source:
+            return pa.ipc.open_file(source).read_all()
+    if suffix in {".xlsx", ".xls"}:
+        from .excel import read_excel
+        return pa.Table.from_pandas(read_excel(path), preserve_index=False)
+    if suffix == ".json":
+        return pa.Table.from_pandas(pd.read_json(path), preserve_index=False)
+    raise ValueError(f"Unsupported file format: {path.suffix}")
+
+
+def prepare_scratch_table(
+    table: "pa.Table",
+    dtypes: Optional[Dict[str, str]] = None,
+    max_unique_ratio: float = 0.5,
+) -> "pa.Table":
+    """
+    Encode a table for scratch storage.
+
+    Low-cardinality string columns are dictionary-encoded (see
+    ``encode_strings``). Date columns become timestamps so they load as
+    ``datetime64`` rather than Python ``date`` objects.
+    """
+    for index, field in enumerate(table.schema):
+        if pa.types.is_date(field.type):
+            table = table.set_column(index, field.name, table.column(index).cast(pa.timestamp("ms")))
+    return encode_strings(table, dtypes, max_unique_ratio=max_unique_ratio)
+
+
+class ScratchCache:
+    """
+    Converts input files to memory-mappable Arrow IPC files, once per version.
+
+    Args:
+        directory: Where scratch files are written; defaults to
+            ``default_scratch_dir()``
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        if pa is None:
+            raise ImportError("The scratch cache requires pyarrow")
+        self.directory = Path(directory) if directory is not None else default_scratch_dir()
+
+    def path_for(self, file_path: Union[str, Path], dtypes: Optional[Dict[str, str]] = None) -> Path:
+        """Scratch file location for the current version of ``file_path``."""
+        key = file_fingerprint(file_path)
+        hints = _text_hints(dtypes)
+        if hints:
+            key = hashlib.sha256(f"{key}\0{sorted(hints.items())}".encode()).hexdigest()
+        return self.directory / f"{key}{SCRATCH_SUFFIX}"
+
+    def convert(self, file_path: Union[str, Path], dtypes: Optional[Dict[str, str]] = None) -> Path:
+        """
+        Return the scratch file for ``file_path``, creating it if needed.
+
+        ``dtypes`` are expected column types used as CSV load hints.
+        """
+        target = self.path_for(file_path, dtypes)
+        if target.exists():
+            return target
+
+        table = prepare_scratch_table(_read_source(Path(file_path), dtypes), dtypes)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return target
+
+    def load(
+        self,
+        file_path: Union[str, Path],
+        columns: Optional[Sequence[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> pd.DataFrame:
+        """Load ``file_path`` through its scratch file, reading only ``columns``."""
+        return read_columnar(self.convert(file_path, dtypes), columns=columns)
+
+    def clear(self) -> int:
+        """Delete every scratch file and return how many were removed."""
+        if not self.directory.exists():
+            return 0
+        removed = 0
+        for path in self.directory.glob(f"*{SCRATCH_SUFFIX}"):
+            path.unlink()
+            removed += 1
+        return removed
@@ -14,6 +14,13 @@ from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
+from .dates import DateParser
+
+# Formats recognised when generalizing dates for Safe Harbor anonymization
+SAFE_HARBOR_DATE_PARSER = DateParser(
+    formats=['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d'], fallback=False
+)
+
 class HIPAAComplianceChecker:
     """HIPAA compliance checker for medical data."""
     
@@ -149,7 +156,7 @@ class DataAnonymizer:
         
         # Dates - keep only year
         elif any(date_field in column_lower for date_field in ['date', 'birth', 'admission', 'discharge']):
-            return column_data.apply(self._generalize_date)
+            return self._generalize_dates(column_data)
         
         # Addresses
         elif any(addr_field in column_lower for addr_field in ['address', 'street', 'city', 'state', 'zip']):
@@ -193,6 +200,16 @@ class DataAnonymizer:
         else:
             return column_data.apply(lambda x: f"{str(x)[:3]}***" if pd.notna(x) else x)
     
+    def _generalize_dates(self, column_data: pd.Series) -> pd.Series:
+        """Generalize a column of dates to years, parsing each distinct value once."""
+        if pd.api.types.is_numeric_dtype(column_data) or pd.api.types.is_bool_dtype(column_data):
+            return column_data.apply(self._generalize_date)
+        
+        parsed = SAFE_HARBOR_DATE_PARSER.parse(column_data).values
+        years = parsed.dt.year.astype('Int64').astype(str)
+        generalized = column_data.astype(str).where(parsed.isna(), years).astype(object)
+        return generalized.where(column_data.notna(), None)
+    
     def _generalize_date(self, date_value) -> str:
         """Generalize date to year only."""
         if pd.isna(date_value):
@@ -0,0 +1,181 @@
+"""
+Group-aware sequence checks across rows (per patient or subject).
+
+Rows are sorted once by (group, time) with ``np.lexsort`` and every check
+is evaluated on the sorted arrays with shifts and grouped cumulative
+reductions, so no Python code runs per patient. Results are row masks in
+the original row order, which the validator turns into row-level issues.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .core import ValidationIssue, ValidationRule
+from .dates import parse_dates
+
+SEQUENCE_CHECKS = ("order", "overlap", "monotonic")
+
+
+def _time_values(data: pd.DataFrame, column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sortable numeric view of a time column and its validity mask."""
+    series = data[column]
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return values, ~np.isnan(values)
+    parsed = parse_dates(data, column).values
+    valid = parsed.notna().to_numpy()
+    return parsed.to_numpy(dtype="datetime64[ns]").view(np.int64), valid
+
+
+class SequenceValidator(ValidationRule):
+    """
+    Validates temporal sequences of rows within each group.
+
+    Checks:
+        order: ``end_column`` is not before ``time_column`` on the same row
+        overlap: a row does not start before an earlier row of the same
+            group has ended (needs ``end_column``)
+        monotonic: ``sequence_column`` strictly increases with time within
+            each group
+
+    Checks whose columns are not configured or not present are skipped.
+    """
+
+    def __init__(
+        self,
+        group_column: str,
+        time_column: str,
+        end_column: Optional[str] = None,
+        sequence_column: Optional[str] = None,
+        checks: Optional[Sequence[str]] = None,
+        max_row_issues: Optional[int] = 1000,
+        name: str = "SequenceValidator",
+        description: str = "Validates per-group temporal sequences",
+    ):
+        super().__init__(name=name, description=description)
+        unknown = set(checks or ()) - set(SEQUENCE_CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown sequence checks: {sorted(unknown)}")
+        self.group_column = group_column
+        self.time_column = time_column
+        self.end_column = end_column
+        self.sequence_column = sequence_column
+        self.checks = list(checks) if checks is not None else list(SEQUENCE_CHECKS)
+        self.max_row_issues = max_row_issues
+
+    def referenced_columns(self) -> Optional[List[str]]:
+        columns = [self.group_column, self.time_column, self.end_column, self.sequence_column]
+        return [column for column in columns if column is not None]
+
+    def _applicable_checks(self, data: pd.DataFrame) -> List[str]:
+        if self.group_column not in data.columns or self.time_column not in data.columns:
+            return []
+        has_end = self.end_column is not None and self.end_column in data.columns
+        has_sequence = self.sequence_column is not None and self.sequence_column in data.columns
+        available = {"order": has_end, "overlap": has_end, "monotonic": has_sequence}
+        return [check for check in self.checks if available[check]]
+
+    def evaluate(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Row masks of violations per check, in the original row order."""
+        checks = self._applicable_checks(data)
+        if not checks:
+            return {}
+
+        results: Dict[str, np.ndarray] = {}
+        group_codes, _ = pd.factorize(data[self.group_column], use_na_sentinel=True)
+        start, start_ok = _time_values(data, self.time_column)
+        end = end_ok = None
+        if self.end_column is not None and self.end_column in data.columns:
+            end, end_ok = _time_values(data, self.end_column)
+
+        if "order" in checks:
+            results["order"] = start_ok & end_ok & (end < start)
+
+        sequence = None
+        if "monotonic" in checks:
+            sequence = pd.to_numeric(data[self.sequence_column], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+
+        grouped = [check for check in checks if check != "order"]
+        if not grouped:
+            return results
+
+        # One sort shared by every grouped check; sequence breaks time ties
+        positions = np.flatnonzero((group_codes >= 0) & start_ok)
+        keys = [start[positions], group_codes[positions]]
+        if sequence is not None:
+            keys.insert(0, np.nan_to_num(sequence[positions], nan=np.inf))
+        order = positions[np.lexsort(keys)]
+        groups = group_codes[order]
+        same_group = np.zeros(len(order), dtype=bool)
+        same_group[1:] = groups[1:] == groups[:-1]
+
+        if "overlap" in grouped:
+            sorted_start = start[order]
+            # Rows without an end are treated as instantaneous
+            sorted_end = np.where(end_ok[order], end[order], sorted_start)
+            running_end = pd.Series(sorted_end).groupby(groups).cummax().to_numpy()
+            previous_end = np.empty_like(running_end)
+            previous_end[1:] = running_end[:-1]
+            violation = np.zeros(len(data), dtype=bool)
+            violation[order[1:]] = same_group[1:] & (sorted_start[1:] < previous_end[1:])
+            results["overlap"] = violation
+
+        if "monotonic" in grouped:
+            sorted_sequence = sequence[order]
+            violation = np.zeros(len(data), dtype=bool)
+            with np.errstate(invalid="ignore"):
+                violation[order[1:]] = same_group[1:] & (sorted_sequence[1:] <= sorted_sequence[:-1])
+            results["monotonic"] = violation
+
+        return {check: results[check] for check in checks}
+
+    def _describe(self, check: str) -> Tuple[str, str]:
+        """Issue column and message for a check."""
+        if check == "order":
+            return self.end_column, f"'{self.end_column}' is before '{self.time_column}'"
+        if check == "overlap":
+            return self.time_column, f"Overlaps an earlier row for the same '{self.group_column}'"
+        return (
+            self.sequence_column,
+            f"'{self.sequence_column}' does not increase with '{self.time_column}' within '{self.group_column}'",
+        )
+
+    def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
+        issues = []
+        remaining = self.max_row_issues
+
+        for check, violations in self.evaluate(data).items():
+            rows = np.flatnonzero(violations)
+            if len(rows) == 0:
+                continue
+            column, message = self._describe(check)
+            reported = rows if remaining is None else rows[:remaining]
+            values = data[column].iloc[reported].tolist()
+            for row, value in zip(reported, values):
+                issues.append(
+                    ValidationIssue(
+                        severity=self.severity,
+                        message=message,
+                        column=column,
+                        row=int(row),
+                        value=value,
+                        rule_name=self.name,
+                    )
+                )
+            if remaining is not None:
+                remaining -= len(reported)
+                if len(reported) < len(rows):
+                    issues.append(
+                        ValidationIssue(
+                            severity=self.severity,
+                            message=f"{len(rows) - len(reported)} more rows fail the {check} check ({len(rows)} total)",
+                            column=column,
+                            rule_name=self.name,
+                        )
+                    )
+
+        return issues
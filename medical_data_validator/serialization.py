@@ -0,0 +1,111 @@
+"""
+JSON serialization for validation results, reports and API responses.
+
+One encoder for everything the package emits: NumPy scalars and arrays,
+pandas objects, dates, dataclasses and pydantic models are converted by a
+single ``default`` hook instead of walking every payload in Python first.
+orjson is used when installed (it serializes NumPy arrays and dataclasses
+natively and only calls the hook for the rest); otherwise the standard
+library encoder is used with the same hook.
+
+``dashboard.json_provider.FastJSONProvider`` plugs the same encoder into
+Flask's ``jsonify``.
+"""
+
+import dataclasses
+import datetime
+import decimal
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def default(obj: Any) -> Any:
+    """Convert an object the JSON encoder does not handle natively."""
+    if obj is None or obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (datetime.timedelta, pd.Timedelta)):
+        return str(obj)
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient="records")
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return obj.tolist()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    return str(obj)
+
+
+def _str_keys(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {str(key): _str_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(item) for item in obj]
+    return obj
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False, indent: Optional[int] = None) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON."""
+    if orjson is not None:
+        option = _OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # Dict keys orjson cannot encode (NumPy scalars, tuples): stringify and retry
+            return orjson.dumps(_str_keys(obj), default=default, option=option)
+    separators = None if indent else (",", ":")
+    try:
+        return json.dumps(obj, default=default, sort_keys=sort_keys, indent=indent, separators=separators).encode()
+    except TypeError:
+        return json.dumps(
+            _str_keys(obj), default=default, sort_keys=sort_keys, indent=indent, separators=separators
+        ).encode()
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: Optional[int] = None) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    return dumps_bytes(obj, sort_keys=sort_keys, indent=indent).decode()
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from ``str`` or ``bytes``."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def to_builtin(obj: Any) -> Any:
+    """
+    ``obj`` with only JSON types left: NumPy and pandas values become Python
+    scalars and lists, and dict keys become strings.
+
+    For results that callers may pass to ``json.dumps`` themselves.
+    """
+    return loads(dumps_bytes(obj))
+
@@ -8,8 +8,25 @@ and medical-specific quality checks.
 
 import re
 from typing import Any, Dict, List, Optional, Set, Union
+import numpy as np
 import pandas as pd
 from .core import ValidationRule, ValidationIssue
+from .codesets import CodeSet, codeset_registry
+from .checkdigits import CHECK_DIGIT_VALIDATORS
+from .backends import (
+    arrow_logical_type,
+    count_rows,
+    count_true,
+    duplicate_row_count,
+    is_arrow_text,
+    parse_arrow_dates,
+    pc,
+    regex_mask,
+)
+from .dates import default_date_parser, parse_dates
+from .loaders import source_columns
+from .ranges import RangeEngine, RangeEvaluation
+from .schema import is_logical_compatible, is_text_dtype, is_type_compatible
 
 
 class SchemaValidator(ValidationRule):
@@ -26,20 +43,18 @@ class SchemaValidator(ValidationRule):
         self.required_columns = required_columns or []
         self.column_types = column_types or {}
     
+    def referenced_columns(self) -> Optional[List[str]]:
+        # Required columns are checked by name only
+        return list(self.column_types)
+    
+    def column_type_hints(self) -> Dict[str, str]:
+        return dict(self.column_types)
+    
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         issues = []
         
         # Check required columns
-        missing_columns = set(self.required_columns) - set(data.columns)
-        for column in missing_columns:
-            issues.append(
-                ValidationIssue(
-                    severity="error",
-                    message=f"Required column '{column}' is missing",
-                    column=column,
-                    rule_name=self.name,
-                )
-            )
+        issues.extend(self._missing_column_issues(source_columns(data)))
         
         # Check column types
         for column, expected_type in self.column_types.items():
@@ -48,32 +63,47 @@ class SchemaValidator(ValidationRule):
             
             actual_type = str(data[column].dtype)
             if not self._is_type_compatible(actual_type, expected_type):
-                issues.append(
-                    ValidationIssue(
-                        severity="error",
-                        message=f"Column '{column}' has type '{actual_type}' but expected '{expected_type}'",
-                        column=column,
-                        rule_name=self.name,
-                    )
-                )
+                issues.append(self._type_issue(column, actual_type, expected_type))
         
         return issues
     
-    def _is_type_compatible(self, actual: str, expected: str) -> bool:
-        """Check if actual type is compatible with expected type."""
-        type_mapping = {
-            "int64": ["int", "integer", "int64"],
-            "float64": ["float", "float64", "number"],
-            "object": ["string", "str", "object", "text"],
-            "datetime64[ns]": ["datetime", "date", "timestamp"],
-            "bool": ["boolean", "bool"],
-        }
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        issues = self._missing_column_issues(table.column_names)
         
-        for pandas_type, compatible_types in type_mapping.items():
-            if actual == pandas_type and expected.lower() in compatible_types:
-                return True
+        for column, expected_type in self.column_types.items():
+            if column not in table.column_names:
+                continue
+            
+            arrow_type = table.schema.field(column).type
+            actual_type = str(arrow_type)
+            if actual_type != expected_type and not is_logical_compatible(arrow_logical_type(arrow_type), expected_type):
+                issues.append(self._type_issue(column, actual_type, expected_type))
         
-        return False
+        return issues
+    
+    def _missing_column_issues(self, columns: Any) -> List[ValidationIssue]:
+        missing_columns = set(self.required_columns) - set(columns)
+        return [
+            ValidationIssue(
+                severity="error",
+                message=f"Required column '{column}' is missing",
+                column=column,
+                rule_name=self.name,
+            )
+            for column in missing_columns
+        ]
+    
+    def _type_issue(self, column: str, actual_type: str, expected_type: str) -> ValidationIssue:
+        return ValidationIssue(
+            severity="error",
+            message=f"Column '{column}' has type '{actual_type}' but expected '{expected_type}'",
+            column=column,
+            rule_name=self.name,
+        )
+    
+    def _is_type_compatible(self, actual: str, expected: str) -> bool:
+        """Check if actual type is compatible with expected type."""
+        return is_type_compatible(actual, expected)
 
 
 class PHIDetector(ValidationRule):
@@ -101,22 +131,12 @@ class PHIDetector(ValidationRule):
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         issues = []
         
-        for column in data.columns:
-            column_lower = column.lower()
-            
+        for column in source_columns(data):
             # Check for PHI keywords in column names
-            if any(keyword in column_lower for keyword in self.phi_keywords):
-                issues.append(
-                    ValidationIssue(
-                        severity="warning",
-                        message=f"Column '{column}' may contain PHI/PII based on name",
-                        column=column,
-                        rule_name=self.name,
-                    )
-                )
+            issues.extend(self._check_phi_keywords(column))
             
             # Check for PHI patterns in data
-            if data[column].dtype == "object":
+            if column in data.columns and is_text_dtype(data[column].dtype):
                 column_series = data[column]
                 if isinstance(column_series, pd.Series):
                     phi_found = self._check_phi_patterns(column_series, column)
@@ -124,6 +144,43 @@ class PHIDetector(ValidationRule):
         
         return issues
     
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        issues = []
+        
+        for column in table.column_names:
+            issues.extend(self._check_phi_keywords(column))
+            
+            if is_arrow_text(table.schema.field(column).type):
+                column_data = table.column(column)
+                for pattern_name, pattern in self.phi_patterns.items():
+                    match_count = count_true(regex_mask(column_data, pattern))
+                    if match_count:
+                        issues.append(self._pattern_issue(column, pattern_name, match_count))
+        
+        return issues
+    
+    def _check_phi_keywords(self, column: str) -> List[ValidationIssue]:
+        """Check a column name for PHI keywords."""
+        column_lower = column.lower()
+        if any(keyword in column_lower for keyword in self.phi_keywords):
+            return [
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Column '{column}' may contain PHI/PII based on name",
+                    column=column,
+                    rule_name=self.name,
+                )
+            ]
+        return []
+    
+    def _pattern_issue(self, column: str, pattern_name: str, match_count: int) -> ValidationIssue:
+        return ValidationIssue(
+            severity="warning",
+            message=f"Found {match_count} potential {pattern_name.upper()} values in column '{column}'",
+            column=column,
+            rule_name=self.name,
+        )
+    
     def _check_phi_patterns(self, series: pd.Series, column: str) -> List[ValidationIssue]:
         """Check for PHI patterns in a data series."""
         issues = []
@@ -132,15 +189,7 @@ class PHIDetector(ValidationRule):
             # Use the raw regex pattern (do NOT escape)
             matches = series.astype(str).str.contains(pattern, regex=True, na=False)
             if matches.any():
-                match_count = int(matches.sum())
-                issues.append(
-                    ValidationIssue(
-                        severity="warning",
-                        message=f"Found {match_count} potential {pattern_name.upper()} values in column '{column}'",
-                        column=column,
-                        rule_name=self.name,
-                    )
-                )
+                issues.append(self._pattern_issue(column, pattern_name, int(matches.sum())))
         
         return issues
 
@@ -160,9 +209,35 @@ class DataQualityChecker(ValidationRule):
         
         # Check for missing values
         missing_counts = data.isnull().sum()
-        for column, count in missing_counts.items():
+        issues.extend(self._missing_value_issues(missing_counts.items(), len(data)))
+        
+        # Check for duplicate rows
+        duplicate_mask = data.duplicated()
+        issues.extend(self._duplicate_issues(int(duplicate_mask.sum())))
+        
+        # Check for empty columns
+        for column in data.columns:
+            column_series = data[column]
+            if isinstance(column_series, pd.Series) and column_series.isnull().all():
+                issues.append(self._empty_column_issue(column))
+        
+        return issues
+    
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        # Null counts are Arrow metadata, so no column data is scanned
+        null_counts = [(column, table.column(column).null_count) for column in table.column_names]
+        issues = self._missing_value_issues(null_counts, table.num_rows)
+        issues.extend(self._duplicate_issues(duplicate_row_count(table)))
+        for column, count in null_counts:
+            if count == table.num_rows:
+                issues.append(self._empty_column_issue(column))
+        return issues
+    
+    def _missing_value_issues(self, counts: Any, total_rows: int) -> List[ValidationIssue]:
+        issues = []
+        for column, count in counts:
             if count > 0:
-                percentage = (count / len(data)) * 100
+                percentage = (count / total_rows) * 100
                 severity = "error" if percentage > 50 else "warning"
                 issues.append(
                     ValidationIssue(
@@ -172,33 +247,26 @@ class DataQualityChecker(ValidationRule):
                         rule_name=self.name,
                     )
                 )
-        
-        # Check for duplicate rows
-        duplicate_mask = data.duplicated()
-        duplicate_count = int(duplicate_mask.sum())
+        return issues
+    
+    def _duplicate_issues(self, duplicate_count: int) -> List[ValidationIssue]:
         if duplicate_count > 0:
-            issues.append(
+            return [
                 ValidationIssue(
                     severity="warning",
                     message=f"Found {duplicate_count} duplicate rows",
                     rule_name=self.name,
                 )
-            )
-        
-        # Check for empty columns
-        for column in data.columns:
-            column_series = data[column]
-            if isinstance(column_series, pd.Series) and column_series.isnull().all():
-                issues.append(
-                    ValidationIssue(
-                        severity="error",
-                        message=f"Column '{column}' is completely empty",
-                        column=column,
-                        rule_name=self.name,
-                    )
-                )
-        
-        return issues
+            ]
+        return []
+    
+    def _empty_column_issue(self, column: str) -> ValidationIssue:
+        return ValidationIssue(
+            severity="error",
+            message=f"Column '{column}' is completely empty",
+            column=column,
+            rule_name=self.name,
+        )
 
 
 class MedicalCodeValidator(ValidationRule):
@@ -207,11 +275,19 @@ class MedicalCodeValidator(ValidationRule):
     def __init__(
         self,
         code_columns: Optional[Dict[str, str]] = None,
+        code_sets: Optional[Dict[str, CodeSet]] = None,
+        check_existence: bool = True,
+        verify_check_digits: bool = False,
         name: str = "MedicalCodeValidator",
         description: str = "Validates medical codes",
     ):
         super().__init__(name=name, description=description)
         self.code_columns = code_columns or {}
+        # Explicit code sets win over the global registry
+        self.code_sets = code_sets or {}
+        self.check_existence = check_existence
+        # LOINC mod-10, NPI Luhn and NDC layout checks, reported per row
+        self.verify_check_digits = verify_check_digits
         
         # Basic patterns for common medical codes
         self.code_patterns = {
@@ -219,9 +295,13 @@ class MedicalCodeValidator(ValidationRule):
             "icd9": r"^\d{3}(\.\d{1,2})?$",
             "loinc": r"^\d{1,5}-\d$",
             "cpt": r"^\d{4}[A-Z]?$",
-            "ndc": r"^\d{4}-\d{4}-\d{2}$",
+            "ndc": r"^(\d{4}-\d{4}-\d{2}|\d{5}-\d{3}-\d{2}|\d{5}-\d{4}-\d{1,2}|\d{11})$",
+            "npi": r"^\d{10}$",
         }
     
+    def referenced_columns(self) -> Optional[List[str]]:
+        return list(self.code_columns)
+    
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         issues = []
         
@@ -229,91 +309,220 @@ class MedicalCodeValidator(ValidationRule):
             if column not in data.columns:
                 continue
             
+            column_series = data[column]
+            if not isinstance(column_series, pd.Series):
+                continue
+            
+            well_formed = None
             if code_type in self.code_patterns:
                 pattern = self.code_patterns[code_type]
-                column_series = data[column]
-                if isinstance(column_series, pd.Series):
-                    invalid_codes = self._check_code_pattern(column_series, pattern, code_type)
-                    issues.extend(invalid_codes)
+                well_formed = self._valid_pattern_mask(column_series, pattern)
+                invalid_codes = self._check_code_pattern(column_series, pattern, code_type, well_formed)
+                issues.extend(invalid_codes)
+            
+            if self.verify_check_digits and code_type in CHECK_DIGIT_VALIDATORS:
+                issues.extend(self._check_digits(column_series, column, code_type, well_formed))
+            
+            code_set = self._get_code_set(code_type)
+            if code_set is not None:
+                issues.extend(self._check_code_existence(column_series, column, code_type, code_set, well_formed))
+        
+        return issues
+    
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        issues = []
+        
+        for column, code_type in self.code_columns.items():
+            if column not in table.column_names:
+                continue
+            
+            column_data = table.column(column)
+            well_formed = None
+            if code_type in self.code_patterns:
+                matches = pc.fill_null(regex_mask(column_data, self.code_patterns[code_type]), True)
+                invalid = pc.invert(matches)
+                invalid_count = count_true(invalid)
+                if invalid_count:
+                    sample_invalid = pc.filter(column_data, invalid).slice(0, 3).to_pylist()
+                    issues.append(self._invalid_pattern_issue(code_type, invalid_count, sample_invalid))
+                well_formed = matches.to_numpy()
+            
+            # Check digits and code-set lookups work on pandas; convert this column only
+            code_set = self._get_code_set(code_type)
+            check_digits = self.verify_check_digits and code_type in CHECK_DIGIT_VALIDATORS
+            if check_digits or code_set is not None:
+                series = column_data.to_pandas()
+                if check_digits:
+                    issues.extend(self._check_digits(series, column, code_type, well_formed))
+                if code_set is not None:
+                    issues.extend(self._check_code_existence(series, column, code_type, code_set, well_formed))
         
         return issues
     
-    def _check_code_pattern(self, series: pd.Series, pattern: str, code_type: str) -> List[ValidationIssue]:
+    def _get_code_set(self, code_type: str) -> Optional[CodeSet]:
+        """Resolve the code set used for existence checks, if any."""
+        if not self.check_existence:
+            return None
+        if code_type in self.code_sets:
+            return self.code_sets[code_type]
+        return codeset_registry.get(code_type)
+    
+    @staticmethod
+    def _valid_pattern_mask(series: pd.Series, pattern: str) -> np.ndarray:
+        """Match ``pattern`` once per unique value; null rows count as valid."""
+        row_codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        unique_valid = pd.Series(uniques, dtype=object).astype(str).str.match(pattern, na=False).to_numpy(dtype=bool)
+        valid = np.ones(len(series), dtype=bool)
+        present = row_codes >= 0
+        valid[present] = unique_valid[row_codes[present]]
+        return valid
+    
+    def _check_code_pattern(
+        self,
+        series: pd.Series,
+        pattern: str,
+        code_type: str,
+        valid_mask: Optional[np.ndarray] = None,
+    ) -> List[ValidationIssue]:
         """Check if codes match the expected pattern."""
         issues = []
         
-        # Convert to string and check pattern
-        string_series = series.astype(str)
-        valid_mask = string_series.str.match(pattern, na=False)
-        invalid_mask = ~valid_mask & ~series.isnull()
+        if valid_mask is None:
+            valid_mask = self._valid_pattern_mask(series, pattern)
+        invalid_mask = ~valid_mask
         
         if invalid_mask.any():
             invalid_count = int(invalid_mask.sum())
             invalid_series = series[invalid_mask]
             if isinstance(invalid_series, pd.Series):
                 sample_invalid = invalid_series.head(3).tolist()
-                
-                issues.append(
-                    ValidationIssue(
-                        severity="warning",
-                        message=f"Found {invalid_count} invalid {code_type.upper()} codes in column. Sample: {sample_invalid}",
-                        rule_name=self.name,
-                    )
+                issues.append(self._invalid_pattern_issue(code_type, invalid_count, sample_invalid))
+        
+        return issues
+    
+    def _invalid_pattern_issue(self, code_type: str, invalid_count: int, sample_invalid: List[Any]) -> ValidationIssue:
+        return ValidationIssue(
+            severity="warning",
+            message=f"Found {invalid_count} invalid {code_type.upper()} codes in column. Sample: {sample_invalid}",
+            rule_name=self.name,
+        )
+    
+    def _check_digits(
+        self,
+        series: pd.Series,
+        column: str,
+        code_type: str,
+        well_formed: Optional[np.ndarray] = None,
+    ) -> List[ValidationIssue]:
+        """Report each row whose code fails its check digit or segment layout."""
+        failed = ~CHECK_DIGIT_VALIDATORS[code_type](series)
+        if well_formed is not None:
+            failed &= well_formed
+        
+        return [
+            ValidationIssue(
+                severity="warning",
+                message=f"Invalid {code_type.upper()} check digit or layout in column '{column}'",
+                column=column,
+                row=int(row),
+                value=series.iat[row],
+                rule_name=self.name,
+            )
+            for row in np.flatnonzero(failed)
+        ]
+    
+    def _check_code_existence(
+        self,
+        series: pd.Series,
+        column: str,
+        code_type: str,
+        code_set: CodeSet,
+        well_formed: Optional[np.ndarray] = None,
+    ) -> List[ValidationIssue]:
+        """Check that well-formed codes exist in the code set."""
+        issues = []
+        
+        unknown_mask = ~code_set.contains(series) & series.notna().to_numpy()
+        if well_formed is not None:
+            # Malformed codes are already reported by the pattern check
+            unknown_mask &= well_formed
+        
+        if unknown_mask.any():
+            unknown_count = int(unknown_mask.sum())
+            sample_unknown = series[unknown_mask].head(3).tolist()
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Found {unknown_count} unknown {code_type.upper()} codes in column '{column}' (not in code set). Sample: {sample_unknown}",
+                    column=column,
+                    rule_name=self.name,
                 )
+            )
         
         return issues
 
 
 class RangeValidator(ValidationRule):
-    """Validates numeric values within expected ranges."""
+    """
+    Validates numeric values within expected ranges.
+    
+    Ranges may carry a ``unit`` and per-row ``when`` cases; see
+    :mod:`medical_data_validator.ranges` for the configuration format and the
+    built-in vital sign and laboratory packs.
+    """
     
     def __init__(
         self,
-        ranges: Optional[Dict[str, Dict[str, Union[float, int]]]] = None,
+        ranges: Optional[Dict[str, Dict[str, Any]]] = None,
         name: str = "RangeValidator",
         description: str = "Validates numeric values within expected ranges",
     ):
         super().__init__(name=name, description=description)
         self.ranges = ranges or {}
     
+    def evaluate(self, data: pd.DataFrame) -> RangeEvaluation:
+        """Return the row-level range evaluation for the configured columns."""
+        return RangeEngine(self.ranges).evaluate(data)
+    
+    def referenced_columns(self) -> Optional[List[str]]:
+        return RangeEngine(self.ranges).referenced_columns()
+    
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        # Numeric Arrow columns convert to NumPy without copying when null-free
+        columns = [c for c in RangeEngine(self.ranges).referenced_columns() if c in table.column_names]
+        return self.validate(table.select(columns).to_pandas())
+    
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         issues = []
+        evaluation = self.evaluate(data)
+        below_counts = evaluation.below_counts()
+        above_counts = evaluation.above_counts()
         
-        for column, range_config in self.ranges.items():
-            if column not in data.columns:
-                continue
-            
-            if not pd.api.types.is_numeric_dtype(data[column]):
-                continue
+        for j, column in enumerate(evaluation.columns):
+            range_config = self.ranges[column]
+            conditional = bool(range_config.get("when"))
             
-            min_val = range_config.get("min")
-            max_val = range_config.get("max")
-            
-            if min_val is not None:
-                below_min = data[column] < min_val
-                if below_min.any():
-                    count = int(below_min.sum())
-                    issues.append(
-                        ValidationIssue(
-                            severity="warning",
-                            message=f"Column '{column}' has {count} values below minimum {min_val}",
-                            column=column,
-                            rule_name=self.name,
-                        )
+            if below_counts[j]:
+                minimum = "their row's minimum" if conditional else f"minimum {range_config.get('min')}"
+                issues.append(
+                    ValidationIssue(
+                        severity="warning",
+                        message=f"Column '{column}' has {int(below_counts[j])} values below {minimum}",
+                        column=column,
+                        rule_name=self.name,
                     )
+                )
             
-            if max_val is not None:
-                above_max = data[column] > max_val
-                if above_max.any():
-                    count = int(above_max.sum())
-                    issues.append(
-                        ValidationIssue(
-                            severity="warning",
-                            message=f"Column '{column}' has {count} values above maximum {max_val}",
-                            column=column,
-                            rule_name=self.name,
-                        )
+            if above_counts[j]:
+                maximum = "their row's maximum" if conditional else f"maximum {range_config.get('max')}"
+                issues.append(
+                    ValidationIssue(
+                        severity="warning",
+                        message=f"Column '{column}' has {int(above_counts[j])} values above {maximum}",
+                        column=column,
+                        rule_name=self.name,
                     )
+                )
         
         return issues
 
@@ -334,6 +543,9 @@ class DateValidator(ValidationRule):
         self.min_date = pd.to_datetime(min_date) if min_date else None
         self.max_date = pd.to_datetime(max_date) if max_date else None
     
+    def referenced_columns(self) -> Optional[List[str]]:
+        return list(self.date_columns)
+    
     def validate(self, data: pd.DataFrame) -> List[ValidationIssue]:
         issues = []
         
@@ -343,47 +555,48 @@ class DateValidator(ValidationRule):
             
             # Try to convert to datetime
             try:
-                date_series = pd.to_datetime(data[column], errors="coerce")
-                invalid_dates = date_series.isnull() & ~data[column].isnull()
-                
-                if invalid_dates.any():
-                    count = int(invalid_dates.sum())
-                    issues.append(
-                        ValidationIssue(
-                            severity="error",
-                            message=f"Column '{column}' has {count} invalid date values",
-                            column=column,
-                            rule_name=self.name,
-                        )
+                parsed = parse_dates(data, column)
+                date_series = parsed.values
+                before_count = int((date_series < self.min_date).sum()) if self.min_date is not None else 0
+                after_count = int((date_series > self.max_date).sum()) if self.max_date is not None else 0
+                issues.extend(self._date_issues(column, parsed.invalid_count, parsed.formats, before_count, after_count))
+            
+            except Exception as e:
+                issues.append(
+                    ValidationIssue(
+                        severity="error",
+                        message=f"Failed to validate dates in column '{column}': {str(e)}",
+                        column=column,
+                        rule_name=self.name,
                     )
-                
-                # Check date ranges
-                if self.min_date is not None:
-                    before_min = date_series < self.min_date
-                    if before_min.any():
-                        count = int(before_min.sum())
-                        issues.append(
-                            ValidationIssue(
-                                severity="warning",
-                                message=f"Column '{column}' has {count} dates before {self.min_date.date()}",
-                                column=column,
-                                rule_name=self.name,
-                            )
-                        )
-                
-                if self.max_date is not None:
-                    after_max = date_series > self.max_date
-                    if after_max.any():
-                        count = int(after_max.sum())
-                        issues.append(
-                            ValidationIssue(
-                                severity="warning",
-                                message=f"Column '{column}' has {count} dates after {self.max_date.date()}",
-                                column=column,
-                                rule_name=self.name,
-                            )
-                        )
-                
+                )
+        
+        return issues
+    
+    def validate_arrow(self, table: Any) -> List[ValidationIssue]:
+        issues = []
+        
+        for column in self.date_columns:
+            if column not in table.column_names:
+                continue
+            
+            try:
+                column_data = table.column(column)
+                if not is_arrow_text(column_data.type):
+                    # Native timestamps and numbers take the pandas path for this column
+                    parsed = default_date_parser.parse(column_data.to_pandas())
+                    dates = parsed.values
+                    before_count = int((dates < self.min_date).sum()) if self.min_date is not None else 0
+                    after_count = int((dates > self.max_date).sum()) if self.max_date is not None else 0
+                else:
+                    # Text is parsed once per distinct value; counts are taken per row in Arrow
+                    result = parse_arrow_dates(column_data)
+                    parsed, indices = result["parsed"], result["indices"]
+                    dates = parsed.values
+                    before_count = count_rows((dates < self.min_date).to_numpy(), indices) if self.min_date is not None else 0
+                    after_count = count_rows((dates > self.max_date).to_numpy(), indices) if self.max_date is not None else 0
+                    parsed.invalid_count = count_rows(dates.isna().to_numpy(), indices)
+                issues.extend(self._date_issues(column, parsed.invalid_count, parsed.formats, before_count, after_count))
             except Exception as e:
                 issues.append(
                     ValidationIssue(
@@ -394,4 +607,57 @@ class DateValidator(ValidationRule):
                     )
                 )
         
-        return issues 
\ No newline at end of file
+        return issues
+    
+    def _date_issues(
+        self,
+        column: str,
+        invalid_count: int,
+        formats: List[str],
+        before_count: int,
+        after_count: int,
+    ) -> List[ValidationIssue]:
+        issues = []
+        
+        if invalid_count:
+            issues.append(
+                ValidationIssue(
+                    severity="error",
+                    message=f"Column '{column}' has {invalid_count} invalid date values",
+                    column=column,
+                    rule_name=self.name,
+                )
+            )
+        
+        if len(formats) > 1:
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Column '{column}' mixes date formats: {', '.join(formats)}",
+                    column=column,
+                    rule_name=self.name,
+                )
+            )
+        
+        # Check date ranges
+        if before_count:
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Column '{column}' has {before_count} dates before {self.min_date.date()}",
+                    column=column,
+                    rule_name=self.name,
+                )
+            )
+        
+        if after_count:
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Column '{column}' has {after_count} dates after {self.max_date.date()}",
+                    column=column,
+                    rule_name=self.name,
+                )
+            )
+        
+        return issues
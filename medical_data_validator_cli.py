@@ -110,20 +110,13 @@ def run_validation(args):
     """Run data validation."""
     from medical_data_validator.core import MedicalDataValidator
     from medical_data_validator.validators import PHIDetector, DataQualityChecker
-    import pandas as pd
+    from medical_data_validator.loaders import load_file
     
     print(f"🔍 Validating medical data: {args.file}")
     
     # Load data
     try:
-        if args.file.endswith('.csv'):
-            data = pd.read_csv(args.file)
-        elif args.file.endswith(('.xlsx', '.xls')):
-            data = pd.read_excel(args.file)
-        elif args.file.endswith('.json'):
-            data = pd.read_json(args.file)
-        else:
-            raise ValueError(f"Unsupported file format: {args.file}")
+        data = load_file(args.file)
     except Exception as e:
         print(f"❌ Error loading file: {e}")
         return
@@ -202,18 +195,11 @@ def run_compliance_check(args):
     
     from medical_data_validator.core import MedicalDataValidator
     from medical_data_validator.validators import PHIDetector, DataQualityChecker, MedicalCodeValidator
-    import pandas as pd
+    from medical_data_validator.loaders import load_file
     
     # Load data
     try:
-        if args.file.endswith('.csv'):
-            data = pd.read_csv(args.file)
-        elif args.file.endswith(('.xlsx', '.xls')):
-            data = pd.read_excel(args.file)
-        elif args.file.endswith('.json'):
-            data = pd.read_json(args.file)
-        else:
-            raise ValueError(f"Unsupported file format: {args.file}")
+        data = load_file(args.file)
     except Exception as e:
         print(f"❌ Error loading file: {e}")
         return
@@ -0,0 +1,136 @@
+"""
+Tests for the Apache Arrow execution backend.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from medical_data_validator.backends import duplicate_row_count, to_arrow_table
+from medical_data_validator.core import MedicalDataValidator, ValidationRule
+from medical_data_validator.validators import (
+    DataQualityChecker,
+    DateValidator,
+    MedicalCodeValidator,
+    PHIDetector,
+    RangeValidator,
+    SchemaValidator,
+)
+
+
+def _messages(issues):
+    return sorted((issue.severity, issue.message, issue.column) for issue in issues)
+
+
+@pytest.fixture
+def clinical_df():
+    return pd.DataFrame({
+        "patient_id": ["P1", "P2", "P3", "P3", None],
+        "ssn": ["123-45-6789", "none", "987-65-4321", "987-65-4321", None],
+        "diagnosis": ["E11.9", "I10", "bad", "bad", "J45.909"],
+        "visit_date": ["2020-01-05", "05/02/2021", "not a date", "not a date", "1890-01-01"],
+        "heart_rate": [72.0, 300.0, 10.0, 10.0, np.nan],
+        "sex": ["F", "M", "F", "F", "M"],
+        "empty": [None, None, None, None, None],
+    })
+
+
+class TestArrowRules:
+    """Test built-in rules give the same issues on Arrow and pandas data."""
+
+    @pytest.mark.parametrize("rule", [
+        SchemaValidator(
+            required_columns=["patient_id", "missing"],
+            column_types={"heart_rate": "float", "patient_id": "string"},
+        ),
+        PHIDetector(),
+        DataQualityChecker(),
+        MedicalCodeValidator({"diagnosis": "icd10"}, check_existence=False),
+        RangeValidator({"heart_rate": {"min": 20, "max": 250, "when": [{"if": {"sex": "M"}, "max": 200}]}}),
+        DateValidator(["visit_date"], min_date="1900-01-01", max_date="2021-01-01"),
+    ], ids=lambda rule: rule.name)
+    def test_matches_pandas(self, clinical_df, rule):
+        """Test the Arrow path reports the same issues as the pandas path."""
+        table = pa.Table.from_pandas(clinical_df, preserve_index=False)
+
+        assert _messages(rule.validate_arrow(table)) == _messages(rule.validate(clinical_df))
+
+    def test_schema_reports_arrow_types(self):
+        """Test type mismatches name the Arrow type."""
+        table = pa.table({"age": pa.array(["1", "2"]), "code": pa.array(["a", "b"]).dictionary_encode()})
+
+        issues = SchemaValidator(column_types={"age": "int", "code": "category"}).validate_arrow(table)
+
+        assert [issue.message for issue in issues] == ["Column 'age' has type 'string' but expected 'int'"]
+
+    def test_dictionary_encoded_columns(self, clinical_df):
+        """Test dictionary-encoded text is scanned like plain strings."""
+        table = pa.Table.from_pandas(clinical_df, preserve_index=False)
+        table = table.set_column(
+            table.schema.get_field_index("ssn"), "ssn", table.column("ssn").dictionary_encode()
+        )
+
+        issues = PHIDetector().validate_arrow(table)
+
+        assert any("Found 3 potential SSN values in column 'ssn'" == issue.message for issue in issues)
+
+    def test_timestamp_dates(self):
+        """Test native timestamp columns are range checked."""
+        table = pa.table({"visit_date": pa.array(pd.to_datetime(["1850-01-01", "2000-01-01", None]))})
+
+        issues = DateValidator(["visit_date"], min_date="1900-01-01").validate_arrow(table)
+
+        assert [issue.message for issue in issues] == ["Column 'visit_date' has 1 dates before 1900-01-01"]
+
+    def test_duplicate_row_count(self):
+        """Test duplicate rows are counted like DataFrame.duplicated()."""
+        table = pa.table({"a": [1, 1, 2, 1], "b": ["x", "x", "y", "x"]})
+
+        assert duplicate_row_count(table) == 2
+
+
+class TestArrowValidation:
+    """Test MedicalDataValidator with Arrow input."""
+
+    def test_validate_table(self, clinical_df):
+        """Test a pyarrow Table gives the same issues and summary as a DataFrame."""
+        table = pa.Table.from_pandas(clinical_df, preserve_index=False)
+        validator = MedicalDataValidator()
+        validator.add_rule(PHIDetector())
+        validator.add_rule(DataQualityChecker())
+        validator.add_rule(DateValidator(["visit_date"]))
+
+        arrow_result = validator.validate(table)
+        pandas_result = validator.validate(clinical_df)
+
+        assert _messages(arrow_result.issues) == _messages(pandas_result.issues)
+        assert arrow_result.summary["total_rows"] == 5
+        assert arrow_result.summary["missing_values"] == pandas_result.summary["missing_values"]
+        assert arrow_result.summary["duplicate_rows"] == pandas_result.summary["duplicate_rows"]
+
+    def test_rules_without_arrow_support(self, mocker):
+        """Test rules without validate_arrow receive a pandas DataFrame."""
+
+        class CountingRule(ValidationRule):
+            def validate(self, data):
+                assert isinstance(data, pd.DataFrame)
+                return []
+
+        table = pa.table({"a": [1, 2]})
+        rule = CountingRule(name="counting", description="")
+        spy = mocker.spy(CountingRule, "validate")
+        validator = MedicalDataValidator()
+        validator.add_rule(rule)
+
+        result = validator.validate(table)
+
+        assert result.is_valid
+        assert spy.call_count == 1
+
+    def test_unsupported_input(self):
+        """Test unsupported input types are rejected."""
+        assert to_arrow_table("not a table") is None
+        with pytest.raises(ValueError):
+            MedicalDataValidator().validate("not a table")
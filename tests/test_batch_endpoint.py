@@ -0,0 +1,179 @@
+"""
+Tests for validating many datasets in one request.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.core import MedicalDataValidator, ValidationIssue, ValidationRule
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.routes import create_validator, frame_from_json
+from medical_data_validator.declarative import DeclarativeRuleValidator
+from medical_data_validator.extensions import MedicalProfiles
+from medical_data_validator.performance import BatchValidator
+
+
+@pytest.fixture
+def datasets():
+    return [
+        pd.DataFrame({"patient_id": ["P1", "P2"], "age": [30, None], "ssn": ["123-45-6789", "none"]}),
+        pd.DataFrame({"patient_id": ["P3", "P4"], "age": [40, 41], "ssn": ["none", "none"]}),
+        pd.DataFrame({"diagnosis": ["E11.9"]}),
+    ]
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        yield client
+
+
+def _issues(result):
+    return sorted((issue.severity, -1 if issue.row is None else issue.row, issue.message) for issue in result.issues)
+
+
+class TestValidateDatasets:
+    """Test BatchValidator.validate_datasets."""
+
+    def test_matches_separate_validation(self, datasets):
+        """Test each dataset gets exactly the issues of validating it alone."""
+        validator = create_validator(True, True, "")
+        results = BatchValidator(validator).validate_datasets(datasets)
+
+        assert len(results) == len(datasets)
+        for data, result in zip(datasets, results):
+            assert _issues(result) == _issues(validator.validate(data))
+            assert result.summary == {"total_rows": len(data), "total_columns": len(data.columns)}
+
+    def test_row_issues_split_by_position(self):
+        """Test row-local rules run once over the group and keep per-dataset rows."""
+        calls = []
+
+        class Negative(ValidationRule):
+            def is_row_local(self):
+                return True
+
+            def validate(self, data):
+                calls.append(("negative", len(data)))
+                return [
+                    ValidationIssue(severity="error", message="negative", column="x", row=int(row))
+                    for row in data.index[data["x"] < 0]
+                ]
+
+        validator = MedicalDataValidator(
+            [Negative(name="negative", description="x below zero")],
+            enable_compliance=False, enable_analytics=False, enable_monitoring=False,
+        )
+        validator.add_validator("count", lambda data: calls.append(("count", len(data))) or [])
+        results = BatchValidator(validator).validate_datasets(
+            [pd.DataFrame({"x": [1, -1]}), pd.DataFrame({"x": [-2, 3, -4]})]
+        )
+
+        assert [[issue.row for issue in result.issues] for result in results] == [[1], [0, 2]]
+        assert [result.is_valid for result in results] == [False, False]
+        # Custom validators are not known to be row-local, so they see each dataset
+        assert calls == [("negative", 5), ("count", 2), ("count", 3)]
+
+    def test_cross_row_rules_see_one_dataset(self):
+        """Test sequence checks and issue caps are not shared between datasets."""
+        validator = MedicalDataValidator(
+            MedicalProfiles.clinical_trials().rules,
+            enable_compliance=False, enable_analytics=False, enable_monitoring=False,
+        )
+        datasets = [
+            pd.DataFrame({"subject_id": ["S1"], "visit_date": ["2020-01-01"], "visit_number": [1]}),
+            pd.DataFrame({"subject_id": ["S1"], "visit_date": ["2020-02-01"], "visit_number": [1]}),
+            pd.DataFrame({"subject_id": ["S2", "S2"], "visit_date": ["2020-01-01", "2020-01-02"],
+                          "visit_number": [2, 1]}),
+        ]
+        results = BatchValidator(validator).validate_datasets(datasets)
+
+        for data, result in zip(datasets, results):
+            assert _issues(result) == _issues(validator.validate(data))
+        assert not any("visit_number" in issue.message for issue in results[1].issues)
+
+    def test_row_level_declarative_rules(self):
+        """Test row-level declarative rules are batched and counted ones are not."""
+        rules = [{"name": "known_sex", "column": "sex", "in": ["M", "F"], "message": "Unknown sex code"}]
+        row_level = DeclarativeRuleValidator(rules, row_level=True)
+        validator = MedicalDataValidator(
+            [row_level], enable_compliance=False, enable_analytics=False, enable_monitoring=False
+        )
+        results = BatchValidator(validator).validate_datasets(
+            [pd.DataFrame({"sex": ["M", "U"]}), pd.DataFrame({"sex": ["X", "F"]})]
+        )
+
+        assert row_level.is_row_local()
+        assert not DeclarativeRuleValidator(rules).is_row_local()
+        assert [[(issue.row, issue.value) for issue in result.issues] for result in results] == [[(1, "U")], [(0, "X")]]
+
+
+class TestBatchEndpoint:
+    """Test the /api/validate/batch endpoint."""
+
+    def test_json_array(self, client, datasets):
+        """Test a JSON array of datasets gets one entry per dataset, in order."""
+        columns = {"patient_id": ["P1", "P2"], "age": [30, None], "ssn": ["123-45-6789", "none"]}
+        payload = [{"id": "enc-1", "data": columns}]
+        payload += [json.loads(data.to_json(orient="records")) for data in datasets[1:]]
+        resp = client.post("/api/validate/batch?standards=hipaa", json=payload)
+        body = resp.get_json()
+
+        assert resp.status_code == 200
+        assert [entry["id"] for entry in body["datasets"]] == ["enc-1", 1, 2]
+        assert body["total_datasets"] == 3
+        assert "SSN detected in column: ssn" in body["datasets"][0]["compliance_report"]["hipaa"]["issues"]
+        assert "SSN detected in column: ssn" not in body["datasets"][1]["compliance_report"]["hipaa"]["issues"]
+        assert body["datasets"][0]["summary"]["total_rows"] == 2
+        assert body["total_issues"] == sum(entry["total_issues"] for entry in body["datasets"])
+
+    def test_ndjson_in_and_out(self, client, datasets):
+        """Test NDJSON bodies are read per line and results streamed per dataset."""
+        body = "\n".join(data.to_json(orient="records") for data in datasets)
+        resp = client.post(
+            "/api/validate/batch",
+            data=body,
+            content_type="application/x-ndjson",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        records = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+
+        assert [record["type"] for record in records] == ["header", "dataset", "dataset", "dataset", "summary"]
+        assert records[-1]["total_datasets"] == 3
+
+    def test_bad_dataset_reported_alone(self, client):
+        """Test a dataset that cannot be framed fails without failing the batch."""
+        resp = client.post("/api/validate/batch", json=[{"a": [1, 2]}, "not a dataset"])
+        entries = resp.get_json()["datasets"]
+
+        assert resp.status_code == 200
+        assert entries[0]["success"] is True
+        assert entries[1]["success"] is False
+
+    def test_rejects_non_array(self, client):
+        """Test a body that is not a list of datasets is a 400."""
+        resp = client.post("/api/validate/batch", json={"a": [1]})
+
+        assert resp.status_code == 400
+
+    def test_batch_limit(self, client):
+        """Test batches over MAX_BATCH_DATASETS are rejected."""
+        client.application.config["MAX_BATCH_DATASETS"] = 1
+        resp = client.post("/api/validate/batch", json=[{"a": [1]}, {"a": [2]}])
+
+        assert resp.status_code == 413
+
+
+class TestFrameFromJson:
+    """Test frame_from_json function."""
+
+    def test_pads_and_repeats(self):
+        """Test short columns are padded with None and scalars repeated."""
+        frame = frame_from_json({"a": [1, 2, 3], "b": [4], "c": "x"})
+
+        assert frame["b"].isna().tolist() == [False, True, True]
+        assert frame["c"].tolist() == ["x", "x", "x"]
@@ -0,0 +1,95 @@
+"""
+Tests for vectorized check-digit and NDC layout validation.
+"""
+
+import pandas as pd
+
+from medical_data_validator.checkdigits import (
+    digit_matrix,
+    loinc_check_digit_valid,
+    luhn_valid,
+    ndc_valid,
+    normalize_ndc,
+    npi_valid,
+)
+from medical_data_validator.codesets import CodeSet
+from medical_data_validator.validators import MedicalCodeValidator
+
+
+class TestCheckDigits:
+    """Test the check-digit functions."""
+
+    def test_digit_matrix_right_aligned(self):
+        """Test values are zero-padded on the left."""
+        matrix = digit_matrix(pd.Series(["12", "345"]), 4)
+        assert matrix.tolist() == [[0, 0, 1, 2], [0, 3, 4, 5]]
+
+    def test_luhn(self):
+        """Test the Luhn check on a digit matrix."""
+        digits = digit_matrix(pd.Series(["79927398713", "79927398710"]), 11)
+        assert luhn_valid(digits).tolist() == [True, False]
+
+    def test_loinc_mod10(self):
+        """Test LOINC check digits, including published codes."""
+        values = pd.Series(["2345-7", "58410-2", "789-8", "2345-8", "INVALID", None])
+        assert loinc_check_digit_valid(values).tolist() == [True, True, True, False, False, True]
+
+    def test_npi_luhn_with_prefix(self):
+        """Test NPI validation with the 80840 prefix."""
+        values = pd.Series(["1234567893", "1234567890", "123"])
+        assert npi_valid(values).tolist() == [True, False, False]
+
+    def test_ndc_normalization(self):
+        """Test every NDC layout normalizes to 11 digits."""
+        values = pd.Series(["1234-5678-90", "12345-678-90", "12345-6789-1", "00002322730", "1234567890", "123-45-6"])
+        normalized = normalize_ndc(values)
+        assert normalized.tolist()[:4] == ["01234567890", "12345067890", "12345678901", "00002322730"]
+        assert normalized.iloc[4:].isna().all()
+
+    def test_ndc_valid(self):
+        """Test the NDC layout mask."""
+        values = pd.Series(["12345-678-90", "123456-78-9", None])
+        assert ndc_valid(values).tolist() == [True, False, True]
+
+
+class TestMedicalCodeValidatorCheckDigits:
+    """Test check-digit reporting in MedicalCodeValidator."""
+
+    def test_row_level_check_digit_issues(self):
+        """Test each failing row is reported with its position and value."""
+        validator = MedicalCodeValidator(code_columns={"test": "loinc"}, verify_check_digits=True)
+        df = pd.DataFrame({"test": ["2345-7", "2345-8", "INVALID", "2345-8"]})
+
+        issues = validator.validate(df)
+
+        check_issues = [i for i in issues if "check digit" in i.message]
+        assert [i.row for i in check_issues] == [1, 3]
+        assert all(i.value == "2345-8" for i in check_issues)
+        assert all(i.column == "test" for i in check_issues)
+        # The malformed value is still reported once by the pattern check
+        assert any("invalid LOINC" in i.message for i in issues)
+
+    def test_check_digits_off_by_default(self):
+        """Test check digits are only verified when enabled."""
+        validator = MedicalCodeValidator(code_columns={"test": "loinc"})
+        df = pd.DataFrame({"test": ["2345-8"]})
+        assert validator.validate(df) == []
+
+    def test_npi_column(self):
+        """Test NPI columns are validated."""
+        validator = MedicalCodeValidator(code_columns={"npi": "npi"}, verify_check_digits=True)
+        df = pd.DataFrame({"npi": ["1234567893", "1234567890"]})
+        issues = validator.validate(df)
+        assert len(issues) == 1
+        assert issues[0].row == 1
+
+    def test_ndc_layouts_accepted(self):
+        """Test 5-3-2 and 5-4-1 NDCs pass the pattern check."""
+        validator = MedicalCodeValidator(code_columns={"ndc": "ndc"}, verify_check_digits=True)
+        df = pd.DataFrame({"ndc": ["12345-678-90", "12345-6789-1", "1234-5678-90"]})
+        assert validator.validate(df) == []
+
+    def test_ndc_code_set_matches_any_layout(self):
+        """Test NDC code sets compare through the 11-digit form."""
+        code_set = CodeSet("ndc", codes=["01234567890"])
+        assert code_set.contains(["1234-5678-90", "01234-5678-90", "1234-5678-91"]).tolist() == [True, True, False]
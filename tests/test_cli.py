@@ -197,6 +197,8 @@ class TestMain:
         
         # Mock the validator creation
         mock_validator = mock_create_validator.return_value
+        mock_validator.referenced_columns.return_value = None
+        mock_validator.column_type_hints.return_value = {}
         mock_result = ValidationResult(is_valid=True)
         mock_validator.validate.return_value = mock_result
         
@@ -214,7 +216,7 @@ class TestMain:
                 assert exc_info.value.code == 0
             
             # Verify function calls
-            mock_load_data.assert_called_once_with(temp_file)
+            mock_load_data.assert_called_once_with(temp_file, columns=None, dtypes={})
             mock_create_validator.assert_called_once()
             mock_validator.validate.assert_called_once_with(mock_df)
         finally:
@@ -427,6 +429,51 @@ class TestCLIIntegration:
         finally:
             os.unlink(temp_file)
 
+    
+    def test_profile_reads_only_its_columns(self, tmp_path, capsys):
+        """Test a shipped profile narrows the Parquet read to the columns its rules use."""
+        pytest.importorskip("pyarrow")
+        from medical_data_validator import loaders
+        
+        path = tmp_path / "wide.parquet"
+        data = pd.DataFrame({
+            "subject_id": ["S1", "S1"],
+            "visit_date": pd.to_datetime(["2020-01-01", "2020-02-01"]),
+            "visit_number": [1, 2],
+            "age": [40, 41],
+        })
+        for i in range(20):
+            data[f"lab_{i}"] = [0.5, 1.5]
+        data.to_parquet(path)
+        
+        with patch.object(loaders, "read_columnar", wraps=loaders.read_columnar) as read:
+            with patch('sys.argv', ['medical-validator', str(path), '--profile', 'clinical_trials', '--format', 'json']):
+                with pytest.raises(SystemExit):
+                    main()
+        
+        columns = read.call_args.kwargs["columns"]
+        assert set(columns) == {"subject_id", "visit_date", "screening_date", "visit_number", "age", "bmi"}
+        assert '"is_valid"' in capsys.readouterr().out
+    
+    def test_profile_whole_frame_checks_opt_in(self):
+        """Test a profile's PHI and quality checks and the engines run only when asked for."""
+        class MockArgs:
+            required_columns = None
+            column_types = None
+            detect_phi = True
+            quality_checks = False
+            profile = "clinical_trials"
+            compliance = True
+            analytics = False
+        
+        validator = create_validator_from_args(MockArgs())
+        names = [rule.__class__.__name__ for rule in validator.rules]
+        
+        assert "PHIDetector" in names
+        assert "DataQualityChecker" not in names
+        assert validator.compliance_engine is not None
+        assert validator.analytics_engine is None
+        assert validator.referenced_columns() is None
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
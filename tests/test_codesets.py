@@ -0,0 +1,135 @@
+"""
+Tests for the code-set lookup tables and existence checks.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from medical_data_validator.cache_store import TieredCache
+from medical_data_validator.codesets import CodeSet, CodeSetRegistry
+from medical_data_validator.compliance import ComplianceEngine
+from medical_data_validator.validators import MedicalCodeValidator
+
+
+class TestCodeSet:
+    """Test CodeSet class."""
+
+    def test_contains_vectorized(self):
+        """Test membership for a batch including duplicates and nulls."""
+        code_set = CodeSet("icd10", codes=["E11.9", "I10", "Z51.11"])
+        values = pd.Series(["E11.9", "I10", "E11.9", None, "A00.0", " i10 "])
+
+        found = code_set.contains(values)
+
+        assert found.tolist() == [True, True, True, False, False, True]
+
+    def test_icd_codes_match_without_dots(self):
+        """Test ICD codes from dot-less CMS files match dotted data."""
+        code_set = CodeSet("icd10", codes=["E119", "Z5111"])
+        assert "E11.9" in code_set
+        assert "Z51.11" in code_set
+        assert "E11.8" not in code_set
+
+    def test_empty_set(self):
+        """Test an empty code set reports nothing as present."""
+        code_set = CodeSet("cpt", codes=[])
+        assert code_set.contains(["99213"]).tolist() == [False]
+
+    def test_requires_codes_or_source(self):
+        """Test constructing without codes or a source fails."""
+        with pytest.raises(ValueError):
+            CodeSet("cpt")
+
+    def test_lazy_text_source(self, tmp_path):
+        """Test a text source is only read on first use."""
+        path = tmp_path / "cpt.txt"
+        path.write_text("99213\n99214\n\n")
+        code_set = CodeSet("cpt", source=path)
+
+        assert not code_set.is_loaded
+        assert "99214" in code_set
+        assert code_set.is_loaded
+        assert len(code_set) == 2
+
+    def test_csv_source_with_column(self, tmp_path):
+        """Test loading codes from a named CSV column."""
+        path = tmp_path / "loinc.csv"
+        pd.DataFrame({"LOINC_NUM": ["2345-7", "718-7"], "NAME": ["Glucose", "Hgb"]}).to_csv(path, index=False)
+        code_set = CodeSet("loinc", source=path, column="LOINC_NUM")
+        assert code_set.contains(["718-7", "1-1"]).tolist() == [True, False]
+
+    def test_save_and_memory_map(self, tmp_path):
+        """Test saved code sets load memory-mapped and give the same answers."""
+        original = CodeSet("cpt", codes=["99215", "99213", "99214"])
+        saved_path = original.save(tmp_path / "cpt")
+
+        reloaded = CodeSet("cpt", source=saved_path)
+        assert isinstance(reloaded.codes, np.memmap)
+        assert reloaded.contains(["99213", "00000"]).tolist() == [True, False]
+        assert reloaded.fingerprint == original.fingerprint
+
+
+class TestCodeSetRegistry:
+    """Test CodeSetRegistry class."""
+
+    def test_register_iterable(self):
+        """Test registering a plain list of codes."""
+        registry = CodeSetRegistry()
+        registry.register("cpt", ["99213"])
+        assert "99213" in registry.get("cpt")
+        assert registry.list_code_sets() == ["cpt"]
+        assert registry.unregister("cpt")
+        assert registry.get("cpt") is None
+
+    def test_search_dir_discovery(self, tmp_path):
+        """Test code sets are discovered by file name."""
+        (tmp_path / "ndc.txt").write_text("1234-5678-90\n")
+        registry = CodeSetRegistry(search_dir=str(tmp_path))
+        assert registry.get("ndc") is not None
+        assert registry.get("loinc") is None
+
+
+class TestMedicalCodeExistence:
+    """Test code existence checks in the validators."""
+
+    def test_validator_reports_unknown_codes(self):
+        """Test well-formed codes missing from the code set are reported."""
+        validator = MedicalCodeValidator(
+            code_columns={"diagnosis": "icd10"},
+            code_sets={"icd10": CodeSet("icd10", codes=["E11.9", "I10"])},
+        )
+        df = pd.DataFrame({"diagnosis": ["E11.9", "I10", "Q99.9", "INVALID", None]})
+
+        issues = validator.validate(df)
+
+        assert len(issues) == 2
+        assert "invalid ICD10" in issues[0].message
+        assert "1 unknown ICD10" in issues[1].message
+        assert "Q99.9" in issues[1].message
+        assert issues[1].column == "diagnosis"
+
+    def test_existence_check_can_be_disabled(self):
+        """Test check_existence=False keeps shape checks only."""
+        validator = MedicalCodeValidator(
+            code_columns={"diagnosis": "icd10"},
+            code_sets={"icd10": CodeSet("icd10", codes=["E11.9"])},
+            check_existence=False,
+        )
+        df = pd.DataFrame({"diagnosis": ["E11.9", "Q99.9"]})
+        assert validator.validate(df) == []
+
+    def test_compliance_engine_counts_unknown_codes(self):
+        """Test the compliance coding section uses code sets."""
+        df = pd.DataFrame({"diagnosis_code": ["E11.9", "I10", "Q99.9"]})
+        plain = ComplianceEngine(column_cache=TieredCache())
+        with_codes = ComplianceEngine(
+            column_cache=TieredCache(),
+            code_sets={"icd10": CodeSet("icd10", codes=["E11.9", "I10"])},
+        )
+
+        plain_report = plain.comprehensive_compliance_validation(df)
+        coded_report = with_codes.comprehensive_compliance_validation(df)
+
+        assert plain_report["standards"]["medical_coding"]["icd10"]["violations_count"] == 0
+        assert coded_report["standards"]["medical_coding"]["icd10"]["violations_count"] == 1
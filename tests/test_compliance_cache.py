@@ -0,0 +1,125 @@
+"""
+Tests for the tiered cache and per-column compliance scan caching.
+"""
+
+import pickle
+
+import pandas as pd
+from unittest.mock import patch
+
+from medical_data_validator.cache_store import TieredCache
+from medical_data_validator.compliance import ComplianceEngine
+
+
+class TestTieredCache:
+    """Test TieredCache class."""
+
+    def test_memory_get_set(self):
+        """Test basic get and set on the memory tier."""
+        cache = TieredCache(max_size=10)
+        assert cache.get("a") is None
+        cache.set("a", {"x": 1})
+        assert cache.get("a") == {"x": 1}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = TieredCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_disk_tier_shared_between_instances(self, tmp_path):
+        """Test a second cache on the same database sees earlier entries."""
+        db_path = str(tmp_path / "cache.db")
+        first = TieredCache(db_path=db_path, namespace="ns")
+        first.set("key", [1, 2, 3])
+
+        second = TieredCache(db_path=db_path, namespace="ns")
+        assert second.get("key") == [1, 2, 3]
+        assert second.stats()["disk_hits"] == 1
+
+        other_namespace = TieredCache(db_path=db_path, namespace="other")
+        assert other_namespace.get("key") is None
+
+    def test_clear(self, tmp_path):
+        """Test clearing removes entries from both tiers."""
+        cache = TieredCache(db_path=str(tmp_path / "cache.db"))
+        cache.set("key", 1)
+        cache.clear()
+        assert cache.get("key") is None
+
+    def test_pickle(self, tmp_path):
+        """Test a cache with an open connection pickles and reopens its database."""
+        cache = TieredCache(db_path=str(tmp_path / "cache.db"), namespace="ns")
+        cache.set("key", 1)
+
+        copy = pickle.loads(pickle.dumps(cache))
+        copy.clear()
+        copy.set("other", 2)
+
+        assert copy.get("key") is None
+        assert cache.get("other") == 2
+
+
+class TestComplianceColumnCache:
+    """Test column scan caching in ComplianceEngine."""
+
+    def setup_method(self):
+        self.data = pd.DataFrame({
+            "patient_name": ["John Doe", "Jane Smith"],
+            "ssn": ["123-45-6789", "987-65-4321"],
+            "diagnosis_code": ["E11.9", "bad"],
+        })
+
+    def test_unchanged_columns_skip_scanning(self):
+        """Test a repeated validation is served from the cache."""
+        engine = ComplianceEngine(column_cache=TieredCache())
+        first = engine.comprehensive_compliance_validation(self.data)
+
+        with patch.object(engine, "_scan_column", wraps=engine._scan_column) as scan:
+            second = engine.comprehensive_compliance_validation(self.data)
+            assert scan.call_count == 0
+
+        assert first["all_violations"] == second["all_violations"]
+        assert first["overall_score"] == second["overall_score"]
+
+    def test_only_changed_column_is_rescanned(self):
+        """Test modifying one column rescans just that column."""
+        engine = ComplianceEngine(column_cache=TieredCache())
+        engine.comprehensive_compliance_validation(self.data)
+
+        changed = self.data.copy()
+        changed["diagnosis_code"] = ["E11.9", "I10"]
+        with patch.object(engine, "_scan_column", wraps=engine._scan_column) as scan:
+            report = engine.comprehensive_compliance_validation(changed)
+            assert [call.args[0] for call in scan.call_args_list] == ["diagnosis_code"]
+
+        assert report["standards"]["medical_coding"]["icd10"]["violations_count"] == 0
+
+    def test_rule_change_invalidates_cache(self):
+        """Test adding a custom rule changes the rule-set version."""
+        engine = ComplianceEngine(column_cache=TieredCache())
+        engine.comprehensive_compliance_validation(self.data)
+
+        engine.add_custom_pattern("ssn_rule", r"\d{3}-\d{2}-\d{4}", field_pattern="ssn")
+        report = engine.comprehensive_compliance_validation(self.data)
+
+        custom = [v for v in report["all_violations"] if v["standard"] == "CUSTOM"]
+        assert [v["field"] for v in custom] == ["ssn"]
+
+    def test_cached_results_match_uncached(self):
+        """Test cached and uncached engines produce identical reports."""
+        cached = ComplianceEngine(column_cache=TieredCache())
+        uncached = ComplianceEngine(use_column_cache=False)
+        assert uncached.column_cache is None
+
+        cached.comprehensive_compliance_validation(self.data)
+        cached_report = cached.comprehensive_compliance_validation(self.data)
+        uncached_report = uncached.comprehensive_compliance_validation(self.data)
+        assert cached_report["standards"] == uncached_report["standards"]
@@ -0,0 +1,210 @@
+"""
+Tests for compressed request/response bodies and Arrow uploads.
+"""
+
+import gzip
+import io
+import json
+import zlib
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.dashboard import compression
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.uploads import iter_upload_batches, read_upload
+
+pa = pytest.importorskip("pyarrow")
+feather = pytest.importorskip("pyarrow.feather")
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "patient_id": [f"P{i}" for i in range(50)],
+        "age": [20 + i for i in range(50)],
+        "contact": ["a@b.com"] + ["none"] * 49,
+    })
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        yield client
+
+
+def _arrow_stream(frame, chunk_rows=None):
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=chunk_rows):
+            writer.write_batch(batch)
+    return sink.getvalue()
+
+
+class TestCompressedRequests:
+    """Test decoding of compressed request bodies."""
+
+    def test_gzip_csv_upload(self, client, frame):
+        """Test a gzip-encoded CSV body is validated like the plain one."""
+        resp = client.post(
+            "/api/validate/file?standards=hipaa",
+            data=gzip.compress(frame.to_csv(index=False).encode()),
+            content_type="text/csv",
+            headers={"Content-Encoding": "gzip"},
+        )
+        body = resp.get_json()
+
+        assert resp.status_code == 200
+        assert body["summary"]["total_rows"] == 50
+        assert "Email detected in column: contact" in body["compliance_report"]["hipaa"]["issues"]
+
+    def test_gzip_json_body(self, client):
+        """Test JSON endpoints read gzip-encoded bodies too."""
+        resp = client.post(
+            "/api/validate/data",
+            data=gzip.compress(json.dumps({"age": [30, 40]}).encode()),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert resp.status_code == 200
+        assert resp.get_json()["summary"]["total_rows"] == 2
+
+    def test_decompression_bomb(self, client):
+        """Test a body that decodes past MAX_UPLOAD_BYTES is rejected with 413."""
+        client.application.config["MAX_UPLOAD_BYTES"] = 10_000
+        bomb = gzip.compress(b"a\n" + b"1\n" * 1_000_000)
+
+        resp = client.post("/api/validate/file", data=bomb, content_type="text/csv",
+                           headers={"Content-Encoding": "gzip"})
+
+        assert len(bomb) < 10_000
+        assert resp.status_code == 413
+
+    def test_gzip_json_past_request_limit(self, client):
+        """Test a JSON body decoding past the request's limit gets 413, not a truncated parse."""
+        client.application.config["MAX_CONTENT_LENGTH"] = 10_000
+        payload = json.dumps({"age": list(range(5_000))}).encode()
+
+        plain = client.post("/api/validate/data", data=payload, content_type="application/json")
+        resp = client.post(
+            "/api/validate/data",
+            data=gzip.compress(payload),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert plain.status_code == 413
+        assert resp.status_code == 413
+
+    def test_gzip_json_at_request_limit(self, client):
+        """Test a body decoding to exactly the request's limit is still accepted."""
+        payload = json.dumps({"age": [30, 40]}).encode()
+        client.application.config["MAX_CONTENT_LENGTH"] = len(payload)
+
+        resp = client.post(
+            "/api/validate/data",
+            data=gzip.compress(payload),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert resp.status_code == 200
+
+    def test_unsupported_encoding(self, client, frame):
+        """Test unknown encodings are refused with 415."""
+        resp = client.post("/api/validate/file", data=b"x", content_type="text/csv",
+                           headers={"Content-Encoding": "br"})
+
+        assert resp.status_code == 415
+
+    def test_zstd_offered_only_when_installed(self):
+        """Test zstd is accepted and offered only with the zstandard package."""
+        available = compression.zstandard is not None
+
+        assert ("zstd" in compression.request_decoders()) is available
+        assert ("zstd" in compression.response_encodings()) is available
+
+
+class TestCompressedResponses:
+    """Test Accept-Encoding negotiation of responses."""
+
+    def test_gzip_json_response(self, client, frame):
+        """Test JSON responses are gzip-encoded with a weak ETag."""
+        client.application.config["COMPRESS_MIN_SIZE"] = 0
+        data = frame.to_csv(index=False).encode()
+        resp = client.post(
+            "/api/validate/file",
+            data=data,
+            content_type="text/csv",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert resp.headers["ETag"].startswith('W/"')
+        body = json.loads(gzip.decompress(resp.get_data()))
+        assert body["summary"]["total_rows"] == 50
+
+        # The weak ETag still revalidates
+        again = client.post("/api/validate/file", data=data, content_type="text/csv",
+                            headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]})
+        assert again.status_code == 304
+
+    def test_small_and_unrequested_left_alone(self, client):
+        """Test small responses and clients without Accept-Encoding get plain bodies."""
+        assert "Content-Encoding" not in client.get("/api/health", headers={"Accept-Encoding": "gzip"}).headers
+        assert "Content-Encoding" not in client.post("/api/validate/data", json={"a": [1] * 500}).headers
+
+    def test_streamed_ndjson(self, client, frame):
+        """Test streamed NDJSON is compressed with a flush per record."""
+        resp = client.post(
+            "/api/validate/file",
+            data=frame.to_csv(index=False),
+            content_type="text/csv",
+            headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip"},
+        )
+        chunks = list(resp.response)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        # Each flushed chunk decodes on its own, without waiting for the end
+        first = decoder.decompress(chunks[0])
+        assert json.loads(first.decode().splitlines()[0])["type"] == "header"
+        lines = (first + b"".join(decoder.decompress(chunk) for chunk in chunks[1:])).decode().splitlines()
+        assert json.loads(lines[-1])["type"] == "summary"
+
+
+class TestArrowUploads:
+    """Test Arrow IPC uploads."""
+
+    def test_stream_batches(self, frame):
+        """Test small record batches are combined into full validation batches."""
+        batches = list(iter_upload_batches(io.BytesIO(_arrow_stream(frame, chunk_rows=7)), "arrows", batch_size=20))
+
+        assert [len(batch) for batch in batches] == [20, 20, 10]
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), frame)
+
+    def test_arrow_file(self, frame):
+        """Test Arrow IPC (Feather) files are read whole."""
+        sink = io.BytesIO()
+        feather.write_feather(pa.Table.from_pandas(frame, preserve_index=False), sink)
+        sink.seek(0)
+
+        pd.testing.assert_frame_equal(read_upload(sink, "feather"), frame)
+
+    def test_raw_arrow_body(self, client, frame):
+        """Test an Arrow stream body is validated without text parsing."""
+        resp = client.post(
+            "/api/validate/file?standards=hipaa",
+            data=_arrow_stream(frame),
+            content_type="application/vnd.apache.arrow.stream",
+        )
+        body = resp.get_json()
+
+        assert resp.status_code == 200
+        assert (body["summary"]["total_rows"], body["summary"]["total_columns"]) == (50, 3)
+        assert "Email detected in column: contact" in body["compliance_report"]["hipaa"]["issues"]
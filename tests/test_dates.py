@@ -0,0 +1,128 @@
+"""
+Tests for the shared date-parsing service.
+"""
+
+import datetime
+
+import pandas as pd
+
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.dates import (
+    INFERRED_FORMAT,
+    DateParser,
+    date_parsing_session,
+    parse_dates,
+)
+from medical_data_validator.security import DataAnonymizer
+from medical_data_validator.validators import DateValidator
+
+
+class TestDateParser:
+    """Test DateParser class."""
+
+    def test_infers_single_format(self):
+        """Test a uniform column is parsed with one explicit format."""
+        parser = DateParser()
+        result = parser.parse(pd.Series(["03/15/2021", "12/01/2020", None, "03/15/2021"]))
+
+        assert result.formats == ["%m/%d/%Y"]
+        assert not result.mixed
+        assert result.invalid_count == 0
+        assert result.values.iloc[0] == pd.Timestamp("2021-03-15")
+        assert pd.isna(result.values.iloc[2])
+
+    def test_mixed_formats_reported(self):
+        """Test values in a second layout are parsed and flagged."""
+        parser = DateParser()
+        result = parser.parse(pd.Series(["2020-01-01", "2020-02-02", "2020-03-03", "04/05/2021"]))
+
+        assert result.formats == ["%Y-%m-%d", "%m/%d/%Y"]
+        assert result.mixed
+        assert result.values.iloc[3] == pd.Timestamp("2021-04-05")
+
+    def test_invalid_values_counted(self):
+        """Test unparseable values become NaT and are counted."""
+        parser = DateParser()
+        result = parser.parse(pd.Series(["2020-01-01", "invalid-date", "not-a-date"]))
+
+        assert result.invalid_count == 2
+        assert result.formats == ["%Y-%m-%d"]
+
+    def test_fallback_inference(self):
+        """Test values outside the candidate formats use pandas inference."""
+        values = pd.Series(["2020-01-01", "January 5 2020"])
+
+        assert DateParser().parse(values).formats == ["%Y-%m-%d", INFERRED_FORMAT]
+        assert DateParser(fallback=False).parse(values).invalid_count == 1
+
+    def test_datetime_objects_pass_through(self):
+        """Test existing datetime values are kept without string parsing."""
+        parser = DateParser()
+        result = parser.parse(pd.Series([datetime.date(2020, 1, 1), "2021-06-01"], dtype=object))
+        assert result.values.tolist() == [pd.Timestamp("2020-01-01"), pd.Timestamp("2021-06-01")]
+
+        native = pd.Series(pd.to_datetime(["2020-01-01"]))
+        assert parser.parse(native).values is native
+
+
+class TestDateParsingSession:
+    """Test parsed-column reuse within a validation run."""
+
+    def test_session_caches_columns(self, mocker):
+        """Test a column is parsed once per session."""
+        df = pd.DataFrame({"visit_date": ["2020-01-01", "2020-01-02"]})
+        spy = mocker.spy(DateParser, "parse")
+
+        with date_parsing_session():
+            first = parse_dates(df, "visit_date")
+            second = parse_dates(df, "visit_date")
+        parse_dates(df, "visit_date")
+
+        assert first is second
+        assert spy.call_count == 2
+
+    def test_validator_shares_parse_between_rules(self, mocker):
+        """Test two date rules on the same column share one parse."""
+        df = pd.DataFrame({"visit_date": ["2020-01-01", "1990-01-01"]})
+        validator = MedicalDataValidator(
+            [
+                DateValidator(date_columns=["visit_date"], min_date="2000-01-01"),
+                DateValidator(date_columns=["visit_date"], max_date="2010-01-01", name="MaxDate"),
+            ],
+            enable_compliance=False,
+            enable_analytics=False,
+            enable_monitoring=False,
+        )
+        spy = mocker.spy(DateParser, "parse")
+
+        result = validator.validate(df)
+
+        assert spy.call_count == 1
+        assert len(result.issues) == 2
+
+
+class TestDateValidatorFormats:
+    """Test mixed-format reporting in DateValidator."""
+
+    def test_mixed_format_warning(self):
+        """Test a warning lists the formats found in a column."""
+        validator = DateValidator(date_columns=["visit_date"])
+        df = pd.DataFrame({"visit_date": ["2020-01-01", "2020-01-02", "01/03/2020"]})
+
+        issues = validator.validate(df)
+
+        assert len(issues) == 1
+        assert issues[0].severity == "warning"
+        assert "%Y-%m-%d, %m/%d/%Y" in issues[0].message
+
+
+class TestSafeHarborDates:
+    """Test vectorized date generalization in the anonymizer."""
+
+    def test_generalize_dates_matches_per_value(self):
+        """Test the column path agrees with the per-value method."""
+        anonymizer = DataAnonymizer()
+        values = pd.Series(["2020-01-05", "05/06/2019", None, "junk", pd.Timestamp("2001-01-01")], dtype=object)
+
+        expected = values.apply(anonymizer._generalize_date).tolist()
+        assert anonymizer._generalize_dates(values).tolist() == expected
@@ -0,0 +1,167 @@
+"""
+Tests for declarative rules compiled to vectorized expressions.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.dates import DateParser
+from medical_data_validator.declarative import (
+    DeclarativeRuleValidator,
+    ExpressionEvaluator,
+    compile_expression,
+    load_rules,
+    referenced_columns,
+)
+
+
+def _encounters() -> pd.DataFrame:
+    return pd.DataFrame({
+        "admission_date": ["2024-01-01", "2024-01-05", "2024-01-10", None],
+        "discharge_date": ["2024-01-03", "2024-01-04", "2024-01-10", "2024-01-02"],
+        "hemoglobin": [13.0, 11.0, 16.0, 12.5],
+        "sex": ["F", "F", "M", "F"],
+        "mrn": ["MRN000001", "MRN000002", "X3", None],
+    })
+
+
+class TestCompileExpression:
+    """Test expression compilation to IR."""
+
+    def test_chained_comparison(self):
+        """Test a < b < c compiles to a conjunction."""
+        node = compile_expression("0 < age < 120")
+        assert node[0] == "and"
+        assert referenced_columns(node) == {"age"}
+
+    def test_rejects_unknown_functions(self):
+        """Test arbitrary calls are not allowed."""
+        with pytest.raises(ValueError):
+            compile_expression("__import__('os')")
+        with pytest.raises(ValueError):
+            compile_expression("age.real > 1")
+
+    def test_null_aware_columns(self):
+        """Test columns inside notnull() are not null-sensitive."""
+        node = compile_expression("notnull(a) and b > 1")
+        assert referenced_columns(node, null_sensitive_only=True) == {"b"}
+
+    def test_common_subexpressions_evaluated_once(self, mocker):
+        """Test identical subexpressions share one evaluation."""
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        evaluator = ExpressionEvaluator(df)
+        spy = mocker.spy(evaluator, "_evaluate")
+
+        evaluator.mask(compile_expression("a * 2 > 2"))
+        evaluator.mask(compile_expression("a * 2 < 6"))
+
+        evaluated = [call.args[0] for call in spy.call_args_list]
+        assert evaluated.count(("arith", "*", ("col", "a"), ("const", 2))) == 1
+
+
+class TestDeclarativeRuleValidator:
+    """Test DeclarativeRuleValidator class."""
+
+    def test_cross_column_dates(self):
+        """Test date comparisons across columns, skipping missing values."""
+        validator = DeclarativeRuleValidator({
+            "dates": ["admission_date", "discharge_date"],
+            "rules": [{"name": "discharge_after_admission", "assert": "discharge_date >= admission_date"}],
+        })
+
+        issues = validator.validate(_encounters())
+
+        assert len(issues) == 1
+        assert issues[0].message == "1 rows fail rule 'discharge_after_admission'"
+        assert issues[0].rule_name == "discharge_after_admission"
+
+    def test_conditional_range_and_regex(self):
+        """Test range sugar with a condition and regex sugar."""
+        validator = DeclarativeRuleValidator([
+            {"name": "female_hgb", "column": "hemoglobin", "range": {"min": 12.0, "max": 15.5}, "when": "sex == 'F'"},
+            {"name": "mrn_format", "column": "mrn", "regex": r"^MRN\d{6}$", "severity": "warning"},
+        ])
+
+        issues = validator.validate(_encounters())
+
+        assert [issue.message for issue in issues] == [
+            "Column 'hemoglobin' has 1 values failing rule 'female_hgb'",
+            "Column 'mrn' has 1 values failing rule 'mrn_format'",
+        ]
+        assert issues[1].severity == "warning"
+
+    def test_row_level_issues(self):
+        """Test row-level output reports positions and values."""
+        validator = DeclarativeRuleValidator(
+            [{"name": "known_sex", "column": "sex", "in": ["M", "F"], "message": "Unknown sex code"}],
+            row_level=True,
+        )
+        df = pd.DataFrame({"sex": ["M", "U", "F", "X"]})
+
+        issues = validator.validate(df)
+
+        assert [(issue.row, issue.value) for issue in issues] == [(1, "U"), (3, "X")]
+        assert issues[0].message == "Unknown sex code"
+
+    def test_not_null_and_missing_columns(self):
+        """Test not_null flags missing values and absent columns are skipped."""
+        validator = DeclarativeRuleValidator([
+            {"name": "mrn_required", "column": "mrn", "not_null": True},
+            {"name": "other", "assert": "weight > 0"},
+        ])
+        issues = validator.validate(_encounters())
+        assert [issue.rule_name for issue in issues] == ["mrn_required"]
+
+    def test_dates_parsed_once_per_run(self, mocker):
+        """Test declared date columns reuse the run's parsed dates."""
+        validator = MedicalDataValidator(
+            [DeclarativeRuleValidator({
+                "dates": ["admission_date", "discharge_date"],
+                "rules": [
+                    {"name": "order", "assert": "discharge_date >= admission_date"},
+                    {"name": "recent", "assert": "admission_date >= '2023-01-01'"},
+                ],
+            })],
+            enable_compliance=False,
+            enable_analytics=False,
+            enable_monitoring=False,
+        )
+        spy = mocker.spy(DateParser, "parse")
+
+        validator.validate(_encounters())
+
+        assert spy.call_count == 2
+
+
+class TestLoadRules:
+    """Test rule set loading."""
+
+    def test_json_file(self, tmp_path):
+        """Test loading rules from a JSON file."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"rules": [{"name": "positive", "assert": "x > 0"}]}))
+
+        rule_set = load_rules(str(path))
+
+        assert rule_set["rules"][0]["name"] == "positive"
+        assert rule_set["dates"] == []
+
+    def test_yaml_string(self):
+        """Test loading rules from YAML text."""
+        pytest.importorskip("yaml")
+        rule_set = load_rules("rules:\n  - name: positive\n    assert: x > 0\n")
+        assert rule_set["rules"][0]["assert"] == "x > 0"
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing rule file is reported instead of parsed as text."""
+        with pytest.raises(FileNotFoundError):
+            load_rules(str(tmp_path / "rules.yaml"))
+
+    def test_not_a_rule_set(self):
+        """Test text that parses to a scalar is rejected."""
+        pytest.importorskip("yaml")
+        with pytest.raises(ValueError, match="mapping or a list"):
+            load_rules("just some text")
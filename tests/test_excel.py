@@ -0,0 +1,104 @@
+"""
+Tests for streaming Excel ingestion.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.excel import iter_excel, read_excel, sheet_names, validate_excel
+from medical_data_validator.performance import BatchValidator
+from medical_data_validator.validators import RangeValidator, SchemaValidator
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "sites.xlsx"
+    wb = openpyxl.Workbook()
+    site_a = wb.active
+    site_a.title = "site_a"
+    site_a.append(["patient_id", "heart_rate", "note"])
+    for i in range(7):
+        site_a.append([f"A{i}", 70 + i if i != 5 else 400, "NA" if i == 2 else "ok"])
+    site_a.append([None, None, None])
+    site_b = wb.create_sheet("site_b")
+    site_b.append(["patient_id", "heart_rate", "note"])
+    site_b.append(["B0", 10, "ok"])
+    wb.save(path)
+    return path
+
+
+def _validator():
+    return MedicalDataValidator(
+        [RangeValidator({"heart_rate": {"min": 20, "max": 250}}), SchemaValidator(required_columns=["note"])],
+        enable_compliance=False,
+        enable_analytics=False,
+        enable_monitoring=False,
+    )
+
+
+class TestIterExcel:
+    """Test iter_excel and read_excel."""
+
+    def test_batches(self, workbook):
+        """Test rows stream in bounded batches, skipping blank rows."""
+        batches = list(iter_excel(workbook, "site_a", batch_size=3))
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert pd.api.types.is_integer_dtype(batches[0]["heart_rate"])
+        assert batches[0]["note"].isna().sum() == 1
+
+    def test_matches_read_excel(self, workbook):
+        """Test the streamed rows equal a full pandas read."""
+        streamed = pd.concat(iter_excel(workbook, "site_a", batch_size=2), ignore_index=True)
+        expected = pd.read_excel(workbook, sheet_name="site_a").dropna(how="all")
+
+        pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+
+    def test_projection(self, workbook):
+        """Test unread columns are dropped but kept as source columns."""
+        batch = next(iter_excel(workbook, columns=["heart_rate"]))
+        data = read_excel(workbook, columns=["heart_rate"])
+
+        assert list(batch.columns) == ["heart_rate"] == list(data.columns)
+        assert batch.attrs["source_columns"] == ["patient_id", "heart_rate", "note"]
+        assert data.attrs["source_columns"] == ["patient_id", "heart_rate", "note"]
+
+
+class TestStreamingValidation:
+    """Test BatchValidator.validate_stream and validate_excel."""
+
+    def test_validate_stream(self, workbook):
+        """Test streamed results count rows across batches."""
+        result = BatchValidator(_validator(), batch_size=3).validate_stream(
+            iter_excel(workbook, "site_a", batch_size=3)
+        )
+
+        assert result.summary["total_rows"] == 7
+        assert result.summary["total_batches"] == 3
+        assert [issue.message for issue in result.issues] == ["Column 'heart_rate' has 1 values above maximum 250"]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_validate_excel(self, workbook, max_workers):
+        """Test every sheet is validated, in or out of process."""
+        results = validate_excel(_validator(), workbook, batch_size=4, max_workers=max_workers)
+
+        assert list(results) == sheet_names(workbook) == ["site_a", "site_b"]
+        assert results["site_a"].summary["total_rows"] == 7
+        assert [issue.message for issue in results["site_b"].issues] == [
+            "Column 'heart_rate' has 1 values below minimum 20"
+        ]
+
+    def test_default_validator_runs_in_workers(self, workbook, mocker):
+        """Test a default validator, with its compliance cache, is sent to worker processes."""
+        pool = mocker.patch("medical_data_validator.excel.ProcessPoolExecutor", wraps=ProcessPoolExecutor)
+        validator = MedicalDataValidator([RangeValidator({"heart_rate": {"min": 20, "max": 250}})])
+
+        results = validate_excel(validator, workbook, batch_size=4, max_workers=2)
+
+        pool.assert_called_once_with(max_workers=2)
+        assert results["site_a"].summary["total_rows"] == 7
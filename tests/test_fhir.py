@@ -0,0 +1,158 @@
+"""
+Tests for streaming FHIR Bulk Data NDJSON validation.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.fhir import (
+    FhirStructureChecker,
+    iter_fhir,
+    parse_path,
+    resolve_path,
+    split_offsets,
+    validate_fhir_ndjson,
+)
+from medical_data_validator.validators import RangeValidator
+
+
+def _observation(i, **overrides):
+    resource = {
+        "resourceType": "Observation",
+        "id": f"obs-{i}",
+        "status": "final",
+        "code": {"coding": [{"system": "http://loinc.org", "code": "8867-4"}]},
+        "subject": {"reference": f"Patient/p{i}"},
+        "valueQuantity": {"value": 70 + i, "unit": "/min"},
+    }
+    resource.update(overrides)
+    return resource
+
+
+@pytest.fixture
+def observations(tmp_path):
+    lines = [json.dumps(_observation(i)) for i in range(20)]
+    lines[3] = json.dumps(_observation(3, valueQuantity={"value": 400}))
+    lines[7] = "{not json"
+    lines[11] = json.dumps(_observation(11, status=None, subject={"reference": "p11"}))
+    lines[15] = ""
+    lines[16] = json.dumps({"resourceType": "Patient", "id": "p1"})
+    path = tmp_path / "Observation.ndjson"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _validator():
+    return MedicalDataValidator(
+        [RangeValidator({"value": {"min": 20, "max": 250}})],
+        enable_compliance=False,
+        enable_analytics=False,
+        enable_monitoring=False,
+    )
+
+
+class TestFlattening:
+    """Test path resolution and batch flattening."""
+
+    def test_resolve_path(self):
+        """Test dotted paths, list positions and implicit first elements."""
+        resource = _observation(1)
+
+        assert resolve_path(resource, parse_path("code.coding.code")) == "8867-4"
+        assert resolve_path(resource, parse_path("code.coding.0.system")) == "http://loinc.org"
+        assert resolve_path(resource, parse_path("code.coding.1.code")) is None
+        assert resolve_path(resource, parse_path("valueString")) is None
+
+    def test_batches(self, observations):
+        """Test resources stream in bounded batches of default columns."""
+        checker = FhirStructureChecker("Observation")
+        batches = list(iter_fhir(observations, resource_type="Observation", batch_size=5, checker=checker))
+
+        assert [len(batch) for batch in batches] == [5, 5, 5, 2]
+        assert {"id", "resourceType", "code", "value", "subject"} <= set(batches[0].columns)
+        assert batches[0]["value"].tolist()[3] == 400
+        assert checker.lines == 20
+
+    def test_custom_paths(self, observations):
+        """Test explicit paths replace the defaults."""
+        batch = next(iter_fhir(observations, paths={"unit": "valueQuantity.unit"}))
+
+        assert list(batch.columns) == ["id", "resourceType", "unit"]
+
+
+class TestStructureChecks:
+    """Test FHIR structural checks."""
+
+    def test_structure_issues(self, observations):
+        """Test parse errors, wrong types, required elements and references are tallied."""
+        checker = FhirStructureChecker("Observation")
+        list(iter_fhir(observations, resource_type="Observation", checker=checker))
+
+        messages = [issue.message for issue in checker.issues()]
+
+        assert messages == [
+            "1 lines are not valid JSON objects (first at line 8)",
+            "1 Observation resources are missing required element 'status' (first at line 12)",
+            "1 Observation resources have a malformed reference in 'subject' (first at line 12)",
+            "1 resources are Patient, expected Observation (first at line 17)",
+        ]
+
+    def test_choice_elements(self):
+        """Test choice-type elements accept any typed variant."""
+        checker = FhirStructureChecker()
+        checker.check({"resourceType": "MedicationRequest", "id": "m1", "status": "active", "intent": "order",
+                       "medicationCodeableConcept": {}, "subject": {"reference": "Patient/1"}}, 0)
+        checker.check({"resourceType": "MedicationRequest", "id": "m2", "status": "active", "intent": "order",
+                       "medicationsomething": {}, "subject": {"reference": "Patient/1"}}, 1)
+
+        assert [issue.row for issue in checker.issues()] == [1]
+
+
+class TestValidateNdjson:
+    """Test validate_fhir_ndjson."""
+
+    def test_split_offsets(self, observations):
+        """Test byte ranges cover the file and start on line boundaries."""
+        ranges = split_offsets(observations, 3)
+        content = observations.read_bytes()
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(content)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert all(content[start - 1:start] == b"\n" for start, _ in ranges[1:])
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_same_result_in_parallel(self, observations, max_workers):
+        """Test splitting across processes keeps global rows and counts."""
+        result = validate_fhir_ndjson(_validator(), observations, resource_type="Observation", batch_size=4,
+                                      max_workers=max_workers)
+
+        range_issues = [issue for issue in result.issues if issue.rule_name != "fhir_structure"]
+        structure_rows = sorted(issue.row for issue in result.issues if issue.rule_name == "fhir_structure")
+
+        assert not result.is_valid
+        assert result.summary["total_rows"] == 17
+        assert result.summary["total_lines"] == 20
+        assert [issue.message for issue in range_issues] == ["Column 'value' has 1 values above maximum 250"]
+        assert structure_rows == [7, 11, 11, 16]
+
+    def test_default_validator_runs_in_workers(self, observations):
+        """Test a default validator, with its compliance cache, is split across processes."""
+        validator = MedicalDataValidator([RangeValidator({"value": {"min": 20, "max": 250}})])
+
+        result = validate_fhir_ndjson(validator, observations, resource_type="Observation", max_workers=3)
+
+        assert result.summary["workers"] == 3
+        assert result.summary["total_rows"] == 17
+
+    def test_gzip(self, tmp_path, observations):
+        """Test compressed exports are read in a single range."""
+        path = tmp_path / "Observation.ndjson.gz"
+        path.write_bytes(gzip.compress(observations.read_bytes()))
+
+        result = validate_fhir_ndjson(_validator(), path, resource_type="Observation", max_workers=2)
+
+        assert split_offsets(path, 2) == [(0, path.stat().st_size)]
+        assert result.summary["total_rows"] == 17
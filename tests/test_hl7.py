@@ -0,0 +1,145 @@
+"""
+Tests for streaming HL7 v2 validation.
+"""
+
+import pytest
+
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.hl7 import (
+    Delimiters,
+    iter_hl7,
+    parse_field_spec,
+    split_offsets,
+    validate_hl7,
+)
+from medical_data_validator.validators import MedicalCodeValidator, RangeValidator
+
+HEADER = "MSH|^~\\&|LAB|HOSP|EHR|HOSP|20240101120000||{type}|{control}|P|2.5.1"
+
+
+def _oru(i, rate=72, code="8867-4"):
+    return "\r".join([
+        HEADER.format(type="ORU^R01", control=f"C{i}"),
+        f"PID|1||MRN{i}^^^HOSP^MR||Doe^Jane||19800101|F",
+        "OBR|1|||24331-1^Lipid panel^LN",
+        f"OBX|1|NM|{code}^Heart rate^LN||{rate}|/min^beats per minute|||||F",
+        "OBX|2|NM|8310-5^Body temperature^LN||37.1|Cel|||||F",
+    ])
+
+
+@pytest.fixture
+def messages(tmp_path):
+    batch = [_oru(i) for i in range(12)]
+    batch[4] = _oru(4, rate=400)
+    batch[9] = _oru(9, code="bad code")
+    batch.append("\r".join([HEADER.format(type="ADT^A01", control=""), "PV1|1|I"]))
+    path = tmp_path / "feed.hl7"
+    path.write_bytes(("BHS|^~\\&|LAB\r" + "\r\n".join(batch) + "\rBTS|13\r").encode())
+    return path
+
+
+def _validator():
+    return MedicalDataValidator(
+        [
+            RangeValidator({"observation_value": {"min": 20, "max": 250}}),
+            MedicalCodeValidator({"observation_code": "loinc"}, check_existence=False),
+        ],
+        enable_compliance=False,
+        enable_analytics=False,
+        enable_monitoring=False,
+    )
+
+
+class TestParsing:
+    """Test field references and delimiter handling."""
+
+    def test_field_spec(self):
+        """Test field references parse into segment, field, component, subcomponent."""
+        assert parse_field_spec("pid-3.1") == ("PID", 3, 1, None)
+        assert parse_field_spec("OBX-5") == ("OBX", 5, None, None)
+        with pytest.raises(ValueError):
+            parse_field_spec("PID3")
+
+    def test_extract(self):
+        """Test MSH numbering, components, repetitions and escapes."""
+        header = HEADER.format(type="ORU^R01", control="C1")
+        delimiters = Delimiters(header)
+        msh = header.split("|")
+        pid = "PID|1||A1^^^H~B2^^^H||O\\S\\Brien".split("|")
+
+        assert delimiters.extract(msh, parse_field_spec("MSH-9.2")) == "R01"
+        assert delimiters.extract(msh, parse_field_spec("MSH-10")) == "C1"
+        assert delimiters.extract(pid, parse_field_spec("PID-3")) == "A1^^^H"
+        assert delimiters.extract(pid, parse_field_spec("PID-3.4")) == "H"
+        assert delimiters.extract(pid, parse_field_spec("PID-5")) == "O^Brien"
+        assert delimiters.extract(pid, parse_field_spec("PID-30")) is None
+
+    def test_rows_per_message(self, messages):
+        """Test one row per message with first segment occurrences."""
+        data = next(iter_hl7(messages, fields={"mrn": "PID-3.1", "value": "OBX-5"}))
+
+        assert len(data) == 13
+        assert data["mrn"].iloc[0] == "MRN0"
+        assert data["value"].iloc[4] == 400
+        assert data["message_type"].iloc[-1] == "ADT^A01"
+
+    def test_repeat_segment(self, messages):
+        """Test one row per OBX, in bounded batches."""
+        batches = list(iter_hl7(messages, repeat_segment="OBX", batch_size=10))
+
+        assert [len(batch) for batch in batches] == [10, 10, 4]
+        assert batches[0]["observation_code"].tolist()[:2] == ["8867-4", "8310-5"]
+        assert batches[0]["units"].tolist()[:2] == ["/min", "Cel"]
+
+
+class TestValidateHl7:
+    """Test validate_hl7."""
+
+    def test_split_offsets(self, messages):
+        """Test byte ranges start at MSH segments and cover the file."""
+        content = messages.read_bytes()
+        ranges = split_offsets(messages, 4)
+
+        assert len(ranges) > 1
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(content)
+        assert all(content[start:start + 3] == b"MSH" for start, _ in ranges[1:])
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_validation(self, messages, max_workers):
+        """Test rule and structure issues are the same in or out of process."""
+        result = validate_hl7(_validator(), messages, repeat_segment="OBX", batch_size=5, max_workers=max_workers)
+
+        rule_messages = sorted(issue.message for issue in result.issues if issue.rule_name != "hl7_structure")
+        structure = [issue for issue in result.issues if issue.rule_name == "hl7_structure"]
+
+        assert result.summary["total_messages"] == 13
+        assert result.summary["total_rows"] == 24
+        assert rule_messages == [
+            "Column 'observation_value' has 1 values above maximum 250",
+            "Found 1 invalid LOINC codes in column. Sample: ['bad code']",
+        ]
+        assert [(issue.message, issue.row) for issue in structure] == [
+            ("1 messages have no control ID (MSH-10) (first in message 13)", 12),
+            ("1 ADT messages are missing required segment EVN (first in message 13)", 12),
+            ("1 ADT messages are missing required segment PID (first in message 13)", 12),
+        ]
+
+    def test_default_validator_runs_in_workers(self, messages):
+        """Test a default validator, with its compliance cache, is split across processes."""
+        validator = MedicalDataValidator([RangeValidator({"observation_value": {"min": 20, "max": 250}})])
+
+        result = validate_hl7(validator, messages, repeat_segment="OBX", max_workers=3)
+
+        assert result.summary["workers"] > 1
+        assert result.summary["total_messages"] == 13
+
+    def test_orphan_segments(self, tmp_path):
+        """Test segments before any MSH are reported."""
+        path = tmp_path / "orphan.hl7"
+        path.write_text("PID|1||X\r" + _oru(1))
+
+        result = validate_hl7(_validator(), path, max_workers=1)
+
+        assert "1 segments appear before the first MSH segment (first in message 1)" in [
+            issue.message for issue in result.issues
+        ]
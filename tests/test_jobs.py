@@ -0,0 +1,203 @@
+"""
+Tests for asynchronous validation jobs.
+"""
+
+import io
+import time
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.jobs import JobManager, JobStore, run_job
+
+
+@pytest.fixture
+def csv_bytes():
+    frame = pd.DataFrame({
+        "patient_id": [f"P{i}" for i in range(30)],
+        "age": [30 + i for i in range(30)],
+        "diagnosis": ["E11.9", "I10", None] * 10,
+    })
+    return frame.to_csv(index=False).encode()
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_dashboard_app()
+    app.config.update(TESTING=True, JOB_DIR=str(tmp_path / "jobs"), JOB_WORKERS=1)
+    yield app
+    manager = app.extensions.get("validation_jobs")
+    if manager is not None:
+        manager.shutdown()
+
+
+def _wait(client, job_id, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        body = client.get(f"/api/jobs/{job_id}").get_json()
+        if body["status"] in ("completed", "failed"):
+            return body
+        time.sleep(0.1)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestJobStore:
+    """Test JobStore class."""
+
+    def test_lifecycle(self, tmp_path):
+        """Test a job moves from queued to completed with its result."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        job_id = store.create("validate", None, {"profile": ""})
+
+        assert store.get(job_id)["status"] == "queued"
+        store.start(job_id)
+        store.set_progress(job_id, 0.5)
+        assert (store.get(job_id)["status"], store.get(job_id)["progress"]) == ("running", 0.5)
+
+        store.complete(job_id, {"total": pd.Series([1]).sum()})
+        job = store.get(job_id)
+        assert (job["status"], job["progress"], job["result"]) == ("completed", 1.0, {"total": 1})
+        assert store.get("missing") is None
+
+    def test_fail_unfinished(self, tmp_path):
+        """Test interrupted jobs can be marked failed."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        store.create("validate", None, {})
+
+        assert store.fail_unfinished() == 1
+        assert store.fail_unfinished() == 0
+
+    def test_purge_finished(self, tmp_path):
+        """Test finished jobs past retention are deleted with their issues; others are kept."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        done = store.create("validate", None, {})
+        store.complete(done, {"issues": [{"row": 1}, {"row": 2}]})
+        failed = store.create("validate", None, {})
+        store.fail(failed, "boom")
+        queued = store.create("validate", None, {})
+
+        assert store.purge_finished(3600) == 0
+        assert store.purge_finished(-1) == 2
+
+        assert store.get(done) is None and store.get(failed) is None
+        assert list(store.issues(done)) == []
+        assert store.get(queued)["status"] == "queued"
+
+
+class TestJobManager:
+    """Test JobManager class."""
+
+    def test_restart_fails_interrupted_jobs(self, tmp_path):
+        """Test a new server fails jobs left running, but not those of a live sibling."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        interrupted = store.create("validate", None, {})
+        store.start(interrupted)
+
+        first = JobManager(tmp_path)
+        running = store.create("validate", None, {})
+        store.start(running)
+        JobManager(tmp_path)
+
+        assert store.get(interrupted)["status"] == "failed"
+        assert store.get(interrupted)["error"] == "Interrupted by a server restart"
+        assert store.get(running)["status"] == "running"
+        first.shutdown()
+
+
+class TestRunJob:
+    """Test job execution."""
+
+    def test_progress_and_result(self, tmp_path, csv_bytes, mocker):
+        """Test batches report progress and the result matches the file endpoint."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(csv_bytes)
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        job_id = store.create("validate", str(path), {"batch_size": 10, "detect_phi": False})
+        progress = mocker.spy(JobStore, "set_progress")
+
+        run_job(store.db_path, job_id)
+
+        job = store.get(job_id)
+        assert job["status"] == "completed"
+        assert job["result"]["summary"]["total_rows"] == 30
+        assert [call.args[2] for call in progress.call_args_list] == pytest.approx([0.1, 0.1 + 0.8 / 3, 0.1 + 1.6 / 3, 0.9])
+        assert not path.exists()
+
+    def test_failure(self, tmp_path):
+        """Test load errors are recorded on the job."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        job_id = store.create("validate", str(tmp_path / "missing.csv"), {})
+
+        run_job(store.db_path, job_id)
+
+        job = store.get(job_id)
+        assert job["status"] == "failed"
+        assert "FileNotFoundError" in job["error"]
+
+
+class TestJobApi:
+    """Test the /api/jobs endpoints."""
+
+    @pytest.mark.parametrize("kind,key", [("validate", "issues"), ("analytics", "quality_metrics")])
+    def test_submit_and_poll(self, app, csv_bytes, kind, key):
+        """Test a job is accepted at once and its result can be polled."""
+        client = app.test_client()
+        resp = client.post(
+            "/api/jobs",
+            data={"file": (io.BytesIO(csv_bytes), "data.csv"), "kind": kind},
+            content_type="multipart/form-data",
+        )
+
+        assert resp.status_code == 202
+        job_id = resp.get_json()["job_id"]
+        body = _wait(client, job_id)
+        assert body["status"] == "completed", body["error"]
+        assert body["progress"] == 1.0
+        assert key in body["result"]
+
+    def test_rejects_bad_requests(self, app, csv_bytes):
+        """Test missing files, unknown kinds and unknown jobs."""
+        client = app.test_client()
+
+        assert client.post("/api/jobs", data={}).status_code == 400
+        resp = client.post(
+            "/api/jobs",
+            data={"file": (io.BytesIO(csv_bytes), "data.csv"), "kind": "bogus"},
+            content_type="multipart/form-data",
+        )
+        assert resp.status_code == 400
+        assert client.get("/api/jobs/unknown").status_code == 404
+
+    def test_upload_limit(self, app, csv_bytes):
+        """Test job uploads use MAX_UPLOAD_BYTES rather than MAX_CONTENT_LENGTH."""
+        client = app.test_client()
+        app.config.update(MAX_CONTENT_LENGTH=100, MAX_UPLOAD_BYTES=len(csv_bytes) * 2)
+        resp = client.post("/api/jobs", data={"file": (io.BytesIO(csv_bytes), "data.csv")},
+                           content_type="multipart/form-data")
+        assert resp.status_code == 202
+
+        app.config["MAX_UPLOAD_BYTES"] = 100
+        resp = client.post("/api/jobs", data={"file": (io.BytesIO(csv_bytes), "data.csv")},
+                           content_type="multipart/form-data")
+        assert resp.status_code == 413
+
+    def test_issue_pages(self, app, tmp_path):
+        """Test stored issues are paged by cursor and streamed as NDJSON."""
+        client = app.test_client()
+        client.get("/api/jobs/unknown")  # creates the job manager
+        store = app.extensions["validation_jobs"].store
+        job_id = store.create("validate", None, {})
+        store.complete(job_id, {"issues": [{"row": row} for row in range(5)], "is_valid": False})
+
+        body = client.get(f"/api/jobs/{job_id}?limit=2").get_json()
+        assert body["result"]["issues"] == [{"row": 0}, {"row": 1}]
+        assert (body["result"]["issues_count"], body["result"]["next_cursor"]) == (5, 2)
+
+        page = client.get(f"/api/jobs/{job_id}/issues?cursor=4&limit=2").get_json()
+        assert (page["issues"], page["next_cursor"]) == ([{"row": 4}], None)
+
+        resp = client.get(f"/api/jobs/{job_id}/issues?cursor=3", headers={"Accept": "application/x-ndjson"})
+        assert resp.mimetype == "application/x-ndjson"
+        assert resp.get_data(as_text=True).splitlines() == ['{"type":"issue","row":3}', '{"type":"issue","row":4}']
+        assert client.get("/api/jobs/unknown/issues").status_code == 404
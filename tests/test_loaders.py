@@ -0,0 +1,199 @@
+"""
+Tests for column-projected Parquet and Feather loading.
+"""
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+import pyarrow.feather as feather
+
+from medical_data_validator.analytics import AdvancedAnalytics
+from medical_data_validator.core import MedicalDataValidator
+from medical_data_validator.extensions import MedicalProfiles
+from medical_data_validator.loaders import (
+    iter_columnar,
+    load_file,
+    read_columnar,
+    read_csv,
+    source_columns,
+)
+from medical_data_validator.validators import (
+    DataQualityChecker,
+    DateValidator,
+    PHIDetector,
+    RangeValidator,
+    SchemaValidator,
+)
+
+
+@pytest.fixture
+def wide_df():
+    data = {f"extra_{i}": range(10) for i in range(20)}
+    data.update({
+        "patient_id": [f"P{i}" for i in range(10)],
+        "heart_rate": [70 + i for i in range(9)] + [400],
+        "sex": ["F", "M"] * 5,
+        "visit_date": ["2020-01-01"] * 10,
+    })
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def wide_file(request, tmp_path, wide_df):
+    path = tmp_path / f"wide.{request.param}"
+    table = pa.Table.from_pandas(wide_df, preserve_index=False)
+    if request.param == "parquet":
+        pq.write_table(table, path, row_group_size=4)
+    else:
+        feather.write_feather(table, path, compression="uncompressed", chunksize=4)
+    return path
+
+
+class TestColumnarLoading:
+    """Test read_columnar and iter_columnar."""
+
+    def test_projection(self, wide_file, wide_df):
+        """Test only requested columns are loaded and source columns are kept."""
+        data = read_columnar(wide_file, columns=["heart_rate", "patient_id", "not_there"])
+
+        assert list(data.columns) == ["patient_id", "heart_rate"]
+        assert source_columns(data) == list(wide_df.columns)
+
+    def test_streaming(self, wide_file):
+        """Test batches are bounded and cover every row."""
+        batches = list(iter_columnar(wide_file, columns=["heart_rate"], batch_size=3))
+
+        assert all(len(batch) <= 3 for batch in batches)
+        assert sum(len(batch) for batch in batches) == 10
+        assert all(list(batch.columns) == ["heart_rate"] for batch in batches)
+
+    def test_unsupported_format(self, tmp_path):
+        """Test non-columnar files are rejected."""
+        with pytest.raises(ValueError):
+            read_columnar(tmp_path / "data.csv")
+
+
+class TestReferencedColumns:
+    """Test rules and validators report the columns they read."""
+
+    def test_validator_projection(self):
+        """Test the union of rule columns, with name-only checks excluded."""
+        validator = MedicalDataValidator(enable_compliance=False, enable_analytics=False, enable_monitoring=False)
+        validator.add_rule(SchemaValidator(required_columns=["patient_id"], column_types={"heart_rate": "float"}))
+        validator.add_rule(RangeValidator({"heart_rate": {"max": 250, "when": [{"if": {"sex": "F"}, "max": 200}]}}))
+        validator.add_rule(DateValidator(["visit_date"]))
+
+        assert validator.referenced_columns() == ["heart_rate", "sex", "visit_date"]
+
+    def test_whole_table_rules_disable_projection(self):
+        """Test rules and engines that read every column disable projection."""
+        validator = MedicalDataValidator(enable_compliance=False, enable_analytics=False, enable_monitoring=False)
+        validator.add_rule(DataQualityChecker())
+        assert validator.referenced_columns() is None
+
+        validator = MedicalDataValidator(enable_compliance=False, enable_analytics=False, enable_monitoring=False)
+        validator.add_validator("custom", lambda data: [])
+        assert validator.referenced_columns() is None
+
+    def test_name_checks_use_source_columns(self, wide_file):
+        """Test required-column and PHI name checks see unloaded columns."""
+        data = read_columnar(wide_file, columns=["heart_rate"])
+
+        schema_issues = SchemaValidator(required_columns=["patient_id", "missing"]).validate(data)
+        phi_issues = PHIDetector().validate(data)
+
+        assert [issue.column for issue in schema_issues] == ["missing"]
+        assert "patient_id" in {issue.column for issue in phi_issues}
+
+    def test_projected_result_matches_full_load(self, wide_file):
+        """Test validating the projection gives the same issues as the full file."""
+        profile_rules = [
+            rule for rule in MedicalProfiles.laboratory_data().rules
+            if rule.referenced_columns() is not None
+        ]
+        validator = MedicalDataValidator(
+            rules=profile_rules, enable_compliance=False, enable_analytics=False, enable_monitoring=False
+        )
+
+        projected = validator.validate(read_columnar(wide_file, columns=validator.referenced_columns()))
+        full = validator.validate(read_columnar(wide_file))
+
+        assert [i.message for i in projected.issues] == [i.message for i in full.issues]
+
+
+@pytest.fixture
+def messy_csv(tmp_path):
+    path = tmp_path / "messy.csv"
+    path.write_text(
+        "patient_id,zip,sex,visit_date,heart_rate,note\n"
+        "P1,02134,F,2020-01-01,70,\n"
+        "P2,10001,M,2020-02-01,NA,None\n"
+        "P3,,F,2020-03-01,90,fine\n"
+        "P4,02134,F,2020-04-01,,null\n"
+    )
+    return path
+
+
+class TestCsvIngestion:
+    """Test the shared CSV ingestion path."""
+
+    def test_matches_pandas(self, messy_csv):
+        """Test nulls, numbers and dates load like pd.read_csv."""
+        data = read_csv(messy_csv, categorical_strings=False)
+        expected = pd.read_csv(messy_csv)
+
+        pd.testing.assert_frame_equal(data, expected, check_dtype=False)
+        assert data["visit_date"].dtype == object
+
+    def test_projection_and_categories(self, messy_csv):
+        """Test usecols projection and categorical low-cardinality text."""
+        data = read_csv(messy_csv, columns=["sex", "heart_rate"])
+
+        assert list(data.columns) == ["sex", "heart_rate"]
+        assert isinstance(data["sex"].dtype, pd.CategoricalDtype)
+        assert source_columns(data)[:2] == ["patient_id", "zip"]
+
+    def test_categories_analysed_as_text(self, messy_csv):
+        """Test analytics treat categorical text like the object columns of pd.read_csv."""
+        data = load_file(messy_csv)
+        expected = pd.read_csv(messy_csv)
+        analytics = AdvancedAnalytics()
+        loaded, read = analytics.comprehensive_analysis(data), analytics.comprehensive_analysis(expected)
+
+        assert isinstance(data["sex"].dtype, pd.CategoricalDtype)
+        assert "sex" in loaded["statistical_summary"]["categorical_summary"]
+        # Only the storage description (dtypes, memory) may differ
+        for report in (loaded, read):
+            del report["statistical_summary"]["dataset_info"]
+        assert loaded == read
+
+    def test_text_hints(self, messy_csv):
+        """Test columns declared as text keep leading zeros."""
+        data = read_csv(messy_csv, dtypes={"zip": "string", "heart_rate": "int"})
+
+        assert data["zip"].tolist()[:2] == ["02134", "10001"]
+        assert pd.api.types.is_float_dtype(data["heart_rate"])
+
+    @pytest.mark.parametrize("codec,suffix", [("gzip", ".gz"), ("zstd", ".zst")])
+    def test_compressed(self, tmp_path, messy_csv, codec, suffix):
+        """Test compressed CSV is detected from the extension."""
+        path = tmp_path / f"messy.csv{suffix}"
+        with pa.CompressedOutputStream(str(path), codec) as sink:
+            sink.write(messy_csv.read_bytes())
+
+        data = load_file(path)
+
+        assert len(data) == 4
+
+    def test_falls_back_to_pandas(self, tmp_path, mocker):
+        """Test files pyarrow cannot type are read by pandas."""
+        path = tmp_path / "late_text.csv"
+        path.write_text("value\n1\n2\n")
+        mocker.patch("medical_data_validator.loaders.read_csv_table", side_effect=pa.ArrowInvalid("bad"))
+
+        data = read_csv(path, columns=["value"])
+
+        assert data["value"].tolist() == [1, 2]
+        assert source_columns(data) == ["value"]
@@ -0,0 +1,166 @@
+"""
+Tests for OMOP CDM validation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from medical_data_validator.omop import (
+    ConceptValidator,
+    ConceptVocabulary,
+    omop_profile,
+    omop_validator,
+)
+
+CONCEPTS = [
+    # concept_id, domain_id, standard_concept, invalid_reason
+    (0, "Metadata", "", ""),
+    (8507, "Gender", "S", ""),
+    (8532, "Gender", "S", ""),
+    (8527, "Race", "S", ""),
+    (38003564, "Ethnicity", "S", ""),
+    (9201, "Visit", "S", ""),
+    (32817, "Type Concept", "S", ""),
+    (201826, "Condition", "S", ""),
+    (44054006, "Condition", "", ""),
+    (3027018, "Measurement", "S", ""),
+    (3004249, "Measurement", "S", "U"),
+    (8541, "Unit", "S", ""),
+]
+
+
+@pytest.fixture
+def concept_file(tmp_path):
+    path = tmp_path / "CONCEPT.csv"
+    lines = ["concept_id\tconcept_name\tdomain_id\tstandard_concept\tinvalid_reason"]
+    lines += [f"{cid}\tname \"{cid}\"\t{domain}\t{std}\t{invalid}" for cid, domain, std, invalid in CONCEPTS]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def vocabulary(concept_file):
+    return ConceptVocabulary.from_concept_file(concept_file, chunksize=4)
+
+
+def _cdm():
+    person = pd.DataFrame({
+        "person_id": [1, 2, 3],
+        "gender_concept_id": [8507, 8532, 8527],
+        "year_of_birth": [1980, 1990, 1700],
+        "race_concept_id": [8527, 8527, 0],
+        "ethnicity_concept_id": [38003564] * 3,
+    })
+    visits = pd.DataFrame({
+        "visit_occurrence_id": [10, 11],
+        "person_id": [1, 9],
+        "visit_concept_id": [9201, 9201],
+        "visit_start_date": ["2020-01-01", "2020-02-01"],
+        "visit_end_date": ["2020-01-02", "2020-02-01"],
+        "visit_type_concept_id": [32817, 32817],
+    })
+    conditions = pd.DataFrame({
+        "condition_occurrence_id": [100, 101, 102],
+        "person_id": [1, 2, 3],
+        "condition_concept_id": [201826, 44054006, 3027018],
+        "condition_start_date": ["2020-01-01"] * 3,
+        "condition_type_concept_id": [32817] * 3,
+        "visit_occurrence_id": [10, None, 99],
+    })
+    measurements = pd.DataFrame({
+        "measurement_id": [1000, 1001, 1002],
+        "person_id": [1, 1, 2],
+        "measurement_concept_id": [3027018, 3004249, 123],
+        "measurement_date": ["2020-01-01"] * 3,
+        "measurement_type_concept_id": [32817] * 3,
+        "unit_concept_id": [8541, None, 8541],
+    })
+    return {"person": person, "visit_occurrence": visits, "condition_occurrence": conditions, "measurement": measurements}
+
+
+class TestConceptVocabulary:
+    """Test ConceptVocabulary class."""
+
+    def test_lookup(self, vocabulary):
+        """Test ids are found with searchsorted, and missing or non-integer values are not."""
+        present, found, positions = vocabulary.lookup(pd.Series([8541, 201826.0, 5, None, 1.5, "8507"]))
+
+        assert present.tolist() == [True, True, True, False, True, True]
+        assert found.tolist() == [True, True, False, False, False, True]
+        assert vocabulary.concept_ids[positions[0]] == 8541
+        assert 3027018 in vocabulary and 1 not in vocabulary
+        assert len(vocabulary) == len(CONCEPTS)
+
+    def test_save_and_memory_map(self, vocabulary, tmp_path):
+        """Test saved vocabularies load memory-mapped with the same lookups."""
+        loaded = ConceptVocabulary.load(vocabulary.save(tmp_path / "vocab"))
+
+        assert isinstance(loaded.concept_ids, np.memmap)
+        assert loaded.domain_names == vocabulary.domain_names
+        assert loaded.lookup([3004249, 7])[1].tolist() == [True, False]
+
+
+class TestConceptValidator:
+    """Test ConceptValidator class."""
+
+    def test_concept_checks(self, vocabulary):
+        """Test unknown, unmapped, wrong-domain, non-standard and deprecated concepts."""
+        data = pd.DataFrame({"concept_id": [201826, 44054006, 3027018, 3004249, 0, 42, None]})
+
+        issues = ConceptValidator({"concept_id": "Condition"}, vocabulary).validate(data)
+
+        assert [(issue.severity, issue.message) for issue in issues] == [
+            ("error", "Found 1 concept_ids in column 'concept_id' that are not in the vocabulary. Sample: [42.0]"),
+            ("warning", "Column 'concept_id' has 1 rows with concept_id 0 (no matching concept)"),
+            ("error", "Found 2 concept_ids outside domain 'Condition' in column 'concept_id'. Sample: [3027018.0, 3004249.0]"),
+            ("warning", "Found 1 non-standard concept_ids in column 'concept_id'. Sample: [44054006.0]"),
+            ("warning", "Found 1 deprecated or upgraded concept_ids in column 'concept_id'. Sample: [3004249.0]"),
+        ]
+
+    def test_any_domain(self, vocabulary):
+        """Test columns without a domain only check existence and deprecation."""
+        data = pd.DataFrame({"value_as_concept_id": [8507, 44054006]})
+
+        assert ConceptValidator({"value_as_concept_id": None}, vocabulary).validate(data) == []
+
+
+class TestOmopValidator:
+    """Test the OMOP CDM multi-table validator."""
+
+    def test_cdm(self, vocabulary):
+        """Test keys, concepts and per-table rules across the CDM tables."""
+        result = omop_validator(vocabulary).validate(_cdm())
+        messages = [issue.message for issue in result.issues]
+
+        assert "Table 'visit_occurrence' has 1 orphan rows: (person_id) not found in 'person'. Sample: [9]" in messages
+        assert (
+            "Table 'condition_occurrence' has 1 orphan rows: (visit_occurrence_id) not found in 'visit_occurrence'. "
+            "Sample: [99.0]"
+        ) in messages
+        assert "Found 1 concept_ids outside domain 'Gender' in column 'gender_concept_id'. Sample: [8527]" in messages
+        assert "Found 1 concept_ids in column 'measurement_concept_id' that are not in the vocabulary. Sample: [123]" in messages
+        assert any("year_of_birth" in message for message in messages)
+        assert result.summary["tables"]["measurement"]["rows"] == 3
+
+    def test_chunked_tables(self, vocabulary):
+        """Test chunked tables give the same issues as whole tables."""
+        tables = _cdm()
+        chunked = {name: [frame.iloc[i:i + 1] for i in range(len(frame))] for name, frame in tables.items()}
+
+        whole = omop_validator(vocabulary).validate(tables)
+        streamed = omop_validator(vocabulary).validate(chunked)
+
+        def orphan_messages(result):
+            return sorted(issue.message for issue in result.issues if "orphan" in issue.message)
+
+        assert orphan_messages(streamed) == orphan_messages(whole)
+
+    def test_subset_and_profile(self):
+        """Test table subsets, unknown tables and single-table profiles."""
+        validator = omop_validator(tables=["person", "measurement"])
+
+        assert [fk.describe() for fk in validator.foreign_keys] == ["measurement(person_id) -> person(person_id)"]
+        assert omop_profile("person").create_validator().rules
+        with pytest.raises(ValueError):
+            omop_validator(tables=["note"])
@@ -0,0 +1,115 @@
+"""
+Tests for the vectorized range engine and bound packs.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from medical_data_validator.ranges import (
+    LAB_RANGES_BY_LOINC,
+    VITAL_SIGNS,
+    RangeEngine,
+    build_ranges,
+)
+from medical_data_validator.validators import RangeValidator
+
+
+class TestRangeEngine:
+    """Test RangeEngine class."""
+
+    def test_multi_column_evaluation(self):
+        """Test all columns are checked in one evaluation."""
+        engine = RangeEngine({"a": {"min": 0, "max": 10}, "b": {"max": 5}, "missing": {"min": 0}})
+        df = pd.DataFrame({"a": [-1, 5, 11], "b": [6, np.nan, 1], "text": ["x", "y", "z"]})
+
+        evaluation = engine.evaluate(df)
+
+        assert evaluation.columns == ["a", "b"]
+        assert evaluation.below_counts().tolist() == [1, 0]
+        assert evaluation.above_counts().tolist() == [1, 1]
+        assert evaluation.failing_rows().tolist() == [0, 2]
+
+    def test_row_bitmap(self):
+        """Test packed per-row bitmaps follow column order."""
+        engine = RangeEngine({"a": {"max": 1}, "b": {"max": 1}})
+        df = pd.DataFrame({"a": [2, 0, 2], "b": [0, 2, 2]})
+
+        bitmap = engine.evaluate(df).row_bitmap()
+
+        assert bitmap.shape == (3, 1)
+        assert bitmap[:, 0].tolist() == [0b10000000, 0b01000000, 0b11000000]
+
+    def test_conditional_ranges(self):
+        """Test per-row bounds from sex- and age-dependent cases."""
+        engine = RangeEngine({
+            "hemoglobin": {
+                "min": 13.5,
+                "max": 17.5,
+                "when": [
+                    {"if": {"sex": "F"}, "min": 12.0, "max": 15.5},
+                    {"if": {"age": (None, 18)}, "min": 11.0},
+                ],
+            }
+        })
+        df = pd.DataFrame({
+            "hemoglobin": [12.5, 12.5, 12.5, 16.0],
+            "sex": ["F", "M", "M", "F"],
+            "age": [40, 40, 10, 40],
+        })
+
+        evaluation = engine.evaluate(df)
+
+        assert evaluation.below[:, 0].tolist() == [False, True, False, False]
+        assert evaluation.above[:, 0].tolist() == [False, False, False, True]
+
+    def test_nullable_integer_columns(self):
+        """Test extension dtypes with missing values are supported."""
+        engine = RangeEngine({"age": {"max": 120}})
+        df = pd.DataFrame({"age": pd.array([30, None, 150], dtype="Int64")})
+        assert engine.evaluate(df).above_counts().tolist() == [1]
+
+
+class TestRangePacks:
+    """Test the bound packs and unit conversion."""
+
+    def test_vital_signs_pack(self):
+        """Test the vital sign pack builds a configuration for every key."""
+        ranges = build_ranges(VITAL_SIGNS)
+        assert set(ranges) == set(VITAL_SIGNS)
+        assert "unit" in ranges["heart_rate"]
+
+    def test_generic_unit_conversion(self):
+        """Test temperature bounds are converted to Fahrenheit."""
+        ranges = build_ranges(VITAL_SIGNS, columns={"temp_f": "temperature"}, units={"temp_f": "[degF]"})
+        assert ranges["temp_f"]["min"] == pytest.approx(86.0)
+        assert ranges["temp_f"]["max"] == pytest.approx(113.0)
+
+    def test_lab_pack_by_loinc(self):
+        """Test lab bounds are looked up by LOINC with analyte conversions."""
+        ranges = build_ranges(LAB_RANGES_BY_LOINC, columns={"glucose": "2345-7"}, units={"glucose": "mmol/L"})
+        assert ranges["glucose"]["unit"] == "mmol/L"
+        assert ranges["glucose"]["max"] == pytest.approx(55.5)
+
+    def test_unknown_conversion(self):
+        """Test unsupported unit conversions are rejected."""
+        with pytest.raises(ValueError):
+            build_ranges(VITAL_SIGNS, columns={"hr": "heart_rate"}, units={"hr": "Hz"})
+        with pytest.raises(KeyError):
+            build_ranges(LAB_RANGES_BY_LOINC, columns={"x": "0000-0"})
+
+
+class TestRangeValidatorConditional:
+    """Test RangeValidator messages for conditional ranges."""
+
+    def test_conditional_message(self):
+        """Test conditional columns mention the row-specific bound."""
+        validator = RangeValidator(ranges={
+            "hemoglobin": {"min": 13.5, "when": [{"if": {"sex": "F"}, "min": 12.0}]}
+        })
+        df = pd.DataFrame({"hemoglobin": [12.5, 11.0], "sex": ["F", "F"]})
+
+        issues = validator.validate(df)
+
+        assert len(issues) == 1
+        assert issues[0].message == "Column 'hemoglobin' has 1 values below their row's minimum"
@@ -0,0 +1,159 @@
+"""
+Tests for multi-table referential integrity validation.
+"""
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.relational import ForeignKey, MultiTableValidator, hash_keys
+from medical_data_validator.validators import RangeValidator
+
+
+def _tables():
+    patients = pd.DataFrame({"patient_id": [1, 2, 3, 3, None], "age": [30, 40, 50, 50, 60]})
+    encounters = pd.DataFrame({
+        "encounter_id": ["E1", "E2", "E3", "E4"],
+        "patient_id": ["1", "2", "9", None],
+    })
+    labs = pd.DataFrame({
+        "encounter_id": ["E1", "E2", "E5", "E6"],
+        "value": [1.0, 2.0, 3.0, -1.0],
+    })
+    return {"patients": patients, "encounters": encounters, "labs": labs}
+
+
+def _validator(**kwargs):
+    return MultiTableValidator(
+        primary_keys={"patients": "patient_id", "encounters": "encounter_id"},
+        foreign_keys=[
+            ("encounters", "patient_id", "patients", "patient_id"),
+            {"table": "labs", "columns": "encounter_id", "ref_table": "encounters"},
+        ],
+        **kwargs,
+    )
+
+
+class TestHashKeys:
+    """Test key normalization and hashing."""
+
+    def test_numeric_and_text_keys_match(self):
+        """Test integer keys match their text form across tables."""
+        left, _ = hash_keys(pd.DataFrame({"k": [1, 2]}), ("k",))
+        right, _ = hash_keys(pd.DataFrame({"k": ["1", "2"]}), ("k",))
+        assert left.tolist() == right.tolist()
+
+    def test_mixed_keys_hash_alike_in_any_chunk(self):
+        """Test a key hashes the same whether its chunk is all numeric or mixed."""
+        mixed, _ = hash_keys(pd.DataFrame({"k": ["1", "A2", 3.0]}), ("k",))
+        alone = [hash_keys(pd.DataFrame({"k": [value]}), ("k",))[0][0] for value in ("1", "A2", 3)]
+        floats, _ = hash_keys(pd.DataFrame({"k": ["3.0", 1.0]}), ("k",))
+        assert mixed.tolist() == alone
+        assert floats.tolist() == [alone[2], alone[0]]
+
+    def test_missing_keys_not_present(self):
+        """Test rows with a missing key column are flagged."""
+        _, present = hash_keys(pd.DataFrame({"a": [1, None], "b": ["x", "y"]}), ("a", "b"))
+        assert present.tolist() == [True, False]
+
+
+class TestMultiTableValidator:
+    """Test MultiTableValidator class."""
+
+    def test_keys_and_orphans(self):
+        """Test duplicate/missing primary keys and orphan foreign keys are reported."""
+        result = _validator().validate(_tables())
+        messages = [issue.message for issue in result.issues]
+
+        assert "Table 'patients' has 1 duplicate primary key values in (patient_id)" in messages
+        assert "Table 'patients' has 1 rows with a missing primary key (patient_id)" in messages
+        assert "Table 'encounters' has 1 orphan rows: (patient_id) not found in 'patients'. Sample: ['9']" in messages
+        assert "Table 'labs' has 2 orphan rows: (encounter_id) not found in 'encounters'. Sample: ['E5', 'E6']" in messages
+        assert not result.is_valid
+        assert result.summary["tables"]["patients"]["rows"] == 5
+
+    def test_streamed_child_table(self):
+        """Test a child table given as chunks gives the same orphan counts."""
+        tables = _tables()
+        labs = tables["labs"]
+        tables["labs"] = (labs.iloc[i:i + 1] for i in range(len(labs)))
+
+        result = _validator().validate(tables)
+
+        fk_summary = {entry["foreign_key"]: entry for entry in result.summary["foreign_keys"]}
+        assert fk_summary["labs(encounter_id) -> encounters(encounter_id)"]["orphan_rows"] == 2
+        assert fk_summary["labs(encounter_id) -> encounters(encounter_id)"]["checked_rows"] == 4
+
+    def test_mixed_keys_split_across_chunks(self):
+        """Test int-like and text keys split across chunks match and count duplicates."""
+        validator = MultiTableValidator(
+            primary_keys={"p": "pid"},
+            foreign_keys=[("e", "pid", "p", "pid")],
+        )
+        tables = {
+            "p": iter([pd.DataFrame({"pid": ["1", "A2"]}), pd.DataFrame({"pid": [1]})]),
+            "e": iter([pd.DataFrame({"pid": ["1"]}), pd.DataFrame({"pid": ["A2"]}), pd.DataFrame({"pid": [1.0]})]),
+        }
+
+        result = validator.validate(tables)
+        messages = [issue.message for issue in result.issues]
+
+        assert result.summary["foreign_keys"][0]["orphan_rows"] == 0
+        assert "Table 'p' has 1 duplicate primary key values in (pid)" in messages
+
+    def test_padded_text_keys_stay_distinct(self):
+        """Test zero-padded identifiers are not merged with unpadded ones."""
+        validator = MultiTableValidator(
+            primary_keys={"p": "mrn"},
+            foreign_keys=[("e", "mrn", "p", "mrn")],
+        )
+        tables = {
+            "p": pd.DataFrame({"mrn": ["123", "A1"]}),
+            "e": pd.DataFrame({"mrn": ["00123", "123"]}),
+        }
+
+        result = validator.validate(tables)
+
+        assert result.summary["foreign_keys"][0]["orphan_rows"] == 1
+        assert MultiTableValidator(primary_keys={"p": "mrn"}).validate(
+            {"p": pd.DataFrame({"mrn": ["00123", "123", "A1"]})}
+        ).is_valid
+
+    def test_composite_keys(self):
+        """Test composite foreign keys are hashed together."""
+        validator = MultiTableValidator(
+            primary_keys={"visits": ["subject_id", "visit"]},
+            foreign_keys=[ForeignKey("samples", ("subject_id", "visit"), "visits", ("subject_id", "visit"))],
+        )
+        tables = {
+            "visits": pd.DataFrame({"subject_id": ["S1", "S1"], "visit": [1, 2]}),
+            "samples": pd.DataFrame({"subject_id": ["S1", "S1"], "visit": [2, 3]}),
+        }
+
+        result = validator.validate(tables)
+
+        assert result.summary["foreign_keys"][0]["orphan_rows"] == 1
+
+    def test_table_rules_with_chunk_offsets(self):
+        """Test per-table rules run on chunks with table-prefixed columns and global rows."""
+        validator = _validator(table_rules={"labs": [RangeValidator(ranges={"value": {"min": 0}})]})
+        tables = _tables()
+        tables["labs"] = iter([tables["labs"].iloc[:2], tables["labs"].iloc[2:]])
+
+        result = validator.validate(tables)
+
+        range_issues = [issue for issue in result.issues if issue.rule_name == "RangeValidator"]
+        assert [issue.column for issue in range_issues] == ["labs.value"]
+
+    def test_missing_parent_table(self):
+        """Test foreign keys to absent tables produce a warning."""
+        tables = _tables()
+        del tables["patients"]
+        result = _validator().validate(tables)
+        assert any("was not checked" in issue.message for issue in result.issues)
+
+    def test_cycle_detection(self):
+        """Test cyclic foreign keys are rejected."""
+        validator = MultiTableValidator(foreign_keys=[("a", "x", "b", "x"), ("b", "x", "a", "x")])
+        tables = {"a": pd.DataFrame({"x": [1]}), "b": pd.DataFrame({"x": [1]})}
+        with pytest.raises(ValueError):
+            validator.validate(tables)
@@ -0,0 +1,145 @@
+"""
+Tests for content-hash caching of file validation results.
+"""
+
+import hashlib
+import io
+
+import pandas as pd
+import pytest
+
+from medical_data_validator import __version__
+from medical_data_validator.codesets import codeset_registry
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.result_cache import (
+    HashingReader,
+    hashed_upload,
+    result_key,
+    validation_version,
+)
+
+
+class _Unseekable(io.RawIOBase):
+    """A request body that can only be read forwards."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+@pytest.fixture
+def csv_bytes():
+    frame = pd.DataFrame({"patient_id": [f"P{i}" for i in range(20)], "age": range(20)})
+    return frame.to_csv(index=False).encode()
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        yield client
+
+
+class TestHashedUpload:
+    """Test hashed_upload function."""
+
+    def test_seekable_hashed_up_front(self, csv_bytes):
+        """Test seekable uploads are hashed before reading and rewound."""
+        stream, content_hash, reader = hashed_upload(io.BytesIO(csv_bytes), None)
+
+        assert content_hash == hashlib.sha256(csv_bytes).hexdigest()
+        assert reader is None
+        assert stream.read() == csv_bytes
+
+    def test_small_body_buffered(self, csv_bytes):
+        """Test small unseekable bodies are buffered so their hash is known up front."""
+        stream, content_hash, reader = hashed_upload(_Unseekable(csv_bytes), len(csv_bytes))
+
+        assert content_hash == hashlib.sha256(csv_bytes).hexdigest()
+        assert stream.read() == csv_bytes
+
+    def test_large_body_hashed_while_read(self, csv_bytes):
+        """Test large unseekable bodies are hashed as they are consumed."""
+        stream, content_hash, reader = hashed_upload(_Unseekable(csv_bytes), len(csv_bytes), buffer_limit=10)
+
+        assert content_hash is None
+        assert isinstance(reader, HashingReader)
+        assert b"".join(stream) == csv_bytes
+        assert reader.hexdigest() == hashlib.sha256(csv_bytes).hexdigest()
+
+    def test_options_change_key(self):
+        """Test the key covers the validation options as well as the content."""
+        assert result_key("abc", "csv", True) == result_key("abc", "csv", True)
+        assert result_key("abc", "csv", True) != result_key("abc", "csv", False)
+        assert result_key("abc", "csv", True) != result_key("abd", "csv", True)
+
+
+class TestCachedFileEndpoint:
+    """Test result caching on the file validation endpoint."""
+
+    def _upload(self, client, csv_bytes, **headers):
+        return client.post(
+            "/api/validate/file",
+            data={"file": (io.BytesIO(csv_bytes), "data.csv")},
+            content_type="multipart/form-data",
+            headers=headers,
+        )
+
+    def test_repeat_upload_served_from_cache(self, client, csv_bytes):
+        """Test the same file and options are validated once and share an ETag."""
+        first = self._upload(client, csv_bytes)
+        second = self._upload(client, csv_bytes)
+        cache = client.application.extensions["result_cache"]
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["ETag"] == second.headers["ETag"]
+        assert first.get_json() == second.get_json()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_if_none_match(self, client, csv_bytes):
+        """Test a client holding the current ETag gets 304 without a body."""
+        etag = self._upload(client, csv_bytes).headers["ETag"]
+        resp = self._upload(client, csv_bytes, **{"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.get_data() == b""
+        assert resp.headers["ETag"] == etag
+
+    def test_streamed_body_stored_for_later(self, client, csv_bytes):
+        """Test a body too large to buffer is hashed while validated and cached afterwards."""
+        client.application.config["RESULT_CACHE_BUFFER_BYTES"] = 0
+        raw = client.post("/api/validate/file", data=csv_bytes, content_type="text/csv")
+        multipart = self._upload(client, csv_bytes)
+
+        assert raw.headers["ETag"] == multipart.headers["ETag"]
+        assert client.application.extensions["result_cache"].hits == 1
+
+    def test_options_not_shared(self, client, csv_bytes):
+        """Test different validation options are cached separately."""
+        first = self._upload(client, csv_bytes)
+        other = client.post(
+            "/api/validate/file",
+            data={"file": (io.BytesIO(csv_bytes), "data.csv"), "detect_phi": "false"},
+            content_type="multipart/form-data",
+        )
+
+        assert first.headers["ETag"] != other.headers["ETag"]
+
+    def test_code_sets_change_key(self, client, csv_bytes):
+        """Test a new code table is not answered with results cached before it."""
+        before = self._upload(client, csv_bytes).headers["ETag"]
+        codeset_registry.register("icd10", ["E11.9", "I10"])
+        try:
+            after = self._upload(client, csv_bytes, **{"If-None-Match": before})
+        finally:
+            codeset_registry.unregister("icd10")
+
+        assert after.status_code == 200
+        assert after.headers["ETag"] != before
+        assert validation_version()["package"] == __version__
@@ -0,0 +1,116 @@
+"""
+Tests for schema inference, typed loading and dtype compatibility.
+"""
+
+import pandas as pd
+
+from medical_data_validator.schema import (
+    STRING_DTYPE,
+    Schema,
+    infer_csv_schema,
+    infer_schema,
+    is_text_dtype,
+    is_type_compatible,
+    logical_type,
+)
+from medical_data_validator.validators import PHIDetector, SchemaValidator
+
+
+def _sample_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "patient_id": [f"P{i:05d}" for i in range(20)],
+        "age": list(range(20, 40)),
+        "weight": [70.5] * 20,
+        "sex": ["M", "F"] * 10,
+        "visit_date": ["2024-01-%02d" % (i + 1) for i in range(20)],
+        "active": [True, False] * 10,
+    })
+
+
+class TestTypeCompatibility:
+    """Test dtype compatibility with nullable and compact types."""
+
+    def test_logical_types(self):
+        """Test dtype classification."""
+        assert logical_type("Int32") == "integer"
+        assert logical_type("float32") == "float"
+        assert logical_type("string") == "string"
+        assert logical_type("category") == "category"
+        assert logical_type("datetime64[ns, UTC]") == "datetime"
+        assert logical_type("boolean") == "boolean"
+
+    def test_compact_types_compatible(self):
+        """Test compact dtypes satisfy the generic type names."""
+        assert is_type_compatible("Int64", "int")
+        assert is_type_compatible("int32", "integer")
+        assert is_type_compatible("string", "string")
+        assert is_type_compatible("category", "string")
+        assert is_type_compatible("category", "category")
+        assert is_type_compatible("boolean", "bool")
+        assert is_type_compatible("float32", "float32")
+        assert not is_type_compatible("Int64", "float")
+        assert not is_type_compatible("string", "category")
+
+    def test_schema_validator_uses_compact_types(self):
+        """Test SchemaValidator accepts nullable integers."""
+        validator = SchemaValidator(column_types={"age": "int"})
+        df = pd.DataFrame({"age": pd.array([30, None], dtype="Int64")})
+        assert validator.validate(df) == []
+
+    def test_text_dtypes(self):
+        """Test text detection for object, string and category columns."""
+        assert is_text_dtype(pd.Series(["a"]).dtype)
+        assert is_text_dtype(pd.Series(["a"], dtype="string").dtype)
+        assert is_text_dtype(pd.Series(["a"], dtype="category").dtype)
+        assert not is_text_dtype(pd.Series([1], dtype="category").dtype)
+
+    def test_phi_detector_scans_string_columns(self):
+        """Test PHI patterns are found in typed text columns."""
+        df = pd.DataFrame({"notes": pd.Series(["SSN 123-45-6789"], dtype="string")})
+        issues = PHIDetector().validate(df)
+        assert any("SSN" in issue.message for issue in issues)
+
+
+class TestSchemaInference:
+    """Test infer_schema and typed loading."""
+
+    def test_infer_schema(self):
+        """Test compact load types are chosen per column."""
+        schema = infer_schema(_sample_frame())
+        columns = schema.columns
+
+        assert columns["patient_id"].dtype == STRING_DTYPE
+        assert columns["age"].dtype == "Int32"
+        assert columns["weight"].dtype == "float64"
+        assert columns["sex"].dtype == "category"
+        assert columns["visit_date"].logical_type == "datetime"
+        assert columns["visit_date"].date_format == "%Y-%m-%d"
+        assert columns["active"].dtype == "boolean"
+
+    def test_read_csv_with_schema(self, tmp_path):
+        """Test a CSV loads straight into the inferred types."""
+        path = tmp_path / "data.csv"
+        _sample_frame().to_csv(path, index=False)
+
+        schema = infer_csv_schema(path, sample_rows=10)
+        data = schema.read_csv(path)
+
+        assert str(data["age"].dtype) == "Int32"
+        assert str(data["sex"].dtype) == "category"
+        assert pd.api.types.is_datetime64_any_dtype(data["visit_date"])
+        assert schema.to_validator().validate(data) == []
+
+    def test_round_trip(self):
+        """Test schemas survive to_dict/from_dict."""
+        schema = infer_schema(_sample_frame())
+        assert Schema.from_dict(schema.to_dict()) == schema
+
+    def test_compiled_validator_reports_mismatch(self):
+        """Test the compiled validator flags columns loaded with other types."""
+        schema = infer_schema(_sample_frame())
+        df = schema.apply(_sample_frame()).assign(age=lambda d: d["age"].astype(str))
+        validator = schema.to_validator()
+
+        issues = validator.validate(df)
+
+        assert [issue.column for issue in issues] == ["age"]
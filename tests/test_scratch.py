@@ -0,0 +1,82 @@
+"""
+Tests for memory-mapped scratch copies of input files.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from medical_data_validator import scratch
+from medical_data_validator.loaders import load_file
+from medical_data_validator.scratch import ScratchCache, file_fingerprint
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "visits.csv"
+    pd.DataFrame({
+        "patient_id": [f"P{i}" for i in range(6)],
+        "sex": ["F", "M", "F", "F", "M", "F"],
+        "visit_date": ["2020-01-01", "2020-02-01", "2020-03-01", "2020-04-01", "2020-05-01", "2020-06-01"],
+        "heart_rate": [70, 80, 90, 100, 110, 120],
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestScratchCache:
+    """Test ScratchCache class."""
+
+    def test_convert_once(self, tmp_path, csv_file, mocker):
+        """Test the source is parsed once and later loads reuse the scratch file."""
+        cache = ScratchCache(tmp_path / "scratch")
+        read_source = mocker.spy(scratch, "_read_source")
+
+        first = cache.load(csv_file)
+        second = cache.load(csv_file, columns=["heart_rate"])
+
+        assert read_source.call_count == 1
+        assert len(first) == 6
+        assert list(second.columns) == ["heart_rate"]
+        assert second.attrs["source_columns"] == ["patient_id", "sex", "visit_date", "heart_rate"]
+
+    def test_encoding(self, tmp_path, csv_file):
+        """Test low-cardinality strings are categorical and dates load like a direct read."""
+        data = ScratchCache(tmp_path / "scratch").load(csv_file)
+
+        assert isinstance(data["sex"].dtype, pd.CategoricalDtype)
+        assert data["patient_id"].dtype == object
+        assert data["visit_date"].tolist()[0] == "2020-01-01"
+
+    def test_text_hints(self, tmp_path):
+        """Test declared text columns keep leading zeros, as in a direct load."""
+        path = tmp_path / "zips.csv"
+        path.write_text("zip,heart_rate\n02134,70\n10001,80\n02134,90\n")
+        cache = ScratchCache(tmp_path / "scratch")
+
+        hinted = cache.load(path, dtypes={"zip": "str"})
+
+        assert hinted["zip"].tolist() == load_file(path, dtypes={"zip": "str"})["zip"].tolist() == ["02134", "10001", "02134"]
+        assert cache.load(path)["zip"].tolist() == [2134, 10001, 2134]
+        assert cache.path_for(path, {"zip": "str"}) != cache.path_for(path)
+
+    def test_modified_file_gets_new_entry(self, tmp_path, csv_file):
+        """Test editing the source invalidates the scratch file."""
+        cache = ScratchCache(tmp_path / "scratch")
+        before = cache.convert(csv_file)
+
+        with open(csv_file, "a") as handle:
+            handle.write("P6,M,2020-07-01,130\n")
+        stat = os.stat(csv_file)
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        after = cache.convert(csv_file)
+        assert before != after
+        assert len(cache.load(csv_file)) == 7
+        assert cache.clear() == 2
+
+    def test_fingerprint_is_stable(self, csv_file):
+        """Test an unchanged file keeps its fingerprint."""
+        assert file_fingerprint(csv_file) == file_fingerprint(str(csv_file))
@@ -0,0 +1,84 @@
+"""
+Tests for group-aware sequence checks.
+"""
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.extensions import MedicalProfiles
+from medical_data_validator.sequences import SequenceValidator
+
+
+def _encounters() -> pd.DataFrame:
+    return pd.DataFrame({
+        "patient_id": ["A", "B", "A", "A", "B", None],
+        "admission_date": ["2024-01-01", "2024-02-01", "2024-01-05", "2024-01-08", "2024-02-10", "2024-01-01"],
+        "discharge_date": ["2024-01-06", "2024-02-03", "2024-01-07", "2024-01-07", "2024-02-12", "2024-01-02"],
+    })
+
+
+class TestSequenceValidator:
+    """Test SequenceValidator class."""
+
+    def test_order_check(self):
+        """Test discharge before admission is reported on its row."""
+        validator = SequenceValidator("patient_id", "admission_date", end_column="discharge_date", checks=["order"])
+
+        issues = validator.validate(_encounters())
+
+        assert [(issue.row, issue.value) for issue in issues] == [(3, "2024-01-07")]
+        assert issues[0].column == "discharge_date"
+
+    def test_overlap_check(self):
+        """Test encounters starting before an earlier one ended are flagged."""
+        validator = SequenceValidator("patient_id", "admission_date", end_column="discharge_date", checks=["overlap"])
+
+        violations = validator.evaluate(_encounters())["overlap"]
+
+        # Row 2 starts on 01-05 while row 0 runs until 01-06
+        assert violations.tolist() == [False, False, True, False, False, False]
+
+    def test_overlap_uses_running_end(self):
+        """Test a long stay is compared against all later encounters."""
+        df = pd.DataFrame({"pid": [1, 1, 1], "start": [0, 2, 5], "end": [10, 3, 6]})
+        validator = SequenceValidator("pid", "start", end_column="end", checks=["overlap"])
+        assert validator.evaluate(df)["overlap"].tolist() == [False, True, True]
+
+    def test_monotonic_visit_numbers(self):
+        """Test visit numbers must increase with visit dates per subject."""
+        df = pd.DataFrame({
+            "subject_id": ["S1", "S1", "S1", "S2", "S2"],
+            "visit_date": ["2024-03-01", "2024-01-01", "2024-02-01", "2024-01-01", "2024-02-01"],
+            "visit_number": [2, 1, 3, 1, 2],
+        })
+        validator = SequenceValidator("subject_id", "visit_date", sequence_column="visit_number")
+
+        issues = validator.validate(df)
+
+        # Sorted by date S1 runs 1, 3, 2 so the March visit is out of sequence
+        assert [(issue.row, issue.value) for issue in issues] == [(0, 2)]
+
+    def test_missing_columns_skip_checks(self):
+        """Test checks without their columns are skipped."""
+        validator = SequenceValidator("subject_id", "visit_date", sequence_column="visit_number")
+        assert validator.validate(pd.DataFrame({"subject_id": ["S1"]})) == []
+
+    def test_row_issue_cap(self):
+        """Test row-level output is capped with a summary issue."""
+        df = pd.DataFrame({"pid": [1] * 5, "start": [5, 4, 3, 2, 1], "end": [0] * 5})
+        validator = SequenceValidator("pid", "start", end_column="end", checks=["order"], max_row_issues=2)
+
+        issues = validator.validate(df)
+
+        assert len(issues) == 3
+        assert issues[-1].message == "3 more rows fail the order check (5 total)"
+
+    def test_unknown_check(self):
+        """Test unknown check names are rejected."""
+        with pytest.raises(ValueError):
+            SequenceValidator("pid", "start", checks=["gaps"])
+
+    def test_clinical_trials_profile(self):
+        """Test the clinical trials profile checks visit sequences."""
+        profile = MedicalProfiles.clinical_trials()
+        assert any(isinstance(rule, SequenceValidator) for rule in profile.rules)
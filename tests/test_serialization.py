@@ -0,0 +1,94 @@
+"""
+Tests for the central JSON serializer and the Flask JSON provider.
+"""
+
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask, jsonify
+
+from medical_data_validator import serialization
+from medical_data_validator.core import ValidationIssue
+from medical_data_validator.dashboard.json_provider import FastJSONProvider
+
+
+@pytest.fixture
+def payload():
+    return {
+        "count": np.int64(3),
+        "score": np.float32(0.5),
+        "flags": np.array([True, False]),
+        "labels": np.array(["a", None], dtype=object),
+        "when": pd.Timestamp("2024-01-02 03:04:05"),
+        "missing": pd.NaT,
+        "series": pd.Series([1, 2]),
+        "issue": ValidationIssue(severity="error", message="bad", column="age", row=np.int64(4)),
+        np.int64(7): "numpy key",
+    }
+
+
+EXPECTED = {
+    "count": 3,
+    "score": 0.5,
+    "flags": [True, False],
+    "labels": ["a", None],
+    "when": "2024-01-02T03:04:05",
+    "missing": None,
+    "series": [1, 2],
+    "7": "numpy key",
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, mocker):
+    if request.param == "stdlib":
+        mocker.patch.object(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestSerialization:
+    """Test the serialization functions."""
+
+    def test_to_builtin(self, payload, backend):
+        """Test NumPy, pandas and dataclass values become plain JSON types."""
+        result = serialization.to_builtin(payload)
+        issue = result.pop("issue")
+
+        assert result == EXPECTED
+        assert (issue["severity"], issue["row"]) == ("error", 4)
+        json.dumps(result)
+
+    def test_round_trip(self, backend):
+        """Test dumps and loads agree for both bytes and text."""
+        text = serialization.dumps({"b": 1, "a": [1.5, None]}, sort_keys=True)
+
+        assert text == '{"a":[1.5,null],"b":1}'
+        assert serialization.loads(text.encode()) == {"a": [1.5, None], "b": 1}
+
+
+class TestFastJSONProvider:
+    """Test FastJSONProvider class."""
+
+    def test_jsonify(self, payload):
+        """Test jsonify encodes NumPy and pandas values without conversion."""
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        with app.app_context():
+            resp = jsonify(payload)
+
+        body = json.loads(resp.get_data())
+        body.pop("issue")
+        assert body == EXPECTED
+        assert resp.mimetype == "application/json"
+
+    def test_dates_are_iso(self):
+        """Test dates are encoded as ISO 8601."""
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        with app.app_context():
+            assert app.json.loads(app.json.dumps({"d": datetime.date(2024, 5, 6)})) == {"d": "2024-05-06"}
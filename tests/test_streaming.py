@@ -0,0 +1,79 @@
+"""
+Tests for streamed NDJSON validation responses.
+"""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard import streaming
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        yield client
+
+
+def _records(resp):
+    return [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+
+
+class TestStreamedValidation:
+    """Test NDJSON responses from the validation endpoints."""
+
+    def test_file_records(self, client, mocker):
+        """Test a file upload streams header, per-batch issues and a summary."""
+        mocker.patch.object(streaming, "ISSUE_CHUNK_SIZE", 1)
+        frame = pd.DataFrame({"patient_id": ["P1", None, "P3"], "email": ["a@b.com", None, None]})
+        resp = client.post(
+            "/api/validate/file",
+            data={"file": (io.BytesIO(frame.to_csv(index=False).encode()), "data.csv"), "standards": "hipaa"},
+            content_type="multipart/form-data",
+            headers=NDJSON,
+        )
+        records = _records(resp)
+
+        assert resp.mimetype == "application/x-ndjson"
+        assert records[0] == {"type": "header", "success": True, "format": "csv", "standards": ["hipaa"]}
+        issue_records = [record for record in records if record["type"] == "issues"]
+        assert all(len(record["issues"]) == 1 and record["end_row"] == 3 for record in issue_records)
+
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert summary["total_issues"] == len(issue_records)
+        assert summary["summary"]["total_rows"] == 3
+        assert "Email detected in column: email" in summary["compliance_report"]["hipaa"]["issues"]
+
+    def test_matches_json_response(self, client):
+        """Test the streamed summary agrees with the single-document response."""
+        data = {"patient_id": ["P1", None], "age": [30, 200]}
+        document = client.post("/api/validate/data", json=data).get_json()
+        records = _records(client.post("/api/validate/data", json=data, headers=NDJSON))
+
+        issues = [issue for record in records if record["type"] == "issues" for issue in record["issues"]]
+        assert (records[0]["type"], records[-1]["type"]) == ("header", "summary")
+        assert len(issues) == document["total_issues"] == records[-1]["total_issues"]
+        assert records[-1]["is_valid"] == document["is_valid"]
+
+    def test_default_is_json(self, client):
+        """Test clients that accept anything still get one JSON document."""
+        resp = client.post("/api/validate/data", json={"a": [1]}, headers={"Accept": "*/*"})
+
+        assert resp.mimetype == "application/json"
+
+    def test_error_record(self, client, mocker):
+        """Test failures after the response started end the stream with an error record."""
+        mocker.patch("medical_data_validator.dashboard.routes.iter_upload_batches", side_effect=ValueError("bad input"))
+        resp = client.post("/api/validate/file", data="a,b\n1,2\n", content_type="text/csv", headers=NDJSON)
+        records = _records(resp)
+
+        assert records[0]["type"] == "header"
+        assert records[-1] == {"type": "error", "success": False, "error": "bad input"}
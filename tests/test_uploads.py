@@ -0,0 +1,108 @@
+"""
+Tests for streaming upload parsing and the streamed file endpoint.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.uploads import iter_upload_batches, read_upload
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "patient_id": [f"P{i}" for i in range(25)],
+        "age": [30 + i for i in range(25)],
+        "contact": ["a@b.com"] + ["none"] * 24,
+    })
+
+
+@pytest.fixture
+def client():
+    app = create_dashboard_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        yield client
+
+
+class TestIterUploadBatches:
+    """Test iter_upload_batches function."""
+
+    def test_csv_batches(self, frame):
+        """Test CSV uploads are split into batches of the requested size."""
+        stream = io.BytesIO(frame.to_csv(index=False).encode())
+        batches = list(iter_upload_batches(stream, "csv", batch_size=10))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), frame)
+
+    def test_jsonl_batches(self, frame):
+        """Test JSON Lines uploads skip blank lines and keep every record."""
+        body = frame.to_json(orient="records", lines=True).replace("\n", "\n\n")
+        batches = list(iter_upload_batches(io.BytesIO(body.encode()), "jsonl", batch_size=10))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert pd.concat(batches, ignore_index=True)["patient_id"].tolist() == frame["patient_id"].tolist()
+
+    def test_parquet_sliced(self, frame):
+        """Test formats read whole are sliced into batches."""
+        buffer = io.BytesIO()
+        frame.to_parquet(buffer)
+        buffer.seek(0)
+
+        assert [len(batch) for batch in iter_upload_batches(buffer, "parquet", batch_size=20)] == [20, 5]
+
+    def test_unsupported_format(self):
+        """Test an unknown format is rejected."""
+        with pytest.raises(ValueError):
+            read_upload(io.BytesIO(b""), "txt")
+
+
+class TestStreamedFileEndpoint:
+    """Test the file validation endpoint with streamed uploads."""
+
+    def test_multipart_csv(self, client, frame):
+        """Test a multipart CSV upload reports rows, columns and PHI values."""
+        resp = client.post(
+            "/api/validate/file",
+            data={"file": (io.BytesIO(frame.to_csv(index=False).encode()), "data.csv"), "standards": "hipaa"},
+            content_type="multipart/form-data",
+        )
+        body = resp.get_json()
+
+        assert resp.status_code == 200
+        assert (body["summary"]["total_rows"], body["summary"]["total_columns"]) == (25, 3)
+        assert "Email detected in column: contact" in body["compliance_report"]["hipaa"]["issues"]
+
+    def test_raw_jsonl_body(self, client, frame):
+        """Test a raw JSON Lines body is validated without a multipart form."""
+        resp = client.post(
+            "/api/validate/file?standards=hipaa",
+            data=frame.to_json(orient="records", lines=True),
+            content_type="application/x-ndjson",
+        )
+        body = resp.get_json()
+
+        assert resp.status_code == 200
+        assert body["summary"]["total_rows"] == 25
+        assert body["compliance_report"]["hipaa"]["compliant"] is False
+
+    def test_upload_limit(self, client, frame):
+        """Test bodies over MAX_UPLOAD_BYTES are rejected with 413."""
+        client.application.config["MAX_UPLOAD_BYTES"] = 100
+        resp = client.post("/api/validate/file", data=frame.to_csv(index=False), content_type="text/csv")
+
+        assert resp.status_code == 413
+        assert "File too large" in resp.get_json()["error"]
+
+    def test_legacy_upload_keeps_app_limit(self, client, frame):
+        """Test the whole-frame /upload endpoint is not raised to MAX_UPLOAD_BYTES."""
+        client.application.config.update(MAX_CONTENT_LENGTH=100, MAX_UPLOAD_BYTES=10 ** 9)
+        data = frame.to_csv(index=False).encode()
+
+        assert client.post("/api/validate/file", data=data, content_type="text/csv").status_code == 200
+        assert client.post("/upload", data={"file": (io.BytesIO(data), "data.csv")},
+                           content_type="multipart/form-data").status_code == 413
@@ -2,6 +2,7 @@
 Test cases for Medical Data Validator v1.2 Real-time Monitoring Features
 """
 
+import os
 import pytest
 import time
 import threading
@@ -456,4 +457,36 @@ class TestRealTimeMonitor:
             json.dumps(active_alerts)
             json.dumps(trends)
         except (TypeError, ValueError) as e:
-            pytest.fail(f"Monitoring data is not JSON serializable: {e}") 
\ No newline at end of file
+            pytest.fail(f"Monitoring data is not JSON serializable: {e}") 
+
+def _monitor_thread_alive():
+    from medical_data_validator.monitoring import monitor
+    return monitor.monitor_thread is not None and monitor.monitor_thread.is_alive()
+
+
+class TestForkedMonitoring:
+    """Test the monitoring loop across forks."""
+    
+    def test_post_fork_restarts_loop(self, monkeypatch):
+        """Test the gunicorn hook restarts an active loop in the worker."""
+        from medical_data_validator import monitoring
+        
+        worker_monitor = RealTimeMonitor()
+        worker_monitor.monitoring_active = True
+        monkeypatch.setattr(monitoring, "monitor", worker_monitor)
+        
+        monitoring.post_fork(None, None)
+        
+        assert worker_monitor.monitor_thread.is_alive()
+        worker_monitor.monitoring_active = False
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_pool_workers_start_no_loop(self):
+        """Test forked worker processes do not start their own monitoring loop."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from medical_data_validator.monitoring import monitor
+        
+        monitor.start_monitoring()
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as pool:
+            assert pool.submit(_monitor_thread_alive).result() is False
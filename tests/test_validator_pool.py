@@ -0,0 +1,74 @@
+"""
+Tests for the pre-built validator pool.
+"""
+
+import pytest
+
+from medical_data_validator.dashboard.app import create_dashboard_app
+from medical_data_validator.dashboard.routes import get_validator
+from medical_data_validator.dashboard.validator_pool import ValidatorConfig, ValidatorPool, freeze_rules
+
+
+class TestValidatorPool:
+    """Test ValidatorPool class."""
+
+    def test_builds_once_per_config(self):
+        """Test a configuration is built on first use and then shared."""
+        built = []
+        pool = ValidatorPool(lambda config: built.append(config) or object())
+
+        first = pool.get(ValidatorConfig(profile="lab"))
+        assert pool.get(ValidatorConfig(profile="lab")) is first
+        assert pool.get(ValidatorConfig(profile="ehr")) is not first
+        assert built == [ValidatorConfig(profile="lab"), ValidatorConfig(profile="ehr")]
+        assert (pool.stats()["hits"], pool.stats()["misses"]) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test the pool keeps at most max_size configurations."""
+        pool = ValidatorPool(lambda config: object(), max_size=2)
+        a = pool.get(ValidatorConfig(profile="a"))
+        pool.get(ValidatorConfig(profile="b"))
+        pool.get(ValidatorConfig(profile="a"))
+        pool.get(ValidatorConfig(profile="c"))
+
+        assert len(pool) == 2
+        assert pool.get(ValidatorConfig(profile="a")) is a
+        assert pool.misses == 3
+
+    def test_custom_rules_are_part_of_the_key(self):
+        """Test changed custom rules give a different configuration."""
+        rule = {"name": "mrn", "pattern": r"MRN\d+", "severity": "high"}
+
+        assert freeze_rules([rule]) == freeze_rules([dict(reversed(list(rule.items())))])
+        assert ValidatorConfig(custom_rules=freeze_rules([rule])) != ValidatorConfig(
+            custom_rules=freeze_rules([{**rule, "severity": "low"}])
+        )
+
+
+class TestAppPool:
+    """Test the pool installed by the dashboard app."""
+
+    @pytest.fixture
+    def app(self):
+        return create_dashboard_app()
+
+    def test_warmed_at_startup(self, app):
+        """Test common configurations are built before the first request."""
+        pool = app.extensions["validator_pool"]
+
+        assert len(pool) > 0
+        with app.app_context():
+            get_validator(True, True, "")
+            get_validator(False, True, "clinical_trials")
+        assert pool.misses == len(pool)
+
+    def test_custom_rules_applied(self, app):
+        """Test pooled compliance validators carry the custom rules they were built with."""
+        rules = [{"name": "mrn", "pattern": r"MRN\d+", "severity": "high"}]
+        with app.app_context():
+            plain = get_validator(True, True, "")
+            custom = get_validator(True, True, "", custom_rules=rules)
+
+        assert custom is not plain
+        assert [rule.name for rule in custom.compliance_engine.get_custom_rules()] == ["mrn"]
+        assert plain.compliance_engine.get_custom_rules() == []